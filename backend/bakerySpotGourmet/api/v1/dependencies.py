@@ -2,15 +2,17 @@
 API Dependencies.
 Common dependency injection.
 """
-from typing import Generator, Annotated
+from functools import lru_cache
+from typing import Annotated, Callable, Generator, TypeVar
 
-from fastapi import Depends, HTTPException, Request, status
+from fastapi import Depends, FastAPI, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError
 from pydantic import ValidationError
 
 from bakerySpotGourmet.core import security
 from bakerySpotGourmet.core.config import settings
+from bakerySpotGourmet.core.tracing import traced
 from bakerySpotGourmet.domain.users.entities import UserIdentity, RoleName
 from bakerySpotGourmet.repositories.user_repository import UserRepository
 from bakerySpotGourmet.schemas.user import TokenPayload
@@ -19,41 +21,75 @@ reusable_oauth2 = OAuth2PasswordBearer(
     tokenUrl=f"{settings.API_V1_STR}/users/login/access-token"
 )
 
+T = TypeVar("T")
+
+# Repositories hold the in-memory data, so requests and background
+# consumers share one instance of each
+@lru_cache(maxsize=None)
 def get_user_repository() -> UserRepository:
     return UserRepository()
 
+@lru_cache(maxsize=None)
 def get_item_repository() -> "ItemRepository": # type: ignore
     from bakerySpotGourmet.repositories.item_repository import ItemRepository
     return ItemRepository()
 
+@lru_cache(maxsize=None)
 def get_order_repository() -> "OrderRepository": # type: ignore
     from bakerySpotGourmet.repositories.order_repository import OrderRepository
     return OrderRepository()
 
+@lru_cache(maxsize=None)
 def get_payment_repository() -> "PaymentRepository": # type: ignore
     from bakerySpotGourmet.repositories.payment_repository import PaymentRepository
     return PaymentRepository()
 
+def resolve_dependency(app: FastAPI, provider: Callable[[], T]) -> T:
+    """
+    Call a dependency provider outside a request, e.g. at startup.
+    Honors app.dependency_overrides, so background consumers use the same
+    instances as the routes.
+    
+    Args:
+        app: The application
+        provider: A provider without parameters, e.g. get_order_repository
+        
+    Returns:
+        The provided instance
+    """
+    return app.dependency_overrides.get(provider, provider)()
+
+@traced
 def get_auth_service(
     user_repo: Annotated[UserRepository, Depends(get_user_repository)]
 ) -> "AuthService": # type: ignore
     from bakerySpotGourmet.services.auth_service import AuthService
     return AuthService(user_repo)
 
+@traced
 def get_payment_service(
     payment_repo: Annotated["PaymentRepository", Depends(get_payment_repository)]
 ) -> "PaymentService": # type: ignore
     from bakerySpotGourmet.services.payment_service import PaymentService
-    return PaymentService(payment_repo)
+    from bakerySpotGourmet.infrastructure.events.event_bus import get_event_bus
+    return PaymentService(payment_repo, get_event_bus())
 
+@traced
 def get_order_service(
     order_repo: Annotated["OrderRepository", Depends(get_order_repository)],
     payment_repo: Annotated["PaymentRepository", Depends(get_payment_repository)],
     item_repo: Annotated["ItemRepository", Depends(get_item_repository)],
 ) -> "OrderService": # type: ignore
     from bakerySpotGourmet.services.order_service import OrderService
-    return OrderService(order_repo, payment_repo, item_repo)
+    from bakerySpotGourmet.infrastructure.events.event_bus import get_event_bus
+    return OrderService(order_repo, payment_repo, item_repo, get_event_bus())
+
+def get_payment_webhook_service() -> "PaymentWebhookService": # type: ignore
+    # Repositories are wired once at startup; the background worker keeps them
+    from bakerySpotGourmet.services.payment_webhook_service import get_payment_webhook_service as _get
+    return _get()
 
+@traced
 async def get_current_user(
     token: Annotated[str, Depends(reusable_oauth2)],
     user_repo: Annotated[UserRepository, Depends(get_user_repository)],
@@ -99,6 +135,7 @@ class RoleChecker:
     def __init__(self, allowed_roles: list[RoleName]):
         self.allowed_roles = allowed_roles
 
+    @traced(name="RoleChecker")
     def __call__(self, user: Annotated[UserIdentity, Depends(get_current_user)]) -> UserIdentity:
         if user.role not in self.allowed_roles:
             raise HTTPException(
@@ -131,6 +168,7 @@ def rate_limit_dependency(endpoint: str = "default"):
     Returns:
         Dependency function
     """
+    @traced(name="rate_limit")
     def _rate_limit(
         current_user: Annotated[UserIdentity, Depends(get_current_user)],
         request: Request,
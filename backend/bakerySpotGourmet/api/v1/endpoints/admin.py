@@ -1,35 +1,62 @@
 """
-Admin API endpoints for order management.
-Requires ADMIN or STAFF role.
+Admin API endpoints for order management and diagnostics.
+Requires ADMIN or STAFF role; diagnostics endpoints require ADMIN.
 """
-from typing import Annotated, Any, Optional, List
+from typing import Annotated, Any, Literal, Optional, List
 import structlog
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse, Response
 
 from bakerySpotGourmet.api.v1 import dependencies as deps
 from bakerySpotGourmet.core.exceptions import EntityNotFoundException
+from bakerySpotGourmet.core.constants import MEMORY_TOP_ALLOCATIONS
+from bakerySpotGourmet.core.loop_monitor import get_event_loop_monitor
+from bakerySpotGourmet.core.memory import (
+    get_max_rss_bytes,
+    get_memory_registry,
+    get_rss_bytes,
+    get_tracemalloc_snapshots,
+)
+from bakerySpotGourmet.core.profiling import (
+    RequestProfile,
+    get_continuous_profiler,
+    get_profile_store,
+)
+from bakerySpotGourmet.core.tracing import get_slow_request_log
 from bakerySpotGourmet.domain.users.entities import UserIdentity, RoleName
 from bakerySpotGourmet.domain.orders.status import OrderStatus
 from bakerySpotGourmet.domain.orders.exceptions import InvalidOrderStatusTransitionException
-from bakerySpotGourmet.schemas.order import OrderResponse, OrderStatusUpdate
+from bakerySpotGourmet.schemas.memory import (
+    AllocationDiff,
+    AllocationStat,
+    MemoryReportResponse,
+    MemorySnapshotSummary,
+)
+from bakerySpotGourmet.schemas.order import AdminOrderResponse, OrderResponse, OrderStatusUpdate
+from bakerySpotGourmet.schemas.payment import PaymentResponse
+from bakerySpotGourmet.schemas.profiling import RequestProfileResponse, RequestProfileSummary
+from bakerySpotGourmet.schemas.tracing import SlowRequestResponse, SlowRequestSummary
 from bakerySpotGourmet.services.order_service import OrderService
+from bakerySpotGourmet.services.payment_service import PaymentService
 
 
 logger = structlog.get_logger()
 router = APIRouter()
 
 
-@router.get("/orders", response_model=List[OrderResponse])
+@router.get("/orders", response_model=List[AdminOrderResponse])
 async def list_orders(
     current_user: Annotated[UserIdentity, Depends(deps.RoleChecker([RoleName.ADMIN, RoleName.STAFF]))],
     order_service: Annotated[OrderService, Depends(deps.get_order_service)],
+    payment_service: Annotated[PaymentService, Depends(deps.get_payment_service)],
     skip: int = Query(0, ge=0, description="Number of orders to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of orders to return"),
     status: Optional[OrderStatus] = Query(None, description="Filter by order status"),
 ) -> Any:
     """
     List all orders with optional filtering and pagination.
+    Payments of the whole page are fetched in one repository call.
     
     Requires ADMIN or STAFF role.
     """
@@ -42,7 +69,13 @@ async def list_orders(
     )
     
     orders = order_service.list_orders(skip=skip, limit=limit, status_filter=status)
-    return orders
+    payments = payment_service.get_payments_for_orders(order.id for order in orders)
+    page = []
+    for order in orders:
+        response = AdminOrderResponse.model_validate(order)
+        response.payments = [PaymentResponse.model_validate(p) for p in payments[order.id]]
+        page.append(response)
+    return page
 
 
 @router.get("/orders/{order_id}", response_model=OrderResponse)
@@ -122,3 +155,214 @@ async def update_order_status(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
+
+
+@router.get("/event-loop")
+async def get_event_loop_stats(
+    current_user: Annotated[UserIdentity, Depends(deps.RoleChecker([RoleName.ADMIN]))],
+) -> Any:
+    """
+    Event loop lag statistics and the stack of the last blocking call.
+    
+    Requires ADMIN role.
+    """
+    return get_event_loop_monitor().get_stats()
+
+
+@router.get("/profiler")
+async def get_profiler_stats(
+    current_user: Annotated[UserIdentity, Depends(deps.RoleChecker([RoleName.ADMIN]))],
+) -> Any:
+    """
+    Continuous profiler state, sample counters and measured overhead.
+    
+    Requires ADMIN role.
+    """
+    return get_continuous_profiler().get_stats()
+
+
+@router.get("/profiler/flamegraph", response_class=PlainTextResponse)
+async def get_profiler_flamegraph(
+    current_user: Annotated[UserIdentity, Depends(deps.RoleChecker([RoleName.ADMIN]))],
+    seconds: Optional[float] = Query(None, gt=0, description="Only the most recent seconds"),
+) -> Any:
+    """
+    Process-wide collapsed stacks from the continuous profiler, ready for
+    flamegraph tools.
+    
+    Requires ADMIN role.
+    """
+    return PlainTextResponse(get_continuous_profiler().collapsed(seconds))
+
+
+def _get_profile(request_id: str) -> RequestProfile:
+    profile = get_profile_store().get(request_id)
+    if profile is None:
+        raise EntityNotFoundException("Request profile", request_id)
+    return profile
+
+
+@router.get("/profiles", response_model=List[RequestProfileSummary])
+async def list_profiles(
+    current_user: Annotated[UserIdentity, Depends(deps.RoleChecker([RoleName.ADMIN]))],
+) -> Any:
+    """
+    List stored request profiles, newest first.
+    
+    Requires ADMIN role.
+    """
+    return get_profile_store().list()
+
+
+@router.get("/profiles/{request_id}", response_model=RequestProfileResponse)
+async def get_profile(
+    request_id: str,
+    current_user: Annotated[UserIdentity, Depends(deps.RoleChecker([RoleName.ADMIN]))],
+) -> Any:
+    """
+    Retrieve the profile of a request by its X-Request-ID.
+    
+    Requires ADMIN role.
+    """
+    return _get_profile(request_id)
+
+
+@router.get("/profiles/{request_id}/collapsed", response_class=PlainTextResponse)
+async def get_profile_collapsed(
+    request_id: str,
+    current_user: Annotated[UserIdentity, Depends(deps.RoleChecker([RoleName.ADMIN]))],
+) -> Any:
+    """
+    Retrieve a request profile as collapsed stacks, ready for flamegraph tools.
+    
+    Requires ADMIN role.
+    """
+    return PlainTextResponse(_get_profile(request_id).collapsed())
+
+
+@router.get("/slow-requests", response_model=List[SlowRequestSummary])
+async def list_slow_requests(
+    current_user: Annotated[UserIdentity, Depends(deps.RoleChecker([RoleName.ADMIN]))],
+) -> Any:
+    """
+    List captured slow requests, newest first.
+    
+    Requires ADMIN role.
+    """
+    return [trace.to_dict() for trace in get_slow_request_log().list()]
+
+
+@router.get("/slow-requests/{request_id}", response_model=SlowRequestResponse)
+async def get_slow_request(
+    request_id: str,
+    current_user: Annotated[UserIdentity, Depends(deps.RoleChecker([RoleName.ADMIN]))],
+) -> Any:
+    """
+    Retrieve the span tree of a slow request by its X-Request-ID.
+    
+    Requires ADMIN role.
+    """
+    trace = get_slow_request_log().get(request_id)
+    if trace is None:
+        raise EntityNotFoundException("Slow request", request_id)
+    return trace.to_dict()
+
+
+# Sizing stores and snapshotting walk large structures, so these endpoints
+# are plain functions and run in the threadpool instead of on the event loop.
+AllocationKey = Literal["lineno", "filename", "traceback"]
+
+
+@router.get("/memory", response_model=MemoryReportResponse)
+def get_memory_report(
+    current_user: Annotated[UserIdentity, Depends(deps.RoleChecker([RoleName.ADMIN]))],
+) -> Any:
+    """
+    Entry counts and approximate deep sizes of the in-process stores, largest
+    first, with the process RSS and the tracemalloc state.
+    
+    Requires ADMIN role.
+    """
+    return {
+        "rss_bytes": get_rss_bytes(),
+        "max_rss_bytes": get_max_rss_bytes(),
+        "stores": get_memory_registry().report(),
+        "tracemalloc": get_tracemalloc_snapshots().get_stats(),
+    }
+
+
+@router.post("/memory/snapshots", response_model=MemorySnapshotSummary, status_code=status.HTTP_201_CREATED)
+def take_memory_snapshot(
+    current_user: Annotated[UserIdentity, Depends(deps.RoleChecker([RoleName.ADMIN]))],
+) -> Any:
+    """
+    Take a tracemalloc snapshot, starting allocation tracing if it is off.
+    
+    Requires ADMIN role.
+    """
+    snapshot = get_tracemalloc_snapshots().take()
+    logger.info("memory_snapshot_taken", admin_user_id=current_user.id, snapshot_id=snapshot["id"])
+    return snapshot
+
+
+@router.get("/memory/snapshots", response_model=List[MemorySnapshotSummary])
+async def list_memory_snapshots(
+    current_user: Annotated[UserIdentity, Depends(deps.RoleChecker([RoleName.ADMIN]))],
+) -> Any:
+    """
+    List kept tracemalloc snapshots, oldest first.
+    
+    Requires ADMIN role.
+    """
+    return get_tracemalloc_snapshots().list()
+
+
+@router.delete("/memory/snapshots", status_code=status.HTTP_204_NO_CONTENT)
+async def stop_memory_tracing(
+    current_user: Annotated[UserIdentity, Depends(deps.RoleChecker([RoleName.ADMIN]))],
+) -> Response:
+    """
+    Stop allocation tracing and drop the kept snapshots.
+    
+    Requires ADMIN role.
+    """
+    get_tracemalloc_snapshots().stop()
+    logger.info("memory_tracing_stopped", admin_user_id=current_user.id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.get("/memory/snapshots/{snapshot_id}/top", response_model=List[AllocationStat])
+def get_memory_snapshot_top(
+    snapshot_id: int,
+    current_user: Annotated[UserIdentity, Depends(deps.RoleChecker([RoleName.ADMIN]))],
+    limit: int = Query(MEMORY_TOP_ALLOCATIONS, ge=1, le=500, description="Allocation sites to return"),
+    key_type: AllocationKey = Query("lineno", description="Group allocations by line, file or traceback"),
+) -> Any:
+    """
+    Largest allocation sites of a snapshot.
+    
+    Requires ADMIN role.
+    """
+    try:
+        return get_tracemalloc_snapshots().top(snapshot_id, limit, key_type)
+    except KeyError:
+        raise EntityNotFoundException("Memory snapshot", str(snapshot_id))
+
+
+@router.get("/memory/diff", response_model=List[AllocationDiff])
+def diff_memory_snapshots(
+    current_user: Annotated[UserIdentity, Depends(deps.RoleChecker([RoleName.ADMIN]))],
+    first: int = Query(..., description="ID of the earlier snapshot"),
+    second: int = Query(..., description="ID of the later snapshot"),
+    limit: int = Query(MEMORY_TOP_ALLOCATIONS, ge=1, le=500, description="Allocation sites to return"),
+    key_type: AllocationKey = Query("lineno", description="Group allocations by line, file or traceback"),
+) -> Any:
+    """
+    Allocation sites that grew or shrank most between two snapshots.
+    
+    Requires ADMIN role.
+    """
+    try:
+        return get_tracemalloc_snapshots().diff(first, second, limit, key_type)
+    except KeyError as e:
+        raise EntityNotFoundException("Memory snapshot", str(e.args[0]))
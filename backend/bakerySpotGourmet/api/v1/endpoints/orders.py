@@ -7,6 +7,7 @@ import structlog
 from fastapi import APIRouter, Depends, Request, status
 
 from bakerySpotGourmet.api.v1 import dependencies as deps
+from bakerySpotGourmet.core.responses import PydanticJSONResponse
 from bakerySpotGourmet.domain.users.entities import UserIdentity
 from bakerySpotGourmet.schemas.order import OrderCreate, OrderResponse
 from bakerySpotGourmet.services.order_service import OrderService
@@ -29,6 +30,9 @@ async def create_order(
     Create a new order.
     
     Requires an Idempotency-Key header to prevent duplicate orders.
+    
+    Both the new order and a replayed one are already validated, so they are
+    returned as PydanticJSONResponse, skipping response model validation.
     """
     # Check idempotency store
     idempotency_store = get_idempotency_store()
@@ -40,7 +44,7 @@ async def create_order(
             idempotency_key=idempotency_key,
             user_id=current_user.id,
         )
-        return cached_response
+        return PydanticJSONResponse(cached_response, status_code=status.HTTP_201_CREATED)
     
     # Create new order
     logger.info(
@@ -70,4 +74,4 @@ async def create_order(
         payment_status=order.payment_status.value
     )
     
-    return response_data
+    return PydanticJSONResponse(response_data, status_code=status.HTTP_201_CREATED)
@@ -0,0 +1,63 @@
+"""
+Webhook API endpoints for payment gateway notifications.
+"""
+from typing import Annotated, Any
+
+import structlog
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+
+from bakerySpotGourmet.api.v1 import dependencies as deps
+from bakerySpotGourmet.core.config import settings
+from bakerySpotGourmet.core.constants import PAYMENT_WEBHOOK_SIGNATURE_HEADER
+from bakerySpotGourmet.core.security import verify_webhook_signature
+from bakerySpotGourmet.infrastructure.events.exceptions import EventBusFullException
+from bakerySpotGourmet.schemas.payment import PaymentWebhookAck, PaymentWebhookBatch
+from bakerySpotGourmet.services.payment_webhook_service import PaymentWebhookService
+
+
+logger = structlog.get_logger()
+router = APIRouter()
+
+
+@router.post(
+    "/payments",
+    response_model=PaymentWebhookAck,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def receive_payment_webhook(
+    request: Request,
+    webhook_service: Annotated[PaymentWebhookService, Depends(deps.get_payment_webhook_service)],
+) -> Any:
+    """
+    Receive payment status changes from the gateway.
+    
+    The raw body must carry an HMAC-SHA256 signature made with the shared
+    webhook secret; unsigned or forged deliveries are rejected before they
+    are parsed. Events are deduplicated by event id and queued; they are
+    applied to payments and orders in the background. Redelivered events
+    are acknowledged without being applied again.
+    """
+    body = await request.body()
+    signature = request.headers.get(PAYMENT_WEBHOOK_SIGNATURE_HEADER)
+    if not verify_webhook_signature(body, signature, settings.PAYMENT_WEBHOOK_SECRET):
+        logger.warning("payment_webhook_signature_invalid", signed=signature is not None)
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid webhook signature",
+        )
+    
+    try:
+        batch = PaymentWebhookBatch.model_validate_json(body)
+    except ValidationError as e:
+        raise RequestValidationError(e.errors(include_url=False))
+    
+    try:
+        return webhook_service.accept(batch.events)
+    except EventBusFullException:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Webhook queue is full, retry later",
+            headers={"Retry-After": "1"},
+        )
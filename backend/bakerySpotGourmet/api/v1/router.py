@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from bakerySpotGourmet.api.v1.endpoints import health, users, items, orders, admin
+from bakerySpotGourmet.api.v1.endpoints import health, users, items, orders, admin, webhooks
 
 api_router = APIRouter()
 api_router.include_router(health.router, tags=["system"])
@@ -7,3 +7,4 @@ api_router.include_router(users.router, prefix="/users", tags=["users"])
 api_router.include_router(items.router, prefix="/items", tags=["items"])
 api_router.include_router(orders.router, prefix="/orders", tags=["orders"])
 api_router.include_router(admin.router, prefix="/admin", tags=["admin"])
+api_router.include_router(webhooks.router, prefix="/webhooks", tags=["webhooks"])
@@ -1,8 +1,26 @@
-from typing import List, Union
+from typing import Dict, List, Optional, Union
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import AnyHttpUrl, field_validator
 
+from bakerySpotGourmet.core.constants import (
+    DEFAULT_PAYMENT_GATEWAY_URL,
+    DEFAULT_REQUEST_TIMEOUT_SECONDS,
+    EVENT_LOOP_BLOCK_THRESHOLD_SECONDS,
+    LOG_JSON_SERIALIZER,
+    LOG_SAMPLED_EVENTS,
+    LOG_SAMPLING_PER_SECOND,
+    LOG_SAMPLING_PRIORITY_PER_SECOND,
+    LOG_SAMPLING_SLOW_SECONDS,
+    LOG_QUEUE_OVERFLOW_POLICY,
+    LOG_QUEUE_SIZE,
+    PAYMENT_GATEWAY_KEEPALIVE_EXPIRY_SECONDS,
+    PAYMENT_GATEWAY_MAX_CONNECTIONS,
+    PAYMENT_GATEWAY_MAX_KEEPALIVE_CONNECTIONS,
+    SLOW_REQUEST_LOG_SIZE,
+    SLOW_REQUEST_THRESHOLD_SECONDS,
+)
+
 
 class Settings(BaseSettings):
     PROJECT_NAME: str
@@ -14,6 +32,17 @@ class Settings(BaseSettings):
     LOG_LEVEL: str
     TIMEZONE: str
     
+    # Logging
+    LOG_QUEUE_ENABLED: bool = False  # Render and write logs on a background thread
+    LOG_QUEUE_SIZE: int = LOG_QUEUE_SIZE
+    LOG_QUEUE_OVERFLOW_POLICY: str = LOG_QUEUE_OVERFLOW_POLICY  # drop_newest, drop_oldest or block
+    LOG_JSON_SERIALIZER: str = LOG_JSON_SERIALIZER
+    LOG_SAMPLING_ENABLED: bool = False  # Adaptive sampling of high-volume events
+    LOG_SAMPLED_EVENTS: List[str] = LOG_SAMPLED_EVENTS
+    LOG_SAMPLING_PER_SECOND: float = LOG_SAMPLING_PER_SECOND
+    LOG_SAMPLING_PRIORITY_PER_SECOND: float = LOG_SAMPLING_PRIORITY_PER_SECOND
+    LOG_SAMPLING_SLOW_SECONDS: float = LOG_SAMPLING_SLOW_SECONDS
+    
     # Security
     SECRET_KEY: str
     ALGORITHM: str
@@ -24,6 +53,28 @@ class Settings(BaseSettings):
     HTTP_CLIENT_TIMEOUT: int
     DATABASE_TIMEOUT: int
     EXTERNAL_SERVICE_TIMEOUT: int
+    REQUEST_TIMEOUT_SECONDS: float = DEFAULT_REQUEST_TIMEOUT_SECONDS  # 0 disables request deadlines
+    ROUTE_TIMEOUTS: Dict[str, float] = {}  # Path prefix -> seconds, e.g. {"/api/v1/admin": 60}
+    
+    # Payment Gateway
+    PAYMENT_GATEWAY_URL: str = DEFAULT_PAYMENT_GATEWAY_URL
+    PAYMENT_GATEWAY_MAX_CONNECTIONS: int = PAYMENT_GATEWAY_MAX_CONNECTIONS
+    PAYMENT_GATEWAY_MAX_KEEPALIVE_CONNECTIONS: int = PAYMENT_GATEWAY_MAX_KEEPALIVE_CONNECTIONS
+    PAYMENT_GATEWAY_KEEPALIVE_EXPIRY_SECONDS: float = PAYMENT_GATEWAY_KEEPALIVE_EXPIRY_SECONDS
+    PAYMENT_WEBHOOK_SECRET: Optional[str] = None  # Signs gateway webhooks; unset rejects them all
+    
+    # Request Profiling
+    PROFILING_ENABLED: bool = False
+    PROFILING_TOKEN: Optional[str] = None  # Requests carrying it in X-Profile-Token are profiled
+    CONTINUOUS_PROFILER_ENABLED: bool = False  # Always-on stack sampling of all threads
+    
+    # Slow Request Tracing
+    SLOW_REQUEST_THRESHOLD_SECONDS: float = SLOW_REQUEST_THRESHOLD_SECONDS  # 0 disables
+    SLOW_REQUEST_LOG_SIZE: int = SLOW_REQUEST_LOG_SIZE
+    
+    # Event Loop Monitor
+    EVENT_LOOP_MONITOR_ENABLED: bool = False
+    EVENT_LOOP_BLOCK_THRESHOLD_SECONDS: float = EVENT_LOOP_BLOCK_THRESHOLD_SECONDS
     
     # Rate Limiting
     RATE_LIMIT_ENABLED: bool
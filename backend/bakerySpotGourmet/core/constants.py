@@ -25,6 +25,9 @@ class OrderStatus(str, Enum):
 # HTTP Headers
 REQUEST_ID_HEADER = "X-Request-ID"
 IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+REQUEST_TIMEOUT_HEADER = "X-Request-Timeout"  # Seconds the client is willing to wait
+PROFILE_TOKEN_HEADER = "X-Profile-Token"  # Admin token requesting a profile of the request
+PAYMENT_WEBHOOK_SIGNATURE_HEADER = "X-Webhook-Signature"  # "sha256=" + hex HMAC of the raw body
 
 # Rate Limiting Defaults
 DEFAULT_RATE_LIMIT_PER_MINUTE = 100
@@ -37,8 +40,110 @@ IDEMPOTENCY_TTL_SECONDS = 86400  # 24 hours
 DEFAULT_HTTP_TIMEOUT = 30
 DEFAULT_DB_TIMEOUT = 10
 DEFAULT_EXTERNAL_SERVICE_TIMEOUT = 15
+DEFAULT_REQUEST_TIMEOUT_SECONDS = 30.0  # Whole-request budget, propagated to downstream calls
+
+# Payment Gateway HTTP Pool Defaults
+DEFAULT_PAYMENT_GATEWAY_URL = "http://127.0.0.1:8081"
+PAYMENT_GATEWAY_MAX_CONNECTIONS = 100
+PAYMENT_GATEWAY_MAX_KEEPALIVE_CONNECTIONS = 20
+PAYMENT_GATEWAY_KEEPALIVE_EXPIRY_SECONDS = 30.0
 
 # Circuit Breaker Defaults
 CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5
 CIRCUIT_BREAKER_TIMEOUT_SECONDS = 60
 CIRCUIT_BREAKER_RECOVERY_TIMEOUT = 30
+CIRCUIT_BREAKER_SLIDING_WINDOW_SIZE = 50
+CIRCUIT_BREAKER_MINIMUM_CALLS = 10
+CIRCUIT_BREAKER_FAILURE_RATE_THRESHOLD = 0.5
+CIRCUIT_BREAKER_SLOW_CALL_RATE_THRESHOLD = 0.8
+CIRCUIT_BREAKER_HALF_OPEN_MAX_CALLS = 3
+
+# Retry Budget Defaults
+RETRY_BUDGET_RATIO = 0.1  # Retries may add at most 10% on top of successful calls
+RETRY_BUDGET_MIN_RETRIES_PER_SECOND = 1.0
+RETRY_BUDGET_MAX_TOKENS = 100.0
+
+# Event Bus Defaults
+EVENT_BUS_QUEUE_SIZE = 10000
+EVENT_BUS_BATCH_SIZE = 100
+EVENT_BUS_BATCH_TIMEOUT_SECONDS = 0.05
+
+# Settlement Defaults
+DEFAULT_CURRENCY = "USD"
+SETTLEMENT_BATCH_SIZE = 100
+SETTLEMENT_MAX_CONCURRENCY = 4
+
+# Bulkhead Defaults
+BULKHEAD_MAX_CONCURRENT_CALLS = 50
+BULKHEAD_MAX_QUEUE_SIZE = 50
+BULKHEAD_QUEUE_TIMEOUT_SECONDS = 1.0
+
+# Payment Webhook Defaults
+PAYMENT_WEBHOOK_DEDUP_TTL_SECONDS = 86400  # Gateways retry deliveries for up to a day
+PAYMENT_WEBHOOK_DEDUP_MAX_SIZE = 100000
+PAYMENT_WEBHOOK_QUEUE_SIZE = 10000
+PAYMENT_WEBHOOK_BATCH_SIZE = 200
+PAYMENT_WEBHOOK_MAX_EVENTS_PER_REQUEST = 500
+
+# Metrics Defaults
+METRICS_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+METRICS_UNMATCHED_ROUTE = "unmatched"
+
+# Logging Defaults
+LOG_QUEUE_SIZE = 10000
+LOG_QUEUE_OVERFLOW_POLICY = "drop_newest"
+LOG_JSON_SERIALIZER = "json"  # "orjson" when installed for faster encoding
+
+# Log Sampling Defaults
+LOG_SAMPLED_EVENTS = [
+    "request_started",
+    "request_completed",
+    "creating_order",
+    "order_created",
+    "admin_list_orders",
+    "admin_get_order",
+]
+LOG_SAMPLING_PER_SECOND = 10.0  # Lines per second kept for each event/route
+LOG_SAMPLING_PRIORITY_PER_SECOND = 100.0  # Same, for errors and slow requests
+LOG_SAMPLING_SLOW_SECONDS = 1.0
+
+# Request Profiling Defaults
+PROFILING_INTERVAL_SECONDS = 0.005
+PROFILING_MAX_PROFILES = 50
+
+# Continuous Profiler Defaults
+CONTINUOUS_PROFILER_INTERVAL_SECONDS = 0.02  # 50 Hz
+CONTINUOUS_PROFILER_WINDOW_SECONDS = 60.0
+CONTINUOUS_PROFILER_WINDOWS = 15  # Rolling 15 minutes
+CONTINUOUS_PROFILER_MAX_DEPTH = 64
+CONTINUOUS_PROFILER_TARGET_OVERHEAD = 0.01  # Fraction of one core
+CONTINUOUS_PROFILER_IDLE_FRAMES = (
+    "selectors:EpollSelector.select",
+    "selectors:KqueueSelector.select",
+    "selectors:PollSelector.select",
+    "selectors:SelectSelector.select",
+    "threading:Condition.wait",
+    "threading:Event.wait",
+    "threading:Thread._wait_for_tstate_lock",
+    "queue:Queue.get",
+    "concurrent.futures.thread:_worker",
+)
+
+# Slow Request Tracing Defaults
+SLOW_REQUEST_THRESHOLD_SECONDS = 1.0
+SLOW_REQUEST_LOG_SIZE = 100
+TRACE_MAX_SPANS = 500  # Spans recorded per request; later ones are counted as dropped
+
+# Event Loop Monitor Defaults
+EVENT_LOOP_MONITOR_INTERVAL_SECONDS = 0.05
+EVENT_LOOP_BLOCK_THRESHOLD_SECONDS = 0.1
+EVENT_LOOP_LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+EVENT_LOOP_STACK_DEPTH = 30
+
+# Memory Introspection Defaults
+MEMORY_SIZE_SAMPLE = 1000  # Entries sized per container before extrapolating
+MEMORY_COPY_ATTEMPTS = 3  # Copies of a container changing under the sizing thread
+MEMORY_SNAPSHOT_LIMIT = 10
+MEMORY_TRACEMALLOC_FRAMES = 5
+MEMORY_TOP_ALLOCATIONS = 25
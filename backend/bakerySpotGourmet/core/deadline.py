@@ -0,0 +1,117 @@
+"""
+Request deadline propagation.
+The deadline of the current request lives in a contextvar, so every
+downstream call made on its behalf (retries, circuit breaker, gateway calls,
+repositories) can see how much time is left and stop early.
+
+Deadlines are absolute `time.monotonic()` timestamps, like the `deadline`
+arguments of RetryPolicy and PaymentClient.
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from functools import wraps
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+from bakerySpotGourmet.core.exceptions import DeadlineExceededException
+
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+_request_deadline: ContextVar[Optional[float]] = ContextVar("request_deadline", default=None)
+
+
+def get_deadline() -> Optional[float]:
+    """Get the deadline of the current request, or None outside requests."""
+    return _request_deadline.get()
+
+
+def set_deadline(deadline: Optional[float]) -> Token:
+    """
+    Set the deadline of the current context.
+
+    Args:
+        deadline: Absolute `time.monotonic()` deadline, or None for no deadline
+
+    Returns:
+        Token to restore the previous deadline with `reset_deadline`
+    """
+    return _request_deadline.set(deadline)
+
+
+def reset_deadline(token: Token) -> None:
+    """Restore the deadline that was active before `set_deadline`."""
+    _request_deadline.reset(token)
+
+
+def time_remaining() -> Optional[float]:
+    """Seconds left before the current deadline (may be negative), or None."""
+    deadline = _request_deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def resolve_deadline(deadline: Optional[float] = None) -> Optional[float]:
+    """
+    Combine an explicit deadline with the request deadline.
+
+    Args:
+        deadline: Explicit absolute deadline passed by the caller
+
+    Returns:
+        The earlier of both, or whichever one is set
+    """
+    current = _request_deadline.get()
+    if deadline is None:
+        return current
+    if current is None:
+        return deadline
+    return min(deadline, current)
+
+
+def check_deadline(operation: str) -> None:
+    """
+    Fail fast if the current request deadline has passed.
+
+    Args:
+        operation: Name of the work about to start, for logs and errors
+
+    Raises:
+        DeadlineExceededException: If the deadline has passed
+    """
+    remaining = time_remaining()
+    if remaining is not None and remaining <= 0:
+        raise DeadlineExceededException(operation)
+
+
+def deadline_checked(func: F) -> F:
+    """Decorator calling `check_deadline` before the wrapped function runs."""
+    operation = func.__qualname__
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        check_deadline(operation)
+        return func(*args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
+
+@contextmanager
+def deadline_scope(seconds: float) -> Iterator[float]:
+    """
+    Run a block with a deadline `seconds` from now, never later than the current one.
+
+    Args:
+        seconds: Budget of the block
+
+    Yields:
+        The effective absolute deadline
+    """
+    deadline = resolve_deadline(time.monotonic() + seconds)
+    assert deadline is not None
+    token = set_deadline(deadline)
+    try:
+        yield deadline
+    finally:
+        reset_deadline(token)
@@ -42,6 +42,13 @@ class IdempotencyConflictException(BakeryException):
         super().__init__(message)
 
 
+class DeadlineExceededException(BakeryException, TimeoutError):
+    """Raised when work is attempted after the request deadline has passed."""
+    def __init__(self, operation: str):
+        self.operation = operation
+        super().__init__(f"Request deadline exceeded before {operation}")
+
+
 # Global Exception Handlers
 
 async def bakery_exception_handler(request: Request, exc: BakeryException) -> JSONResponse:
@@ -108,6 +115,20 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     )
 
 
+async def deadline_exceeded_handler(request: Request, exc: DeadlineExceededException) -> JSONResponse:
+    """Handle DeadlineExceededException with 504 status."""
+    logger.warning(
+        "deadline_exceeded",
+        operation=exc.operation,
+        path=request.url.path,
+    )
+    
+    return JSONResponse(
+        status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+        content={"detail": str(exc)},
+    )
+
+
 async def http_exception_handler(request: Request, exc: StarletteHTTPException) -> JSONResponse:
     """
     Handle HTTP exceptions.
@@ -123,6 +144,7 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException)
     return JSONResponse(
         status_code=exc.status_code,
         content={"detail": exc.detail},
+        headers=exc.headers,
     )
 
 
@@ -0,0 +1,129 @@
+"""
+Adaptive sampling of high-volume log events.
+A structlog processor that thins out routine per-request lines under load
+while keeping every line at low volume, and always favouring errors and
+slow requests.
+"""
+import random
+import threading
+import time
+from typing import Any, Dict, Iterable, MutableMapping, Optional, Tuple
+
+import structlog
+
+
+# Log methods whose lines are always treated as priority
+_PRIORITY_METHODS = frozenset({"warning", "warn", "error", "critical", "exception", "fatal"})
+
+_Key = Tuple[str, str, bool]
+
+
+class LogSampler:
+    """
+    Sample log events per event name and route.
+
+    Each (event, route) key gets a per-second target. A key's sample rate is
+    `target / volume`, where volume is the larger of last second's count and
+    the count so far this second, so quiet keys keep every line and busy keys
+    converge on roughly `target` lines per second. Errors and slow requests
+    use the much higher priority target, so they are kept unless they storm.
+
+    Kept lines carry `sample_rate`; summing `1 / sample_rate` over kept lines
+    gives an unbiased estimate of the real event count.
+    """
+
+    def __init__(
+        self,
+        events: Iterable[str],
+        per_second: float,
+        priority_per_second: float,
+        slow_seconds: float,
+        rng: Optional[random.Random] = None,
+    ):
+        """
+        Initialize the sampler.
+
+        Args:
+            events: Event names subject to sampling; others pass through
+            per_second: Target lines per second for each routine key
+            priority_per_second: Target lines per second for each error/slow key
+            slow_seconds: `duration_seconds` at or above which a line is priority
+            rng: Random source, injectable for tests
+        """
+        if per_second <= 0 or priority_per_second <= 0:
+            raise ValueError("Sampling targets must be positive")
+        self.events = frozenset(events)
+        self.per_second = per_second
+        self.priority_per_second = priority_per_second
+        self.slow_seconds = slow_seconds
+        self._rng = rng or random.Random()
+        self._lock = threading.Lock()
+        self._window = int(time.monotonic())
+        self._current: Dict[_Key, int] = {}
+        self._previous: Dict[_Key, int] = {}
+        self.kept = 0
+        self.dropped = 0
+
+    def _is_priority(self, method_name: str, event_dict: MutableMapping[str, Any]) -> bool:
+        if method_name in _PRIORITY_METHODS or "exc_info" in event_dict:
+            return True
+        status_code = event_dict.get("status_code")
+        if isinstance(status_code, int) and status_code >= 500:
+            return True
+        duration = event_dict.get("duration_seconds")
+        return isinstance(duration, (int, float)) and duration >= self.slow_seconds
+
+    def _sample(self, key: _Key, target: float) -> Optional[float]:
+        """
+        Count the event and decide whether to keep it.
+
+        Returns:
+            The keep probability if the line is kept, None if it is dropped
+        """
+        window = int(time.monotonic())
+        with self._lock:
+            if window != self._window:
+                # Only the immediately preceding second informs the rate
+                self._previous = self._current if window == self._window + 1 else {}
+                self._current = {}
+                self._window = window
+            seen = self._current.get(key, 0) + 1
+            self._current[key] = seen
+            volume = max(seen, self._previous.get(key, 0))
+            rate = 1.0 if volume <= target else target / volume
+            if rate < 1.0 and self._rng.random() >= rate:
+                self.dropped += 1
+                return None
+            self.kept += 1
+        return rate
+
+    def __call__(
+        self, logger: Any, method_name: str, event_dict: MutableMapping[str, Any]
+    ) -> MutableMapping[str, Any]:
+        event = event_dict.get("event")
+        if event not in self.events:
+            return event_dict
+
+        priority = self._is_priority(method_name, event_dict)
+        route = event_dict.get("route") or event_dict.get("path") or ""
+        target = self.priority_per_second if priority else self.per_second
+        rate = self._sample((event, route, priority), target)
+
+        if rate is None:
+            raise structlog.DropEvent
+        event_dict["sample_rate"] = round(rate, 6)
+        return event_dict
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get sampler statistics.
+
+        Returns:
+            Dictionary with kept and dropped line counters
+        """
+        with self._lock:
+            return {
+                "kept": self.kept,
+                "dropped": self.dropped,
+                "tracked_keys": len(self._current),
+            }
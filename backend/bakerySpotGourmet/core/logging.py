@@ -1,15 +1,123 @@
+import json
 import logging
+import queue
 import sys
-from typing import Any
+import threading
+from enum import Enum
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Callable, Optional
 
 import structlog
 from bakerySpotGourmet.core.config import settings
+from bakerySpotGourmet.core.log_sampling import LogSampler
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+class LogOverflowPolicy(str, Enum):
+    """What to do when the log queue is full."""
+    DROP_NEWEST = "drop_newest"  # Discard the record being logged
+    DROP_OLDEST = "drop_oldest"  # Evict the oldest queued record to make room
+    BLOCK = "block"              # Wait for the writer thread
+
+
+class _BoundedQueueHandler(QueueHandler):
+    """
+    Queue handler that leaves rendering to the writer thread.
+    The stock QueueHandler formats records before enqueueing them, which
+    would keep JSON encoding on the event loop.
+    """
+
+    def __init__(self, log_queue: "queue.Queue[Any]", overflow_policy: LogOverflowPolicy):
+        super().__init__(log_queue)
+        self.overflow_policy = overflow_policy
+        self.dropped = 0
+        self._drop_lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if not isinstance(record.msg, dict):
+            # Foreign stdlib records: bind %-args now, they may be mutated later
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.overflow_policy == LogOverflowPolicy.BLOCK:
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+        if self.overflow_policy == LogOverflowPolicy.DROP_OLDEST:
+            try:
+                self.queue.get_nowait()
+                self.queue.put_nowait(record)
+            except (queue.Empty, queue.Full):
+                pass
+        with self._drop_lock:
+            self.dropped += 1
+
+
+class _BlockingSentinelListener(QueueListener):
+    """Queue listener whose stop sentinel waits for room in a bounded queue."""
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+
+# Background writer state, set by setup_logging in queue mode
+_queue_handler: Optional[_BoundedQueueHandler] = None
+_queue_listener: Optional[QueueListener] = None
+# Sampler of high-volume events, set by setup_logging when sampling is enabled
+_log_sampler: Optional[LogSampler] = None
+
+
+def _json_serializer() -> Callable[..., str]:
+    """Serializer for JSONRenderer per LOG_JSON_SERIALIZER, falling back to json."""
+    if settings.LOG_JSON_SERIALIZER == "orjson":
+        if orjson is not None:
+            def dumps(obj: Any, **kwargs: Any) -> str:
+                return orjson.dumps(
+                    obj, default=kwargs.get("default"), option=orjson.OPT_NON_STR_KEYS
+                ).decode()
+            return dumps
+        logging.getLogger(__name__).warning("orjson is not installed; using json for logs")
+    return json.dumps
+
+
+def _renderer() -> Any:
+    if settings.DEBUG:
+        # Development renderer
+        return structlog.dev.ConsoleRenderer()
+    # Production renderer (JSON)
+    return structlog.processors.JSONRenderer(serializer=_json_serializer())
 
 
 def setup_logging() -> None:
     """
     Configure strict JSON logging for production and readable console logging for development.
+
+    With LOG_QUEUE_ENABLED, callers only merge context and enqueue the event;
+    a background thread renders and writes it, so logging never blocks the
+    event loop on encoding or stdout. Call `shutdown_logging` to flush.
+
+    With LOG_SAMPLING_ENABLED, high-volume events are sampled first, before
+    any other processor spends time on them.
     """
+    global _log_sampler
+    _log_sampler = LogSampler(
+        events=settings.LOG_SAMPLED_EVENTS,
+        per_second=settings.LOG_SAMPLING_PER_SECOND,
+        priority_per_second=settings.LOG_SAMPLING_PRIORITY_PER_SECOND,
+        slow_seconds=settings.LOG_SAMPLING_SLOW_SECONDS,
+    ) if settings.LOG_SAMPLING_ENABLED else None
+    sampling: list[Any] = [_log_sampler] if _log_sampler is not None else []
+
     shared_processors: list[Any] = [
         structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_logger_name,
@@ -21,16 +129,15 @@ def setup_logging() -> None:
         structlog.processors.UnicodeDecoder(),
     ]
 
-    if settings.DEBUG:
-        # Development processors
-        processors = shared_processors + [
-            structlog.dev.ConsoleRenderer(),
+    # Replace a writer left by a previous setup
+    shutdown_logging()
+
+    if settings.LOG_QUEUE_ENABLED:
+        processors = sampling + shared_processors + [
+            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ]
     else:
-        # Production processors (JSON)
-        processors = shared_processors + [
-            structlog.processors.JSONRenderer(),
-        ]
+        processors = sampling + shared_processors + [_renderer()]
 
     structlog.configure(
         processors=processors,
@@ -40,9 +147,76 @@ def setup_logging() -> None:
         cache_logger_on_first_use=True,
     )
 
+    if settings.LOG_QUEUE_ENABLED:
+        _start_queue_writer(shared_processors)
+        return
+
     # Standard library logging configuration
     logging.basicConfig(
         format="%(message)s",
         stream=sys.stdout,
         level=settings.LOG_LEVEL,
     )
+
+
+def _start_queue_writer(foreign_pre_chain: list[Any]) -> None:
+    """Route all stdlib logging through the bounded queue to a writer thread."""
+    global _queue_handler, _queue_listener
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(structlog.stdlib.ProcessorFormatter(
+        processors=[
+            structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+            _renderer(),
+        ],
+        # Records from other libraries get the same fields as ours
+        foreign_pre_chain=foreign_pre_chain,
+    ))
+
+    log_queue: "queue.Queue[Any]" = queue.Queue(maxsize=settings.LOG_QUEUE_SIZE)
+    _queue_handler = _BoundedQueueHandler(
+        log_queue, LogOverflowPolicy(settings.LOG_QUEUE_OVERFLOW_POLICY)
+    )
+    _queue_listener = _BlockingSentinelListener(log_queue, stream_handler)
+
+    root = logging.getLogger()
+    root.addHandler(_queue_handler)
+    root.setLevel(settings.LOG_LEVEL)
+    _queue_listener.start()
+
+
+def shutdown_logging() -> None:
+    """
+    Flush queued log records and stop the writer thread.
+    Does nothing when logging is synchronous.
+    """
+    global _queue_handler, _queue_listener
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+    if _queue_listener is not None:
+        # Writes out everything already queued before returning
+        _queue_listener.stop()
+    _queue_handler = None
+    _queue_listener = None
+
+
+def get_logging_stats() -> dict[str, Any]:
+    """
+    Get log writer statistics.
+
+    Returns:
+        Dictionary with the logging mode, queue depth, records dropped by the
+        queue and lines dropped by sampling
+    """
+    handler = _queue_handler
+    sampled_out = _log_sampler.dropped if _log_sampler is not None else 0
+    if handler is None:
+        return {"mode": "sync", "queued": 0, "capacity": 0, "dropped": 0, "sampled_out": sampled_out}
+    return {
+        "mode": "queue",
+        "queued": handler.queue.qsize(),
+        "capacity": handler.queue.maxsize,
+        "dropped": handler.dropped,
+        "overflow_policy": handler.overflow_policy.value,
+        "sampled_out": sampled_out,
+    }
@@ -0,0 +1,202 @@
+"""
+Event loop lag monitor.
+Measures how late the event loop runs a periodic heartbeat, and captures the
+loop thread's stack when a single callback blocks it beyond a threshold.
+"""
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from typing import Any, Dict, List, Optional
+
+import structlog
+
+from bakerySpotGourmet.core.config import settings
+from bakerySpotGourmet.core.constants import (
+    EVENT_LOOP_LAG_BUCKETS,
+    EVENT_LOOP_MONITOR_INTERVAL_SECONDS,
+    EVENT_LOOP_STACK_DEPTH,
+)
+from bakerySpotGourmet.core.metrics import MetricsRegistry, get_metrics_registry
+
+
+logger = structlog.get_logger()
+
+
+class EventLoopMonitor:
+    """
+    Event loop lag and blocking call detector.
+
+    A heartbeat task sleeps for `interval` and records how much later than
+    requested it woke up in the `event_loop_lag_seconds` histogram; lag at or
+    above `block_threshold` also counts in `event_loop_blocked_total`. A
+    watchdog thread notices a heartbeat that is overdue by the threshold while
+    the loop is still blocked, and logs the loop thread's stack at that
+    moment, which points at the blocking call (a password hash, a synchronous
+    repository, a `time.sleep`). Each blocking episode is logged once.
+    """
+
+    def __init__(
+        self,
+        interval: float = EVENT_LOOP_MONITOR_INTERVAL_SECONDS,
+        block_threshold: Optional[float] = None,
+        stack_depth: int = EVENT_LOOP_STACK_DEPTH,
+        registry: Optional[MetricsRegistry] = None,
+    ):
+        """
+        Initialize the monitor.
+
+        Args:
+            interval: Seconds between heartbeats
+            block_threshold: Lag counted as blocking, defaults to settings.EVENT_LOOP_BLOCK_THRESHOLD_SECONDS
+            stack_depth: Innermost frames logged for a blocking call
+            registry: Where lag metrics go, defaults to the global registry
+        """
+        self.interval = interval
+        self.block_threshold = (
+            settings.EVENT_LOOP_BLOCK_THRESHOLD_SECONDS if block_threshold is None else block_threshold
+        )
+        self.stack_depth = stack_depth
+        registry = registry or get_metrics_registry()
+        self._lag = registry.histogram(
+            "event_loop_lag_seconds",
+            "Delay of the event loop heartbeat beyond its scheduled time.",
+            buckets=EVENT_LOOP_LAG_BUCKETS,
+        )
+        self._blocked = registry.counter(
+            "event_loop_blocked_total",
+            "Heartbeats delayed by at least the blocking threshold.",
+        )
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._loop_thread_id: Optional[int] = None
+        self._last_tick = 0.0
+        # Tick of the last captured stall; None until one is captured
+        self._reported_tick: Optional[float] = None
+        self.ticks = 0
+        self.max_lag = 0.0
+        self.blocked = 0
+        self.stacks_captured = 0
+        self.last_blocked: Optional[Dict[str, Any]] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the heartbeat task is running."""
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """Start the heartbeat on the running loop and the watchdog thread."""
+        if self.running:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._last_tick = time.monotonic()
+        self._reported_tick = None
+        self._stop.clear()
+        self._task = asyncio.create_task(self._heartbeat(), name="event-loop-monitor")
+        self._thread = threading.Thread(target=self._watch, name="event-loop-watchdog", daemon=True)
+        self._thread.start()
+
+    async def stop(self) -> None:
+        """Stop the heartbeat and the watchdog thread."""
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    async def _heartbeat(self) -> None:
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            self.record(max(0.0, now - expected))
+            self._last_tick = now
+
+    def record(self, lag: float) -> None:
+        """
+        Record one heartbeat's lag.
+
+        Args:
+            lag: Seconds the heartbeat ran late
+        """
+        self.ticks += 1
+        self.max_lag = max(self.max_lag, lag)
+        self._lag.observe(lag)
+        if lag >= self.block_threshold:
+            self.blocked += 1
+            self._blocked.inc()
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.block_threshold / 4):
+            self.check()
+
+    def check(self) -> bool:
+        """
+        Log the loop thread's stack if the heartbeat is overdue.
+
+        Returns:
+            True if a blocking call was captured by this check
+        """
+        tick = self._last_tick
+        stalled = time.monotonic() - tick - self.interval
+        if stalled < self.block_threshold or tick == self._reported_tick:
+            return False
+        frame = sys._current_frames().get(self._loop_thread_id or 0)
+        if frame is None:
+            return False
+        self._reported_tick = tick
+        loop_stack = self._format_stack(frame)
+        self.stacks_captured += 1
+        self.last_blocked = {
+            "at": time.time(),
+            "blocked_seconds": round(stalled, 3),
+            "loop_stack": loop_stack,
+        }
+        logger.warning(
+            "event_loop_blocked",
+            blocked_seconds=round(stalled, 3),
+            threshold_seconds=self.block_threshold,
+            loop_stack=loop_stack,
+        )
+        return True
+
+    def _format_stack(self, frame: Any) -> List[str]:
+        """Innermost frames of the blocked loop thread, outermost first."""
+        summary = traceback.extract_stack(frame)[-self.stack_depth:]
+        return [f"{entry.filename}:{entry.lineno} in {entry.name}" for entry in summary]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get monitor statistics.
+
+        Returns:
+            Dictionary with heartbeat counters, lag quantiles and the last captured block
+        """
+        return {
+            "running": self.running,
+            "interval_seconds": self.interval,
+            "block_threshold_seconds": self.block_threshold,
+            "ticks": self.ticks,
+            "max_lag_seconds": round(self.max_lag, 6),
+            "p99_lag_seconds": self._lag.quantile(0.99),
+            "blocked": self.blocked,
+            "stacks_captured": self.stacks_captured,
+            "last_blocked": self.last_blocked,
+        }
+
+
+# Global event loop monitor instance
+_event_loop_monitor = EventLoopMonitor()
+
+
+def get_event_loop_monitor() -> EventLoopMonitor:
+    """Get the global event loop monitor."""
+    return _event_loop_monitor
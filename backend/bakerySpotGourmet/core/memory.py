@@ -0,0 +1,384 @@
+"""
+Memory introspection for in-process stores.
+Reports entry counts and approximate deep sizes of registered stores, and
+takes tracemalloc snapshots on demand to diff allocations over time.
+"""
+import itertools
+import os
+import sys
+import threading
+import time
+import tracemalloc
+import types
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import structlog
+
+from bakerySpotGourmet.core.constants import (
+    MEMORY_COPY_ATTEMPTS,
+    MEMORY_SIZE_SAMPLE,
+    MEMORY_SNAPSHOT_LIMIT,
+    MEMORY_TRACEMALLOC_FRAMES,
+)
+
+
+logger = structlog.get_logger()
+
+# Shared by the whole process rather than owned by a store
+_SKIPPED_TYPES = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodType,
+    types.CodeType,
+    types.FrameType,
+    Enum,
+)
+_CONTAINERS = (list, tuple, set, frozenset)
+
+
+def _copy(entries: Iterable[Any], limit: int) -> Optional[List[Any]]:
+    """
+    First `limit` entries of a container another thread may be changing.
+
+    Stores are sized off the event loop without their owners' locks, so
+    iteration can fail mid-way; it is retried a few times before giving up.
+    """
+    for _ in range(MEMORY_COPY_ATTEMPTS):
+        try:
+            return list(itertools.islice(entries, limit))
+        except RuntimeError:  # Changed size during iteration
+            continue
+    return None
+
+
+def _children(obj: Any, limit: int) -> Tuple[int, Optional[List[Any]]]:
+    """
+    Number of referenced objects and up to `limit` of them (entries for
+    containers); None when a changing container could not be copied.
+    """
+    if isinstance(obj, dict):
+        items = _copy(obj.items(), limit)
+        return len(obj), None if items is None else list(itertools.chain.from_iterable(items))
+    if isinstance(obj, _CONTAINERS) or type(obj).__name__ == "deque":
+        return len(obj), _copy(obj, limit)
+    referents: List[Any] = []
+    if hasattr(obj, "__dict__"):
+        referents.append(obj.__dict__)
+    for cls in type(obj).__mro__:
+        for slot in getattr(cls, "__slots__", ()):
+            if slot not in ("__dict__", "__weakref__") and hasattr(obj, slot):
+                referents.append(getattr(obj, slot))
+    return len(referents), referents
+
+
+def deep_sizeof(obj: Any, sample: int = MEMORY_SIZE_SAMPLE) -> Tuple[int, bool]:
+    """
+    Approximate the memory retained by an object and everything it references.
+
+    Containers with more than `sample` entries are sized from their first
+    `sample` entries, scaled to the full length, so sizing a store with
+    millions of entries stays cheap. Objects shared by the whole process
+    (classes, modules, functions, enum members) are not counted. A container
+    that keeps changing while it is copied is sized without its entries,
+    which also marks the result as sampled.
+
+    Args:
+        obj: The object to size
+        sample: Entries sized per container before extrapolating
+
+    Returns:
+        Approximate size in bytes, and whether any container was sampled
+    """
+    seen = set()
+    total = 0.0
+    sampled = False
+    stack: List[Tuple[Any, float]] = [(obj, 1.0)]
+    while stack:
+        current, weight = stack.pop()
+        if id(current) in seen or isinstance(current, _SKIPPED_TYPES):
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current) * weight
+        length, referents = _children(current, sample)
+        if referents is None:
+            sampled = True
+            continue
+        if length > sample:
+            sampled = True
+            weight *= length / sample
+        stack.extend((child, weight) for child in referents)
+    return int(total), sampled
+
+
+@dataclass
+class _Store:
+    target: Any
+    count: Optional[Callable[[], int]]
+
+
+class MemoryRegistry:
+    """
+    Registry of long-lived in-process stores to report on.
+
+    Stores are registered next to the instance that owns them, e.g. the
+    rate limiter and the idempotency store, so the report always covers
+    every store the process keeps in memory.
+    """
+
+    def __init__(self, sample: int = MEMORY_SIZE_SAMPLE):
+        """
+        Initialize the registry.
+
+        Args:
+            sample: Entries sized per container before extrapolating
+        """
+        self.sample = sample
+        self._stores: Dict[str, _Store] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, target: Any, count: Optional[Callable[[], int]] = None) -> None:
+        """
+        Register a store, replacing any store of the same name.
+
+        Args:
+            name: Name shown in the report
+            target: The object owning the store's memory
+            count: Returns the number of entries, defaults to len(target)
+        """
+        with self._lock:
+            self._stores[name] = _Store(target, count)
+
+    def unregister(self, name: str) -> None:
+        """Remove a store from the report."""
+        with self._lock:
+            self._stores.pop(name, None)
+
+    def names(self) -> List[str]:
+        """Names of the registered stores, sorted."""
+        with self._lock:
+            return sorted(self._stores)
+
+    def report(self) -> List[Dict[str, Any]]:
+        """
+        Size every registered store.
+
+        Returns:
+            One entry per store with its entry count and approximate deep size,
+            largest first
+        """
+        with self._lock:
+            stores = list(self._stores.items())
+        rows = []
+        for name, store in stores:
+            started = time.perf_counter()
+            size, sampled = deep_sizeof(store.target, self.sample)
+            if store.count is not None:
+                entries: Optional[int] = store.count()
+            else:
+                entries = len(store.target) if hasattr(store.target, "__len__") else None
+            rows.append({
+                "name": name,
+                "type": type(store.target).__name__,
+                "entries": entries,
+                "approx_bytes": size,
+                "sampled": sampled,
+                "sizing_seconds": round(time.perf_counter() - started, 6),
+            })
+        rows.sort(key=lambda row: row["approx_bytes"], reverse=True)
+        return rows
+
+
+class TracemallocSnapshots:
+    """
+    On-demand tracemalloc snapshots for leak hunting.
+
+    Tracing starts with the first snapshot and costs memory and CPU on every
+    allocation until `stop` is called, so it is off until an admin asks for
+    it. Take a snapshot, let traffic run, take another and diff the two:
+    allocation sites that keep growing point at the leak. The newest
+    `max_snapshots` snapshots are kept.
+    """
+
+    def __init__(self, max_snapshots: int = MEMORY_SNAPSHOT_LIMIT, frames: int = MEMORY_TRACEMALLOC_FRAMES):
+        """
+        Initialize the snapshot store.
+
+        Args:
+            max_snapshots: Snapshots kept before the oldest is dropped
+            frames: Traceback frames stored per allocation when tracing starts
+        """
+        self.max_snapshots = max_snapshots
+        self.frames = frames
+        self._snapshots: "OrderedDict[int, Tuple[tracemalloc.Snapshot, Dict[str, Any]]]" = OrderedDict()
+        self._counter = itertools.count(1)
+        self._lock = threading.Lock()
+
+    @property
+    def tracing(self) -> bool:
+        """Whether tracemalloc is tracing allocations."""
+        return tracemalloc.is_tracing()
+
+    def take(self) -> Dict[str, Any]:
+        """
+        Take a snapshot, starting tracemalloc first if needed.
+
+        Allocations made before tracing started are not traced, so the first
+        snapshot is a baseline for later ones.
+
+        Returns:
+            Summary of the new snapshot
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            logger.info("tracemalloc_started", frames=self.frames)
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+            tracemalloc.Filter(False, "<unknown>"),
+        ))
+        current, peak = tracemalloc.get_traced_memory()
+        stats = snapshot.statistics("filename")
+        with self._lock:
+            summary = {
+                "id": next(self._counter),
+                "taken_at": time.time(),
+                "traced_bytes": current,
+                "peak_traced_bytes": peak,
+                "snapshot_bytes": sum(stat.size for stat in stats),
+                "blocks": sum(stat.count for stat in stats),
+            }
+            self._snapshots[summary["id"]] = (snapshot, summary)
+            while len(self._snapshots) > self.max_snapshots:
+                self._snapshots.popitem(last=False)
+        return summary
+
+    def list(self) -> List[Dict[str, Any]]:
+        """Summaries of the kept snapshots, oldest first."""
+        with self._lock:
+            return [summary for _, summary in self._snapshots.values()]
+
+    def _get(self, snapshot_id: int) -> tracemalloc.Snapshot:
+        with self._lock:
+            return self._snapshots[snapshot_id][0]
+
+    def top(self, snapshot_id: int, limit: int = 25, key_type: str = "lineno") -> List[Dict[str, Any]]:
+        """
+        Largest allocation sites of a snapshot.
+
+        Args:
+            snapshot_id: ID of a kept snapshot
+            limit: Sites returned
+            key_type: Group allocations by "lineno", "filename" or "traceback"
+
+        Returns:
+            Allocation sites with their size and block count, largest first
+
+        Raises:
+            KeyError: If the snapshot is not kept
+        """
+        stats = self._get(snapshot_id).statistics(key_type)[:limit]
+        return [
+            {"location": self._location(stat.traceback), "size_bytes": stat.size, "count": stat.count}
+            for stat in stats
+        ]
+
+    def diff(self, first_id: int, second_id: int, limit: int = 25, key_type: str = "lineno") -> List[Dict[str, Any]]:
+        """
+        Allocation sites that changed most between two snapshots.
+
+        Args:
+            first_id: ID of the earlier snapshot
+            second_id: ID of the later snapshot
+            limit: Sites returned
+            key_type: Group allocations by "lineno", "filename" or "traceback"
+
+        Returns:
+            Allocation sites with their size and block count in the second
+            snapshot and the change from the first, largest change first
+
+        Raises:
+            KeyError: If either snapshot is not kept
+        """
+        stats = self._get(second_id).compare_to(self._get(first_id), key_type)[:limit]
+        return [
+            {
+                "location": self._location(stat.traceback),
+                "size_bytes": stat.size,
+                "size_diff_bytes": stat.size_diff,
+                "count": stat.count,
+                "count_diff": stat.count_diff,
+            }
+            for stat in stats
+        ]
+
+    @staticmethod
+    def _location(traceback: tracemalloc.Traceback) -> List[str]:
+        """Frames of an allocation site, innermost first."""
+        return [f"{frame.filename}:{frame.lineno}" for frame in traceback]
+
+    def stop(self) -> None:
+        """Stop tracing and drop the kept snapshots."""
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+            logger.info("tracemalloc_stopped")
+        with self._lock:
+            self._snapshots.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get tracemalloc statistics.
+
+        Returns:
+            Dictionary with the tracing state, traced memory and kept snapshots
+        """
+        current, peak = tracemalloc.get_traced_memory()
+        return {
+            "tracing": self.tracing,
+            "frames": tracemalloc.get_traceback_limit() if self.tracing else self.frames,
+            "traced_bytes": current,
+            "peak_traced_bytes": peak,
+            "tracemalloc_overhead_bytes": tracemalloc.get_tracemalloc_memory(),
+            "snapshots": len(self._snapshots),
+        }
+
+
+def get_rss_bytes() -> Optional[int]:
+    """Current resident set size of the process, where the platform reports it."""
+    try:
+        with open("/proc/self/statm") as statm:
+            pages = int(statm.read().split()[1])
+    except (OSError, IndexError, ValueError):  # Not Linux
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def get_max_rss_bytes() -> Optional[int]:
+    """Peak resident set size of the process, where the platform reports it."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+# Global memory registry and snapshot store instances
+_memory_registry = MemoryRegistry()
+_tracemalloc_snapshots = TracemallocSnapshots()
+
+
+def get_memory_registry() -> MemoryRegistry:
+    """Get the global memory registry."""
+    return _memory_registry
+
+
+def get_tracemalloc_snapshots() -> TracemallocSnapshots:
+    """Get the global tracemalloc snapshot store."""
+    return _tracemalloc_snapshots
@@ -0,0 +1,356 @@
+"""
+In-process metrics registry.
+Counters, gauges and fixed-bucket histograms rendered in the Prometheus text
+exposition format. Recording is a dict lookup plus a lock-protected update,
+cheap enough for the request path.
+"""
+import bisect
+import math
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from bakerySpotGourmet.core.constants import METRICS_LATENCY_BUCKETS
+from bakerySpotGourmet.core.memory import get_memory_registry
+
+
+LabelValues = Tuple[str, ...]
+GaugeCallback = Callable[[], Dict[LabelValues, float]]
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+class _Metric:
+    """Common metric metadata and label formatting."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _check_labels(self, labels: LabelValues) -> None:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {len(labels)} values"
+            )
+
+    def _label_text(self, labels: LabelValues, extra: Optional[Tuple[str, str]] = None) -> str:
+        pairs = [f'{name}="{_escape(value)}"' for name, value in zip(self.labelnames, labels)]
+        if extra is not None:
+            pairs.append(f'{extra[0]}="{extra[1]}"')
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def _header(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+
+    def render(self) -> List[str]:
+        """Render the metric as text exposition lines."""
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """
+    Monotonically increasing value per label set.
+    Either incremented directly or read at scrape time from a cumulative
+    count a component already keeps.
+    """
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._callback: Optional[GaugeCallback] = None
+
+    def inc(self, labels: LabelValues = (), amount: float = 1.0) -> None:
+        """
+        Increase the counter.
+
+        Args:
+            labels: Label values, in the order of labelnames
+            amount: Non-negative increment
+        """
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        with self._lock:
+            current = self._values.get(labels)
+            if current is None:
+                self._check_labels(labels)
+                current = 0.0
+            self._values[labels] = current + amount
+
+    def set_function(self, callback: GaugeCallback) -> None:
+        """
+        Read the counter at scrape time.
+
+        Args:
+            callback: Returns never-decreasing values keyed by label values;
+                replaces incremented values
+        """
+        self._callback = callback
+
+    def value(self, labels: LabelValues = ()) -> float:
+        """Current value for a label set."""
+        return self._collect().get(labels, 0.0)
+
+    def _collect(self) -> Dict[LabelValues, float]:
+        if self._callback is not None:
+            return self._callback()
+        with self._lock:
+            return dict(self._values)
+
+    def render(self) -> List[str]:
+        values = sorted(self._collect().items())
+        lines = self._header()
+        lines.extend(f"{self.name}{self._label_text(k)} {_format_value(v)}" for k, v in values)
+        return lines
+
+
+class Gauge(_Metric):
+    """
+    Value that can go up and down.
+    Either set directly or computed at scrape time by a callback, which keeps
+    the hot path free of bookkeeping for values the app already tracks.
+    """
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._callback: Optional[GaugeCallback] = None
+
+    def set(self, value: float, labels: LabelValues = ()) -> None:
+        """Set the gauge for a label set."""
+        self._check_labels(labels)
+        with self._lock:
+            self._values[labels] = value
+
+    def inc(self, labels: LabelValues = (), amount: float = 1.0) -> None:
+        """Add to the gauge for a label set."""
+        with self._lock:
+            current = self._values.get(labels)
+            if current is None:
+                self._check_labels(labels)
+                current = 0.0
+            self._values[labels] = current + amount
+
+    def dec(self, labels: LabelValues = (), amount: float = 1.0) -> None:
+        """Subtract from the gauge for a label set."""
+        self.inc(labels, -amount)
+
+    def set_function(self, callback: GaugeCallback) -> None:
+        """
+        Compute the gauge at scrape time.
+
+        Args:
+            callback: Returns values keyed by label values; replaces set values
+        """
+        self._callback = callback
+
+    def value(self, labels: LabelValues = ()) -> float:
+        """Current value for a label set."""
+        return self._collect().get(labels, 0.0)
+
+    def _collect(self) -> Dict[LabelValues, float]:
+        if self._callback is not None:
+            return self._callback()
+        with self._lock:
+            return dict(self._values)
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        for labels, value in sorted(self._collect().items()):
+            lines.append(f"{self.name}{self._label_text(labels)} {_format_value(value)}")
+        return lines
+
+
+class _HistogramSeries:
+    """Bucket counts, sum and count of one label set."""
+
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, buckets: int):
+        self.counts = [0] * buckets
+        self.sum = 0.0
+        self.count = 0
+
+
+class Histogram(_Metric):
+    """
+    Fixed-bucket histogram per label set.
+    Observations cost one binary search; quantiles are estimated by linear
+    interpolation inside the bucket, like Prometheus' histogram_quantile.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Iterable[float] = METRICS_LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        bounds = sorted(float(b) for b in buckets)
+        if not bounds:
+            raise ValueError("Histogram needs at least one bucket")
+        if not math.isinf(bounds[-1]):
+            bounds.append(math.inf)
+        self.buckets = tuple(bounds)
+        self._series: Dict[LabelValues, _HistogramSeries] = {}
+
+    def observe(self, value: float, labels: LabelValues = ()) -> None:
+        """
+        Record an observation.
+
+        Args:
+            value: Observed value, e.g. seconds
+            labels: Label values, in the order of labelnames
+        """
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                self._check_labels(labels)
+                series = self._series[labels] = _HistogramSeries(len(self.buckets))
+            series.counts[index] += 1
+            series.sum += value
+            series.count += 1
+
+    def count(self, labels: LabelValues = ()) -> int:
+        """Number of observations for a label set."""
+        with self._lock:
+            series = self._series.get(labels)
+            return series.count if series else 0
+
+    def quantile(self, q: float, labels: LabelValues = ()) -> Optional[float]:
+        """
+        Estimate a quantile from the buckets.
+
+        Args:
+            q: Quantile between 0 and 1, e.g. 0.99
+            labels: Label values of the series
+
+        Returns:
+            Estimated value, or None without observations
+        """
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None or series.count == 0:
+                return None
+            counts = list(series.counts)
+            total = series.count
+
+        rank = q * total
+        cumulative = 0
+        for index, bucket_count in enumerate(counts):
+            if cumulative + bucket_count >= rank and bucket_count > 0:
+                upper = self.buckets[index]
+                lower = self.buckets[index - 1] if index > 0 else 0.0
+                if math.isinf(upper):
+                    # Nothing is known above the last finite bound
+                    return lower
+                return lower + (upper - lower) * (rank - cumulative) / bucket_count
+            cumulative += bucket_count
+        return self.buckets[-2] if len(self.buckets) > 1 else None
+
+    def render(self) -> List[str]:
+        with self._lock:
+            snapshot = sorted(
+                (labels, list(s.counts), s.sum, s.count) for labels, s in self._series.items()
+            )
+        lines = self._header()
+        for labels, counts, total_sum, total_count in snapshot:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                le = ("le", _format_value(bound))
+                lines.append(f"{self.name}_bucket{self._label_text(labels, le)} {cumulative}")
+            label_text = self._label_text(labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(total_sum)}")
+            lines.append(f"{self.name}_count{label_text} {total_count}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Named collection of metrics.
+    Creating a metric that already exists returns the existing instance, so
+    modules can declare the metrics they record at import time.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls: type, name: str, *args: object, **kwargs: object) -> _Metric:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = cls(name, *args, **kwargs)
+                self._metrics[name] = metric
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Metric {name} already registered as {metric.kind}")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Get or create a counter."""
+        return self._get_or_create(Counter, name, documentation, labelnames)  # type: ignore[return-value]
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Get or create a gauge."""
+        return self._get_or_create(Gauge, name, documentation, labelnames)  # type: ignore[return-value]
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Iterable[float] = METRICS_LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Get or create a histogram."""
+        return self._get_or_create(  # type: ignore[return-value]
+            Histogram, name, documentation, labelnames, buckets=buckets
+        )
+
+    def get(self, name: str) -> Optional[_Metric]:
+        """Look up a metric by name."""
+        with self._lock:
+            return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# Global metrics registry instance
+_metrics_registry = MetricsRegistry()
+get_memory_registry().register("metrics_registry", _metrics_registry, lambda: len(_metrics_registry._metrics))
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Get the global metrics registry."""
+    return _metrics_registry
@@ -1,96 +1,502 @@
 """
 Middleware for request handling.
-Includes request ID generation, timing, and logging context injection.
+Includes request ID generation, timing, deadlines, slow request tracing, and logging context injection.
 """
+import asyncio
+import hmac
 import time
 import uuid
-from typing import Callable
+from typing import Dict, Optional
 
 import structlog
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import Request
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from bakerySpotGourmet.core.constants import REQUEST_ID_HEADER
+from bakerySpotGourmet.core.config import settings
+from bakerySpotGourmet.core.constants import (
+    METRICS_UNMATCHED_ROUTE,
+    PROFILE_TOKEN_HEADER,
+    PROFILING_INTERVAL_SECONDS,
+    REQUEST_ID_HEADER,
+    REQUEST_TIMEOUT_HEADER,
+)
+from bakerySpotGourmet.core.deadline import reset_deadline, set_deadline, time_remaining
+from bakerySpotGourmet.core.exceptions import DeadlineExceededException, deadline_exceeded_handler
+from bakerySpotGourmet.core.metrics import get_metrics_registry
+from bakerySpotGourmet.core.profiling import ProfileStore, RequestProfile, TaskSampler, get_profile_store
+from bakerySpotGourmet.core.tracing import SlowRequestLog, end_trace, get_slow_request_log, start_trace
 
 
 logger = structlog.get_logger()
 
+_metrics = get_metrics_registry()
+_http_requests_total = _metrics.counter(
+    "http_requests_total",
+    "HTTP requests by method, route template and status class.",
+    ("method", "route", "status_class"),
+)
+_http_request_duration = _metrics.histogram(
+    "http_request_duration_seconds",
+    "HTTP request duration in seconds, body included.",
+    ("method", "route", "status_class"),
+)
+_http_requests_in_progress = _metrics.gauge(
+    "http_requests_in_progress",
+    "HTTP requests currently being served.",
+)
+_http_request_timeouts_total = _metrics.counter(
+    "http_request_timeouts_total",
+    "HTTP requests cancelled at their deadline by route template.",
+    ("route",),
+)
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
+
+def _route_template(scope: Scope) -> str:
+    """
+    Route template of a request, e.g. /api/v1/orders/{order_id}.
+    Routes of included routers may only know the path below their prefix, so
+    the prefix is recovered from the request path. Unmatched paths share one
+    label so scanners cannot blow up cardinality.
+    """
+    route = scope.get("route")
+    template = getattr(route, "path", None)
+    if template is None:
+        return METRICS_UNMATCHED_ROUTE
+    path = scope["path"]
+    path_regex = getattr(route, "path_regex", None)
+    if path_regex is None or path_regex.match(path):
+        return template
+    start = path.find("/", 1)
+    while start != -1:
+        if path_regex.match(path[start:]):
+            return path[:start] + template
+        start = path.find("/", start + 1)
+    return template
+
+
+class RequestIDMiddleware:
     """
     Middleware to generate and propagate request IDs.
     Binds request_id to structured logging context for traceability.
+    
+    Pure ASGI: no per-request task or body stream wrapping, so streaming
+    responses pass through untouched.
     """
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp):
         """
-        Generate or extract request ID and add to logging context.
+        Initialize the middleware.
         
         Args:
-            request: The incoming HTTP request
-            call_next: The next middleware or route handler
-            
-        Returns:
-            Response with X-Request-ID header
+            app: The ASGI application
         """
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Generate or extract request ID, add it to logging context and response headers.
+        
+        Args:
+            scope: The ASGI connection scope
+            receive: The ASGI receive channel
+            send: The ASGI send channel
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
         # Get or generate request ID
-        request_id = request.headers.get(REQUEST_ID_HEADER, str(uuid.uuid4()))
+        request_id = Headers(scope=scope).get(REQUEST_ID_HEADER) or str(uuid.uuid4())
         
         # Bind to logging context for all subsequent logs
         structlog.contextvars.clear_contextvars()
         structlog.contextvars.bind_contextvars(request_id=request_id)
         
         # Store in request state for access in dependencies
-        request.state.request_id = request_id
+        scope.setdefault("state", {})["request_id"] = request_id
         
-        # Process request
-        response = await call_next(request)
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Add request ID to response headers
+                MutableHeaders(scope=message)[REQUEST_ID_HEADER] = request_id
+            await send(message)
         
-        # Add request ID to response headers
-        response.headers[REQUEST_ID_HEADER] = request_id
-        
-        return response
+        await self.app(scope, receive, send_with_request_id)
 
 
-class RequestTimingMiddleware(BaseHTTPMiddleware):
+class RequestTimingMiddleware:
     """
     Middleware to log request timing and basic request info.
+    Pure ASGI; the duration covers the whole response, body included.
+    Also records request count and latency metrics per route template and
+    status class.
     """
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp):
+        """
+        Initialize the middleware.
+        
+        Args:
+            app: The ASGI application
+        """
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Time the request and log completion.
         
         Args:
-            request: The incoming HTTP request
-            call_next: The next middleware or route handler
-            
-        Returns:
-            Response object
+            scope: The ASGI connection scope
+            receive: The ASGI receive channel
+            send: The ASGI send channel
         """
-        start_time = time.time()
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        start_ns = time.perf_counter_ns()
+        method = scope["method"]
+        path = scope["path"]
+        client = scope.get("client")
         
         # Log incoming request
         logger.info(
             "request_started",
-            method=request.method,
-            path=request.url.path,
-            client=request.client.host if request.client else None,
+            method=method,
+            path=path,
+            client=client[0] if client else None,
         )
         
-        # Process request
-        response = await call_next(request)
+        status_code = None
+        
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
         
-        # Calculate duration
-        duration = time.time() - start_time
+        # Process request
+        _http_requests_in_progress.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            _http_requests_in_progress.dec()
+            # Calculate duration
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
+            # No response start means the error escaped to the server: a 500
+            status_class = f"{(status_code or 500) // 100}xx"
+            route = _route_template(scope)
+            labels = (method, route, status_class)
+            _http_requests_total.inc(labels)
+            _http_request_duration.observe(duration, labels)
         
         # Log completion
         logger.info(
             "request_completed",
-            method=request.method,
-            path=request.url.path,
-            status_code=response.status_code,
+            method=method,
+            path=path,
+            route=route,
+            status_code=status_code,
             duration_seconds=round(duration, 3),
         )
+
+
+class RequestProfilingMiddleware:
+    """
+    Middleware to profile individual requests on demand.
+    A request carrying the configured PROFILING_TOKEN in X-Profile-Token runs
+    under a sampling profiler; its collapsed stacks are stored under the
+    request ID for the admin profiles endpoints. Other requests only pay for
+    one header lookup. Must run inside RequestIDMiddleware.
+    """
+    
+    def __init__(
+        self,
+        app: ASGIApp,
+        token: Optional[str] = None,
+        interval: float = PROFILING_INTERVAL_SECONDS,
+        store: Optional[ProfileStore] = None,
+    ):
+        """
+        Initialize the middleware.
+        
+        Args:
+            app: The ASGI application
+            token: Token authorizing a profile, defaults to settings.PROFILING_TOKEN
+            interval: Seconds between profiler samples
+            store: Where profiles go, defaults to the global profile store
+        """
+        self.app = app
+        self.token = settings.PROFILING_TOKEN if token is None else token
+        self.interval = interval
+        self.store = store or get_profile_store()
+    
+    def _authorized(self, scope: Scope) -> bool:
+        """Whether the request asks for a profile with the right token."""
+        supplied = Headers(scope=scope).get(PROFILE_TOKEN_HEADER)
+        if supplied is None or not self.token:
+            return False
+        if hmac.compare_digest(supplied.encode(), self.token.encode()):
+            return True
+        logger.warning("profile_token_rejected", path=scope["path"])
+        return False
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Run the request, under the profiler if it is authorized.
+        
+        Args:
+            scope: The ASGI connection scope
+            receive: The ASGI receive channel
+            send: The ASGI send channel
+        """
+        task = asyncio.current_task() if scope["type"] == "http" else None
+        if task is None or not self._authorized(scope):
+            await self.app(scope, receive, send)
+            return
+        
+        profile = RequestProfile(
+            request_id=scope.get("state", {}).get("request_id") or str(uuid.uuid4()),
+            method=scope["method"],
+            path=scope["path"],
+            started_at=time.time(),
+        )
+        
+        async def send_with_status(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                profile.status_code = message["status"]
+            await send(message)
+        
+        sampler = TaskSampler(task, self.interval)
+        start_ns = time.perf_counter_ns()
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            sampler.stop()
+            profile.duration_seconds = (time.perf_counter_ns() - start_ns) / 1e9
+            profile.samples = sampler.samples
+            profile.stacks = sampler.stacks
+            self.store.add(profile)
+            logger.info(
+                "request_profiled",
+                path=profile.path,
+                samples=profile.samples,
+                duration_seconds=round(profile.duration_seconds, 3),
+            )
+
+
+class SlowRequestTraceMiddleware:
+    """
+    Middleware to keep the span trees of slow requests.
+    Every request runs under a root span that `traced` dependencies, services,
+    repositories and clients attach child spans to; the tree is stored in the
+    slow request log only when the request takes at least the threshold.
+    Must run inside RequestIDMiddleware.
+    """
+    
+    def __init__(
+        self,
+        app: ASGIApp,
+        threshold_seconds: Optional[float] = None,
+        log: Optional[SlowRequestLog] = None,
+    ):
+        """
+        Initialize the middleware.
+        
+        Args:
+            app: The ASGI application
+            threshold_seconds: Duration from which a request is kept, defaults to settings.SLOW_REQUEST_THRESHOLD_SECONDS
+            log: Where slow traces go, defaults to the global slow request log
+        """
+        self.app = app
+        self.threshold_seconds = (
+            settings.SLOW_REQUEST_THRESHOLD_SECONDS if threshold_seconds is None else threshold_seconds
+        )
+        self.log = log or get_slow_request_log()
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Trace the request and keep the trace if it was slow.
+        
+        Args:
+            scope: The ASGI connection scope
+            receive: The ASGI receive channel
+            send: The ASGI send channel
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        trace, token = start_trace(
+            request_id=scope.get("state", {}).get("request_id") or str(uuid.uuid4()),
+            method=scope["method"],
+            path=scope["path"],
+        )
+        
+        async def send_with_status(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                trace.status_code = message["status"]
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            end_trace(trace, token)
+            if trace.duration_seconds >= self.threshold_seconds:
+                trace.route = _route_template(scope)
+                self.log.add(trace)
+                slowest = trace.slowest_span()
+                logger.warning(
+                    "slow_request_captured",
+                    method=trace.method,
+                    route=trace.route,
+                    duration_seconds=round(trace.duration_seconds, 3),
+                    slowest_span=slowest.name if slowest else None,
+                    slowest_span_seconds=round(slowest.duration_ns / 1e9, 3) if slowest else None,
+                )
+
+
+class RequestDeadlineMiddleware:
+    """
+    Middleware to set the request deadline for downstream calls.
+    The budget is the ROUTE_TIMEOUTS entry with the longest matching path
+    prefix, else REQUEST_TIMEOUT_SECONDS, shortened by the client's
+    X-Request-Timeout header when it is willing to wait less.
+    """
+    
+    def __init__(
+        self,
+        app: ASGIApp,
+        timeout_seconds: Optional[float] = None,
+        route_timeouts: Optional[Dict[str, float]] = None,
+    ):
+        """
+        Initialize the middleware.
+        
+        Args:
+            app: The ASGI application
+            timeout_seconds: Default budget, defaults to settings.REQUEST_TIMEOUT_SECONDS
+            route_timeouts: Budgets by path prefix, defaults to settings.ROUTE_TIMEOUTS
+        """
+        self.app = app
+        self.timeout_seconds = (
+            settings.REQUEST_TIMEOUT_SECONDS if timeout_seconds is None else timeout_seconds
+        )
+        routes = settings.ROUTE_TIMEOUTS if route_timeouts is None else route_timeouts
+        # Longest prefix first, so the most specific route wins
+        self.route_timeouts = sorted(routes.items(), key=lambda item: len(item[0]), reverse=True)
+    
+    def _route_budget(self, path: str) -> float:
+        """Configured budget for a path in seconds; 0 disables the deadline."""
+        for prefix, seconds in self.route_timeouts:
+            if path.startswith(prefix):
+                return seconds
+        return self.timeout_seconds
+    
+    def _budget(self, scope: Scope) -> Optional[float]:
+        """Resolve the request budget in seconds, or None when disabled."""
+        route_budget = self._route_budget(scope["path"])
+        budget = route_budget if route_budget > 0 else None
+        header = Headers(scope=scope).get(REQUEST_TIMEOUT_HEADER)
+        if header is None:
+            return budget
+        try:
+            requested = float(header)
+        except ValueError:
+            logger.warning("invalid_request_timeout_header", value=header)
+            return budget
+        if requested <= 0:
+            return budget
+        return requested if budget is None else min(requested, budget)
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Bind the request deadline for the duration of the request.
+        
+        Args:
+            scope: The ASGI connection scope
+            receive: The ASGI receive channel
+            send: The ASGI send channel
+        """
+        budget = self._budget(scope) if scope["type"] == "http" else None
+        if budget is None:
+            await self.app(scope, receive, send)
+            return
+        
+        token = set_deadline(time.monotonic() + budget)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            reset_deadline(token)
+
+
+class RequestTimeoutMiddleware:
+    """
+    Middleware to enforce the request deadline on route execution.
+    
+    Pure ASGI like the other middlewares here; with BaseHTTPMiddleware,
+    call_next keeps waiting for the route task after a timeout instead of
+    cancelling it. Here the route task is cancelled when the deadline set by RequestDeadlineMiddleware
+    expires, and the client gets the 504 of deadline_exceeded_handler. Sync
+    routes running in the threadpool cannot be interrupted; they stop at their
+    next deadline check instead.
+    """
+    
+    def __init__(self, app: ASGIApp):
+        """
+        Initialize the middleware.
+        
+        Args:
+            app: The ASGI application
+        """
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Run the route, cancelling it if the request deadline passes.
+        
+        Args:
+            scope: The ASGI connection scope
+            receive: The ASGI receive channel
+            send: The ASGI send channel
+        """
+        remaining = time_remaining() if scope["type"] == "http" else None
+        if remaining is None:
+            await self.app(scope, receive, send)
+            return
+        
+        response_started = False
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+        
+        try:
+            async with asyncio.timeout(max(0.0, remaining)) as timeout:
+                await self.app(scope, receive, send_wrapper)
+            return
+        except TimeoutError:
+            if not timeout.expired():
+                raise
+        
+        route_path = _route_template(scope)
+        _http_request_timeouts_total.inc((route_path,))
+        logger.warning(
+            "request_timeout",
+            method=scope["method"],
+            path=scope["path"],
+            route=route_path,
+            response_started=response_started,
+        )
+        if response_started:
+            # Headers are already out; the truncated response is all we can do
+            return
         
-        return response
+        request = Request(scope)
+        exc = DeadlineExceededException(f"{scope['method']} {route_path}")
+        response = await deadline_exceeded_handler(request, exc)
+        await response(scope, receive, send)
@@ -0,0 +1,371 @@
+"""
+Sampling profilers.
+An on-demand profiler that follows a single request's asyncio task, with a
+bounded store of the resulting collapsed stacks keyed by request ID, and an
+always-on process profiler aggregating every thread's stacks over rolling
+windows.
+"""
+import asyncio
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from types import CodeType, FrameType
+from typing import Any, Deque, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from bakerySpotGourmet.core.constants import (
+    CONTINUOUS_PROFILER_IDLE_FRAMES,
+    CONTINUOUS_PROFILER_INTERVAL_SECONDS,
+    CONTINUOUS_PROFILER_MAX_DEPTH,
+    CONTINUOUS_PROFILER_TARGET_OVERHEAD,
+    CONTINUOUS_PROFILER_WINDOW_SECONDS,
+    CONTINUOUS_PROFILER_WINDOWS,
+    PROFILING_INTERVAL_SECONDS,
+    PROFILING_MAX_PROFILES,
+)
+from bakerySpotGourmet.core.memory import get_memory_registry
+
+
+# Leaf marker for samples taken while the request was awaiting I/O
+WAITING_FRAME = "[waiting]"
+
+# Frame names by code object; formatting them dominates sampling cost
+_frame_names: Dict[CodeType, str] = {}
+
+
+def _frame_name(frame: FrameType) -> str:
+    code = frame.f_code
+    name = _frame_names.get(code)
+    if name is None:
+        module = frame.f_globals.get("__name__", "?")
+        name = _frame_names[code] = f"{module}:{getattr(code, 'co_qualname', code.co_name)}"
+    return name
+
+
+def render_collapsed(stacks: Dict[str, int]) -> str:
+    """Render stack counts in the collapsed format read by flamegraph tools."""
+    lines = sorted(stacks.items(), key=lambda item: item[1], reverse=True)
+    return "\n".join(f"{stack} {count}" for stack, count in lines)
+
+
+@dataclass
+class RequestProfile:
+    """Collapsed stacks of one profiled request."""
+    request_id: str
+    method: str
+    path: str
+    started_at: float
+    status_code: Optional[int] = None
+    duration_seconds: float = 0.0
+    samples: int = 0
+    stacks: Dict[str, int] = field(default_factory=dict)
+
+    def collapsed(self) -> str:
+        """Render in the collapsed format read by flamegraph tools."""
+        return render_collapsed(self.stacks)
+
+
+class TaskSampler:
+    """
+    Wall-clock sampling profiler for one asyncio task.
+
+    A background thread periodically inspects the event loop thread. When the
+    task is running, its frames are taken from the thread's stack, cut at the
+    task's root coroutine so concurrent requests do not leak in. When the task
+    is suspended, its await chain is recorded with a `[waiting]` leaf, so time
+    spent waiting on I/O shows up too. Work a sync route does in the
+    threadpool appears as waiting.
+    """
+
+    def __init__(self, task: "asyncio.Task[Any]", interval: float = PROFILING_INTERVAL_SECONDS):
+        """
+        Initialize the sampler.
+
+        Args:
+            task: The task to profile, usually the current request's
+            interval: Seconds between samples
+        """
+        self.task = task
+        self.interval = interval
+        self.stacks: Dict[str, int] = {}
+        self.samples = 0
+        self._root = getattr(task.get_coro(), "cr_frame", None)
+        self._thread_id = threading.get_ident()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+
+    def start(self) -> None:
+        """Start sampling. Must be called from the event loop thread."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the sampler thread."""
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            stack = self._running_stack() or self._waiting_stack()
+            if stack:
+                key = ";".join(stack)
+                self.stacks[key] = self.stacks.get(key, 0) + 1
+                self.samples += 1
+
+    def _running_stack(self) -> List[str]:
+        """Task frames on the loop thread, outermost first, if the task is running."""
+        frame = sys._current_frames().get(self._thread_id)
+        names: List[str] = []
+        while frame is not None:
+            names.append(_frame_name(frame))
+            if frame is self._root:
+                names.reverse()
+                return names
+            frame = frame.f_back
+        return []
+
+    def _waiting_stack(self) -> List[str]:
+        """Await chain of the suspended task, outermost first."""
+        names: List[str] = []
+        awaitable: Any = self.task.get_coro()
+        while awaitable is not None:
+            frame = (
+                getattr(awaitable, "cr_frame", None)
+                or getattr(awaitable, "gi_frame", None)
+                or getattr(awaitable, "ag_frame", None)
+            )
+            if frame is None:
+                break
+            names.append(_frame_name(frame))
+            awaitable = (
+                getattr(awaitable, "cr_await", None)
+                or getattr(awaitable, "gi_yieldfrom", None)
+                or getattr(awaitable, "ag_await", None)
+            )
+        if names:
+            names.append(WAITING_FRAME)
+        return names
+
+
+class ProfileStore:
+    """
+    Ring of the most recent request profiles.
+    The oldest profile is evicted once `max_profiles` are stored.
+    """
+
+    def __init__(self, max_profiles: int = PROFILING_MAX_PROFILES):
+        """
+        Initialize the store.
+
+        Args:
+            max_profiles: Number of profiles kept
+        """
+        self.max_profiles = max_profiles
+        self._profiles: "OrderedDict[str, RequestProfile]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, profile: RequestProfile) -> None:
+        """Store a profile, evicting the oldest beyond capacity."""
+        with self._lock:
+            self._profiles.pop(profile.request_id, None)
+            self._profiles[profile.request_id] = profile
+            while len(self._profiles) > self.max_profiles:
+                self._profiles.popitem(last=False)
+
+    def get(self, request_id: str) -> Optional[RequestProfile]:
+        """Get the profile of a request, if still stored."""
+        with self._lock:
+            return self._profiles.get(request_id)
+
+    def list(self) -> List[RequestProfile]:
+        """Stored profiles, newest first."""
+        with self._lock:
+            return list(reversed(self._profiles.values()))
+
+
+class ContinuousProfiler:
+    """
+    Always-on sampling profiler for the whole process.
+
+    A daemon thread wakes every `interval` seconds, reads the current stack
+    of every other Python thread and counts it as a collapsed stack rooted at
+    the thread's name (the event loop thread is labelled `event-loop`).
+    Counts go into fixed-length windows, and the last `windows` are kept, so
+    profiles of recent minutes are available without growing memory.
+
+    Threads parked in a known idle frame (selector waits, queue gets, lock
+    waits) are counted as idle rather than as stacks, so the flamegraph shows
+    where CPU goes. Overhead target: CONTINUOUS_PROFILER_TARGET_OVERHEAD (1%
+    of one core) at the default 50 Hz. The profiler measures its own CPU
+    time, and `get_stats` reports it as a fraction of wall time. benchmarks/profiler_overhead.py measures the
+    effect on request throughput.
+    """
+
+    def __init__(
+        self,
+        interval: float = CONTINUOUS_PROFILER_INTERVAL_SECONDS,
+        window_seconds: float = CONTINUOUS_PROFILER_WINDOW_SECONDS,
+        windows: int = CONTINUOUS_PROFILER_WINDOWS,
+        max_depth: int = CONTINUOUS_PROFILER_MAX_DEPTH,
+        idle_frames: Iterable[str] = CONTINUOUS_PROFILER_IDLE_FRAMES,
+    ):
+        """
+        Initialize the profiler.
+
+        Args:
+            interval: Seconds between samples
+            window_seconds: Length of one aggregation window
+            windows: Number of windows kept
+            max_depth: Innermost frames kept per stack
+            idle_frames: Leaf frame names meaning the thread is idle
+        """
+        self.interval = interval
+        self.window_seconds = window_seconds
+        self.max_depth = max_depth
+        self.idle_frames: FrozenSet[str] = frozenset(idle_frames)
+        self._windows: Deque[Tuple[float, Dict[str, int]]] = deque(maxlen=windows)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._loop_thread_id: Optional[int] = None
+        self._started_at = 0.0
+        self._cpu_seconds = 0.0
+        self.samples = 0
+        self.idle_samples = 0
+
+    @property
+    def running(self) -> bool:
+        """Whether the sampler thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, loop_thread_id: Optional[int] = None) -> None:
+        """
+        Start the sampler thread.
+
+        Args:
+            loop_thread_id: Thread running the event loop, defaults to the caller
+        """
+        if self.running:
+            return
+        self._loop_thread_id = loop_thread_id or threading.get_ident()
+        self._stop.clear()
+        self._started_at = time.monotonic()
+        self._cpu_seconds = 0.0
+        self._thread = threading.Thread(target=self._run, name="continuous-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the sampler thread; collected windows are kept."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            cpu_start = time.thread_time()
+            self.sample()
+            self._cpu_seconds += time.thread_time() - cpu_start
+
+    def sample(self) -> None:
+        """Take one sample of every other thread."""
+        me = threading.get_ident()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        stacks: List[str] = []
+        idle = 0
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == me:
+                continue
+            leaf = _frame_name(frame)
+            if leaf in self.idle_frames:
+                idle += 1
+                continue
+            frames = [leaf]
+            frame = frame.f_back
+            while frame is not None and len(frames) < self.max_depth:
+                frames.append(_frame_name(frame))
+                frame = frame.f_back
+            root = "event-loop" if thread_id == self._loop_thread_id else names.get(thread_id, "thread")
+            frames.append(root)
+            frames.reverse()
+            stacks.append(";".join(frames))
+
+        now = time.monotonic()
+        window_start = now - now % self.window_seconds
+        with self._lock:
+            if not self._windows or self._windows[-1][0] != window_start:
+                self._windows.append((window_start, {}))
+            counts = self._windows[-1][1]
+            for stack in stacks:
+                counts[stack] = counts.get(stack, 0) + 1
+            self.samples += 1
+            self.idle_samples += idle
+
+    def stacks(self, seconds: Optional[float] = None) -> Dict[str, int]:
+        """
+        Aggregate stack counts over recent windows.
+
+        Args:
+            seconds: How far back to look, defaults to every kept window
+
+        Returns:
+            Collapsed stack -> sample count
+        """
+        cutoff = time.monotonic() - seconds if seconds is not None else float("-inf")
+        merged: Dict[str, int] = {}
+        with self._lock:
+            windows = [counts for start, counts in self._windows if start + self.window_seconds > cutoff]
+            for counts in windows:
+                for stack, count in counts.items():
+                    merged[stack] = merged.get(stack, 0) + count
+        return merged
+
+    def collapsed(self, seconds: Optional[float] = None) -> str:
+        """Recent stacks in the collapsed format read by flamegraph tools."""
+        return render_collapsed(self.stacks(seconds))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get profiler statistics.
+
+        Returns:
+            Dictionary with sample counters, kept windows and measured overhead
+        """
+        elapsed = time.monotonic() - self._started_at if self._started_at else 0.0
+        with self._lock:
+            windows = len(self._windows)
+        return {
+            "running": self.running,
+            "interval_seconds": self.interval,
+            "samples": self.samples,
+            "idle_samples": self.idle_samples,
+            "windows": windows,
+            "window_seconds": self.window_seconds,
+            "cpu_seconds": round(self._cpu_seconds, 6),
+            "overhead_ratio": round(self._cpu_seconds / elapsed, 6) if elapsed else 0.0,
+            "target_overhead_ratio": CONTINUOUS_PROFILER_TARGET_OVERHEAD,
+        }
+
+
+# Global profile store instance
+_profile_store = ProfileStore()
+get_memory_registry().register("profile_store", _profile_store, lambda: len(_profile_store._profiles))
+get_memory_registry().register("profiler_frame_names", _frame_names)
+
+
+def get_profile_store() -> ProfileStore:
+    """Get the global profile store."""
+    return _profile_store
+
+
+# Global continuous profiler instance
+_continuous_profiler = ContinuousProfiler()
+get_memory_registry().register(
+    "continuous_profiler", _continuous_profiler, lambda: len(_continuous_profiler._windows)
+)
+
+
+def get_continuous_profiler() -> ContinuousProfiler:
+    """Get the global continuous profiler."""
+    return _continuous_profiler
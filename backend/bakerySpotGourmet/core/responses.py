@@ -0,0 +1,60 @@
+"""
+JSON responses serialized by pydantic-core.
+Models and lists of models are dumped to JSON bytes by cached TypeAdapters
+in one pass, without jsonable_encoder or json.dumps.
+"""
+from functools import lru_cache
+from typing import Any, List, Type
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json
+
+
+@lru_cache(maxsize=None)
+def model_list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    """
+    Cached TypeAdapter for a list of `model`.
+
+    Building an adapter compiles a serializer, which costs far more than
+    using one, so each list type is built once per process.
+    """
+    return TypeAdapter(List[model])  # type: ignore[valid-type]
+
+
+def dump_json(content: Any) -> bytes:
+    """
+    Serialize response content to JSON bytes.
+
+    Models use their compiled serializer, homogeneous lists of models the
+    cached list adapter, and anything else pydantic-core's inference, which
+    handles datetimes, enums and nested models like jsonable_encoder does.
+    NaN and infinity become null, as in model serialization.
+
+    Args:
+        content: A model, a list of models, or JSON-compatible data
+
+    Returns:
+        The JSON document
+    """
+    if isinstance(content, BaseModel):
+        return content.__pydantic_serializer__.to_json(content)
+    if isinstance(content, list) and content and isinstance(content[0], BaseModel):
+        model = type(content[0])
+        if all(type(item) is model for item in content):
+            return model_list_adapter(model).dump_json(content)
+    return to_json(content, inf_nan_mode="null")
+
+
+class PydanticJSONResponse(JSONResponse):
+    """
+    JSON response rendered by pydantic-core.
+
+    Endpoints that already hold validated models can return this directly,
+    which skips FastAPI's response model validation and serialization. As the
+    application's default response class it also renders routes without a
+    response model.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dump_json(content)
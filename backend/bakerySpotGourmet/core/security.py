@@ -1,5 +1,7 @@
+import hashlib
+import hmac
 from datetime import datetime, timedelta
-from typing import Any, Union
+from typing import Any, Optional, Union
 
 from jose import jwt, JWTError
 from passlib.context import CryptContext
@@ -63,6 +65,24 @@ def decode_token(token: str) -> dict[str, Any] | None:
         return None
 
 
+def sign_webhook_payload(payload: bytes, secret: str) -> str:
+    """
+    Compute the signature header value of a webhook body.
+    """
+    digest = hmac.new(secret.encode(), payload, hashlib.sha256).hexdigest()
+    return f"sha256={digest}"
+
+
+def verify_webhook_signature(payload: bytes, signature: Optional[str], secret: Optional[str]) -> bool:
+    """
+    Check a webhook signature in constant time.
+    Without a configured secret every delivery is rejected.
+    """
+    if not secret or not signature:
+        return False
+    return hmac.compare_digest(sign_webhook_payload(payload, secret), signature)
+
+
 # Rate Limiting
 
 from collections import defaultdict, deque
@@ -71,6 +91,7 @@ from typing import Dict, Deque, Tuple
 import structlog
 
 from bakerySpotGourmet.core.exceptions import RateLimitExceededException
+from bakerySpotGourmet.core.memory import get_memory_registry
 
 
 rate_limit_logger = structlog.get_logger()
@@ -95,6 +116,7 @@ class RateLimiter:
         self.window_seconds = 60
         # Store: {identifier: deque of timestamps}
         self._requests: Dict[str, Deque[float]] = defaultdict(deque)
+        self._rejected_count = 0
     
     def _cleanup_old_requests(self, identifier: str, current_time: float) -> None:
         """Remove requests outside the current time window."""
@@ -139,6 +161,7 @@ class RateLimiter:
                 max_requests=max_requests,
             )
             
+            self._rejected_count += 1
             return False, retry_after
         
         # Record this request
@@ -150,6 +173,20 @@ class RateLimiter:
         key = f"{identifier}:{endpoint}"
         if key in self._requests:
             del self._requests[key]
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get rate limiter statistics.
+        
+        Returns:
+            Dictionary with tracked keys, requests in window and rejections
+        """
+        windows = list(self._requests.values())
+        return {
+            "tracked_keys": len(windows),
+            "tracked_requests": sum(len(w) for w in windows),
+            "rejected_count": self._rejected_count,
+        }
 
 
 # Global rate limiter instance
@@ -157,6 +194,7 @@ _rate_limiter = RateLimiter(
     requests_per_minute=settings.RATE_LIMIT_PER_MINUTE,
     burst=settings.RATE_LIMIT_BURST,
 )
+get_memory_registry().register("rate_limiter", _rate_limiter, lambda: len(_rate_limiter._requests))
 
 
 def get_rate_limiter() -> RateLimiter:
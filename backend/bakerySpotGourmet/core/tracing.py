@@ -0,0 +1,235 @@
+"""
+Lightweight in-process request tracing.
+Every request gets a root span; `traced` functions called on its behalf add
+child spans. Span trees are only kept for requests slower than the
+configured threshold, in a bounded slow request log.
+
+Outside a traced request, `traced` costs one contextvar lookup.
+"""
+import asyncio
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, TypeVar
+
+from bakerySpotGourmet.core.config import settings
+from bakerySpotGourmet.core.constants import SLOW_REQUEST_LOG_SIZE, TRACE_MAX_SPANS
+from bakerySpotGourmet.core.memory import get_memory_registry
+
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+
+@dataclass
+class Span:
+    """A timed operation and the operations it called."""
+    name: str
+    start_ns: int
+    end_ns: Optional[int] = None
+    error: Optional[str] = None
+    children: List["Span"] = field(default_factory=list)
+
+    @property
+    def duration_ns(self) -> int:
+        """Duration so far, or the final duration once ended."""
+        return (self.end_ns or time.perf_counter_ns()) - self.start_ns
+
+    def to_dict(self, origin_ns: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Render the span tree.
+
+        Args:
+            origin_ns: Start of the trace; offsets are relative to it
+
+        Returns:
+            Nested dictionary with millisecond offsets and durations
+        """
+        origin = self.start_ns if origin_ns is None else origin_ns
+        return {
+            "name": self.name,
+            "start_ms": round((self.start_ns - origin) / 1e6, 3),
+            "duration_ms": round(self.duration_ns / 1e6, 3),
+            "error": self.error,
+            "children": [child.to_dict(origin) for child in self.children],
+        }
+
+
+@dataclass
+class Trace:
+    """Span tree of one request."""
+    request_id: str
+    method: str
+    path: str
+    root: Span
+    route: Optional[str] = None
+    status_code: Optional[int] = None
+    span_count: int = 0
+    dropped_spans: int = 0
+
+    @property
+    def duration_seconds(self) -> float:
+        """Duration of the request in seconds."""
+        return self.root.duration_ns / 1e9
+
+    def slowest_span(self) -> Optional[Span]:
+        """The longest span below the root, if any."""
+        slowest: Optional[Span] = None
+        pending = list(self.root.children)
+        while pending:
+            current = pending.pop()
+            if slowest is None or current.duration_ns > slowest.duration_ns:
+                slowest = current
+            pending.extend(current.children)
+        return slowest
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Render the trace with its span tree."""
+        return {
+            "request_id": self.request_id,
+            "method": self.method,
+            "path": self.path,
+            "route": self.route,
+            "status_code": self.status_code,
+            "duration_seconds": round(self.duration_seconds, 6),
+            "dropped_spans": self.dropped_spans,
+            "spans": self.root.to_dict(),
+        }
+
+
+# Trace and innermost open span of the current request
+_current: ContextVar[Optional[Tuple[Trace, Span]]] = ContextVar("current_span", default=None)
+
+
+def start_trace(request_id: str, method: str, path: str, name: str = "request") -> Tuple[Trace, Any]:
+    """
+    Start tracing the current context.
+
+    Returns:
+        The trace and a token for `end_trace`
+    """
+    trace = Trace(request_id=request_id, method=method, path=path, root=Span(name, time.perf_counter_ns()))
+    return trace, _current.set((trace, trace.root))
+
+
+def end_trace(trace: Trace, token: Any) -> None:
+    """End the root span and stop tracing the current context."""
+    trace.root.end_ns = time.perf_counter_ns()
+    _current.reset(token)
+
+
+def _open(name: str) -> Optional[Tuple[Trace, Span, Any]]:
+    current = _current.get()
+    if current is None:
+        return None
+    trace, parent = current
+    if trace.span_count >= TRACE_MAX_SPANS:
+        trace.dropped_spans += 1
+        return None
+    trace.span_count += 1
+    span = Span(name, time.perf_counter_ns())
+    parent.children.append(span)
+    return trace, span, _current.set((trace, span))
+
+
+def _close(opened: Tuple[Trace, Span, Any], error: Optional[BaseException]) -> None:
+    _, span, token = opened
+    span.end_ns = time.perf_counter_ns()
+    if error is not None:
+        span.error = type(error).__name__
+    _current.reset(token)
+
+
+def traced(func: Optional[F] = None, *, name: Optional[str] = None) -> Any:
+    """
+    Decorator recording a span around each call of a sync or async function.
+
+    Usable bare (`@traced`) or with a span name (`@traced(name="auth")`);
+    the name defaults to the function's qualified name.
+    """
+    def decorate(fn: F) -> F:
+        span_name = name or fn.__qualname__
+
+        if asyncio.iscoroutinefunction(fn):
+            @wraps(fn)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                opened = _open(span_name)
+                if opened is None:
+                    return await fn(*args, **kwargs)
+                try:
+                    result = await fn(*args, **kwargs)
+                except BaseException as e:
+                    _close(opened, e)
+                    raise
+                _close(opened, None)
+                return result
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            opened = _open(span_name)
+            if opened is None:
+                return fn(*args, **kwargs)
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                _close(opened, e)
+                raise
+            _close(opened, None)
+            return result
+
+        return wrapper  # type: ignore[return-value]
+
+    if func is not None:
+        return decorate(func)
+    return decorate
+
+
+class SlowRequestLog:
+    """
+    Ring of the most recent slow request traces.
+    The oldest trace is evicted once `max_size` are stored.
+    """
+
+    def __init__(self, max_size: int = SLOW_REQUEST_LOG_SIZE):
+        """
+        Initialize the log.
+
+        Args:
+            max_size: Number of traces kept
+        """
+        self._traces: Deque[Trace] = deque(maxlen=max_size)
+        self._lock = threading.Lock()
+        self.captured = 0
+
+    def add(self, trace: Trace) -> None:
+        """Store a slow request trace."""
+        with self._lock:
+            self._traces.append(trace)
+            self.captured += 1
+
+    def list(self) -> List[Trace]:
+        """Stored traces, newest first."""
+        with self._lock:
+            return list(reversed(self._traces))
+
+    def get(self, request_id: str) -> Optional[Trace]:
+        """Get the trace of a request, if still stored."""
+        with self._lock:
+            for trace in reversed(self._traces):
+                if trace.request_id == request_id:
+                    return trace
+        return None
+
+
+# Global slow request log instance
+_slow_request_log = SlowRequestLog(settings.SLOW_REQUEST_LOG_SIZE)
+get_memory_registry().register("slow_request_log", _slow_request_log, lambda: len(_slow_request_log._traces))
+
+
+def get_slow_request_log() -> SlowRequestLog:
+    """Get the global slow request log."""
+    return _slow_request_log
@@ -0,0 +1,30 @@
+"""
+Order domain events.
+Immutable facts published after an order changes, consumed asynchronously.
+"""
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
+from bakerySpotGourmet.domain.orders.order_type import OrderType
+from bakerySpotGourmet.domain.orders.status import OrderStatus
+
+
+@dataclass(frozen=True)
+class OrderCreated:
+    """Raised when a new order has been persisted."""
+    order_id: int
+    customer_id: int
+    total_amount: float
+    order_type: OrderType
+    occurred_at: datetime = field(default_factory=datetime.utcnow)
+
+
+@dataclass(frozen=True)
+class OrderStatusChanged:
+    """Raised when an order transitions to a new operational status."""
+    order_id: int
+    old_status: OrderStatus
+    new_status: OrderStatus
+    changed_by: Optional[int] = None
+    occurred_at: datetime = field(default_factory=datetime.utcnow)
@@ -0,0 +1,26 @@
+"""
+Payment domain events.
+Immutable facts published after a payment changes, consumed asynchronously.
+"""
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from bakerySpotGourmet.domain.payments.status import PaymentStatus
+
+
+@dataclass(frozen=True)
+class PaymentCompleted:
+    """Raised when a payment has been marked as completed."""
+    payment_id: int
+    order_id: int
+    amount: float
+    occurred_at: datetime = field(default_factory=datetime.utcnow)
+
+
+@dataclass(frozen=True)
+class PaymentWebhookReceived:
+    """Raised when the gateway reports a payment status change via webhook."""
+    event_id: str
+    payment_id: int
+    status: PaymentStatus
+    occurred_at: datetime = field(default_factory=datetime.utcnow)
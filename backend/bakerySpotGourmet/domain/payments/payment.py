@@ -22,6 +22,11 @@ class Payment:
     updated_at: datetime = field(default_factory=datetime.utcnow)
     id: Optional[int] = field(default=None)
 
+    def authorize(self) -> None:
+        """Mark the payment as authorized but not yet captured."""
+        self.status = PaymentStatus.AUTHORIZED
+        self.updated_at = datetime.utcnow()
+
     def complete(self) -> None:
         """Mark the payment as completed."""
         self.status = PaymentStatus.COMPLETED
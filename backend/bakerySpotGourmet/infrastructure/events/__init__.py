@@ -0,0 +1,3 @@
+"""
+In-process event infrastructure package.
+"""
@@ -0,0 +1,368 @@
+"""
+In-process asynchronous event bus.
+Decouples side effects (audit, notifications, read-model updates) from the request path.
+Generic implementation with no domain coupling: events are routed by their type.
+"""
+import asyncio
+import threading
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Type
+
+import structlog
+
+from bakerySpotGourmet.core.constants import (
+    EVENT_BUS_BATCH_SIZE,
+    EVENT_BUS_BATCH_TIMEOUT_SECONDS,
+    EVENT_BUS_QUEUE_SIZE,
+)
+from bakerySpotGourmet.infrastructure.events.exceptions import EventBusFullException
+
+
+logger = structlog.get_logger()
+
+EventHandler = Callable[[List[Any]], Awaitable[None]]
+
+
+class OverflowPolicy(str, Enum):
+    """What to do when a subscriber queue is full."""
+    DROP_NEWEST = "drop_newest"  # Discard the event being published
+    DROP_OLDEST = "drop_oldest"  # Evict the oldest queued event to make room
+    BLOCK = "block"              # Apply backpressure to the publisher
+
+
+@dataclass
+class Subscription:
+    """
+    A subscriber registered on the bus.
+    Each subscription owns a bounded queue so a slow consumer cannot delay others.
+    """
+    name: str
+    event_types: tuple[Type[Any], ...]
+    handler: EventHandler
+    batch_size: int
+    batch_timeout: float
+    concurrency: int
+    overflow_policy: OverflowPolicy
+    queue: "asyncio.Queue[Any]"
+    delivered: int = 0
+    dropped: int = 0
+    failed_batches: int = 0
+    workers: List["asyncio.Task[None]"] = field(default_factory=list)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get subscription statistics.
+
+        Returns:
+            Dictionary with queue depth and delivery counters
+        """
+        return {
+            "name": self.name,
+            "queued": self.queue.qsize(),
+            "capacity": self.queue.maxsize,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "failed_batches": self.failed_batches,
+            "overflow_policy": self.overflow_policy.value,
+        }
+
+
+class EventBus:
+    """
+    Asyncio event bus with batched, bounded, per-subscriber queues.
+
+    Publishing only enqueues: handlers run on background worker tasks that
+    consume events in batches of up to ``batch_size`` or whatever arrived
+    within ``batch_timeout`` seconds, whichever comes first.
+    """
+
+    def __init__(self, queue_size: int = EVENT_BUS_QUEUE_SIZE, name: str = "default"):
+        """
+        Initialize the event bus.
+
+        Args:
+            queue_size: Default capacity of each subscriber queue
+            name: Name for logging purposes
+        """
+        self.queue_size = queue_size
+        self.name = name
+        self._subscriptions: List[Subscription] = []
+        self._routes: Dict[Type[Any], List[Subscription]] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        self._running = False
+
+    @property
+    def is_running(self) -> bool:
+        """Whether worker tasks are consuming events."""
+        return self._running
+
+    def subscribe(
+        self,
+        event_types: Iterable[Type[Any]],
+        handler: EventHandler,
+        name: Optional[str] = None,
+        batch_size: int = EVENT_BUS_BATCH_SIZE,
+        batch_timeout: float = EVENT_BUS_BATCH_TIMEOUT_SECONDS,
+        concurrency: int = 1,
+        queue_size: Optional[int] = None,
+        overflow_policy: OverflowPolicy = OverflowPolicy.DROP_NEWEST,
+    ) -> Subscription:
+        """
+        Register an async handler for one or more event types.
+
+        Args:
+            event_types: Event classes the handler is interested in
+            handler: Coroutine function receiving a list of events
+            name: Subscriber name for logging and stats
+            batch_size: Maximum number of events per handler call
+            batch_timeout: Maximum seconds to wait while filling a batch
+            concurrency: Number of batches processed in parallel
+            queue_size: Queue capacity, defaults to the bus queue size
+            overflow_policy: Behavior when the queue is full
+
+        Returns:
+            The created subscription
+
+        Raises:
+            ValueError: If batch_size or concurrency are not positive
+        """
+        if batch_size < 1 or concurrency < 1:
+            raise ValueError("batch_size and concurrency must be positive")
+
+        subscription = Subscription(
+            name=name or getattr(handler, "__name__", "subscriber"),
+            event_types=tuple(event_types),
+            handler=handler,
+            batch_size=batch_size,
+            batch_timeout=batch_timeout,
+            concurrency=concurrency,
+            overflow_policy=overflow_policy,
+            queue=asyncio.Queue(maxsize=queue_size or self.queue_size),
+        )
+        self._subscriptions.append(subscription)
+        for event_type in subscription.event_types:
+            self._routes.setdefault(event_type, []).append(subscription)
+
+        if self._running:
+            self._start_workers(subscription)
+        return subscription
+
+    def publish(self, event: Any) -> int:
+        """
+        Enqueue an event without waiting.
+        Safe to call from synchronous code and from threads other than the loop.
+
+        Args:
+            event: The event instance
+
+        Returns:
+            Number of subscribers the event was routed to
+
+        Raises:
+            EventBusFullException: If a BLOCK subscriber queue is full
+        """
+        subscriptions = self._routes.get(type(event), [])
+        if not subscriptions:
+            return 0
+
+        if self._is_foreign_thread():
+            assert self._loop is not None
+            for subscription in subscriptions:
+                self._loop.call_soon_threadsafe(self._enqueue, subscription, event)
+            return len(subscriptions)
+
+        for subscription in subscriptions:
+            self._enqueue(subscription, event)
+        return len(subscriptions)
+
+    async def publish_async(self, event: Any) -> int:
+        """
+        Enqueue an event, waiting for room on BLOCK subscribers.
+
+        Args:
+            event: The event instance
+
+        Returns:
+            Number of subscribers the event was routed to
+        """
+        subscriptions = self._routes.get(type(event), [])
+        for subscription in subscriptions:
+            if subscription.overflow_policy == OverflowPolicy.BLOCK:
+                await subscription.queue.put(event)
+            else:
+                self._enqueue(subscription, event)
+        return len(subscriptions)
+
+    def _is_foreign_thread(self) -> bool:
+        """Check whether the caller runs outside the bus event loop thread."""
+        return (
+            self._loop is not None
+            and self._loop_thread_id is not None
+            and threading.get_ident() != self._loop_thread_id
+        )
+
+    def _enqueue(self, subscription: Subscription, event: Any) -> None:
+        """Put an event on a subscriber queue, applying its overflow policy."""
+        try:
+            subscription.queue.put_nowait(event)
+            return
+        except asyncio.QueueFull:
+            pass
+
+        if subscription.overflow_policy == OverflowPolicy.BLOCK:
+            raise EventBusFullException(subscription.name)
+
+        if subscription.overflow_policy == OverflowPolicy.DROP_OLDEST:
+            subscription.queue.get_nowait()
+            subscription.queue.task_done()
+            subscription.queue.put_nowait(event)
+
+        subscription.dropped += 1
+        logger.warning(
+            "event_dropped",
+            bus=self.name,
+            subscriber=subscription.name,
+            event_type=type(event).__name__,
+            policy=subscription.overflow_policy.value,
+        )
+
+    async def start(self) -> None:
+        """Start worker tasks for every subscription on the running loop."""
+        if self._running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._running = True
+        for subscription in self._subscriptions:
+            self._start_workers(subscription)
+        logger.info("event_bus_started", bus=self.name, subscribers=len(self._subscriptions))
+
+    def _start_workers(self, subscription: Subscription) -> None:
+        """Spawn the consumer tasks of a subscription."""
+        assert self._loop is not None
+        for index in range(subscription.concurrency):
+            task = self._loop.create_task(
+                self._consume(subscription),
+                name=f"event-bus:{self.name}:{subscription.name}:{index}",
+            )
+            subscription.workers.append(task)
+
+    async def stop(self, drain: bool = True, timeout: float = 5.0) -> None:
+        """
+        Stop consuming events.
+
+        Args:
+            drain: Deliver already queued events before stopping
+            timeout: Maximum seconds to wait for draining
+        """
+        if not self._running:
+            return
+
+        if drain:
+            try:
+                await asyncio.wait_for(
+                    asyncio.gather(*(s.queue.join() for s in self._subscriptions)),
+                    timeout=timeout,
+                )
+            except asyncio.TimeoutError:
+                logger.warning("event_bus_drain_timeout", bus=self.name, timeout=timeout)
+
+        workers = [task for s in self._subscriptions for task in s.workers]
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        for subscription in self._subscriptions:
+            subscription.workers.clear()
+
+        self._running = False
+        self._loop = None
+        self._loop_thread_id = None
+        logger.info("event_bus_stopped", bus=self.name)
+
+    async def _consume(self, subscription: Subscription) -> None:
+        """Worker loop: collect a batch and hand it to the subscriber."""
+        queue = subscription.queue
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + subscription.batch_timeout
+            while len(batch) < subscription.batch_size:
+                if not queue.empty():
+                    batch.append(queue.get_nowait())
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                await subscription.handler(batch)
+                subscription.delivered += len(batch)
+            except Exception as e:
+                subscription.failed_batches += 1
+                logger.error(
+                    "event_handler_failed",
+                    bus=self.name,
+                    subscriber=subscription.name,
+                    batch_size=len(batch),
+                    error=str(e),
+                    exc_info=True,
+                )
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get event bus statistics.
+
+        Returns:
+            Dictionary with running state and per-subscriber counters
+        """
+        return {
+            "name": self.name,
+            "running": self._running,
+            "subscribers": [s.get_stats() for s in self._subscriptions],
+        }
+
+
+# Global event bus instance
+_event_bus = EventBus(name="domain")
+
+
+def get_event_bus() -> EventBus:
+    """Get the global event bus instance."""
+    return _event_bus
+
+
+def publish_event(event_bus: Optional[EventBus], event: Any) -> int:
+    """
+    Publish an event after the state change it describes was persisted.
+
+    The change cannot be rolled back at that point, so a full BLOCK
+    subscriber queue is logged instead of failing the caller.
+
+    Args:
+        event_bus: The bus to publish on, or None to skip publishing
+        event: The event instance
+
+    Returns:
+        Number of subscribers the event was routed to
+    """
+    if event_bus is None:
+        return 0
+    try:
+        return event_bus.publish(event)
+    except EventBusFullException as e:
+        logger.error(
+            "event_publish_rejected",
+            bus=event_bus.name,
+            subscriber=e.subscriber,
+            event_type=type(event).__name__,
+        )
+        return 0
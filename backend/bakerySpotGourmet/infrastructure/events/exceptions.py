@@ -0,0 +1,10 @@
+"""
+Event bus infrastructure exceptions.
+"""
+
+
+class EventBusFullException(Exception):
+    """Raised when a subscriber queue is full and the overflow policy rejects the event."""
+    def __init__(self, subscriber: str):
+        self.subscriber = subscriber
+        super().__init__(f"Event queue for subscriber '{subscriber}' is full")
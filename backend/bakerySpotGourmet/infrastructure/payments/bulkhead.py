@@ -0,0 +1,281 @@
+"""
+Bulkhead implementation for isolating external dependencies.
+Caps concurrent calls to one dependency so its slowness cannot exhaust the
+worker threads and event-loop tasks that unrelated endpoints need.
+"""
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Optional, TypeVar
+
+import structlog
+
+from bakerySpotGourmet.core.constants import (
+    BULKHEAD_MAX_CONCURRENT_CALLS,
+    BULKHEAD_MAX_QUEUE_SIZE,
+    BULKHEAD_QUEUE_TIMEOUT_SECONDS,
+)
+from bakerySpotGourmet.core.deadline import check_deadline, time_remaining
+from bakerySpotGourmet.infrastructure.payments.exceptions import BulkheadFullException
+
+
+logger = structlog.get_logger()
+
+T = TypeVar('T')
+
+
+class _Waiter:
+    """A queued caller, either a thread or an event-loop task."""
+
+    def __init__(self, future: Optional["asyncio.Future[None]"] = None):
+        self.granted = False
+        self.future = future
+        self._loop = future.get_loop() if future is not None else None
+        self._event = threading.Event() if future is None else None
+
+    def grant(self) -> None:
+        """Hand a slot to the waiter. Caller holds the bulkhead lock."""
+        self.granted = True
+        if self._event is not None:
+            self._event.set()
+        else:
+            assert self._loop is not None
+            self._loop.call_soon_threadsafe(self._wake)
+
+    def _wake(self) -> None:
+        """Resolve the future on its own loop, unless the waiter gave up."""
+        assert self.future is not None
+        if not self.future.done():
+            self.future.set_result(None)
+
+    def wait(self, timeout: float) -> bool:
+        """Block the current thread until granted or timed out."""
+        assert self._event is not None
+        return self._event.wait(timeout)
+
+
+class Bulkhead:
+    """
+    Semaphore with a bounded, FIFO wait queue.
+
+    At most `max_concurrent_calls` calls run at once. Further callers wait in
+    a queue of at most `max_queue_size` entries for up to `queue_timeout`
+    seconds; callers beyond that are rejected immediately with
+    BulkheadFullException instead of piling up.
+
+    Thread-safe: one bulkhead can guard both sync and async callers, and
+    async callers on different event loops.
+    """
+
+    def __init__(
+        self,
+        max_concurrent_calls: int = BULKHEAD_MAX_CONCURRENT_CALLS,
+        max_queue_size: int = BULKHEAD_MAX_QUEUE_SIZE,
+        queue_timeout: float = BULKHEAD_QUEUE_TIMEOUT_SECONDS,
+        name: str = "default",
+    ):
+        """
+        Initialize the bulkhead.
+
+        Args:
+            max_concurrent_calls: Calls allowed to run at the same time
+            max_queue_size: Callers allowed to wait for a slot; 0 rejects as soon as all slots are busy
+            queue_timeout: Seconds a queued caller waits before being rejected
+            name: Name for logging and stats
+        """
+        if max_concurrent_calls < 1 or max_queue_size < 0 or queue_timeout < 0:
+            raise ValueError(
+                "max_concurrent_calls must be >= 1, max_queue_size and queue_timeout >= 0"
+            )
+        self.max_concurrent_calls = max_concurrent_calls
+        self.max_queue_size = max_queue_size
+        self.queue_timeout = queue_timeout
+        self.name = name
+
+        self._lock = threading.Lock()
+        self._active = 0
+        self._waiters: Deque[_Waiter] = deque()
+
+        self._accepted_count = 0
+        self._rejected_count = 0
+        self._timed_out_count = 0
+        self._max_active_seen = 0
+        self._max_queued_seen = 0
+
+    def _try_enter(self, waiter_factory: Callable[[], _Waiter]) -> Optional[_Waiter]:
+        """
+        Take a free slot or join the wait queue.
+
+        Returns:
+            None if a slot was taken, otherwise the queued waiter
+
+        Raises:
+            BulkheadFullException: If every slot is busy and the queue is full
+        """
+        with self._lock:
+            if self._active < self.max_concurrent_calls and not self._waiters:
+                self._admit()
+                return None
+            if len(self._waiters) < self.max_queue_size:
+                waiter = waiter_factory()
+                self._waiters.append(waiter)
+                self._max_queued_seen = max(self._max_queued_seen, len(self._waiters))
+                return waiter
+            self._rejected_count += 1
+
+        logger.warning(
+            "bulkhead_rejected",
+            bulkhead=self.name,
+            max_concurrent_calls=self.max_concurrent_calls,
+            max_queue_size=self.max_queue_size,
+        )
+        raise BulkheadFullException(f"Bulkhead '{self.name}' is full")
+
+    def _admit(self) -> None:
+        """Count a caller as active. Caller holds the lock."""
+        self._active += 1
+        self._accepted_count += 1
+        self._max_active_seen = max(self._max_active_seen, self._active)
+
+    def _abandon(self, waiter: _Waiter) -> bool:
+        """
+        Leave the queue after a timeout or cancellation.
+
+        Returns:
+            True if a slot was granted concurrently and is now owned by the caller
+        """
+        with self._lock:
+            if waiter.granted:
+                return True
+            self._waiters.remove(waiter)
+            self._timed_out_count += 1
+            return False
+
+    def _release(self) -> None:
+        """Free a slot, handing it directly to the next waiter if any."""
+        with self._lock:
+            if self._waiters:
+                # The slot moves to the waiter; the active count is unchanged
+                self._accepted_count += 1
+                self._waiters.popleft().grant()
+            else:
+                self._active -= 1
+
+    def _queue_timeout(self) -> float:
+        """Seconds to wait in the queue, capped by the request deadline."""
+        remaining = time_remaining()
+        if remaining is None:
+            return self.queue_timeout
+        return max(0.0, min(self.queue_timeout, remaining))
+
+    def _reject_timed_out(self, waited: float) -> BulkheadFullException:
+        """Log a queue timeout and build the exception to raise."""
+        logger.warning(
+            "bulkhead_queue_timeout",
+            bulkhead=self.name,
+            waited_seconds=round(waited, 3),
+        )
+        return BulkheadFullException(
+            f"Bulkhead '{self.name}' queue timeout after {self.queue_timeout}s"
+        )
+
+    def call(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a function inside the bulkhead, blocking while queued.
+
+        Args:
+            func: Function to execute
+            *args: Positional arguments for function
+            **kwargs: Keyword arguments for function
+
+        Returns:
+            Function result
+
+        Raises:
+            BulkheadFullException: If no slot became available
+            DeadlineExceededException: If the request deadline has passed
+        """
+        check_deadline(self.name)
+        waiter = self._try_enter(_Waiter)
+        if waiter is not None:
+            started = time.monotonic()
+            if not waiter.wait(self._queue_timeout()) and not self._abandon(waiter):
+                raise self._reject_timed_out(time.monotonic() - started)
+
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self._release()
+
+    async def call_async(
+        self,
+        func: Callable[..., Awaitable[T]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        """
+        Await a coroutine function inside the bulkhead without blocking the event loop.
+
+        Args:
+            func: Coroutine function to execute
+            *args: Positional arguments for function
+            **kwargs: Keyword arguments for function
+
+        Returns:
+            Function result
+
+        Raises:
+            BulkheadFullException: If no slot became available
+            DeadlineExceededException: If the request deadline has passed
+        """
+        check_deadline(self.name)
+        loop = asyncio.get_running_loop()
+        waiter = self._try_enter(lambda: _Waiter(loop.create_future()))
+        if waiter is not None:
+            started = time.monotonic()
+            assert waiter.future is not None
+            try:
+                await asyncio.wait_for(waiter.future, self._queue_timeout())
+            except asyncio.TimeoutError:
+                if not self._abandon(waiter):
+                    raise self._reject_timed_out(time.monotonic() - started)
+            except asyncio.CancelledError:
+                if self._abandon(waiter):
+                    self._release()
+                raise
+
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            self._release()
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get bulkhead gauges and counters.
+
+        Returns:
+            Dictionary with active and queued gauges plus rejection counters
+        """
+        with self._lock:
+            return {
+                "name": self.name,
+                "active": self._active,
+                "queued": len(self._waiters),
+                "max_concurrent_calls": self.max_concurrent_calls,
+                "max_queue_size": self.max_queue_size,
+                "accepted_count": self._accepted_count,
+                "rejected_count": self._rejected_count,
+                "timed_out_count": self._timed_out_count,
+                "max_active_seen": self._max_active_seen,
+                "max_queued_seen": self._max_queued_seen,
+            }
+
+
+# Shared bulkhead for every call to the payment gateway
+_payment_gateway_bulkhead = Bulkhead(name="payment_gateway")
+
+
+def get_payment_gateway_bulkhead() -> Bulkhead:
+    """Get the bulkhead shared by all payment gateway clients."""
+    return _payment_gateway_bulkhead
@@ -2,11 +2,15 @@
 Circuit breaker implementation for resilient external service calls.
 Generic implementation with no domain coupling.
 """
+import threading
 import time
+from collections import deque
 from enum import Enum
-from typing import Callable, Any, TypeVar
+from typing import Awaitable, Callable, Any, Deque, TypeVar
 import structlog
 
+from bakerySpotGourmet.core.deadline import check_deadline
+from bakerySpotGourmet.core.exceptions import DeadlineExceededException
 from bakerySpotGourmet.infrastructure.payments.exceptions import CircuitBreakerOpenException
 
 
@@ -22,6 +26,77 @@ class CircuitState(str, Enum):
     HALF_OPEN = "half_open"  # Testing if service recovered
 
 
+class SlidingWindowType(str, Enum):
+    """How recent call outcomes are aggregated."""
+    COUNT_BASED = "count_based"  # Last N calls
+    TIME_BASED = "time_based"    # Calls in the last N seconds
+
+
+class _CountWindow:
+    """Outcomes of the last `size` calls with O(1) running totals."""
+    
+    def __init__(self, size: int):
+        self._outcomes: Deque[tuple[bool, bool]] = deque()
+        self._size = size
+        self._failures = 0
+        self._slow = 0
+    
+    def record(self, failed: bool, slow: bool, now: float) -> None:
+        """Add an outcome, evicting the oldest once the window is full."""
+        if len(self._outcomes) == self._size:
+            old_failed, old_slow = self._outcomes.popleft()
+            self._failures -= old_failed
+            self._slow -= old_slow
+        self._outcomes.append((failed, slow))
+        self._failures += failed
+        self._slow += slow
+    
+    def snapshot(self, now: float) -> tuple[int, int, int]:
+        """Return (calls, failures, slow calls) in the window."""
+        return len(self._outcomes), self._failures, self._slow
+    
+    def clear(self) -> None:
+        """Forget all outcomes."""
+        self._outcomes.clear()
+        self._failures = 0
+        self._slow = 0
+
+
+class _TimeWindow:
+    """Outcomes of the last `size` seconds, aggregated in one-second buckets."""
+    
+    def __init__(self, size: int):
+        self._size = size
+        # Each bucket: [epoch_second, calls, failures, slow]
+        self._buckets: list[list[int]] = [[-1, 0, 0, 0] for _ in range(size)]
+    
+    def record(self, failed: bool, slow: bool, now: float) -> None:
+        """Add an outcome to the bucket of the current second."""
+        second = int(now)
+        bucket = self._buckets[second % self._size]
+        if bucket[0] != second:
+            bucket[:] = [second, 0, 0, 0]
+        bucket[1] += 1
+        bucket[2] += failed
+        bucket[3] += slow
+    
+    def snapshot(self, now: float) -> tuple[int, int, int]:
+        """Return (calls, failures, slow calls) in the window."""
+        oldest = int(now) - self._size
+        calls = failures = slow = 0
+        for second, bucket_calls, bucket_failures, bucket_slow in self._buckets:
+            if second > oldest:
+                calls += bucket_calls
+                failures += bucket_failures
+                slow += bucket_slow
+        return calls, failures, slow
+    
+    def clear(self) -> None:
+        """Forget all outcomes."""
+        for bucket in self._buckets:
+            bucket[:] = [-1, 0, 0, 0]
+
+
 class CircuitBreaker:
     """
     Generic circuit breaker for protecting against cascading failures.
@@ -29,8 +104,15 @@ class CircuitBreaker:
     States:
     - CLOSED: Normal operation, requests pass through
     - OPEN: Too many failures, requests are rejected immediately
-    - HALF_OPEN: Testing recovery, limited requests allowed
+    - HALF_OPEN: Testing recovery, only `half_open_max_calls` probes allowed
     
+    Trip modes:
+    - Consecutive (default): opens after `failure_threshold` consecutive failures
+    - Sliding window: set `sliding_window_type` to open when the failure rate or
+      slow-call rate over the last N calls / N seconds crosses its threshold
+    
+    Safe to share between threads and asyncio tasks: state is only touched
+    under a short lock, never held while the protected call runs.
     No domain coupling - can be used with any external service.
     """
     
@@ -40,25 +122,66 @@ class CircuitBreaker:
         timeout_seconds: int = 60,
         recovery_timeout: int = 30,
         name: str = "default",
+        sliding_window_type: SlidingWindowType | None = None,
+        sliding_window_size: int = 100,
+        minimum_calls: int = 10,
+        failure_rate_threshold: float = 0.5,
+        slow_call_rate_threshold: float = 1.0,
+        slow_call_duration: float = 60.0,
+        half_open_max_calls: int = 1,
     ):
         """
         Initialize circuit breaker.
         
         Args:
-            failure_threshold: Number of failures before opening circuit
-            timeout_seconds: Time to wait before attempting recovery
-            recovery_timeout: Time to wait in half-open state
+            failure_threshold: Number of consecutive failures before opening (consecutive mode)
+            timeout_seconds: Time to wait in open state before probing
+            recovery_timeout: Maximum time in half-open state; probes that
+                have not concluded by then re-open the circuit
             name: Name for logging purposes
+            sliding_window_type: Enables rate-based mode when set
+            sliding_window_size: Window length in calls (count-based) or seconds (time-based)
+            minimum_calls: Calls needed in the window before rates are evaluated
+            failure_rate_threshold: Failure ratio (0-1) that opens the circuit
+            slow_call_rate_threshold: Slow-call ratio (0-1) that opens the circuit
+            slow_call_duration: Seconds above which a call counts as slow
+            half_open_max_calls: Probe calls admitted while half-open
         """
+        if half_open_max_calls < 1 or sliding_window_size < 1:
+            raise ValueError("half_open_max_calls and sliding_window_size must be positive")
+        
         self.failure_threshold = failure_threshold
         self.timeout_seconds = timeout_seconds
         self.recovery_timeout = recovery_timeout
         self.name = name
+        self.sliding_window_type = sliding_window_type
+        self.sliding_window_size = sliding_window_size
+        self.minimum_calls = minimum_calls
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.slow_call_duration = slow_call_duration
+        self.half_open_max_calls = half_open_max_calls
         
         self._state = CircuitState.CLOSED
         self._failure_count = 0
         self._last_failure_time: float | None = None
         self._last_success_time: float | None = None
+        self._opened_at: float | None = None
+        self._half_open_at: float | None = None
+        self._lock = threading.Lock()
+        
+        self._window: _CountWindow | _TimeWindow | None = None
+        if sliding_window_type == SlidingWindowType.COUNT_BASED:
+            self._window = _CountWindow(sliding_window_size)
+        elif sliding_window_type == SlidingWindowType.TIME_BASED:
+            self._window = _TimeWindow(sliding_window_size)
+        
+        # Half-open probe accounting
+        self._probes_in_flight = 0
+        self._probe_calls = 0
+        self._probe_failures = 0
+        self._probe_slow = 0
+        self._rejected_count = 0
     
     @property
     def state(self) -> CircuitState:
@@ -67,11 +190,60 @@ class CircuitBreaker:
     
     def _should_attempt_reset(self) -> bool:
         """Check if enough time has passed to attempt reset."""
-        if self._last_failure_time is None:
+        if self._opened_at is None:
             return False
         
-        time_since_failure = time.time() - self._last_failure_time
-        return time_since_failure >= self.timeout_seconds
+        time_since_open = time.monotonic() - self._opened_at
+        return time_since_open >= self.timeout_seconds
+    
+    def _acquire_permission(self) -> bool:
+        """
+        Decide whether a call may proceed and reserve a probe slot if half-open.
+        
+        Returns:
+            True if the admitted call is a half-open probe
+        
+        Raises:
+            CircuitBreakerOpenException: If the call is rejected
+        """
+        with self._lock:
+            # Probes that never concluded within recovery_timeout re-open the circuit
+            if (
+                self._state == CircuitState.HALF_OPEN
+                and self._half_open_at is not None
+                and time.monotonic() - self._half_open_at >= self.recovery_timeout
+            ):
+                self._transition_to_open(reason="half_open_timeout")
+            
+            # Check if we should transition from OPEN to HALF_OPEN
+            if self._state == CircuitState.OPEN:
+                if self._should_attempt_reset():
+                    logger.info(
+                        "circuit_breaker_half_open",
+                        name=self.name,
+                        failure_count=self._failure_count,
+                    )
+                    self._transition_to_half_open()
+                else:
+                    self._rejected_count += 1
+                    logger.warning(
+                        "circuit_breaker_open",
+                        name=self.name,
+                        failure_count=self._failure_count,
+                    )
+                    raise CircuitBreakerOpenException(
+                        f"Circuit breaker '{self.name}' is open"
+                    )
+            
+            if self._state == CircuitState.HALF_OPEN:
+                if self._probe_calls + self._probes_in_flight >= self.half_open_max_calls:
+                    self._rejected_count += 1
+                    raise CircuitBreakerOpenException(
+                        f"Circuit breaker '{self.name}' is half-open and probing"
+                    )
+                self._probes_in_flight += 1
+                return True
+            return False
     
     def call(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
         """
@@ -81,81 +253,212 @@ class CircuitBreaker:
             func: Function to execute
             *args: Positional arguments for func
             **kwargs: Keyword arguments for func
-            
+        
         Returns:
             Result of func execution
-            
+        
         Raises:
             CircuitBreakerOpenException: If circuit is open
+            DeadlineExceededException: If the request deadline has passed
             Exception: Any exception raised by func
         """
-        # Check if we should transition from OPEN to HALF_OPEN
-        if self._state == CircuitState.OPEN:
-            if self._should_attempt_reset():
-                logger.info(
-                    "circuit_breaker_half_open",
-                    name=self.name,
-                    failure_count=self._failure_count,
-                )
-                self._state = CircuitState.HALF_OPEN
-            else:
-                logger.warning(
-                    "circuit_breaker_open",
-                    name=self.name,
-                    failure_count=self._failure_count,
-                )
-                raise CircuitBreakerOpenException(
-                    f"Circuit breaker '{self.name}' is open"
-                )
+        check_deadline(self.name)
+        probe = self._acquire_permission()
+        started = time.monotonic()
         
         try:
             # Execute the function
             result = func(*args, **kwargs)
-            
-            # Success - reset failure count
-            self._on_success()
-            return result
-            
+        except DeadlineExceededException:
+            # Out of request time: says nothing about the dependency's health
+            self._on_cancelled(probe)
+            raise
         except Exception as e:
             # Failure - increment count and potentially open circuit
-            self._on_failure()
+            self._on_failure(time.monotonic() - started, probe)
             raise e
+        
+        # Success - reset failure count
+        self._on_success(time.monotonic() - started, probe)
+        return result
     
-    def _on_success(self) -> None:
-        """Handle successful call."""
-        self._failure_count = 0
-        self._last_success_time = time.time()
+    async def call_async(self, func: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+        """
+        Await a coroutine function with circuit breaker protection.
         
-        if self._state == CircuitState.HALF_OPEN:
-            logger.info(
-                "circuit_breaker_closed",
-                name=self.name,
-                message="Circuit recovered",
-            )
-            self._state = CircuitState.CLOSED
+        Args:
+            func: Coroutine function to execute
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+        
+        Returns:
+            Result of func execution
+        
+        Raises:
+            CircuitBreakerOpenException: If circuit is open
+            DeadlineExceededException: If the request deadline has passed
+            Exception: Any exception raised by func
+        """
+        check_deadline(self.name)
+        probe = self._acquire_permission()
+        started = time.monotonic()
+        
+        try:
+            result = await func(*args, **kwargs)
+        except DeadlineExceededException:
+            self._on_cancelled(probe)
+            raise
+        except Exception as e:
+            self._on_failure(time.monotonic() - started, probe)
+            raise e
+        except BaseException:
+            # Cancelled by the caller: says nothing about the dependency's health
+            self._on_cancelled(probe)
+            raise
+        
+        self._on_success(time.monotonic() - started, probe)
+        return result
+    
+    def _on_success(self, duration: float = 0.0, probe: bool = False) -> None:
+        """Handle successful call."""
+        with self._lock:
+            self._failure_count = 0
+            self._last_success_time = time.time()
+            self._record(failed=False, duration=duration, probe=probe)
     
-    def _on_failure(self) -> None:
+    def _on_failure(self, duration: float = 0.0, probe: bool = False) -> None:
         """Handle failed call."""
-        self._failure_count += 1
-        self._last_failure_time = time.time()
+        with self._lock:
+            self._failure_count += 1
+            self._last_failure_time = time.time()
+            self._record(failed=True, duration=duration, probe=probe)
+    
+    def _on_cancelled(self, probe: bool) -> None:
+        """Release the probe slot of a cancelled call without recording an outcome."""
+        if probe:
+            with self._lock:
+                if self._state == CircuitState.HALF_OPEN:
+                    self._probes_in_flight = max(0, self._probes_in_flight - 1)
+    
+    def _record(self, failed: bool, duration: float, probe: bool) -> None:
+        """Apply a call outcome to the current state. Caller holds the lock."""
+        slow = duration >= self.slow_call_duration
+        
+        if probe:
+            if self._state == CircuitState.HALF_OPEN:
+                self._record_probe(failed, slow)
+            # Otherwise the probe outlived its half-open period and is ignored
+            return
         
-        if self._failure_count >= self.failure_threshold:
-            if self._state != CircuitState.OPEN:
+        if self._state != CircuitState.CLOSED:
+            # Call admitted before the circuit opened; it no longer affects state
+            return
+        
+        if self._window is None:
+            if failed and self._failure_count >= self.failure_threshold:
                 logger.error(
                     "circuit_breaker_opened",
                     name=self.name,
                     failure_count=self._failure_count,
                     threshold=self.failure_threshold,
                 )
-                self._state = CircuitState.OPEN
+                self._transition_to_open()
+            return
+        
+        now = time.monotonic()
+        self._window.record(failed, slow, now)
+        calls, failures, slow_calls = self._window.snapshot(now)
+        if calls < self.minimum_calls:
+            return
+        
+        failure_rate = failures / calls
+        slow_call_rate = slow_calls / calls
+        if failure_rate >= self.failure_rate_threshold or slow_call_rate >= self.slow_call_rate_threshold:
+            logger.error(
+                "circuit_breaker_opened",
+                name=self.name,
+                failure_rate=round(failure_rate, 3),
+                slow_call_rate=round(slow_call_rate, 3),
+                window_calls=calls,
+            )
+            self._transition_to_open()
+    
+    def _record_probe(self, failed: bool, slow: bool) -> None:
+        """Account for a half-open probe and decide once all probes returned."""
+        self._probes_in_flight = max(0, self._probes_in_flight - 1)
+        self._probe_calls += 1
+        self._probe_failures += failed
+        self._probe_slow += slow
+        
+        if self._window is None:
+            # Consecutive mode: any failed probe re-opens, all successful probes close
+            if failed:
+                self._transition_to_open(reason="probe_failed")
+            elif self._probe_calls >= self.half_open_max_calls:
+                self._transition_to_closed()
+            return
+        
+        if self._probe_calls < self.half_open_max_calls:
+            return
+        
+        failure_rate = self._probe_failures / self._probe_calls
+        slow_call_rate = self._probe_slow / self._probe_calls
+        if failure_rate >= self.failure_rate_threshold or slow_call_rate >= self.slow_call_rate_threshold:
+            self._transition_to_open(reason="probe_failed")
+        else:
+            self._transition_to_closed()
+    
+    def _transition_to_open(self, reason: str | None = None) -> None:
+        """Move to OPEN. Caller holds the lock."""
+        if reason is not None:
+            logger.warning("circuit_breaker_reopened", name=self.name, reason=reason)
+        self._state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        self._half_open_at = None
+        self._reset_probes()
+    
+    def _transition_to_half_open(self) -> None:
+        """Move to HALF_OPEN. Caller holds the lock."""
+        self._state = CircuitState.HALF_OPEN
+        self._half_open_at = time.monotonic()
+        self._reset_probes()
+    
+    def _transition_to_closed(self) -> None:
+        """Move to CLOSED with a fresh window. Caller holds the lock."""
+        logger.info(
+            "circuit_breaker_closed",
+            name=self.name,
+            message="Circuit recovered",
+        )
+        self._state = CircuitState.CLOSED
+        self._failure_count = 0
+        self._opened_at = None
+        self._half_open_at = None
+        self._reset_probes()
+        if self._window is not None:
+            self._window.clear()
+    
+    def _reset_probes(self) -> None:
+        """Clear half-open probe counters. Caller holds the lock."""
+        self._probes_in_flight = 0
+        self._probe_calls = 0
+        self._probe_failures = 0
+        self._probe_slow = 0
     
     def reset(self) -> None:
         """Manually reset the circuit breaker."""
         logger.info("circuit_breaker_reset", name=self.name)
-        self._state = CircuitState.CLOSED
-        self._failure_count = 0
-        self._last_failure_time = None
-        self._last_success_time = None
+        with self._lock:
+            self._state = CircuitState.CLOSED
+            self._failure_count = 0
+            self._last_failure_time = None
+            self._last_success_time = None
+            self._opened_at = None
+            self._half_open_at = None
+            self._rejected_count = 0
+            self._reset_probes()
+            if self._window is not None:
+                self._window.clear()
     
     def get_stats(self) -> dict[str, Any]:
         """
@@ -164,11 +467,23 @@ class CircuitBreaker:
         Returns:
             Dictionary with current state and metrics
         """
-        return {
-            "name": self.name,
-            "state": self._state.value,
-            "failure_count": self._failure_count,
-            "failure_threshold": self.failure_threshold,
-            "last_failure_time": self._last_failure_time,
-            "last_success_time": self._last_success_time,
-        }
+        with self._lock:
+            stats: dict[str, Any] = {
+                "name": self.name,
+                "state": self._state.value,
+                "failure_count": self._failure_count,
+                "failure_threshold": self.failure_threshold,
+                "last_failure_time": self._last_failure_time,
+                "last_success_time": self._last_success_time,
+                "rejected_count": self._rejected_count,
+                "half_open_in_flight": self._probes_in_flight,
+            }
+            if self._window is not None and self.sliding_window_type is not None:
+                calls, failures, slow_calls = self._window.snapshot(time.monotonic())
+                stats.update({
+                    "sliding_window_type": self.sliding_window_type.value,
+                    "window_calls": calls,
+                    "failure_rate": round(failures / calls, 4) if calls else 0.0,
+                    "slow_call_rate": round(slow_calls / calls, 4) if calls else 0.0,
+                })
+            return stats
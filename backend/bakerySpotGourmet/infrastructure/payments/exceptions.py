@@ -12,3 +12,9 @@ class CircuitBreakerOpenException(Exception):
     """Raised when circuit breaker is open and requests are being rejected."""
     def __init__(self, message: str = "Circuit breaker is open"):
         super().__init__(message)
+
+
+class BulkheadFullException(Exception):
+    """Raised when a bulkhead has no free slot and its wait queue is full or timed out."""
+    def __init__(self, message: str = "Bulkhead is full"):
+        super().__init__(message)
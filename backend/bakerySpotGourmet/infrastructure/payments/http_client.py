@@ -0,0 +1,78 @@
+"""
+Shared, pooled async HTTP client for the payment gateway.
+One client per process keeps connections alive across calls instead of
+opening a new TCP/TLS connection for every payment.
+"""
+from typing import Optional
+
+import httpx
+import structlog
+
+from bakerySpotGourmet.core.config import settings
+
+
+logger = structlog.get_logger()
+
+
+def build_payment_http_client(
+    base_url: Optional[str] = None,
+    timeout: Optional[float] = None,
+    max_connections: Optional[int] = None,
+    max_keepalive_connections: Optional[int] = None,
+    keepalive_expiry: Optional[float] = None,
+    transport: Optional[httpx.AsyncBaseTransport] = None,
+) -> httpx.AsyncClient:
+    """
+    Build an AsyncClient configured for the payment gateway.
+
+    Args:
+        base_url: Gateway base URL, defaults to PAYMENT_GATEWAY_URL
+        timeout: Default request timeout in seconds, defaults to EXTERNAL_SERVICE_TIMEOUT
+        max_connections: Upper bound on concurrent connections
+        max_keepalive_connections: Idle connections kept in the pool
+        keepalive_expiry: Seconds an idle connection is kept open
+        transport: Optional custom transport (e.g. an in-process ASGI transport)
+
+    Returns:
+        A configured httpx.AsyncClient
+    """
+    limits = httpx.Limits(
+        max_connections=max_connections or settings.PAYMENT_GATEWAY_MAX_CONNECTIONS,
+        max_keepalive_connections=(
+            max_keepalive_connections or settings.PAYMENT_GATEWAY_MAX_KEEPALIVE_CONNECTIONS
+        ),
+        keepalive_expiry=keepalive_expiry or settings.PAYMENT_GATEWAY_KEEPALIVE_EXPIRY_SECONDS,
+    )
+    return httpx.AsyncClient(
+        base_url=base_url or settings.PAYMENT_GATEWAY_URL,
+        timeout=httpx.Timeout(timeout or settings.EXTERNAL_SERVICE_TIMEOUT),
+        limits=limits,
+        transport=transport,
+    )
+
+
+# Global pooled client, created lazily on first use
+_payment_http_client: httpx.AsyncClient | None = None
+
+
+def get_payment_http_client() -> httpx.AsyncClient:
+    """
+    Get the process-wide pooled payment gateway client.
+
+    Returns:
+        The shared httpx.AsyncClient
+    """
+    global _payment_http_client
+    if _payment_http_client is None or _payment_http_client.is_closed:
+        _payment_http_client = build_payment_http_client()
+        logger.info("payment_http_client_created", base_url=settings.PAYMENT_GATEWAY_URL)
+    return _payment_http_client
+
+
+async def close_payment_http_client() -> None:
+    """Close the shared client and release pooled connections."""
+    global _payment_http_client
+    if _payment_http_client is not None and not _payment_http_client.is_closed:
+        await _payment_http_client.aclose()
+        logger.info("payment_http_client_closed")
+    _payment_http_client = None
@@ -1,30 +1,50 @@
 """
-Payment client placeholder demonstrating circuit breaker and retry policy usage.
-No actual external service integration per instructions.
+Payment gateway client with circuit breaker and retry policy.
+The synchronous path is a placeholder; the async path talks HTTP to the
+gateway over a shared, pooled connection.
 """
-from typing import Any, Dict
+from typing import Any, Awaitable, Callable, Dict, List, TypeVar
+import httpx
 import structlog
 
 from bakerySpotGourmet.core.config import settings
+from bakerySpotGourmet.core.deadline import check_deadline, time_remaining
+from bakerySpotGourmet.core.tracing import traced
 from bakerySpotGourmet.core.constants import (
     CIRCUIT_BREAKER_FAILURE_THRESHOLD,
     CIRCUIT_BREAKER_TIMEOUT_SECONDS,
     CIRCUIT_BREAKER_RECOVERY_TIMEOUT,
+    CIRCUIT_BREAKER_SLIDING_WINDOW_SIZE,
+    CIRCUIT_BREAKER_MINIMUM_CALLS,
+    CIRCUIT_BREAKER_FAILURE_RATE_THRESHOLD,
+    CIRCUIT_BREAKER_SLOW_CALL_RATE_THRESHOLD,
+    CIRCUIT_BREAKER_HALF_OPEN_MAX_CALLS,
 )
-from bakerySpotGourmet.infrastructure.payments.circuit_breaker import CircuitBreaker
-from bakerySpotGourmet.infrastructure.payments.retry_policy import RetryPolicy
+from bakerySpotGourmet.infrastructure.payments.bulkhead import Bulkhead, get_payment_gateway_bulkhead
+from bakerySpotGourmet.infrastructure.payments.circuit_breaker import CircuitBreaker, SlidingWindowType
+from bakerySpotGourmet.infrastructure.payments.http_client import get_payment_http_client
+from bakerySpotGourmet.infrastructure.payments.retry_budget import get_payment_gateway_retry_budget
+from bakerySpotGourmet.infrastructure.payments.retry_policy import JitterStrategy, RetryPolicy
 from bakerySpotGourmet.infrastructure.payments.exceptions import PaymentGatewayException
 
 
 logger = structlog.get_logger()
 
+T = TypeVar("T")
+
 
 class PaymentClient:
     """
-    Placeholder payment client demonstrating resilience patterns.
-    Uses circuit breaker and retry policy for fault tolerance.
+    Payment client demonstrating resilience patterns.
+    Uses bulkhead, circuit breaker and retry policy for fault tolerance.
     
-    Note: This is a placeholder - no actual payment gateway integration.
+    `process_payment` is a synchronous placeholder with no external call.
+    `process_payment_async` posts to the gateway using a pooled httpx.AsyncClient
+    shared by every client instance, so connections are reused across calls.
+    Every attempt takes a slot in the bulkhead shared by all clients of the
+    gateway, which bounds concurrent gateway calls across the whole process,
+    and passes through the circuit breaker. Both sit inside the retry loop,
+    so no slot is held and no breaker call is timed through a backoff sleep.
     """
     
     def __init__(
@@ -32,24 +52,33 @@ class PaymentClient:
         timeout: int | None = None,
         circuit_breaker: CircuitBreaker | None = None,
         retry_policy: RetryPolicy | None = None,
+        http_client: httpx.AsyncClient | None = None,
+        bulkhead: Bulkhead | None = None,
     ):
         """
         Initialize payment client.
         
         Args:
             timeout: Request timeout in seconds
-            circuit_breaker: Circuit breaker instance
+            circuit_breaker: Circuit breaker instance, defaults to the shared
+                gateway breaker (or a dedicated one when timeout is set)
             retry_policy: Retry policy instance
+            http_client: Async HTTP client, defaults to the shared pooled client
+            bulkhead: Concurrency limit, defaults to the shared gateway bulkhead
         """
         self.timeout = timeout or settings.EXTERNAL_SERVICE_TIMEOUT
+        self._http_client = http_client
+        self.bulkhead = bulkhead or get_payment_gateway_bulkhead()
         
-        # Initialize circuit breaker with defensive defaults
-        self.circuit_breaker = circuit_breaker or CircuitBreaker(
-            failure_threshold=CIRCUIT_BREAKER_FAILURE_THRESHOLD,
-            timeout_seconds=CIRCUIT_BREAKER_TIMEOUT_SECONDS,
-            recovery_timeout=CIRCUIT_BREAKER_RECOVERY_TIMEOUT,
-            name="payment_gateway",
-        )
+        # Clients on the default timeout share one breaker, so gateway health
+        # is tracked across the process rather than per client instance
+        if circuit_breaker is None:
+            circuit_breaker = (
+                get_payment_gateway_circuit_breaker()
+                if timeout is None
+                else _build_circuit_breaker(self.timeout)
+            )
+        self.circuit_breaker = circuit_breaker
         
         # Initialize retry policy
         self.retry_policy = retry_policy or RetryPolicy(
@@ -57,12 +86,18 @@ class PaymentClient:
             base_delay=1.0,
             backoff_multiplier=2.0,
             retryable_exceptions=(PaymentGatewayException,),
+            jitter=JitterStrategy.FULL,
+            retry_budget=get_payment_gateway_retry_budget(),
         )
     
+    @traced
     def process_payment(self, amount: float, currency: str, **kwargs: Any) -> Dict[str, Any]:
         """
         Process a payment (placeholder implementation).
         
+        Makes a single attempt: retrying here would block the calling thread
+        through the backoff sleeps. Use `process_payment_async` for retries.
+        
         Args:
             amount: Payment amount
             currency: Currency code
@@ -72,6 +107,7 @@ class PaymentClient:
             Payment result dictionary
             
         Raises:
+            BulkheadFullException: If too many gateway calls are in flight
             CircuitBreakerOpenException: If circuit breaker is open
             PaymentGatewayException: If payment processing fails
         """
@@ -81,18 +117,14 @@ class PaymentClient:
             currency=currency,
         )
         
-        # Use circuit breaker to protect against cascading failures
-        def _process() -> Dict[str, Any]:
-            # Use retry policy for transient failures
-            return self.retry_policy.execute(
+        try:
+            result = self.bulkhead.call(
+                self.circuit_breaker.call,
                 self._make_payment_request,
                 amount,
                 currency,
                 **kwargs
             )
-        
-        try:
-            result = self.circuit_breaker.call(_process)
             
             logger.info(
                 "payment_processing_completed",
@@ -112,6 +144,7 @@ class PaymentClient:
             )
             raise
     
+    @traced
     def _make_payment_request(self, amount: float, currency: str, **kwargs: Any) -> Dict[str, Any]:
         """
         Make actual payment request (placeholder).
@@ -146,6 +179,204 @@ class PaymentClient:
             "currency": currency,
         }
     
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """HTTP client used for gateway calls."""
+        return self._http_client or get_payment_http_client()
+    
+    @traced
+    async def process_payment_async(
+        self,
+        amount: float,
+        currency: str,
+        timeout: float | None = None,
+        deadline: float | None = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """
+        Process a payment through the gateway without blocking the event loop.
+        Transient gateway failures are retried with jittered, non-blocking backoff;
+        each attempt is guarded by the bulkhead and the circuit breaker.
+        
+        Args:
+            amount: Payment amount
+            currency: Currency code
+            timeout: Per-call timeout in seconds, defaults to the client timeout
+            deadline: Absolute `time.monotonic()` deadline covering all retries;
+                the request deadline applies as well when it is earlier
+            **kwargs: Additional payment parameters sent to the gateway
+            
+        Returns:
+            Payment result dictionary
+            
+        Raises:
+            BulkheadFullException: If too many gateway calls are in flight
+            CircuitBreakerOpenException: If circuit breaker is open
+            PaymentGatewayException: If payment processing fails
+            asyncio.TimeoutError: If the deadline passes while a request is in flight
+        """
+        logger.info(
+            "payment_processing_started",
+            amount=amount,
+            currency=currency,
+        )
+        
+        try:
+            result = await self.retry_policy.execute_async(
+                self._call_gateway_async,
+                self._make_payment_request_async,
+                amount,
+                currency,
+                timeout,
+                deadline=deadline,
+                **kwargs
+            )
+        except Exception as e:
+            logger.error(
+                "payment_processing_failed",
+                amount=amount,
+                currency=currency,
+                error=str(e),
+            )
+            raise
+        
+        logger.info(
+            "payment_processing_completed",
+            amount=amount,
+            currency=currency,
+            transaction_id=result.get("transaction_id"),
+        )
+        return result
+    
+    async def _make_payment_request_async(
+        self,
+        amount: float,
+        currency: str,
+        timeout: float | None = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """
+        POST a payment to the gateway.
+        
+        Args:
+            amount: Payment amount
+            currency: Currency code
+            timeout: Per-call timeout in seconds
+            **kwargs: Additional parameters
+            
+        Returns:
+            Gateway response body
+            
+        Raises:
+            PaymentGatewayException: On timeout, transport error or non-2xx response
+        """
+        payload = {"amount": amount, "currency": currency, **kwargs}
+        return await self._post_async("/payments", payload, timeout)
+    
+    @traced
+    async def capture_batch_async(
+        self,
+        captures: List[Dict[str, Any]],
+        timeout: float | None = None,
+        deadline: float | None = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Capture several authorized payments in one gateway call.
+        
+        Each capture must carry a unique `reference`; the gateway treats it as an
+        idempotency key, so resending a batch never captures a payment twice.
+        
+        Args:
+            captures: Items with `reference`, `amount` and `currency`
+            timeout: Per-call timeout in seconds, defaults to the client timeout
+            deadline: Absolute `time.monotonic()` deadline covering all retries
+            
+        Returns:
+            One result per capture with `reference`, `status` and `transaction_id`
+            
+        Raises:
+            BulkheadFullException: If too many gateway calls are in flight
+            CircuitBreakerOpenException: If circuit breaker is open
+            PaymentGatewayException: If the batch could not be submitted
+        """
+        response = await self.retry_policy.execute_async(
+            self._call_gateway_async,
+            self._post_async,
+            "/payments/captures",
+            {"captures": captures},
+            timeout,
+            deadline=deadline,
+        )
+        results: List[Dict[str, Any]] = response["results"]
+        return results
+    
+    async def _call_gateway_async(
+        self,
+        func: Callable[..., Awaitable[T]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        """
+        Make one gateway attempt inside the bulkhead and the circuit breaker.
+        
+        Args:
+            func: Coroutine function making the request
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+            
+        Returns:
+            Result of func
+        """
+        return await self.bulkhead.call_async(self.circuit_breaker.call_async, func, *args, **kwargs)
+    
+    @traced
+    async def _post_async(
+        self,
+        path: str,
+        payload: Dict[str, Any],
+        timeout: float | None = None,
+    ) -> Dict[str, Any]:
+        """
+        POST a JSON payload to the gateway.
+        
+        Args:
+            path: Gateway path
+            payload: JSON body
+            timeout: Per-call timeout in seconds
+            
+        Returns:
+            Gateway response body
+            
+        Raises:
+            DeadlineExceededException: If the request deadline has passed
+            PaymentGatewayException: On timeout, transport error or non-2xx response
+        """
+        check_deadline(f"POST {path}")
+        timeout = float(timeout or self.timeout)
+        remaining = time_remaining()
+        if remaining is not None:
+            # Never wait on the gateway longer than the caller is willing to
+            timeout = min(timeout, remaining)
+        
+        try:
+            response = await self.http_client.post(
+                path,
+                json=payload,
+                timeout=timeout,
+            )
+        except httpx.TimeoutException as e:
+            raise PaymentGatewayException("Payment gateway timed out") from e
+        except httpx.HTTPError as e:
+            raise PaymentGatewayException(f"Payment gateway unreachable: {type(e).__name__}") from e
+        
+        if response.status_code >= 400:
+            raise PaymentGatewayException(
+                f"Payment gateway returned status {response.status_code}"
+            )
+        
+        result: Dict[str, Any] = response.json()
+        return result
+    
     def get_circuit_breaker_stats(self) -> Dict[str, Any]:
         """
         Get circuit breaker statistics.
@@ -154,3 +385,41 @@ class PaymentClient:
             Circuit breaker stats
         """
         return self.circuit_breaker.get_stats()
+    
+    def get_bulkhead_stats(self) -> Dict[str, Any]:
+        """
+        Get bulkhead statistics.
+        
+        Returns:
+            Bulkhead gauges and counters
+        """
+        return self.bulkhead.get_stats()
+
+
+def _build_circuit_breaker(timeout: float) -> CircuitBreaker:
+    """Build a gateway circuit breaker with defensive defaults."""
+    return CircuitBreaker(
+        failure_threshold=CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+        timeout_seconds=CIRCUIT_BREAKER_TIMEOUT_SECONDS,
+        recovery_timeout=CIRCUIT_BREAKER_RECOVERY_TIMEOUT,
+        name="payment_gateway",
+        sliding_window_type=SlidingWindowType.COUNT_BASED,
+        sliding_window_size=CIRCUIT_BREAKER_SLIDING_WINDOW_SIZE,
+        minimum_calls=CIRCUIT_BREAKER_MINIMUM_CALLS,
+        failure_rate_threshold=CIRCUIT_BREAKER_FAILURE_RATE_THRESHOLD,
+        slow_call_rate_threshold=CIRCUIT_BREAKER_SLOW_CALL_RATE_THRESHOLD,
+        slow_call_duration=float(timeout) / 2,
+        half_open_max_calls=CIRCUIT_BREAKER_HALF_OPEN_MAX_CALLS,
+    )
+
+
+# Shared circuit breaker for clients on the default timeout
+_payment_gateway_circuit_breaker: CircuitBreaker | None = None
+
+
+def get_payment_gateway_circuit_breaker() -> CircuitBreaker:
+    """Get the circuit breaker shared by payment gateway clients."""
+    global _payment_gateway_circuit_breaker
+    if _payment_gateway_circuit_breaker is None:
+        _payment_gateway_circuit_breaker = _build_circuit_breaker(settings.EXTERNAL_SERVICE_TIMEOUT)
+    return _payment_gateway_circuit_breaker
@@ -0,0 +1,131 @@
+"""
+Shared retry budget for an external dependency.
+Bounds retry amplification when the dependency degrades: retries are allowed
+only up to a fraction of recent successful calls, plus a small fixed reserve.
+"""
+import threading
+import time
+from typing import Any
+
+from bakerySpotGourmet.core.constants import (
+    RETRY_BUDGET_MAX_TOKENS,
+    RETRY_BUDGET_MIN_RETRIES_PER_SECOND,
+    RETRY_BUDGET_RATIO,
+)
+
+
+class RetryBudget:
+    """
+    Token bucket shared by every RetryPolicy that talks to the same dependency.
+
+    Each successful call deposits `ratio` tokens (capped at `max_tokens`) and
+    each retry withdraws one token. When calls keep failing, no new tokens
+    arrive and retries stop after the bucket drains, so the extra load is
+    bounded to roughly `ratio` of the recent success rate. A reserve refilled
+    at `min_retries_per_second` keeps low-traffic dependencies retryable.
+
+    Thread-safe: one budget can be shared by sync and async callers.
+    """
+
+    def __init__(
+        self,
+        ratio: float = RETRY_BUDGET_RATIO,
+        min_retries_per_second: float = RETRY_BUDGET_MIN_RETRIES_PER_SECOND,
+        max_tokens: float = RETRY_BUDGET_MAX_TOKENS,
+        name: str = "default",
+    ):
+        """
+        Initialize the retry budget.
+
+        Args:
+            ratio: Tokens deposited per successful call (0.1 allows 10% extra load)
+            min_retries_per_second: Refill rate of the reserve, independent of traffic
+            max_tokens: Upper bound on saved-up tokens
+            name: Name for logging and stats
+        """
+        if ratio < 0 or min_retries_per_second < 0 or max_tokens <= 0:
+            raise ValueError("ratio and min_retries_per_second must be >= 0, max_tokens > 0")
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.max_tokens = max_tokens
+        self.name = name
+
+        self._reserve_cap = min(max_tokens, max(1.0, min_retries_per_second))
+        self._tokens = self._reserve_cap if min_retries_per_second > 0 else 0.0
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+        self._successes = 0
+        self._retries_allowed = 0
+        self._retries_rejected = 0
+
+    def _refill_reserve(self, now: float) -> None:
+        """Top up the reserve based on elapsed time. Caller holds the lock."""
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        if self._tokens < self._reserve_cap and self.min_retries_per_second > 0:
+            self._tokens = min(
+                self._reserve_cap,
+                self._tokens + elapsed * self.min_retries_per_second,
+            )
+
+    def record_success(self) -> None:
+        """Deposit tokens for a successful call."""
+        with self._lock:
+            self._successes += 1
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_acquire_retry(self) -> bool:
+        """
+        Withdraw a token for a retry.
+
+        Returns:
+            True if the retry may proceed, False if the budget is exhausted
+        """
+        with self._lock:
+            self._refill_reserve(time.monotonic())
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                self._retries_allowed += 1
+                return True
+            self._retries_rejected += 1
+            return False
+
+    def reset(self) -> None:
+        """Restore the initial state and clear counters."""
+        with self._lock:
+            self._tokens = self._reserve_cap if self.min_retries_per_second > 0 else 0.0
+            self._last_refill = time.monotonic()
+            self._successes = 0
+            self._retries_allowed = 0
+            self._retries_rejected = 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get retry budget statistics.
+
+        Returns:
+            Dictionary with available tokens and retry counters
+        """
+        with self._lock:
+            self._refill_reserve(time.monotonic())
+            calls = self._successes or 1
+            return {
+                "name": self.name,
+                "tokens": round(self._tokens, 3),
+                "max_tokens": self.max_tokens,
+                "ratio": self.ratio,
+                "successes": self._successes,
+                "retries_allowed": self._retries_allowed,
+                "retries_rejected": self._retries_rejected,
+                "retry_ratio": round(self._retries_allowed / calls, 4),
+            }
+
+
+# Shared budget for every call to the payment gateway
+_payment_gateway_retry_budget = RetryBudget(name="payment_gateway")
+
+
+def get_payment_gateway_retry_budget() -> RetryBudget:
+    """Get the retry budget shared by all payment gateway clients."""
+    return _payment_gateway_retry_budget
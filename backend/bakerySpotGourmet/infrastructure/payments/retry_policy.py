@@ -1,16 +1,46 @@
 """
 Retry policy with exponential backoff for resilient external service calls.
 """
+import asyncio
+import random
 import time
-from typing import Callable, Any, TypeVar, Type
+from dataclasses import dataclass
+from enum import Enum
+from typing import Awaitable, Callable, Any, Generic, TypeVar, Type
 import structlog
 
+from bakerySpotGourmet.core.deadline import check_deadline, resolve_deadline, time_remaining
+from bakerySpotGourmet.core.exceptions import DeadlineExceededException
+from bakerySpotGourmet.infrastructure.payments.retry_budget import RetryBudget
+
 
 logger = structlog.get_logger()
 
 T = TypeVar('T')
 
 
+class JitterStrategy(str, Enum):
+    """Randomization applied to backoff delays."""
+    NONE = "none"                  # Plain exponential backoff
+    FULL = "full"                  # Uniform in [0, exponential delay]
+    DECORRELATED = "decorrelated"  # Uniform in [base_delay, previous delay * 3]
+
+
+@dataclass
+class RetryResult(Generic[T]):
+    """
+    Outcome of a successful retried call.
+    
+    Attributes:
+        value: Return value of the wrapped function
+        attempts: Number of attempts made, including the successful one
+        total_wait_seconds: Time spent sleeping between attempts
+    """
+    value: T
+    attempts: int
+    total_wait_seconds: float
+
+
 class RetryPolicy:
     """
     Exponential backoff retry policy.
@@ -24,6 +54,9 @@ class RetryPolicy:
         max_delay: float = 60.0,
         backoff_multiplier: float = 2.0,
         retryable_exceptions: tuple[Type[Exception], ...] = (Exception,),
+        jitter: JitterStrategy = JitterStrategy.NONE,
+        rng: random.Random | None = None,
+        retry_budget: RetryBudget | None = None,
     ):
         """
         Initialize retry policy.
@@ -34,38 +67,76 @@ class RetryPolicy:
             max_delay: Maximum delay in seconds
             backoff_multiplier: Multiplier for exponential backoff
             retryable_exceptions: Tuple of exception types to retry
+            jitter: Randomization applied to delays
+            rng: Random generator, injectable for deterministic tests
+            retry_budget: Shared budget consulted before every retry
         """
         self.max_retries = max_retries
         self.base_delay = base_delay
         self.max_delay = max_delay
         self.backoff_multiplier = backoff_multiplier
         self.retryable_exceptions = retryable_exceptions
+        self.jitter = jitter
+        self._rng = rng or random.Random()
+        self.retry_budget = retry_budget
     
     def _calculate_delay(self, attempt: int) -> float:
         """Calculate delay for given attempt number."""
         delay = self.base_delay * (self.backoff_multiplier ** attempt)
         return min(delay, self.max_delay)
     
+    def _next_delay(self, attempt: int, previous_delay: float) -> float:
+        """
+        Calculate the jittered delay before the next attempt.
+        
+        Args:
+            attempt: Zero-based number of the attempt that just failed
+            previous_delay: Delay used before the failed attempt (0 for the first)
+        
+        Returns:
+            Delay in seconds, never above max_delay
+        """
+        if self.jitter == JitterStrategy.FULL:
+            return self._rng.uniform(0, self._calculate_delay(attempt))
+        if self.jitter == JitterStrategy.DECORRELATED:
+            upper = max(self.base_delay, previous_delay * 3)
+            return min(self.max_delay, self._rng.uniform(self.base_delay, upper))
+        return self._calculate_delay(attempt)
+    
+    def _record_success(self) -> None:
+        """Credit the shared retry budget, if any, for a successful call."""
+        if self.retry_budget is not None:
+            self.retry_budget.record_success()
+    
+    def _retry_allowed(self) -> bool:
+        """Check the shared retry budget, if any, before scheduling a retry."""
+        return self.retry_budget is None or self.retry_budget.try_acquire_retry()
+    
     def execute(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
         """
         Execute a function with retry logic.
+        Stops early once the request deadline, if any, leaves no room for another attempt.
         
         Args:
             func: Function to execute
             *args: Positional arguments for func
             **kwargs: Keyword arguments for func
-            
+        
         Returns:
             Result of func execution
-            
+        
         Raises:
+            DeadlineExceededException: If the request deadline passed before an attempt
             Exception: The last exception if all retries fail
         """
         last_exception: Exception | None = None
+        delay = 0.0
         
         for attempt in range(self.max_retries + 1):
+            check_deadline(func.__name__)
             try:
                 result = func(*args, **kwargs)
+                self._record_success()
                 
                 if attempt > 0:
                     logger.info(
@@ -75,12 +146,32 @@ class RetryPolicy:
                     )
                 
                 return result
-                
+            
             except self.retryable_exceptions as e:
                 last_exception = e
                 
                 if attempt < self.max_retries:
-                    delay = self._calculate_delay(attempt)
+                    # Checked before the budget, so a retry that cannot
+                    # happen does not spend a token
+                    delay = self._next_delay(attempt, delay)
+                    remaining = time_remaining()
+                    if remaining is not None and delay >= remaining:
+                        logger.warning(
+                            "retry_deadline_exceeded",
+                            attempts=attempt + 1,
+                            function=func.__name__,
+                            exception=str(e),
+                        )
+                        raise
+                    
+                    if not self._retry_allowed():
+                        logger.warning(
+                            "retry_budget_rejected",
+                            attempts=attempt + 1,
+                            function=func.__name__,
+                            exception=str(e),
+                        )
+                        raise
                     
                     logger.warning(
                         "retry_attempt",
@@ -106,3 +197,130 @@ class RetryPolicy:
         
         # Should never reach here
         raise RuntimeError("Retry logic error")
+    
+    async def execute_async(
+        self,
+        func: Callable[..., Awaitable[T]],
+        *args: Any,
+        deadline: float | None = None,
+        **kwargs: Any,
+    ) -> T:
+        """
+        Execute a coroutine function with retry logic, sleeping without blocking the loop.
+        
+        Args:
+            func: Coroutine function to execute
+            *args: Positional arguments for func
+            deadline: Absolute `time.monotonic()` deadline for the whole call, including retries;
+                capped by the request deadline when one is set
+            **kwargs: Keyword arguments for func
+        
+        Returns:
+            Result of func execution
+        
+        Raises:
+            DeadlineExceededException: If the deadline passed before an attempt
+            asyncio.TimeoutError: If the deadline passes during an attempt
+            Exception: The last exception if all retries fail or the budget runs out
+        """
+        result = await self.execute_async_with_result(func, *args, deadline=deadline, **kwargs)
+        return result.value
+    
+    async def execute_async_with_result(
+        self,
+        func: Callable[..., Awaitable[T]],
+        *args: Any,
+        deadline: float | None = None,
+        **kwargs: Any,
+    ) -> RetryResult[T]:
+        """
+        Same as `execute_async`, but report attempts and total wait time.
+        
+        A retry is only scheduled when its delay fits in the remaining budget,
+        and every attempt is cut off at the deadline.
+        
+        Args:
+            func: Coroutine function to execute
+            *args: Positional arguments for func
+            deadline: Absolute `time.monotonic()` deadline for the whole call
+            **kwargs: Keyword arguments for func
+        
+        Returns:
+            RetryResult with the value, attempts made and seconds spent waiting
+        
+        Raises:
+            DeadlineExceededException: If the deadline passed before an attempt
+            asyncio.TimeoutError: If the deadline passes during an attempt
+            Exception: The last exception if all retries fail or the budget runs out
+        """
+        function_name = getattr(func, "__name__", repr(func))
+        deadline = resolve_deadline(deadline)
+        total_wait = 0.0
+        delay = 0.0
+        attempt = 0
+        
+        while True:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise DeadlineExceededException(function_name)
+            try:
+                if remaining is None:
+                    value = await func(*args, **kwargs)
+                else:
+                    value = await asyncio.wait_for(func(*args, **kwargs), timeout=remaining)
+                self._record_success()
+                
+                if attempt > 0:
+                    logger.info(
+                        "retry_succeeded",
+                        attempt=attempt,
+                        function=function_name,
+                        total_wait_seconds=round(total_wait, 3),
+                    )
+                return RetryResult(value=value, attempts=attempt + 1, total_wait_seconds=total_wait)
+            
+            except self.retryable_exceptions as e:
+                if attempt >= self.max_retries:
+                    logger.error(
+                        "retry_exhausted",
+                        attempts=attempt + 1,
+                        function=function_name,
+                        total_wait_seconds=round(total_wait, 3),
+                        exception=str(e),
+                    )
+                    raise
+                
+                delay = self._next_delay(attempt, delay)
+                # Checked before the budget, so a retry that cannot happen
+                # does not spend a token
+                if deadline is not None and time.monotonic() + delay >= deadline:
+                    logger.warning(
+                        "retry_deadline_exceeded",
+                        attempts=attempt + 1,
+                        function=function_name,
+                        total_wait_seconds=round(total_wait, 3),
+                        exception=str(e),
+                    )
+                    raise
+                
+                if not self._retry_allowed():
+                    logger.warning(
+                        "retry_budget_rejected",
+                        attempts=attempt + 1,
+                        function=function_name,
+                        total_wait_seconds=round(total_wait, 3),
+                        exception=str(e),
+                    )
+                    raise
+                
+                attempt += 1
+                logger.warning(
+                    "retry_attempt",
+                    attempt=attempt,
+                    max_retries=self.max_retries,
+                    delay_seconds=round(delay, 3),
+                    function=function_name,
+                    exception=str(e),
+                )
+                await asyncio.sleep(delay)
+                total_wait += delay
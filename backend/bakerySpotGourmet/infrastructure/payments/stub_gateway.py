@@ -0,0 +1,168 @@
+"""
+Local stub payment gateway for tests and benchmarks.
+Simulates gateway latency and transient errors; never moves real money.
+
+Run standalone:
+    python -m bakerySpotGourmet.infrastructure.payments.stub_gateway --port 8081 --latency 0.05 --error-rate 0.1
+
+Or in-process, without sockets:
+    transport = httpx.ASGITransport(app=create_stub_gateway_app(StubGatewayConfig()))
+"""
+import argparse
+import asyncio
+import random
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, Field
+
+
+@dataclass
+class StubGatewayConfig:
+    """
+    Behavior of the stub gateway.
+
+    Attributes:
+        latency_seconds: Base latency added to every request
+        latency_jitter_seconds: Uniform random jitter added on top of the base latency
+        error_rate: Probability (0-1) of answering with error_status_code
+        error_status_code: HTTP status returned for simulated errors
+        decline_rate: Probability (0-1) that a single capture in a batch is declined
+        seed: Random seed for reproducible runs
+    """
+    latency_seconds: float = 0.0
+    latency_jitter_seconds: float = 0.0
+    error_rate: float = 0.0
+    error_status_code: int = 503
+    decline_rate: float = 0.0
+    seed: Optional[int] = None
+
+
+class StubPaymentRequest(BaseModel):
+    """Payment request accepted by the stub gateway."""
+    amount: float = Field(gt=0)
+    currency: str = Field(min_length=3, max_length=3)
+    reference: Optional[str] = None
+
+
+class StubCapture(BaseModel):
+    """A single capture inside a batch."""
+    reference: str = Field(min_length=1)
+    amount: float = Field(gt=0)
+    currency: str = Field(min_length=3, max_length=3)
+
+
+class StubCaptureBatch(BaseModel):
+    """Batch capture request accepted by the stub gateway."""
+    captures: List[StubCapture] = Field(max_length=1000)
+
+
+def create_stub_gateway_app(config: Optional[StubGatewayConfig] = None) -> FastAPI:
+    """
+    Create the stub gateway ASGI application.
+
+    Args:
+        config: Latency and error behavior, defaults to an always-successful gateway
+
+    Returns:
+        FastAPI application exposing POST /payments, POST /payments/captures and GET /stats
+    """
+    config = config or StubGatewayConfig()
+    rng = random.Random(config.seed)
+    stats: Dict[str, int] = {"requests": 0, "errors": 0, "captures": 0}
+    # Capture results by reference, so replayed batches are idempotent
+    captured: Dict[str, Dict[str, Any]] = {}
+
+    app = FastAPI(title="Stub Payment Gateway")
+    app.state.config = config
+    app.state.stats = stats
+
+    @app.post("/payments")
+    async def create_payment(payment: StubPaymentRequest) -> Any:
+        """Simulate authorizing and capturing a payment."""
+        error = await _simulate_call()
+        if error is not None:
+            return error
+
+        return {
+            "transaction_id": f"stub_{uuid.uuid4().hex}",
+            "status": "success",
+            "amount": payment.amount,
+            "currency": payment.currency,
+            "reference": payment.reference,
+        }
+
+    @app.post("/payments/captures")
+    async def capture_batch(batch: StubCaptureBatch) -> Any:
+        """Simulate capturing a batch of authorized payments."""
+        error = await _simulate_call()
+        if error is not None:
+            return error
+
+        results = []
+        for capture in batch.captures:
+            if capture.reference not in captured:
+                stats["captures"] += 1
+                declined = rng.random() < config.decline_rate
+                captured[capture.reference] = {
+                    "reference": capture.reference,
+                    "status": "declined" if declined else "success",
+                    "transaction_id": None if declined else f"stub_{uuid.uuid4().hex}",
+                }
+            results.append(captured[capture.reference])
+        return {"results": results}
+
+    async def _simulate_call() -> Optional[JSONResponse]:
+        """Apply configured latency and maybe return a simulated error response."""
+        stats["requests"] += 1
+        delay = config.latency_seconds + rng.uniform(0, config.latency_jitter_seconds)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        if rng.random() < config.error_rate:
+            stats["errors"] += 1
+            return JSONResponse(
+                status_code=config.error_status_code,
+                content={"detail": "Simulated gateway error"},
+            )
+        return None
+
+    @app.get("/stats")
+    async def get_stats() -> Dict[str, int]:
+        """Return request and simulated error counters."""
+        return dict(stats)
+
+    return app
+
+
+def main() -> None:
+    """Run the stub gateway with uvicorn."""
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Stub payment gateway")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--latency", type=float, default=0.0, help="Base latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Latency jitter in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Error probability (0-1)")
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--decline-rate", type=float, default=0.0, help="Per-capture decline probability (0-1)")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    app = create_stub_gateway_app(StubGatewayConfig(
+        latency_seconds=args.latency,
+        latency_jitter_seconds=args.jitter,
+        error_rate=args.error_rate,
+        error_status_code=args.error_status,
+        decline_rate=args.decline_rate,
+        seed=args.seed,
+    ))
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,34 @@
 import structlog
 from fastapi import FastAPI
+from fastapi.datastructures import Default
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
+from fastapi.responses import PlainTextResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from contextlib import asynccontextmanager
 
 from bakerySpotGourmet.core.config import settings
-from bakerySpotGourmet.core.logging import setup_logging
-from bakerySpotGourmet.core.middleware import RequestIDMiddleware, RequestTimingMiddleware
+from bakerySpotGourmet.core.constants import METRICS_CONTENT_TYPE
+from bakerySpotGourmet.core.logging import setup_logging, shutdown_logging
+from bakerySpotGourmet.core.loop_monitor import get_event_loop_monitor
+from bakerySpotGourmet.core.middleware import (
+    RequestDeadlineMiddleware,
+    RequestIDMiddleware,
+    RequestProfilingMiddleware,
+    RequestTimeoutMiddleware,
+    RequestTimingMiddleware,
+    SlowRequestTraceMiddleware,
+)
+from bakerySpotGourmet.core.profiling import get_continuous_profiler
+from bakerySpotGourmet.core.responses import PydanticJSONResponse
 from bakerySpotGourmet.core import exceptions
+from bakerySpotGourmet.api.v1 import dependencies as deps
 from bakerySpotGourmet.api.v1.router import api_router
+from bakerySpotGourmet.infrastructure.events.event_bus import get_event_bus
+from bakerySpotGourmet.infrastructure.payments.http_client import close_payment_http_client
+from bakerySpotGourmet.services.metrics_service import register_default_collectors, render_metrics
+from bakerySpotGourmet.services.order_event_service import get_order_event_service
+from bakerySpotGourmet.services.payment_webhook_service import get_payment_webhook_service
 
 
 @asynccontextmanager
@@ -20,8 +39,23 @@ async def lifespan(app: FastAPI):
     setup_logging()
     logger = structlog.get_logger()
     logger.info("Application starting up")
+    event_bus = get_event_bus()
+    # Subscribe background consumers before workers start
+    order_repository = deps.resolve_dependency(app, deps.get_order_repository)
+    get_payment_webhook_service(deps.resolve_dependency(app, deps.get_payment_repository), order_repository)
+    get_order_event_service(order_repository)
+    await event_bus.start()
+    if settings.CONTINUOUS_PROFILER_ENABLED:
+        get_continuous_profiler().start()
+    if settings.EVENT_LOOP_MONITOR_ENABLED:
+        await get_event_loop_monitor().start()
     yield
     logger.info("Application shutting down")
+    await get_event_loop_monitor().stop()
+    get_continuous_profiler().stop()
+    await event_bus.stop()
+    await close_payment_http_client()
+    shutdown_logging()
 
 
 def get_application() -> FastAPI:
@@ -33,6 +67,9 @@ def get_application() -> FastAPI:
         version=settings.VERSION,
         openapi_url=f"{settings.API_V1_STR}/openapi.json",
         lifespan=lifespan,
+        # Wrapped in Default so routes with a response model keep FastAPI's
+        # own dump_json fast path, which an explicit class would turn off
+        default_response_class=Default(PydanticJSONResponse),
     )
 
     # Set all CORS enabled origins
@@ -45,13 +82,20 @@ def get_application() -> FastAPI:
             allow_headers=["*"],
         )
     
-    # Add custom middleware (order matters - first added is outermost)
+    # Add custom middleware (order matters - last added is outermost)
+    app.add_middleware(RequestTimeoutMiddleware)
+    app.add_middleware(RequestDeadlineMiddleware)
+    if settings.PROFILING_ENABLED:
+        app.add_middleware(RequestProfilingMiddleware)
+    if settings.SLOW_REQUEST_THRESHOLD_SECONDS > 0:
+        app.add_middleware(SlowRequestTraceMiddleware)
     app.add_middleware(RequestTimingMiddleware)
     app.add_middleware(RequestIDMiddleware)
     
     # Register global exception handlers
     app.add_exception_handler(exceptions.RateLimitExceededException, exceptions.rate_limit_handler)
     app.add_exception_handler(exceptions.EntityNotFoundException, exceptions.entity_not_found_handler)
+    app.add_exception_handler(exceptions.DeadlineExceededException, exceptions.deadline_exceeded_handler)
     app.add_exception_handler(exceptions.BakeryException, exceptions.bakery_exception_handler)
     app.add_exception_handler(RequestValidationError, exceptions.validation_exception_handler)
     app.add_exception_handler(StarletteHTTPException, exceptions.http_exception_handler)
@@ -72,6 +116,17 @@ def get_application() -> FastAPI:
     async def liveness_check():
         """Liveness check endpoint."""
         return {"status": "alive"}
+    
+    register_default_collectors(repositories=lambda: {
+        "users": deps.resolve_dependency(app, deps.get_user_repository),
+        "orders": deps.resolve_dependency(app, deps.get_order_repository),
+        "payments": deps.resolve_dependency(app, deps.get_payment_repository),
+    })
+    
+    @app.get("/metrics", tags=["health"], include_in_schema=False)
+    async def metrics():
+        """Prometheus scrape endpoint."""
+        return PlainTextResponse(render_metrics(), media_type=METRICS_CONTENT_TYPE)
 
     app.include_router(api_router, prefix=settings.API_V1_STR)
 
@@ -1,5 +1,6 @@
-from typing import List, Optional
+from typing import Iterable, List, Optional
 from bakerySpotGourmet.domain.catalog.product import Product
+from bakerySpotGourmet.core.tracing import traced
 
 class ItemRepository:
     def __init__(self):
@@ -10,12 +11,23 @@ class ItemRepository:
             3: Product(id=3, name="Espresso", price=3.00, description="Strong coffee"),
         }
 
+    @traced
     def get_by_id(self, item_id: int) -> Optional[Product]:
         return self._items.get(item_id)
     
+    @traced
     def save(self, product: Product) -> Product:
         """
         Save a product to the repository.
         """
         self._items[product.id] = product
         return product
+
+    @traced
+    def save_many(self, products: Iterable[Product]) -> List[Product]:
+        """
+        Save several products in one call.
+        """
+        saved = list(products)
+        self._items.update((product.id, product) for product in saved)
+        return saved
@@ -1,9 +1,11 @@
 """
 Order repository for persistence operations.
 """
-from typing import Dict, Optional, List
+from typing import Dict, Iterable, Optional, List
 from bakerySpotGourmet.domain.orders.order import Order
 from bakerySpotGourmet.domain.orders.status import OrderStatus
+from bakerySpotGourmet.core.deadline import deadline_checked
+from bakerySpotGourmet.core.tracing import traced
 
 
 class OrderRepository:
@@ -13,6 +15,8 @@ class OrderRepository:
         self._orders: Dict[int, Order] = {}
         self._counter = 1
 
+    @traced
+    @deadline_checked
     def save(self, order: Order) -> Order:
         """
         Save a new order or update existing.
@@ -29,6 +33,29 @@ class OrderRepository:
         self._orders[order.id] = order
         return order
 
+    @traced
+    @deadline_checked
+    def save_many(self, orders: Iterable[Order]) -> List[Order]:
+        """
+        Save several orders in one call, assigning IDs like `save`.
+        
+        Args:
+            orders: The orders to save
+            
+        Returns:
+            The saved orders with IDs assigned
+        """
+        saved = []
+        for order in orders:
+            if order.id is None:
+                order.id = self._counter
+                self._counter += 1
+            self._orders[order.id] = order
+            saved.append(order)
+        return saved
+
+    @traced
+    @deadline_checked
     def get_by_id(self, order_id: int) -> Optional[Order]:
         """
         Retrieve an order by ID.
@@ -41,6 +68,8 @@ class OrderRepository:
         """
         return self._orders.get(order_id)
     
+    @traced
+    @deadline_checked
     def get_all(
         self, 
         skip: int = 0, 
@@ -70,6 +99,8 @@ class OrderRepository:
         # Apply pagination
         return orders[skip:skip + limit]
     
+    @traced
+    @deadline_checked
     def update(self, order: Order) -> Order:
         """
         Update an existing order.
@@ -88,3 +119,9 @@ class OrderRepository:
         
         self._orders[order.id] = order
         return order
+    
+    def count(self) -> int:
+        """
+        Number of stored orders.
+        """
+        return len(self._orders)
@@ -1,36 +1,124 @@
 """
 Payment repository for persistence operations.
 """
-from typing import Dict, Optional, List
+from typing import Dict, Iterable, Optional, List, Tuple
 from bakerySpotGourmet.domain.payments.payment import Payment
 from bakerySpotGourmet.domain.payments.status import PaymentStatus
+from bakerySpotGourmet.core.deadline import deadline_checked
+from bakerySpotGourmet.core.tracing import traced
 
 
 class PaymentRepository:
-    """In-memory payment repository."""
+    """
+    In-memory payment repository.
+    Keeps secondary indexes by order id and by status so lookups do not scan every payment.
+    """
     
     def __init__(self):
         self._payments: Dict[int, Payment] = {}
         self._counter = 1
+        self._by_order: Dict[int, List[int]] = {}
+        # Insertion-ordered, so payments come back in the order they entered a status
+        self._by_status: Dict[PaymentStatus, Dict[int, None]] = {}
+        # Indexed (order_id, status) per payment, to re-index on update
+        self._indexed: Dict[int, Tuple[int, PaymentStatus]] = {}
 
+    @traced
+    @deadline_checked
     def save(self, payment: Payment) -> Payment:
         """
         Save a new payment or update existing.
         """
+        return self._store(payment)
+
+    @traced
+    @deadline_checked
+    def save_many(self, payments: Iterable[Payment]) -> List[Payment]:
+        """
+        Save several payments in one call.
+        """
+        return [self._store(payment) for payment in payments]
+
+    def _store(self, payment: Payment) -> Payment:
+        """Assign an ID if needed, store and index a payment."""
         if payment.id is None:
             payment.id = self._counter
             self._counter += 1
         self._payments[payment.id] = payment
+        self._index(payment)
         return payment
 
+    def _index(self, payment: Payment) -> None:
+        """Add or move a payment in the order and status indexes."""
+        assert payment.id is not None
+        current = (payment.order_id, payment.status)
+        previous = self._indexed.get(payment.id)
+        if previous == current:
+            return
+        
+        if previous is not None:
+            old_order_id, old_status = previous
+            if old_order_id != payment.order_id:
+                self._by_order[old_order_id].remove(payment.id)
+                if not self._by_order[old_order_id]:
+                    del self._by_order[old_order_id]
+            self._by_status[old_status].pop(payment.id, None)
+        
+        if previous is None or previous[0] != payment.order_id:
+            self._by_order.setdefault(payment.order_id, []).append(payment.id)
+        self._by_status.setdefault(payment.status, {})[payment.id] = None
+        self._indexed[payment.id] = current
+
+    @traced
+    @deadline_checked
     def get_by_id(self, payment_id: int) -> Optional[Payment]:
         """
         Retrieve a payment by ID.
         """
         return self._payments.get(payment_id)
     
+    @traced
+    @deadline_checked
     def get_by_order_id(self, order_id: int) -> List[Payment]:
         """
         Retrieve all payments associated with an order.
         """
-        return [p for p in self._payments.values() if p.order_id == order_id]
+        return [self._payments[pid] for pid in self._by_order.get(order_id, ())]
+
+    @traced
+    @deadline_checked
+    def get_by_order_ids(self, order_ids: Iterable[int]) -> Dict[int, List[Payment]]:
+        """
+        Retrieve payments for several orders in one pass.
+        
+        Args:
+            order_ids: Order IDs to look up
+            
+        Returns:
+            Mapping of every requested order ID to its payments (empty list if none)
+        """
+        payments, by_order = self._payments, self._by_order
+        return {
+            order_id: [payments[pid] for pid in by_order.get(order_id, ())]
+            for order_id in order_ids
+        }
+
+    @traced
+    @deadline_checked
+    def get_by_status(self, status: PaymentStatus) -> List[Payment]:
+        """
+        Retrieve all payments currently in the given status, in the order
+        they were saved in it.
+        
+        Payments mutated in place but not yet saved are re-checked, so a
+        stale index entry never returns a payment in the wrong status.
+        """
+        payments = (self._payments[pid] for pid in self._by_status.get(status, ()))
+        return [p for p in payments if p.status == status]
+
+    @deadline_checked
+    def count(self) -> int:
+        """
+        Number of stored payments.
+        """
+        return len(self._payments)
@@ -0,0 +1,93 @@
+"""
+Settlement checkpoint repository.
+Persists the plan and progress of a settlement run so it can resume after a crash.
+"""
+import json
+import os
+import tempfile
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Set
+
+
+@dataclass
+class SettlementCheckpoint:
+    """
+    Progress of one settlement run.
+
+    Attributes:
+        run_id: Identifier of the run; also prefixes gateway idempotency references
+        batches: Payment IDs per batch, fixed when the run is planned
+        completed_batches: Indexes of batches whose results were applied
+        unanswered_payments: Payment IDs the gateway returned no result for;
+            their batches stay pending and are resent on resume
+    """
+    run_id: str
+    batches: List[List[int]]
+    completed_batches: List[int] = field(default_factory=list)
+    unanswered_payments: List[int] = field(default_factory=list)
+
+    @property
+    def is_complete(self) -> bool:
+        """Whether every batch has been applied."""
+        return len(self.completed_batches) == len(self.batches)
+
+
+class SettlementCheckpointRepository:
+    """
+    Checkpoint store, in memory or backed by a JSON file.
+    File writes go through a temporary file and an atomic rename, so a crash
+    mid-write never leaves a truncated checkpoint behind.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize the repository.
+
+        Args:
+            path: JSON file to persist checkpoints to; in-memory only when None
+        """
+        self._path = path
+        self._checkpoints: Dict[str, SettlementCheckpoint] = {}
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for raw in json.load(f):
+                    checkpoint = SettlementCheckpoint(**raw)
+                    self._checkpoints[checkpoint.run_id] = checkpoint
+
+    def get(self, run_id: str) -> Optional[SettlementCheckpoint]:
+        """
+        Retrieve the checkpoint of a run.
+        """
+        return self._checkpoints.get(run_id)
+
+    def get_unanswered_payment_ids(self) -> Set[int]:
+        """
+        IDs of payments awaiting a gateway answer in any run.
+        """
+        return {
+            payment_id
+            for checkpoint in self._checkpoints.values()
+            for payment_id in checkpoint.unanswered_payments
+        }
+
+    def save(self, checkpoint: SettlementCheckpoint) -> SettlementCheckpoint:
+        """
+        Save a checkpoint and flush it to disk when file-backed.
+        """
+        self._checkpoints[checkpoint.run_id] = checkpoint
+        self._flush()
+        return checkpoint
+
+    def _flush(self) -> None:
+        """Atomically write all checkpoints to the backing file."""
+        if not self._path:
+            return
+        directory = os.path.dirname(os.path.abspath(self._path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump([asdict(c) for c in self._checkpoints.values()], f)
+            os.replace(tmp_path, self._path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
@@ -1,17 +1,32 @@
-from typing import Optional
+from typing import Iterable, List, Optional
 from bakerySpotGourmet.domain.users.entities import UserIdentity
+from bakerySpotGourmet.core.tracing import traced
 
 class UserRepository:
     def __init__(self):
         self._users = {}
 
+    @traced
     def get_by_email(self, email: str) -> Optional[UserIdentity]:
         return next((u for u in self._users.values() if u.email == email), None)
 
+    @traced
     def get_by_id(self, user_id: int) -> Optional[UserIdentity]:
         return self._users.get(user_id)
     
+    @traced
     def save(self, user: UserIdentity) -> UserIdentity:
         """Save a user to the repository."""
         self._users[user.id] = user
         return user
+
+    @traced
+    def save_many(self, users: Iterable[UserIdentity]) -> List[UserIdentity]:
+        """Save several users in one call."""
+        saved = list(users)
+        self._users.update((user.id, user) for user in saved)
+        return saved
+
+    def count(self) -> int:
+        """Number of stored users."""
+        return len(self._users)
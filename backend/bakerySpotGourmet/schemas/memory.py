@@ -0,0 +1,56 @@
+"""
+Memory introspection Pydantic schemas.
+"""
+from typing import List, Optional
+from pydantic import BaseModel
+
+
+class StoreMemoryResponse(BaseModel):
+    """Schema for the entry count and approximate deep size of a store."""
+    name: str
+    type: str
+    entries: Optional[int]
+    approx_bytes: int
+    sampled: bool
+    sizing_seconds: float
+
+
+class TracemallocStatsResponse(BaseModel):
+    """Schema for the tracemalloc state."""
+    tracing: bool
+    frames: int
+    traced_bytes: int
+    peak_traced_bytes: int
+    tracemalloc_overhead_bytes: int
+    snapshots: int
+
+
+class MemoryReportResponse(BaseModel):
+    """Schema for the process memory report."""
+    rss_bytes: Optional[int]
+    max_rss_bytes: Optional[int]
+    stores: List[StoreMemoryResponse]
+    tracemalloc: TracemallocStatsResponse
+
+
+class MemorySnapshotSummary(BaseModel):
+    """Schema for a kept tracemalloc snapshot."""
+    id: int
+    taken_at: float
+    traced_bytes: int
+    peak_traced_bytes: int
+    snapshot_bytes: int
+    blocks: int
+
+
+class AllocationStat(BaseModel):
+    """Schema for the memory allocated at one site, frames innermost first."""
+    location: List[str]
+    size_bytes: int
+    count: int
+
+
+class AllocationDiff(AllocationStat):
+    """Schema for the change of an allocation site between two snapshots."""
+    size_diff_bytes: int
+    count_diff: int
@@ -7,6 +7,7 @@ from pydantic import BaseModel, ConfigDict
 from bakerySpotGourmet.domain.orders.status import OrderStatus
 from bakerySpotGourmet.domain.orders.order_type import OrderType
 from bakerySpotGourmet.domain.payments.status import PaymentStatus
+from bakerySpotGourmet.schemas.payment import PaymentResponse
 
 class OrderItemCreate(BaseModel):
     product_id: int
@@ -41,6 +42,10 @@ class OrderResponse(BaseModel):
 
 # Admin schemas
 
+class AdminOrderResponse(OrderResponse):
+    """Order with its payments, for the admin order listing."""
+    payments: List[PaymentResponse] = []
+
 class OrderStatusUpdate(BaseModel):
     """Schema for updating order status."""
     status: OrderStatus
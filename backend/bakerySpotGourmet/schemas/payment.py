@@ -2,8 +2,9 @@
 Payment Pydantic schemas.
 """
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, ConfigDict
+from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, Field
+from bakerySpotGourmet.core.constants import PAYMENT_WEBHOOK_MAX_EVENTS_PER_REQUEST
 from bakerySpotGourmet.domain.payments.status import PaymentStatus
 
 
@@ -27,3 +28,23 @@ class PaymentResponse(PaymentBase):
     updated_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class PaymentWebhookEvent(BaseModel):
+    """A payment status change reported by the gateway."""
+    event_id: str = Field(min_length=1, max_length=255)
+    payment_id: int
+    status: PaymentStatus
+
+
+class PaymentWebhookBatch(BaseModel):
+    """Webhook delivery carrying one or more gateway events."""
+    events: List[PaymentWebhookEvent] = Field(
+        min_length=1, max_length=PAYMENT_WEBHOOK_MAX_EVENTS_PER_REQUEST
+    )
+
+
+class PaymentWebhookAck(BaseModel):
+    """Acknowledgement returned to the gateway."""
+    accepted: int
+    duplicates: int
@@ -0,0 +1,23 @@
+"""
+Request profiling Pydantic schemas.
+"""
+from typing import Dict, Optional
+from pydantic import BaseModel, ConfigDict
+
+
+class RequestProfileSummary(BaseModel):
+    """Schema for a stored request profile without its stacks."""
+    request_id: str
+    method: str
+    path: str
+    status_code: Optional[int]
+    started_at: float
+    duration_seconds: float
+    samples: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class RequestProfileResponse(RequestProfileSummary):
+    """Schema for a request profile with collapsed stacks and sample counts."""
+    stacks: Dict[str, int]
@@ -0,0 +1,30 @@
+"""
+Slow request tracing Pydantic schemas.
+"""
+from typing import List, Optional
+from pydantic import BaseModel
+
+
+class SpanResponse(BaseModel):
+    """Schema for a span and its child spans, timed from the request start."""
+    name: str
+    start_ms: float
+    duration_ms: float
+    error: Optional[str]
+    children: List["SpanResponse"]
+
+
+class SlowRequestSummary(BaseModel):
+    """Schema for a captured slow request without its span tree."""
+    request_id: str
+    method: str
+    path: str
+    route: Optional[str]
+    status_code: Optional[int]
+    duration_seconds: float
+    dropped_spans: int
+
+
+class SlowRequestResponse(SlowRequestSummary):
+    """Schema for a captured slow request with its span tree."""
+    spans: SpanResponse
@@ -5,11 +5,13 @@ from bakerySpotGourmet.core import security
 from bakerySpotGourmet.repositories.user_repository import UserRepository
 from bakerySpotGourmet.schemas.user import Token
 from bakerySpotGourmet.domain.users.entities import UserIdentity
+from bakerySpotGourmet.core.tracing import traced
 
 class AuthService:
     def __init__(self, user_repository: UserRepository):
         self.user_repository = user_repository
 
+    @traced
     def authenticate_user(self, email: str, password: str) -> Optional[UserIdentity]:
         user = self.user_repository.get_by_email(email)
         if not user:
@@ -18,6 +20,7 @@ class AuthService:
             return None
         return user
 
+    @traced
     def create_tokens(self, user: UserIdentity) -> Token:
         access_token_expires = timedelta(minutes=security.settings.ACCESS_TOKEN_EXPIRE_MINUTES)
         access_token = security.create_access_token(
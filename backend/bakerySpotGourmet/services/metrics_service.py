@@ -0,0 +1,145 @@
+"""
+Metrics service layer.
+Exposes the state of long-lived components as scrape-time gauges and counters.
+"""
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from bakerySpotGourmet.core.logging import get_logging_stats
+from bakerySpotGourmet.core.metrics import LabelValues, MetricsRegistry, get_metrics_registry
+from bakerySpotGourmet.core.profiling import get_continuous_profiler
+from bakerySpotGourmet.core.security import get_rate_limiter
+from bakerySpotGourmet.infrastructure.events.event_bus import get_event_bus
+from bakerySpotGourmet.infrastructure.payments.bulkhead import get_payment_gateway_bulkhead
+from bakerySpotGourmet.infrastructure.payments.circuit_breaker import CircuitState
+from bakerySpotGourmet.infrastructure.payments.payment_client import get_payment_gateway_circuit_breaker
+from bakerySpotGourmet.infrastructure.payments.retry_budget import get_payment_gateway_retry_budget
+from bakerySpotGourmet.utils.idempotency import get_idempotency_store
+
+
+# Numeric encoding of circuit states for the state gauge
+_CIRCUIT_STATE_VALUES = {
+    CircuitState.CLOSED.value: 0,
+    CircuitState.HALF_OPEN.value: 1,
+    CircuitState.OPEN.value: 2,
+}
+
+
+RepositoriesProvider = Callable[[], Dict[str, Any]]
+
+
+def _from_stats(
+    stats: Callable[[], Dict[str, Any]],
+    key: str,
+    labels: LabelValues = (),
+) -> Callable[[], Dict[LabelValues, float]]:
+    """Metric callback reading one field of a component's get_stats()."""
+    return lambda: {labels: float(stats()[key])}
+
+
+def _gauges(
+    registry: MetricsRegistry,
+    definitions: Iterable[Tuple[str, str, Callable[[], Dict[LabelValues, float]]]],
+    labelnames: Tuple[str, ...] = (),
+) -> None:
+    """Register callback gauges sharing the same label names."""
+    for name, documentation, callback in definitions:
+        registry.gauge(name, documentation, labelnames).set_function(callback)
+
+
+def _counters(
+    registry: MetricsRegistry,
+    definitions: Iterable[Tuple[str, str, Callable[[], Dict[LabelValues, float]]]],
+    labelnames: Tuple[str, ...] = (),
+) -> None:
+    """Register callback counters, for cumulative counts, sharing the same label names."""
+    for name, documentation, callback in definitions:
+        registry.counter(name, documentation, labelnames).set_function(callback)
+
+
+def _repository_sizes(repositories: RepositoriesProvider) -> Callable[[], Dict[LabelValues, float]]:
+    """Gauge callback counting the entities of each repository."""
+    return lambda: {(name,): float(repository.count()) for name, repository in repositories().items()}
+
+
+def _event_bus_queues() -> Dict[LabelValues, float]:
+    """Queue depth per event bus subscriber."""
+    stats = get_event_bus().get_stats()
+    return {(s["name"],): float(s["queued"]) for s in stats["subscribers"]}
+
+
+def register_default_collectors(
+    registry: MetricsRegistry | None = None,
+    repositories: Optional[RepositoriesProvider] = None,
+) -> MetricsRegistry:
+    """
+    Register gauges and counters for the app's shared components.
+    Values are read from their get_stats() at scrape time, so nothing is
+    added to the request path. Safe to call more than once.
+
+    Args:
+        registry: Registry to register on, defaults to the global one
+        repositories: Returns the repositories the app serves, by name, each
+            with a count(); repository sizes are only exported when given
+
+    Returns:
+        The registry
+    """
+    registry = registry or get_metrics_registry()
+    rate_limiter = get_rate_limiter().get_stats
+    idempotency_store = get_idempotency_store().get_stats
+    circuit_breaker = get_payment_gateway_circuit_breaker().get_stats
+    bulkhead = get_payment_gateway_bulkhead().get_stats
+    retry_budget = get_payment_gateway_retry_budget().get_stats
+
+    _gauges(registry, [
+        ("rate_limiter_tracked_keys", "Identifier/endpoint keys tracked by the rate limiter.",
+         _from_stats(rate_limiter, "tracked_keys")),
+        ("rate_limiter_tracked_requests", "Requests inside the rate limiter window.",
+         _from_stats(rate_limiter, "tracked_requests")),
+        ("idempotency_store_entries", "Responses held by the idempotency store.",
+         _from_stats(idempotency_store, "entries")),
+        ("log_queue_records", "Log records waiting for the writer thread.",
+         _from_stats(get_logging_stats, "queued")),
+        ("continuous_profiler_overhead_ratio", "CPU time of the continuous profiler per wall second.",
+         _from_stats(get_continuous_profiler().get_stats, "overhead_ratio")),
+    ])
+    _counters(registry, [
+        ("rate_limiter_rejected_total", "Requests rejected by the rate limiter.",
+         _from_stats(rate_limiter, "rejected_count")),
+        ("log_records_dropped_total", "Log records dropped because the log queue was full.",
+         _from_stats(get_logging_stats, "dropped")),
+        ("log_lines_sampled_out_total", "High-volume log lines dropped by sampling.",
+         _from_stats(get_logging_stats, "sampled_out")),
+    ])
+
+    gateway = ("payment_gateway",)
+    _gauges(registry, [
+        ("circuit_breaker_state", "Circuit state: 0 closed, 1 half-open, 2 open.",
+         lambda: {gateway: float(_CIRCUIT_STATE_VALUES[circuit_breaker()["state"]])}),
+        ("bulkhead_active_calls", "Calls holding a bulkhead slot.",
+         _from_stats(bulkhead, "active", gateway)),
+        ("bulkhead_queued_calls", "Calls waiting for a bulkhead slot.",
+         _from_stats(bulkhead, "queued", gateway)),
+        ("retry_budget_tokens", "Retry tokens available.",
+         _from_stats(retry_budget, "tokens", gateway)),
+    ], labelnames=("name",))
+    _counters(registry, [
+        ("circuit_breaker_rejected_total", "Calls rejected by the circuit breaker.",
+         _from_stats(circuit_breaker, "rejected_count", gateway)),
+        ("bulkhead_rejected_total", "Calls rejected by the bulkhead.",
+         _from_stats(bulkhead, "rejected_count", gateway)),
+    ], labelnames=("name",))
+
+    if repositories is not None:
+        registry.gauge(
+            "repository_entities", "Entities held by in-memory repositories.", ("repository",)
+        ).set_function(_repository_sizes(repositories))
+    registry.gauge(
+        "event_bus_queued_events", "Events waiting in subscriber queues.", ("subscriber",)
+    ).set_function(_event_bus_queues)
+    return registry
+
+
+def render_metrics(registry: MetricsRegistry | None = None) -> str:
+    """Render the registry in the Prometheus text exposition format."""
+    return (registry or get_metrics_registry()).render()
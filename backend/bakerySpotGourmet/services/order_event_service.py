@@ -0,0 +1,113 @@
+"""
+Order event service layer.
+Runs the side effects of order and payment events off the request path.
+"""
+from typing import List, Optional, Union
+
+import structlog
+
+from bakerySpotGourmet.domain.orders.events import OrderCreated, OrderStatusChanged
+from bakerySpotGourmet.domain.payments.events import PaymentCompleted
+from bakerySpotGourmet.domain.payments.status import PaymentStatus
+from bakerySpotGourmet.infrastructure.events.event_bus import EventBus, get_event_bus
+from bakerySpotGourmet.repositories.order_repository import OrderRepository
+
+
+logger = structlog.get_logger()
+
+
+class OrderEventService:
+    """
+    Subscribers for order and payment domain events.
+
+    OrderService and PaymentService only persist and publish; the audit log
+    and the order's payment status are written here by event bus workers,
+    in batches, after the response has been sent.
+    """
+
+    def __init__(self, order_repository: OrderRepository, event_bus: EventBus):
+        self.order_repository = order_repository
+        self.event_bus = event_bus
+        self.audit_subscription = event_bus.subscribe(
+            [OrderCreated, OrderStatusChanged],
+            self.audit_batch,
+            name="order_audit",
+        )
+        self.payment_subscription = event_bus.subscribe(
+            [PaymentCompleted],
+            self.apply_payments,
+            name="order_payment_status",
+        )
+
+    async def audit_batch(self, events: List[Union[OrderCreated, OrderStatusChanged]]) -> None:
+        """
+        Write the audit log of order creations and status changes.
+
+        Args:
+            events: Events collected by the event bus worker
+        """
+        for event in events:
+            if isinstance(event, OrderCreated):
+                logger.info(
+                    "order_created",
+                    order_id=event.order_id,
+                    customer_id=event.customer_id,
+                    total_amount=event.total_amount,
+                    order_type=event.order_type.value,
+                )
+            else:
+                logger.info(
+                    "order_status_updated",
+                    order_id=event.order_id,
+                    old_status=event.old_status.value,
+                    new_status=event.new_status.value,
+                    admin_user_id=event.changed_by,
+                )
+
+    async def apply_payments(self, events: List[PaymentCompleted]) -> None:
+        """
+        Mark the orders of completed payments as paid.
+        Each order is updated once per batch, and not at all when it is
+        already marked, e.g. by the payment webhook service.
+
+        Args:
+            events: Events collected by the event bus worker
+        """
+        for event in events:
+            logger.info(
+                "payment_completed",
+                payment_id=event.payment_id,
+                order_id=event.order_id,
+            )
+
+        for order_id in dict.fromkeys(event.order_id for event in events):
+            order = self.order_repository.get_by_id(order_id)
+            if order is None or getattr(order, "payment_status", None) == PaymentStatus.COMPLETED:
+                continue
+            order.payment_status = PaymentStatus.COMPLETED
+            self.order_repository.update(order)
+            logger.info(
+                "order_payment_attached",
+                order_id=order_id,
+                payment_status=order.payment_status.value,
+            )
+
+
+# Global order event service instance
+_order_event_service: Optional[OrderEventService] = None
+
+
+def get_order_event_service(order_repository: Optional[OrderRepository] = None) -> OrderEventService:
+    """
+    Get the global order event service, subscribing it on first use.
+
+    Args:
+        order_repository: Repository the application serves orders from;
+            replaces the one the service applies payments to when given
+    """
+    global _order_event_service
+    if _order_event_service is None:
+        _order_event_service = OrderEventService(order_repository or OrderRepository(), get_event_bus())
+    elif order_repository is not None:
+        _order_event_service.order_repository = order_repository
+    return _order_event_service
@@ -7,10 +7,13 @@ import structlog
 from fastapi import HTTPException
 
 from bakerySpotGourmet.core.exceptions import EntityNotFoundException
+from bakerySpotGourmet.core.tracing import traced
+from bakerySpotGourmet.domain.orders.events import OrderCreated, OrderStatusChanged
 from bakerySpotGourmet.domain.orders.order import Order
 from bakerySpotGourmet.domain.orders.status import OrderStatus
 from bakerySpotGourmet.domain.orders.order_type import OrderType
 from bakerySpotGourmet.domain.orders.exceptions import InvalidOrderStatusTransitionException
+from bakerySpotGourmet.infrastructure.events.event_bus import EventBus, publish_event
 from bakerySpotGourmet.repositories.item_repository import ItemRepository
 from bakerySpotGourmet.repositories.order_repository import OrderRepository
 from bakerySpotGourmet.repositories.payment_repository import PaymentRepository
@@ -27,12 +30,15 @@ class OrderService:
         self,
         order_repository: OrderRepository,
         payment_repository: "PaymentRepository",
-        item_repository: ItemRepository
+        item_repository: ItemRepository,
+        event_bus: Optional[EventBus] = None,
     ):
         self.order_repository = order_repository
         self.payment_repository = payment_repository
         self.item_repository = item_repository
+        self.event_bus = event_bus
 
+    @traced
     def create_order(
         self, 
         customer_id: int, 
@@ -75,48 +81,19 @@ class OrderService:
         # 3. Persist (should be transactional)
         saved_order = self.order_repository.save(order)
         
-        logger.info(
-            "order_created",
+        # Audit logging runs in the order event subscribers
+        publish_event(self.event_bus, OrderCreated(
             order_id=saved_order.id,
             customer_id=customer_id,
             total_amount=saved_order.total_amount,
-            order_type=order_type.value
-        )
+            order_type=order_type,
+        ))
         
         return saved_order
     
-    def attach_payment(self, order_id: int, payment_id: int) -> Order:
-        """
-        Associate a payment status with an order.
-        Operational transitions remain unblocked by payment.
-        """
-        order = self.get_order_by_id(order_id)
-        # In a real system, we'd fetch the payment to verify amount/etc.
-        # For now, we update the informational payment_status on the order aggregate.
-        # This demonstrates the association without logic coupling.
-        
-        # Simulating fetching payment status from PaymentService/Repo
-        from bakerySpotGourmet.repositories.payment_repository import PaymentRepository
-        # Assuming we can get the status from the repository
-        # (This is just for demonstration of association)
-        # In a multi-service setup, this might be via events or a read model.
-        
-        # For the sake of this task, we'll just update it to COMPLETED as an example
-        from bakerySpotGourmet.domain.payments.status import PaymentStatus
-        order.payment_status = PaymentStatus.COMPLETED
-        
-        updated_order = self.order_repository.update(order)
-        
-        logger.info(
-            "order_payment_attached",
-            order_id=order_id,
-            payment_id=payment_id,
-            payment_status=order.payment_status.value
-        )
-        return updated_order
-    
     # Admin operations
     
+    @traced
     def list_orders(
         self, 
         skip: int = 0, 
@@ -136,6 +113,7 @@ class OrderService:
         """
         return self.order_repository.get_all(skip=skip, limit=limit, status=status_filter)
     
+    @traced
     def get_order_by_id(self, order_id: int) -> Order:
         """
         Retrieve a single order by ID.
@@ -154,6 +132,7 @@ class OrderService:
             raise EntityNotFoundException("Order", str(order_id))
         return order
     
+    @traced
     def update_order_status(
         self, 
         order_id: int, 
@@ -186,13 +165,12 @@ class OrderService:
         # Persist
         updated_order = self.order_repository.update(order)
         
-        # Audit log
-        logger.info(
-            "order_status_updated",
+        # Audit log, written by the order event subscribers
+        publish_event(self.event_bus, OrderStatusChanged(
             order_id=order_id,
-            old_status=old_status.value,
-            new_status=new_status.value,
-            admin_user_id=admin_user_id,
-        )
+            old_status=old_status,
+            new_status=new_status,
+            changed_by=admin_user_id,
+        ))
         
         return updated_order
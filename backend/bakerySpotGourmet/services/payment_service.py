@@ -3,11 +3,14 @@ Payment service layer.
 Handles financial transactions and lifecycle.
 """
 import structlog
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
+from bakerySpotGourmet.domain.payments.events import PaymentCompleted
 from bakerySpotGourmet.domain.payments.payment import Payment
 from bakerySpotGourmet.domain.payments.status import PaymentStatus
 from bakerySpotGourmet.repositories.payment_repository import PaymentRepository
 from bakerySpotGourmet.core.exceptions import EntityNotFoundException
+from bakerySpotGourmet.core.tracing import traced
+from bakerySpotGourmet.infrastructure.events.event_bus import EventBus, publish_event
 
 
 logger = structlog.get_logger()
@@ -16,9 +19,11 @@ logger = structlog.get_logger()
 class PaymentService:
     """Service for payment operations."""
     
-    def __init__(self, payment_repository: PaymentRepository):
+    def __init__(self, payment_repository: PaymentRepository, event_bus: Optional[EventBus] = None):
         self.payment_repository = payment_repository
+        self.event_bus = event_bus
 
+    @traced
     def create_payment(self, order_id: int, amount: float, method: str) -> Payment:
         """
         Create a new payment for an order.
@@ -35,6 +40,7 @@ class PaymentService:
         )
         return saved_payment
 
+    @traced
     def complete_payment(self, payment_id: int) -> Payment:
         """
         Mark a payment as completed.
@@ -46,13 +52,15 @@ class PaymentService:
         payment.complete()
         updated_payment = self.payment_repository.save(payment)
         
-        logger.info(
-            "payment_completed",
+        # Logged, and applied to the order, by the order event subscribers
+        publish_event(self.event_bus, PaymentCompleted(
             payment_id=payment_id,
-            order_id=payment.order_id
-        )
+            order_id=payment.order_id,
+            amount=payment.amount,
+        ))
         return updated_payment
 
+    @traced
     def fail_payment(self, payment_id: int) -> Payment:
         """
         Mark a payment as failed.
@@ -71,8 +79,16 @@ class PaymentService:
         )
         return updated_payment
 
+    @traced
     def get_payments_for_order(self, order_id: int) -> List[Payment]:
         """
         List all payments for a given order.
         """
         return self.payment_repository.get_by_order_id(order_id)
+
+    @traced
+    def get_payments_for_orders(self, order_ids: Iterable[int]) -> Dict[int, List[Payment]]:
+        """
+        List payments for a page of orders in a single repository call.
+        """
+        return self.payment_repository.get_by_order_ids(order_ids)
@@ -0,0 +1,251 @@
+"""
+Payment webhook service layer.
+Ingests gateway payment notifications and applies them off the request path.
+"""
+from typing import Dict, Iterable, List, Optional, Set
+
+import structlog
+
+from bakerySpotGourmet.core.constants import (
+    PAYMENT_WEBHOOK_BATCH_SIZE,
+    PAYMENT_WEBHOOK_DEDUP_MAX_SIZE,
+    PAYMENT_WEBHOOK_DEDUP_TTL_SECONDS,
+    PAYMENT_WEBHOOK_QUEUE_SIZE,
+)
+from bakerySpotGourmet.core.memory import get_memory_registry
+from bakerySpotGourmet.domain.payments.events import PaymentCompleted, PaymentWebhookReceived
+from bakerySpotGourmet.domain.payments.payment import Payment
+from bakerySpotGourmet.domain.payments.status import PaymentStatus
+from bakerySpotGourmet.infrastructure.events.event_bus import EventBus, OverflowPolicy, get_event_bus, publish_event
+from bakerySpotGourmet.infrastructure.events.exceptions import EventBusFullException
+from bakerySpotGourmet.repositories.order_repository import OrderRepository
+from bakerySpotGourmet.repositories.payment_repository import PaymentRepository
+from bakerySpotGourmet.schemas.payment import PaymentWebhookEvent
+from bakerySpotGourmet.utils.ttl_set import TTLSet
+
+
+logger = structlog.get_logger()
+
+
+class PaymentWebhookService:
+    """
+    Service for gateway payment webhooks.
+
+    `accept` only deduplicates and enqueues, so the endpoint can acknowledge
+    a burst immediately. A background event bus worker then applies queued
+    events in batches: one bulk save for the payments and one update per
+    affected order, instead of a fetch/save round-trip per event.
+
+    An event id is remembered as seen only once its batch was applied. Until
+    then it is held as pending, so a redelivery is not queued twice, and a
+    batch that fails forgets its ids, so the gateway's redelivery applies it.
+    """
+
+    def __init__(
+        self,
+        payment_repository: PaymentRepository,
+        order_repository: OrderRepository,
+        event_bus: EventBus,
+        dedup: Optional[TTLSet] = None,
+        batch_size: int = PAYMENT_WEBHOOK_BATCH_SIZE,
+        queue_size: int = PAYMENT_WEBHOOK_QUEUE_SIZE,
+    ):
+        self.payment_repository = payment_repository
+        self.order_repository = order_repository
+        self.event_bus = event_bus
+        self.dedup = dedup or TTLSet(
+            ttl_seconds=PAYMENT_WEBHOOK_DEDUP_TTL_SECONDS,
+            max_size=PAYMENT_WEBHOOK_DEDUP_MAX_SIZE,
+        )
+        # Queued but not yet applied; bounded by the queue size. Only touched
+        # on the event loop, by the endpoint and the bus worker
+        self.pending: Set[str] = set()
+        self.subscription = event_bus.subscribe(
+            [PaymentWebhookReceived],
+            self.apply_batch,
+            name="payment_webhooks",
+            batch_size=batch_size,
+            queue_size=queue_size,
+            overflow_policy=OverflowPolicy.BLOCK,
+        )
+
+    def accept(self, events: Iterable[PaymentWebhookEvent]) -> Dict[str, int]:
+        """
+        Deduplicate webhook events and queue the new ones for processing.
+
+        Args:
+            events: Events from one webhook delivery
+
+        Returns:
+            Counts of accepted and duplicate events
+
+        Raises:
+            EventBusFullException: If the queue cannot take the whole delivery;
+                nothing is queued, so the gateway can redeliver
+        """
+        fresh: List[PaymentWebhookEvent] = []
+        seen: Set[str] = set()
+        duplicates = 0
+        for event in events:
+            if event.event_id in seen or event.event_id in self.pending or event.event_id in self.dedup:
+                duplicates += 1
+            else:
+                seen.add(event.event_id)
+                fresh.append(event)
+
+        queue = self.subscription.queue
+        if queue.maxsize - queue.qsize() < len(fresh):
+            logger.warning(
+                "payment_webhook_queue_full",
+                events=len(fresh),
+                queued=queue.qsize(),
+            )
+            raise EventBusFullException(self.subscription.name)
+
+        self.pending.update(seen)
+        for event in fresh:
+            self.event_bus.publish(PaymentWebhookReceived(
+                event_id=event.event_id,
+                payment_id=event.payment_id,
+                status=event.status,
+            ))
+
+        if duplicates:
+            logger.info("payment_webhook_duplicates", duplicates=duplicates)
+        return {"accepted": len(fresh), "duplicates": duplicates}
+
+    async def apply_batch(self, events: List[PaymentWebhookReceived]) -> None:
+        """
+        Apply a batch of queued webhook events.
+        Events are applied in arrival order, so a later event for the same
+        payment wins. Their ids are remembered as seen only when the whole
+        batch was applied.
+
+        Args:
+            events: Events collected by the event bus worker
+        """
+        try:
+            for event_id in self._apply(events):
+                self.dedup.add(event_id)
+        finally:
+            for event in events:
+                self.pending.discard(event.event_id)
+
+    def _apply(self, events: List[PaymentWebhookReceived]) -> List[str]:
+        """
+        Apply events to payments and orders.
+
+        Returns:
+            Ids of the events handled for good: applied, or rejected as an
+            invalid transition. Events for unknown payments are left out, so a
+            redelivery can apply them once the payment exists.
+        """
+        handled: List[str] = []
+        changed: Dict[int, Payment] = {}
+        completed: Dict[int, Payment] = {}
+        for event in events:
+            payment = changed.get(event.payment_id) or self.payment_repository.get_by_id(event.payment_id)
+            if payment is None:
+                logger.warning(
+                    "payment_webhook_unknown_payment",
+                    event_id=event.event_id,
+                    payment_id=event.payment_id,
+                )
+                continue
+            try:
+                self._apply_status(payment, event.status)
+            except ValueError as e:
+                logger.warning(
+                    "payment_webhook_rejected",
+                    event_id=event.event_id,
+                    payment_id=event.payment_id,
+                    status=event.status.value,
+                    error=str(e),
+                )
+                handled.append(event.event_id)
+                continue
+            handled.append(event.event_id)
+            changed[event.payment_id] = payment
+            if event.status == PaymentStatus.COMPLETED:
+                completed[event.payment_id] = payment
+
+        if not changed:
+            return handled
+        self.payment_repository.save_many(changed.values())
+
+        order_statuses = {payment.order_id: payment.status for payment in changed.values()}
+        for order_id, payment_status in order_statuses.items():
+            order = self.order_repository.get_by_id(order_id)
+            if order is None:
+                continue
+            order.payment_status = payment_status
+            self.order_repository.update(order)
+
+        for payment in completed.values():
+            if payment.status == PaymentStatus.COMPLETED:
+                assert payment.id is not None
+                publish_event(self.event_bus, PaymentCompleted(
+                    payment_id=payment.id,
+                    order_id=payment.order_id,
+                    amount=payment.amount,
+                ))
+
+        logger.info(
+            "payment_webhooks_applied",
+            events=len(events),
+            payments=len(changed),
+            orders=len(order_statuses),
+        )
+        return handled
+
+    @staticmethod
+    def _apply_status(payment: Payment, status: PaymentStatus) -> None:
+        """Move a payment to the reported status through its domain methods."""
+        if status == PaymentStatus.AUTHORIZED:
+            payment.authorize()
+        elif status == PaymentStatus.COMPLETED:
+            payment.complete()
+        elif status == PaymentStatus.FAILED:
+            payment.fail()
+        elif status == PaymentStatus.REFUNDED:
+            payment.refund()
+        else:
+            raise ValueError(f"Unsupported webhook status {status.value}")
+
+
+# Global payment webhook service instance
+_payment_webhook_service: Optional[PaymentWebhookService] = None
+
+
+def get_payment_webhook_service(
+    payment_repository: Optional[PaymentRepository] = None,
+    order_repository: Optional[OrderRepository] = None,
+) -> PaymentWebhookService:
+    """
+    Get the global payment webhook service, subscribing it on first use.
+
+    Only the application lifespan passes repositories, once at startup;
+    requests get the service as wired, so the background worker never
+    switches stores while it applies a batch.
+
+    Args:
+        payment_repository: Repository the application serves payments from;
+            replaces the service's when given
+        order_repository: Repository the application serves orders from;
+            replaces the service's when given
+    """
+    global _payment_webhook_service
+    if _payment_webhook_service is None:
+        _payment_webhook_service = PaymentWebhookService(
+            payment_repository or PaymentRepository(),
+            order_repository or OrderRepository(),
+            get_event_bus(),
+        )
+        # Sized separately; the service itself reaches the event loop
+        get_memory_registry().register("payment_webhook_dedup", _payment_webhook_service.dedup)
+    else:
+        if payment_repository is not None:
+            _payment_webhook_service.payment_repository = payment_repository
+        if order_repository is not None:
+            _payment_webhook_service.order_repository = order_repository
+    return _payment_webhook_service
@@ -0,0 +1,260 @@
+"""
+Settlement service layer.
+Captures authorized payments in gateway-sized batches at end of shift.
+"""
+import asyncio
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import structlog
+
+from bakerySpotGourmet.core.constants import (
+    DEFAULT_CURRENCY,
+    SETTLEMENT_BATCH_SIZE,
+    SETTLEMENT_MAX_CONCURRENCY,
+)
+from bakerySpotGourmet.domain.payments.events import PaymentCompleted
+from bakerySpotGourmet.domain.payments.payment import Payment
+from bakerySpotGourmet.domain.payments.status import PaymentStatus
+from bakerySpotGourmet.infrastructure.events.event_bus import EventBus, publish_event
+from bakerySpotGourmet.infrastructure.payments.payment_client import PaymentClient
+from bakerySpotGourmet.repositories.payment_repository import PaymentRepository
+from bakerySpotGourmet.repositories.settlement_checkpoint_repository import (
+    SettlementCheckpoint,
+    SettlementCheckpointRepository,
+)
+from bakerySpotGourmet.utils.uuid import generate_uuid
+
+
+logger = structlog.get_logger()
+
+
+@dataclass
+class SettlementReport:
+    """Summary of a settlement run."""
+    run_id: str
+    batches_total: int
+    batches_completed: int
+    batches_failed: int
+    captured: int
+    declined: int
+    skipped: int
+    unanswered: int
+
+
+class SettlementService:
+    """
+    Service for batched payment capture.
+
+    A run snapshots the AUTHORIZED payments, splits them into batches and
+    checkpoints that plan before calling the gateway. Batches are sent
+    concurrently (bounded by a semaphore); each batch's results are applied
+    to the repository in bulk and then marked complete in the checkpoint.
+    A batch with captures the gateway did not answer stays pending, with the
+    unanswered payments recorded in the checkpoint. Re-running with the same
+    run_id skips completed batches and resends the rest with the same gateway
+    references, so nothing is captured twice.
+    """
+
+    def __init__(
+        self,
+        payment_repository: PaymentRepository,
+        payment_client: PaymentClient,
+        checkpoint_repository: SettlementCheckpointRepository,
+        batch_size: int = SETTLEMENT_BATCH_SIZE,
+        max_concurrency: int = SETTLEMENT_MAX_CONCURRENCY,
+        currency: str = DEFAULT_CURRENCY,
+        event_bus: Optional[EventBus] = None,
+    ):
+        if batch_size < 1 or max_concurrency < 1:
+            raise ValueError("batch_size and max_concurrency must be positive")
+        self.payment_repository = payment_repository
+        self.payment_client = payment_client
+        self.checkpoint_repository = checkpoint_repository
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self.currency = currency
+        self.event_bus = event_bus
+
+    def plan(self, run_id: Optional[str] = None) -> SettlementCheckpoint:
+        """
+        Load the checkpoint of an existing run or plan a new one.
+
+        A new run leaves out payments still awaiting a gateway answer in
+        another run; resuming that run settles them under their reference.
+
+        Args:
+            run_id: Run to resume; a new run is planned when unknown or None
+
+        Returns:
+            The run checkpoint
+        """
+        if run_id is not None:
+            existing = self.checkpoint_repository.get(run_id)
+            if existing is not None:
+                return existing
+
+        unanswered = self.checkpoint_repository.get_unanswered_payment_ids()
+        payment_ids = [
+            p.id for p in self.payment_repository.get_by_status(PaymentStatus.AUTHORIZED)
+            if p.id is not None and p.id not in unanswered
+        ]
+        batches = [
+            payment_ids[i:i + self.batch_size]
+            for i in range(0, len(payment_ids), self.batch_size)
+        ]
+        checkpoint = SettlementCheckpoint(run_id=run_id or generate_uuid(), batches=batches)
+        self.checkpoint_repository.save(checkpoint)
+
+        logger.info(
+            "settlement_planned",
+            run_id=checkpoint.run_id,
+            payments=len(payment_ids),
+            batches=len(batches),
+        )
+        return checkpoint
+
+    async def settle(self, run_id: Optional[str] = None) -> SettlementReport:
+        """
+        Capture all authorized payments, resuming a previous run if given.
+
+        Args:
+            run_id: Run to resume, or None to start a new one
+
+        Returns:
+            Summary of the run
+        """
+        checkpoint = self.plan(run_id)
+        pending = [
+            index for index in range(len(checkpoint.batches))
+            if index not in checkpoint.completed_batches
+        ]
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        totals: Dict[str, int] = {"captured": 0, "declined": 0, "skipped": 0, "unanswered": 0, "failed": 0}
+
+        async def run_batch(index: int) -> None:
+            async with semaphore:
+                await self._settle_batch(checkpoint, index, totals)
+
+        await asyncio.gather(*(run_batch(index) for index in pending))
+
+        report = SettlementReport(
+            run_id=checkpoint.run_id,
+            batches_total=len(checkpoint.batches),
+            batches_completed=len(checkpoint.completed_batches),
+            batches_failed=totals["failed"],
+            captured=totals["captured"],
+            declined=totals["declined"],
+            skipped=totals["skipped"],
+            unanswered=totals["unanswered"],
+        )
+        logger.info("settlement_finished", **vars(report))
+        return report
+
+    async def _settle_batch(
+        self,
+        checkpoint: SettlementCheckpoint,
+        index: int,
+        totals: Dict[str, int],
+    ) -> None:
+        """
+        Send one batch to the gateway and apply its results.
+
+        The batch is marked complete only when every capture got a result.
+        """
+        unanswered: List[int] = []
+        payments: List[Payment] = []
+        for payment_id in checkpoint.batches[index]:
+            payment = self.payment_repository.get_by_id(payment_id)
+            if payment is None or payment.status != PaymentStatus.AUTHORIZED:
+                # Already settled by a previous, interrupted attempt
+                totals["skipped"] += 1
+                continue
+            payments.append(payment)
+
+        if payments:
+            captures = [
+                {
+                    "reference": self._reference(checkpoint.run_id, payment),
+                    "amount": payment.amount,
+                    "currency": self.currency,
+                }
+                for payment in payments
+            ]
+            try:
+                results = await self.payment_client.capture_batch_async(captures)
+            except Exception as e:
+                totals["failed"] += 1
+                logger.error(
+                    "settlement_batch_failed",
+                    run_id=checkpoint.run_id,
+                    batch=index,
+                    size=len(payments),
+                    error=str(e),
+                )
+                return
+
+            unanswered = self._apply_results(checkpoint.run_id, payments, results, totals)
+
+        batch = set(checkpoint.batches[index])
+        checkpoint.unanswered_payments = [
+            payment_id for payment_id in checkpoint.unanswered_payments if payment_id not in batch
+        ] + unanswered
+        if unanswered:
+            totals["unanswered"] += len(unanswered)
+            logger.warning(
+                "settlement_captures_unanswered",
+                run_id=checkpoint.run_id,
+                batch=index,
+                payment_ids=unanswered,
+            )
+        else:
+            checkpoint.completed_batches.append(index)
+        self.checkpoint_repository.save(checkpoint)
+
+    def _apply_results(
+        self,
+        run_id: str,
+        payments: List[Payment],
+        results: List[Dict[str, object]],
+        totals: Dict[str, int],
+    ) -> List[int]:
+        """
+        Update payment statuses from gateway results and save them in bulk.
+
+        Returns:
+            IDs of the payments the gateway returned no result for
+        """
+        by_reference = {result["reference"]: result for result in results}
+        completed: List[Payment] = []
+        unanswered: List[int] = []
+        for payment in payments:
+            result = by_reference.get(self._reference(run_id, payment))
+            if result is None:
+                # Left AUTHORIZED; resent with the same reference on resume
+                assert payment.id is not None
+                unanswered.append(payment.id)
+                continue
+            if result.get("status") == "success":
+                payment.complete()
+                completed.append(payment)
+                totals["captured"] += 1
+            else:
+                payment.fail()
+                totals["declined"] += 1
+
+        self.payment_repository.save_many(payments)
+
+        for payment in completed:
+            assert payment.id is not None
+            publish_event(self.event_bus, PaymentCompleted(
+                payment_id=payment.id,
+                order_id=payment.order_id,
+                amount=payment.amount,
+            ))
+        return unanswered
+
+    @staticmethod
+    def _reference(run_id: str, payment: Payment) -> str:
+        """Gateway idempotency reference of a payment within a run."""
+        return f"settlement:{run_id}:{payment.id}"
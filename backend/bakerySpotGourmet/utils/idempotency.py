@@ -13,6 +13,8 @@ from fastapi import Header, HTTPException, Request, status
 
 from bakerySpotGourmet.core.config import settings
 from bakerySpotGourmet.core.constants import IDEMPOTENCY_KEY_HEADER
+from bakerySpotGourmet.core.memory import get_memory_registry
+from bakerySpotGourmet.core.tracing import traced
 
 
 logger = structlog.get_logger()
@@ -34,6 +36,7 @@ class IdempotencyStore:
         self._store: Dict[str, Dict[str, Any]] = {}
         self._ttl_seconds = ttl_seconds
     
+    @traced
     def get(self, key: str) -> Optional[Dict[str, Any]]:
         """
         Retrieve a stored response by idempotency key.
@@ -56,6 +59,7 @@ class IdempotencyStore:
         
         return entry["response"]
     
+    @traced
     def set(self, key: str, response: Dict[str, Any]) -> None:
         """
         Store a response with the given idempotency key.
@@ -94,10 +98,23 @@ class IdempotencyStore:
             True if key exists and is valid, False otherwise
         """
         return self.get(key) is not None
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get idempotency store statistics.
+        
+        Returns:
+            Dictionary with the number of stored entries
+        """
+        return {
+            "entries": len(self._store),
+            "ttl_seconds": self._ttl_seconds,
+        }
 
 
 # Global idempotency store instance
 _idempotency_store = IdempotencyStore(ttl_seconds=settings.IDEMPOTENCY_TTL_SECONDS)
+get_memory_registry().register("idempotency_store", _idempotency_store, lambda: len(_idempotency_store._store))
 
 
 def get_idempotency_store() -> IdempotencyStore:
@@ -146,6 +163,7 @@ def compute_request_hash(request_body: bytes) -> str:
     return hashlib.sha256(request_body).hexdigest()
 
 
+@traced
 async def get_idempotency_key(
     idempotency_key: Optional[str] = Header(None, alias=IDEMPOTENCY_KEY_HEADER)
 ) -> Optional[str]:
@@ -163,6 +181,7 @@ async def get_idempotency_key(
     return idempotency_key
 
 
+@traced
 async def require_idempotency_key(
     idempotency_key: Optional[str] = Header(None, alias=IDEMPOTENCY_KEY_HEADER)
 ) -> str:
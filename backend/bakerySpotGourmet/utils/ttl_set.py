@@ -0,0 +1,83 @@
+"""
+Bounded set of recently seen keys with TTL expiry.
+Used to deduplicate at-least-once deliveries such as gateway webhooks.
+"""
+import threading
+import time
+from typing import Dict
+
+
+class TTLSet:
+    """
+    Set of keys that expire `ttl_seconds` after being added.
+
+    Keys live in a single insertion-ordered dict mapping key -> expiry. With a
+    fixed TTL the oldest key always expires first, so expiry and size-based
+    eviction only ever pop from the front: `add` and `__contains__` are O(1)
+    amortized and no per-key timers or heaps are needed.
+    """
+
+    def __init__(self, ttl_seconds: float, max_size: int):
+        """
+        Initialize the set.
+
+        Args:
+            ttl_seconds: Seconds a key is remembered
+            max_size: Maximum number of keys; the oldest are evicted beyond it
+        """
+        if ttl_seconds <= 0 or max_size < 1:
+            raise ValueError("ttl_seconds and max_size must be positive")
+        self._ttl_seconds = ttl_seconds
+        self._max_size = max_size
+        self._expiries: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self.evicted = 0
+
+    def add(self, key: str) -> bool:
+        """
+        Add a key unless it is already present.
+
+        Args:
+            key: The key to remember
+
+        Returns:
+            True if the key was new, False if it was seen within the TTL
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            if key in self._expiries:
+                return False
+            if len(self._expiries) >= self._max_size:
+                del self._expiries[next(iter(self._expiries))]
+                self.evicted += 1
+            self._expiries[key] = now + self._ttl_seconds
+            return True
+
+    def discard(self, key: str) -> None:
+        """
+        Forget a key, e.g. when its processing could not be accepted.
+
+        Args:
+            key: The key to remove
+        """
+        with self._lock:
+            self._expiries.pop(key, None)
+
+    def _expire(self, now: float) -> None:
+        """Drop expired keys from the front. Caller holds the lock."""
+        while self._expiries:
+            oldest = next(iter(self._expiries))
+            if self._expiries[oldest] > now:
+                break
+            del self._expiries[oldest]
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            expiry = self._expiries.get(key)  # type: ignore[call-overload]
+            return expiry is not None and expiry > time.monotonic()
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._expire(time.monotonic())
+            return len(self._expiries)
@@ -0,0 +1,4 @@
+"""
+Performance benchmarks for BakerySpotGourmet.
+Run from the backend directory, e.g. `python -m benchmarks.middleware_overhead`.
+"""
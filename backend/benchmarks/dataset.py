@@ -0,0 +1,351 @@
+"""
+Synthetic bakery dataset for scale testing.
+
+Generates users, products, orders in every OrderStatus and their payments
+with bakery-shaped distributions:
+
+- order times peak at breakfast and lunch, and weekends are busier
+- a few regulars place many orders and a few best sellers dominate baskets
+  (Zipf-like weights)
+- most baskets hold one to three lines of one or two units
+- old orders are delivered or cancelled, recent ones spread over the
+  active states; ON_THE_WAY only happens to delivery orders
+- payments follow the order state, with occasional failed first attempts
+  and refunds
+
+Entities stream out in batches and load into any repository with a
+`save_many` method (the in-memory repositories or another backend), so
+millions of orders never need to be materialized at once beyond what the
+target repository keeps. Generation is deterministic for a given seed.
+
+    from benchmarks.dataset import DatasetGenerator, DatasetSpec
+    DatasetGenerator(DatasetSpec(orders=1_000_000)).load(orders=order_repo, payments=payment_repo)
+
+    cd backend && python -m benchmarks.dataset --orders 1000000
+"""
+import argparse
+import itertools
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Protocol, Sequence, Tuple, TypeVar
+
+from bakerySpotGourmet.domain.business_rules.fulfillment import FulfillmentType
+from bakerySpotGourmet.domain.catalog.product import Product
+from bakerySpotGourmet.domain.orders.order import Order, OrderItem
+from bakerySpotGourmet.domain.orders.status import OrderStatus
+from bakerySpotGourmet.domain.payments.payment import Payment
+from bakerySpotGourmet.domain.payments.status import PaymentStatus
+from bakerySpotGourmet.domain.users.entities import Role, RoleName, User
+
+
+T = TypeVar("T")
+
+# Relative order volume per hour of day: breakfast and lunch peaks, closed at night
+HOURLY_WEIGHTS = (
+    0, 0, 0, 0, 0, 1,        # 00-05
+    6, 14, 16, 10, 7, 9,     # 06-11
+    13, 11, 6, 5, 7, 8,      # 12-17
+    6, 4, 2, 1, 0, 0,        # 18-23
+)
+# Relative order volume per weekday, Monday first
+WEEKDAY_WEIGHTS = (10, 10, 10, 11, 13, 17, 15)
+# Lines per order, 1 to 8
+ITEM_COUNT_WEIGHTS = (38, 28, 15, 8, 5, 3, 2, 1)
+# Units per line, 1 to 6
+QUANTITY_WEIGHTS = (62, 24, 7, 4, 2, 1)
+DELIVERY_RATIO = 0.35
+PAYMENT_METHODS = ("card", "cash", "sinpe")
+PAYMENT_METHOD_WEIGHTS = (70, 18, 12)
+FAILED_FIRST_ATTEMPT_RATIO = 0.03
+REFUND_RATIO = 0.02
+STAFF_RATIO = 0.002
+INACTIVE_PRODUCT_RATIO = 0.05
+
+# Product categories with name stems and sale price ranges
+CATEGORIES: Tuple[Tuple[str, Tuple[str, ...], Tuple[float, float]], ...] = (
+    ("bread", ("Baguette", "Sourdough", "Rye Loaf", "Ciabatta", "Brioche"), (1.5, 6.0)),
+    ("pastry", ("Croissant", "Pain au Chocolat", "Danish", "Cinnamon Roll", "Eclair"), (1.8, 4.5)),
+    ("cake", ("Cheesecake", "Tres Leches", "Carrot Cake", "Opera", "Tart"), (3.5, 38.0)),
+    ("coffee", ("Espresso", "Cappuccino", "Latte", "Americano", "Mocha"), (1.5, 4.8)),
+    ("sandwich", ("Club", "Caprese", "Ham and Cheese", "Tuna", "Veggie"), (4.0, 9.5)),
+)
+VARIANTS = ("Classic", "Whole Wheat", "Mini", "Large", "Seasonal", "Gluten Free", "Vegan", "Double")
+
+_HOURS = range(24)
+_HOURLY_CUM_WEIGHTS = list(itertools.accumulate(HOURLY_WEIGHTS))
+_ITEM_COUNTS = range(1, len(ITEM_COUNT_WEIGHTS) + 1)
+_ITEM_COUNT_CUM_WEIGHTS = list(itertools.accumulate(ITEM_COUNT_WEIGHTS))
+_QUANTITIES = range(1, len(QUANTITY_WEIGHTS) + 1)
+_QUANTITY_CUM_WEIGHTS = list(itertools.accumulate(QUANTITY_WEIGHTS))
+_PAYMENT_METHOD_CUM_WEIGHTS = list(itertools.accumulate(PAYMENT_METHOD_WEIGHTS))
+
+
+class BulkRepository(Protocol[T]):
+    """Anything entities can be bulk-loaded into."""
+
+    def save_many(self, entities: Iterable[T]) -> List[T]:
+        ...
+
+
+@dataclass
+class DatasetSpec:
+    """Size and shape of a synthetic dataset."""
+    users: int = 10_000
+    products: int = 200
+    orders: int = 100_000
+    days: int = 90  # Orders spread over this many days before `now`
+    seed: int = 0
+    now: Optional[datetime] = None
+    batch_size: int = 10_000
+
+
+def _zipf_cum_weights(count: int, exponent: float) -> List[float]:
+    return list(itertools.accumulate(1 / rank ** exponent for rank in range(1, count + 1)))
+
+
+def _batched(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    iterator = iter(items)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+
+class DatasetGenerator:
+    """
+    Deterministic generator of a synthetic bakery dataset.
+    User and product IDs are assigned here (1..N); order and payment IDs are
+    left to the repository, or numbered here when orders are not stored.
+    """
+
+    def __init__(self, spec: DatasetSpec):
+        """
+        Initialize the generator.
+
+        Args:
+            spec: Dataset size and shape
+        """
+        self.spec = spec
+        self.now = spec.now or datetime.now().replace(microsecond=0)
+        self._product_prices: List[float] = []
+        self._active_products: List[int] = []
+        self._customer_ids: List[int] = []
+
+    def users(self) -> Iterator[User]:
+        """Customers, with a few staff and admins."""
+        rng = random.Random(f"{self.spec.seed}:users")
+        customer_ids = []
+        for user_id in range(1, self.spec.users + 1):
+            if user_id == 1:
+                role = RoleName.ADMIN
+            elif rng.random() < STAFF_RATIO:
+                role = RoleName.STAFF
+            else:
+                role = RoleName.CUSTOMER
+                customer_ids.append(user_id)
+            yield User(
+                id=user_id,  # type: ignore[arg-type]
+                email=f"user{user_id}@example.com",
+                role=Role(id=list(RoleName).index(role) + 1, name=role),
+                is_active=rng.random() > 0.01,
+            )
+        self._customer_ids = customer_ids
+
+    def products(self) -> Iterator[Product]:
+        """Catalog products across the bakery categories."""
+        rng = random.Random(f"{self.spec.seed}:products")
+        prices, active = [], []
+        for product_id in range(1, self.spec.products + 1):
+            category_index = (product_id - 1) % len(CATEGORIES)
+            _, stems, (low, high) = CATEGORIES[category_index]
+            stem = stems[(product_id - 1) // len(CATEGORIES) % len(stems)]
+            variant = VARIANTS[(product_id - 1) // (len(CATEGORIES) * len(stems)) % len(VARIANTS)]
+            sale_price = round(rng.uniform(low, high), 2)
+            is_active = rng.random() >= INACTIVE_PRODUCT_RATIO
+            prices.append(sale_price)
+            if is_active:
+                active.append(product_id)
+            yield Product(
+                id=product_id,  # type: ignore[arg-type]
+                category_id=category_index + 1,  # type: ignore[arg-type]
+                name=f"{variant} {stem}",
+                cost_price=round(sale_price * rng.uniform(0.3, 0.55), 2),
+                sale_price=sale_price,
+                is_active=is_active,
+            )
+        self._product_prices, self._active_products = prices, active
+
+    def _ensure_references(self) -> None:
+        """Derive customers and prices without storing users and products."""
+        if not self._customer_ids:
+            for _ in self.users():
+                pass
+            self._customer_ids = self._customer_ids or [1]
+        if not self._product_prices:
+            for _ in self.products():
+                pass
+
+    def _order_time(self, rng: random.Random, day_weights: Sequence[float]) -> datetime:
+        day = rng.choices(range(len(day_weights)), cum_weights=day_weights)[0]
+        hour = rng.choices(_HOURS, cum_weights=_HOURLY_CUM_WEIGHTS)[0]
+        start = (self.now - timedelta(days=day)).replace(hour=hour, minute=0, second=0)
+        created_at = start + timedelta(seconds=rng.randrange(3600))
+        return min(created_at, self.now - timedelta(seconds=rng.randrange(1, 600)))
+
+    def _status(self, rng: random.Random, created_at: datetime, fulfillment: FulfillmentType) -> OrderStatus:
+        age_hours = (self.now - created_at).total_seconds() / 3600
+        if age_hours > 24:
+            return OrderStatus.CANCELLED if rng.random() < 0.06 else OrderStatus.DELIVERED
+        active = [OrderStatus.PENDING, OrderStatus.CONFIRMED, OrderStatus.PREPARING, OrderStatus.READY]
+        weights = [1 + 6 / (1 + age_hours), 2, 2, 2]
+        if fulfillment == FulfillmentType.DELIVERY:
+            active.append(OrderStatus.ON_THE_WAY)
+            weights.append(2)
+        active += [OrderStatus.DELIVERED, OrderStatus.CANCELLED]
+        weights += [age_hours * 2, 0.5]
+        return rng.choices(active, weights=weights)[0]
+
+    def orders(self) -> Iterator[Order]:
+        """Orders without IDs, in creation order."""
+        self._ensure_references()
+        rng = random.Random(f"{self.spec.seed}:orders")
+        days = max(1, self.spec.days)
+        day_weights = list(itertools.accumulate(
+            WEEKDAY_WEIGHTS[(self.now - timedelta(days=day)).weekday()] for day in range(days)
+        ))
+        customer_weights = _zipf_cum_weights(len(self._customer_ids), 0.8)
+        products = self._active_products or list(range(1, len(self._product_prices) + 1))
+        product_weights = _zipf_cum_weights(len(products), 1.1)
+        customers = self._customer_ids[:]
+        rng.shuffle(customers)
+        rng.shuffle(products)
+        for _ in range(self.spec.orders):
+            fulfillment = FulfillmentType.DELIVERY if rng.random() < DELIVERY_RATIO else FulfillmentType.PICKUP
+            created_at = self._order_time(rng, day_weights)
+            lines = rng.choices(_ITEM_COUNTS, cum_weights=_ITEM_COUNT_CUM_WEIGHTS)[0]
+            items = [
+                OrderItem(
+                    product_id=product_id,  # type: ignore[arg-type]
+                    quantity=rng.choices(_QUANTITIES, cum_weights=_QUANTITY_CUM_WEIGHTS)[0],
+                    unit_price=self._product_prices[product_id - 1],
+                )
+                for product_id in rng.choices(products, cum_weights=product_weights, k=lines)
+            ]
+            yield Order(
+                id=None,  # type: ignore[arg-type]
+                user_id=rng.choices(customers, cum_weights=customer_weights)[0],  # type: ignore[arg-type]
+                fulfillment_type=fulfillment,
+                status=self._status(rng, created_at, fulfillment),
+                payment_confirmed=False,
+                created_at=created_at,
+                items=items,
+            )
+
+    def payments(self, orders: Iterable[Order], rng: Optional[random.Random] = None) -> Iterator[Payment]:
+        """
+        Payments of stored orders, following each order's state.
+
+        Args:
+            orders: Orders with IDs assigned
+            rng: Random source, defaults to one derived from the seed
+        """
+        rng = rng or random.Random(f"{self.spec.seed}:payments")
+        for order in orders:
+            if order.status == OrderStatus.PENDING and rng.random() < 0.5:
+                continue
+            amount = round(order.total, 2)
+            method = rng.choices(PAYMENT_METHODS, cum_weights=_PAYMENT_METHOD_CUM_WEIGHTS)[0]
+            created_at = order.created_at + timedelta(seconds=rng.randrange(5, 120))
+            if rng.random() < FAILED_FIRST_ATTEMPT_RATIO:
+                yield Payment(order.id, amount, method, PaymentStatus.FAILED, created_at, created_at)  # type: ignore[arg-type]
+                created_at += timedelta(seconds=rng.randrange(30, 300))
+            if order.status == OrderStatus.PENDING:
+                status = PaymentStatus.PENDING
+            elif order.status == OrderStatus.CANCELLED:
+                status = PaymentStatus.REFUNDED if rng.random() < 0.4 else PaymentStatus.FAILED
+            elif order.status == OrderStatus.DELIVERED:
+                status = PaymentStatus.REFUNDED if rng.random() < REFUND_RATIO else PaymentStatus.COMPLETED
+            else:
+                status = PaymentStatus.COMPLETED if method != "cash" else PaymentStatus.AUTHORIZED
+            order.payment_confirmed = status in (PaymentStatus.AUTHORIZED, PaymentStatus.COMPLETED)
+            yield Payment(order.id, amount, method, status, created_at, created_at)  # type: ignore[arg-type]
+
+    def load(
+        self,
+        users: Optional[BulkRepository[User]] = None,
+        products: Optional[BulkRepository[Product]] = None,
+        orders: Optional[BulkRepository[Order]] = None,
+        payments: Optional[BulkRepository[Payment]] = None,
+    ) -> Dict[str, int]:
+        """
+        Bulk-load the dataset in batches of `spec.batch_size`.
+
+        Args:
+            users: Target for users, skipped if None
+            products: Target for products, skipped if None
+            orders: Target for orders, which assigns their IDs; skipped if None
+            payments: Target for payments, skipped if None
+
+        Returns:
+            Number of entities loaded per kind
+        """
+        loaded: Counter = Counter()
+        size = self.spec.batch_size
+        for batch in _batched(self.users(), size):
+            if users is not None:
+                loaded["users"] += len(users.save_many(batch))
+        for batch in _batched(self.products(), size):
+            if products is not None:
+                loaded["products"] += len(products.save_many(batch))
+        if orders is None and payments is None:
+            return dict(loaded)
+
+        payment_rng = random.Random(f"{self.spec.seed}:payments")
+        next_id = 1
+        for batch in _batched(self.orders(), size):
+            if orders is not None:
+                batch = orders.save_many(batch)
+            else:
+                for order in batch:
+                    order.id, next_id = next_id, next_id + 1  # type: ignore[assignment]
+            loaded["orders"] += len(batch) if orders is not None else 0
+            if payments is not None:
+                loaded["payments"] += len(payments.save_many(list(self.payments(batch, payment_rng))))
+        return dict(loaded)
+
+
+def main() -> None:
+    """Generate a dataset into the in-memory repositories and print its shape."""
+    from bakerySpotGourmet.repositories.order_repository import OrderRepository
+    from bakerySpotGourmet.repositories.payment_repository import PaymentRepository
+    from bakerySpotGourmet.repositories.user_repository import UserRepository
+
+    parser = argparse.ArgumentParser(description="Synthetic bakery dataset")
+    parser.add_argument("--users", type=int, default=DatasetSpec.users)
+    parser.add_argument("--products", type=int, default=DatasetSpec.products)
+    parser.add_argument("--orders", type=int, default=DatasetSpec.orders)
+    parser.add_argument("--days", type=int, default=DatasetSpec.days)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    spec = DatasetSpec(users=args.users, products=args.products, orders=args.orders, days=args.days, seed=args.seed)
+    order_repository, payment_repository = OrderRepository(), PaymentRepository()
+    start = time.perf_counter()
+    loaded = DatasetGenerator(spec).load(
+        users=UserRepository(), orders=order_repository, payments=payment_repository
+    )
+    elapsed = time.perf_counter() - start
+
+    stored = order_repository.get_all(limit=spec.orders)
+    statuses = Counter(order.status.value for order in stored)
+    hours = Counter(order.created_at.hour for order in stored)
+    payment_statuses = Counter(p.status.value for p in payment_repository._payments.values())
+    print(f"Loaded {loaded} in {elapsed:.1f}s")
+    print("Orders by status:  ", dict(statuses.most_common()))
+    print("Payments by status:", dict(payment_statuses.most_common()))
+    print("Busiest hours:     ", [hour for hour, _ in hours.most_common(4)])
+
+
+if __name__ == "__main__":
+    main()
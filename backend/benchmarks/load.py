@@ -0,0 +1,509 @@
+"""
+In-process load generator replaying bakery workflows against main.app.
+
+Requests go through httpx's ASGI transport straight into the application
+(middlewares, auth, services, repositories), with no sockets, so the
+numbers move with application changes rather than network noise. The app's
+lifespan runs as in production.
+
+Workflows are picked at random with the weights of `--mix`:
+
+    login                 POST /users/login/access-token (argon2 verify)
+    create_order          POST /orders/ with a fresh Idempotency-Key, replaying
+                          the previous key now and then like a client retry
+    admin_list_orders     GET /admin/orders
+    admin_update_status   GET /admin/orders?status=..., then PATCH the status of
+                          one of them to its next state
+
+With `--rate 0` (default) `--concurrency` simulated users run workflows
+back to back (closed loop). With `--rate N` workflows arrive as a Poisson
+process of N per second, at most `--concurrency` in flight (open loop);
+latency is measured per request and excludes time queued for a slot.
+
+The per-request repositories of the API are replaced by shared in-memory
+instances, seeded with customers and admins, so state carries across
+requests like it would with a database. `--orders N` preloads N synthetic
+orders and their payments from benchmarks.dataset, so listing and status
+changes run against a production-sized history.
+
+    cd backend && python -m benchmarks.load --duration 10 --concurrency 20
+    python -m benchmarks.load --rate 200 --mix create_order=1 --json results.json
+
+The rate limiter applies per user; add customers (`--customers`) or set
+RATE_LIMIT_ENABLED=false to keep 429s out of the order creation numbers.
+The run exits with status 1 when any response is neither 2xx nor one of the
+client errors the workflows expect (see EXPECTED_CLIENT_ERRORS), e.g. a 500.
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import random
+import sys
+import time
+import uuid
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+from fastapi import FastAPI
+
+from bakerySpotGourmet.api.v1 import dependencies as deps
+from bakerySpotGourmet.core.config import settings
+from bakerySpotGourmet.core.memory import get_memory_registry
+from bakerySpotGourmet.core.security import get_password_hash
+from bakerySpotGourmet.domain.orders.status import OrderStatus
+from bakerySpotGourmet.domain.users.entities import RoleName
+from bakerySpotGourmet.repositories.item_repository import ItemRepository
+from bakerySpotGourmet.repositories.order_repository import OrderRepository
+from bakerySpotGourmet.repositories.payment_repository import PaymentRepository
+from bakerySpotGourmet.repositories.user_repository import UserRepository
+
+from benchmarks.dataset import DatasetGenerator, DatasetSpec
+
+
+DEFAULT_MIX = "login=1,create_order=6,admin_list_orders=2,admin_update_status=1"
+PASSWORD = "bakery-load-test"
+IDEMPOTENT_RETRY_RATIO = 0.1  # Share of order creations replaying the previous key
+CATALOG_PRODUCTS = 3  # Product IDs create_order picks from
+
+# Client errors the workflows provoke by design: inactive products, status
+# changes racing another admin, expired tokens and the rate limiter. Any
+# other non-2xx response fails the run.
+EXPECTED_CLIENT_ERRORS = frozenset({400, 401, 429})
+
+# Next state an admin moves an order to
+NEXT_STATUS = {
+    OrderStatus.PENDING: OrderStatus.CONFIRMED,
+    OrderStatus.CONFIRMED: OrderStatus.PREPARING,
+    OrderStatus.PREPARING: OrderStatus.READY,
+    OrderStatus.READY: OrderStatus.DELIVERED,
+}
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile of sorted values, q in [0, 100]."""
+    if not values:
+        return 0.0
+    rank = max(0, min(len(values) - 1, int(round(q / 100 * len(values) + 0.5)) - 1))
+    return values[rank]
+
+
+@dataclass
+class RouteStats:
+    """Latencies and status codes of one route."""
+    latencies: List[float] = field(default_factory=list)
+    statuses: Counter = field(default_factory=Counter)
+
+
+class LoadRecorder:
+    """Collects request outcomes per route label."""
+
+    def __init__(self) -> None:
+        self.routes: Dict[str, RouteStats] = defaultdict(RouteStats)
+        self.workflows: Counter = Counter()
+
+    def record(self, route: str, status_code: int, seconds: float) -> None:
+        """Record one request."""
+        stats = self.routes[route]
+        stats.latencies.append(seconds)
+        stats.statuses[status_code] += 1
+
+    def unexpected_statuses(self) -> Dict[str, Dict[str, int]]:
+        """
+        Responses that fail the run.
+
+        Returns:
+            Counts per route and status code of responses that are neither
+            2xx nor one of EXPECTED_CLIENT_ERRORS, only for routes with any
+        """
+        unexpected: Dict[str, Dict[str, int]] = {}
+        for route, stats in sorted(self.routes.items()):
+            codes = {
+                str(code): count
+                for code, count in sorted(stats.statuses.items())
+                if not 200 <= code < 300 and code not in EXPECTED_CLIENT_ERRORS
+            }
+            if codes:
+                unexpected[route] = codes
+        return unexpected
+
+    def report(self, elapsed: float) -> Dict[str, Any]:
+        """
+        Summarize the run.
+
+        Args:
+            elapsed: Wall-clock duration of the run in seconds
+
+        Returns:
+            Throughput, latency percentiles in milliseconds and status counts per route and overall,
+            and the unexpected statuses
+        """
+        def summarize(latencies: List[float], statuses: Counter) -> Dict[str, Any]:
+            ordered = sorted(latencies)
+            return {
+                "requests": len(ordered),
+                "throughput_rps": round(len(ordered) / elapsed, 1) if elapsed else 0.0,
+                "p50_ms": round(percentile(ordered, 50) * 1000, 2),
+                "p95_ms": round(percentile(ordered, 95) * 1000, 2),
+                "p99_ms": round(percentile(ordered, 99) * 1000, 2),
+                "statuses": {str(code): count for code, count in sorted(statuses.items())},
+            }
+
+        every: List[float] = []
+        statuses: Counter = Counter()
+        for stats in self.routes.values():
+            every.extend(stats.latencies)
+            statuses.update(stats.statuses)
+        return {
+            "elapsed_seconds": round(elapsed, 3),
+            "workflows": dict(self.workflows),
+            "unexpected_statuses": self.unexpected_statuses(),
+            "total": summarize(every, statuses),
+            "routes": {
+                route: summarize(stats.latencies, stats.statuses)
+                for route, stats in sorted(self.routes.items())
+            },
+        }
+
+
+class Session:
+    """A simulated user: credentials, the token once logged in, and the client."""
+
+    def __init__(self, client: httpx.AsyncClient, recorder: LoadRecorder, email: str):
+        self.client = client
+        self.recorder = recorder
+        self.email = email
+        self.token: Optional[str] = None
+        self.last_idempotency_key: Optional[str] = None
+
+    async def request(self, route: str, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """
+        Send a request, recording its latency under `route`.
+
+        A 401 for a held token means it expired during a long run; the
+        session logs in again and retries once, like a client would.
+        """
+        response = await self._send(route, method, url, **kwargs)
+        if response.status_code == 401 and self.token:
+            await self.login()
+            if self.token:
+                response = await self._send(route, method, url, **kwargs)
+        return response
+
+    async def _send(self, route: str, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        if self.token:
+            kwargs.setdefault("headers", {})["Authorization"] = f"Bearer {self.token}"
+        start = time.perf_counter()
+        response = await self.client.request(method, url, **kwargs)
+        self.recorder.record(route, response.status_code, time.perf_counter() - start)
+        return response
+
+    async def login(self) -> None:
+        """Log in and keep the access token."""
+        self.token = None
+        response = await self._send(
+            "POST /users/login/access-token",
+            "POST",
+            f"{settings.API_V1_STR}/users/login/access-token",
+            data={"username": self.email, "password": PASSWORD},
+        )
+        if response.status_code == 200:
+            self.token = response.json()["access_token"]
+
+    async def ensure_login(self) -> None:
+        """Log in unless a token is already held."""
+        if self.token is None:
+            await self.login()
+
+
+Workflow = Callable[[Session, random.Random], Awaitable[None]]
+
+
+async def login(session: Session, rng: random.Random) -> None:
+    """A user signing in again."""
+    await session.login()
+
+
+async def create_order(session: Session, rng: random.Random) -> None:
+    """A customer placing an order, sometimes retrying the previous request."""
+    await session.ensure_login()
+    key = session.last_idempotency_key
+    if key is None or rng.random() >= IDEMPOTENT_RETRY_RATIO:
+        key = session.last_idempotency_key = uuid.uuid4().hex
+    items = [
+        {"product_id": rng.randint(1, CATALOG_PRODUCTS), "quantity": rng.randint(1, 4)}
+        for _ in range(rng.randint(1, 3))
+    ]
+    body = {
+        "items": items,
+        "order_type": rng.choice(["pickup", "delivery"]),
+    }
+    await session.request(
+        "POST /orders/", "POST", f"{settings.API_V1_STR}/orders/", json=body, headers={"Idempotency-Key": key}
+    )
+
+
+async def admin_list_orders(session: Session, rng: random.Random) -> None:
+    """An admin paging through recent orders."""
+    await session.ensure_login()
+    await session.request(
+        "GET /admin/orders", "GET", f"{settings.API_V1_STR}/admin/orders", params={"limit": 50}
+    )
+
+
+async def admin_update_status(session: Session, rng: random.Random) -> None:
+    """An admin moving one order to its next state."""
+    await session.ensure_login()
+    current = rng.choice(list(NEXT_STATUS))
+    response = await session.request(
+        "GET /admin/orders",
+        "GET",
+        f"{settings.API_V1_STR}/admin/orders",
+        params={"status": current.value, "limit": 20},
+    )
+    orders = response.json() if response.status_code == 200 else []
+    if not orders:
+        return
+    order_id = rng.choice(orders)["id"]
+    await session.request(
+        "PATCH /admin/orders/{order_id}/status",
+        "PATCH",
+        f"{settings.API_V1_STR}/admin/orders/{order_id}/status",
+        json={"status": NEXT_STATUS[current].value},
+    )
+
+
+WORKFLOWS: Dict[str, Workflow] = {
+    "login": login,
+    "create_order": create_order,
+    "admin_list_orders": admin_list_orders,
+    "admin_update_status": admin_update_status,
+}
+ADMIN_WORKFLOWS = {"admin_list_orders", "admin_update_status"}
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    """
+    Parse `name=weight,...` into workflow weights.
+
+    Raises:
+        ValueError: For unknown workflows or non-positive totals
+    """
+    weights: Dict[str, float] = {}
+    for part in filter(None, (p.strip() for p in mix.split(","))):
+        name, _, weight = part.partition("=")
+        if name not in WORKFLOWS:
+            raise ValueError(f"Unknown workflow {name!r}, expected one of {', '.join(WORKFLOWS)}")
+        weights[name] = float(weight or 1)
+    if sum(weights.values()) <= 0:
+        raise ValueError("Workflow mix needs a positive weight")
+    return weights
+
+
+def seed_app(app: FastAPI, customers: int, admins: int, orders: int = 0) -> Dict[str, List[str]]:
+    """
+    Replace per-request repositories with shared seeded ones.
+
+    The catalog holds CATALOG_PRODUCTS products from benchmarks.dataset. The
+    shared repositories are registered for memory introspection as
+    load_users, load_orders and load_payments.
+
+    Args:
+        app: The application to seed
+        customers: Customer accounts to create
+        admins: Admin accounts to create
+        orders: Synthetic order history to preload, with payments
+
+    Returns:
+        Customer and admin emails, all with the load test password
+    """
+    users = UserRepository()
+    # Bypass the constructor's hard-coded demo catalog
+    items = ItemRepository.__new__(ItemRepository)
+    items._items = {}
+    order_repository = OrderRepository()
+    payment_repository = PaymentRepository()
+    hashed_password = get_password_hash(PASSWORD)
+    emails: Dict[str, List[str]] = {"customer": [], "admin": []}
+    for index in range(customers + admins):
+        kind = "customer" if index < customers else "admin"
+        email = f"{kind}{index}@load.bakery"
+        users.save(SimpleNamespace(  # type: ignore[arg-type]
+            id=index + 1,
+            email=email,
+            full_name=None,
+            hashed_password=hashed_password,
+            is_active=True,
+            is_superuser=kind == "admin",
+            role=RoleName.ADMIN if kind == "admin" else RoleName.CUSTOMER,
+        ))
+        emails[kind].append(email)
+    generator = DatasetGenerator(DatasetSpec(users=customers + admins, products=CATALOG_PRODUCTS, orders=orders))
+    items.save_many(generator.products())
+    if orders:
+        generator.load(orders=order_repository, payments=payment_repository)
+    registry = get_memory_registry()
+    registry.register("load_users", users, lambda: len(users._users))
+    registry.register("load_orders", order_repository, order_repository.count)
+    registry.register("load_payments", payment_repository, payment_repository.count)
+    app.dependency_overrides[deps.get_user_repository] = lambda: users
+    app.dependency_overrides[deps.get_item_repository] = lambda: items
+    app.dependency_overrides[deps.get_order_repository] = lambda: order_repository
+    app.dependency_overrides[deps.get_payment_repository] = lambda: payment_repository
+    return emails
+
+
+async def run_load(
+    app: FastAPI,
+    mix: Dict[str, float],
+    duration: float,
+    concurrency: int,
+    rate: float = 0.0,
+    customers: int = 50,
+    admins: int = 3,
+    orders: int = 0,
+    seed: Optional[int] = None,
+    show_logs: bool = False,
+    recorder: Optional[LoadRecorder] = None,
+    monitor: Optional[Callable[[LoadRecorder], Awaitable[None]]] = None,
+) -> Dict[str, Any]:
+    """
+    Drive the app with the workflow mix and report per-route latency.
+
+    Args:
+        app: The ASGI application
+        mix: Workflow weights
+        duration: Seconds to generate load for
+        concurrency: Simulated users (closed loop) or in-flight cap (open loop)
+        rate: Workflow arrivals per second; 0 runs a closed loop
+        customers: Seeded customer accounts
+        admins: Seeded admin accounts
+        orders: Synthetic orders preloaded before the run
+        seed: Random seed for workflow choice and arrivals
+        show_logs: Let application logs reach stdout instead of /dev/null
+        recorder: Collects request outcomes, defaults to a new LoadRecorder
+        monitor: Runs alongside the load with the recorder, cancelled when
+            the load ends
+
+    Returns:
+        The recorder's report
+    """
+    rng = random.Random(seed)
+    recorder = recorder if recorder is not None else LoadRecorder()
+    names, weights = list(mix), list(mix.values())
+    overrides = dict(app.dependency_overrides)
+    emails = seed_app(app, customers, admins, orders)
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    # Logs are still rendered and written, so their cost stays in the numbers
+    output = contextlib.nullcontext() if show_logs else contextlib.redirect_stdout(open(os.devnull, "w"))
+    try:
+        with output:
+            async with app.router.lifespan_context(app):
+                async with httpx.AsyncClient(transport=transport, base_url="http://bakery") as client:
+                    sessions = {
+                        kind: [Session(client, recorder, email) for email in kind_emails]
+                        for kind, kind_emails in emails.items()
+                    }
+
+                    async def run_one() -> None:
+                        name = rng.choices(names, weights)[0]
+                        kind = "admin" if name in ADMIN_WORKFLOWS else "customer"
+                        recorder.workflows[name] += 1
+                        await WORKFLOWS[name](rng.choice(sessions[kind]), rng)
+
+                    start = time.perf_counter()
+                    deadline = start + duration
+                    monitor_task = asyncio.create_task(monitor(recorder)) if monitor else None
+                    if rate > 0:
+                        slots = asyncio.Semaphore(concurrency)
+                        in_flight = set()
+
+                        async def arrive() -> None:
+                            async with slots:
+                                await run_one()
+
+                        next_arrival = start
+                        while next_arrival < deadline:
+                            await asyncio.sleep(max(0.0, next_arrival - time.perf_counter()))
+                            task = asyncio.create_task(arrive())
+                            in_flight.add(task)
+                            task.add_done_callback(in_flight.discard)
+                            next_arrival += rng.expovariate(rate)
+                        await asyncio.gather(*in_flight)
+                    else:
+                        async def user() -> None:
+                            while time.perf_counter() < deadline:
+                                await run_one()
+
+                        await asyncio.gather(*(user() for _ in range(concurrency)))
+                    elapsed = time.perf_counter() - start
+                    if monitor_task is not None:
+                        monitor_task.cancel()
+                        with contextlib.suppress(asyncio.CancelledError):
+                            await monitor_task
+    finally:
+        app.dependency_overrides = overrides
+    return recorder.report(elapsed)
+
+
+def _print_report(report: Dict[str, Any]) -> None:
+    header = f"{'route':<40} {'requests':>9} {'rps':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}  statuses"
+    print(header)
+    rows = list(report["routes"].items()) + [("total", report["total"])]
+    for route, stats in rows:
+        statuses = " ".join(f"{code}:{count}" for code, count in stats["statuses"].items())
+        print(
+            f"{route:<40} {stats['requests']:>9} {stats['throughput_rps']:>8.1f} "
+            f"{stats['p50_ms']:>9.2f} {stats['p95_ms']:>9.2f} {stats['p99_ms']:>9.2f}  {statuses}"
+        )
+
+
+def main() -> None:
+    """Run the load generator, print the per-route report and exit non-zero on unexpected statuses."""
+    parser = argparse.ArgumentParser(description="In-process load generator for the bakery API")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds of load")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--rate", type=float, default=0.0, help="Workflows per second; 0 for closed loop")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="Workflow weights, name=weight,...")
+    parser.add_argument("--customers", type=int, default=50)
+    parser.add_argument("--admins", type=int, default=3)
+    parser.add_argument("--orders", type=int, default=0, help="Synthetic order history to preload")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--show-logs", action="store_true", help="Print application logs instead of discarding them")
+    parser.add_argument("--json", dest="json_path", help="Also write the report here")
+    args = parser.parse_args()
+
+    # Client-side request logging would add to every latency
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    from bakerySpotGourmet.main import app
+
+    report = asyncio.run(run_load(
+        app,
+        parse_mix(args.mix),
+        duration=args.duration,
+        concurrency=args.concurrency,
+        rate=args.rate,
+        customers=args.customers,
+        admins=args.admins,
+        orders=args.orders,
+        seed=args.seed,
+        show_logs=args.show_logs,
+    ))
+    _print_report(report)
+    if args.json_path:
+        with open(args.json_path, "w") as output:
+            json.dump(report, output, indent=2)
+    if report["unexpected_statuses"]:
+        for route, codes in report["unexpected_statuses"].items():
+            returned = ", ".join(f"{count}x {code}" for code, count in codes.items())
+            print(f"FAIL: {route} returned {returned}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,358 @@
+"""
+Microbenchmarks of core hot paths, with a committed JSON baseline.
+
+Each case times one call of a hot path (rate limit check, idempotency store
+lookups at growing sizes, JWT encode/decode, order domain logic, repository
+listing at scale, response validation, serialization of an admin page of
+orders) with timeit's autorange, keeping the fastest of several rounds as
+the least noisy estimate.
+
+    cd backend
+    python -m benchmarks.micro run                          # print timings
+    python -m benchmarks.micro run --output benchmarks/baselines/micro.json
+    python -m benchmarks.micro compare                      # run, compare with the baseline
+    python -m benchmarks.micro compare --current results.json --tolerance 0.25
+
+`compare` exits with status 1 when a case is slower than its baseline by more
+than the tolerance. Baselines are machine specific; refresh the committed one
+from the same host that runs the comparison.
+"""
+import argparse
+import contextlib
+import itertools
+import json
+import platform
+import sys
+import timeit
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional, Union
+from unittest.mock import patch
+
+import structlog
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from bakerySpotGourmet.core.config import settings
+from bakerySpotGourmet.core.responses import PydanticJSONResponse
+from bakerySpotGourmet.core.security import RateLimiter, create_access_token, decode_token
+from bakerySpotGourmet.domain.business_rules.fulfillment import FulfillmentType
+from bakerySpotGourmet.domain.orders.order import Order
+from bakerySpotGourmet.domain.orders.status import OrderStatus
+from bakerySpotGourmet.repositories.order_repository import OrderRepository
+from bakerySpotGourmet.schemas.order import OrderResponse
+from bakerySpotGourmet.utils.idempotency import IdempotencyStore
+
+from benchmarks.dataset import DatasetGenerator, DatasetSpec
+from benchmarks.utils import drop_event
+
+
+DEFAULT_BASELINE = Path(__file__).parent / "baselines" / "micro.json"
+DEFAULT_TOLERANCE = 0.25  # Slowdown ratio flagged as a regression
+DEFAULT_ROUNDS = 5
+
+IDEMPOTENCY_SIZES = (10_000, 100_000, 1_000_000)
+REPOSITORY_SIZES = (1_000, 10_000, 100_000)
+ORDER_PAGE_SIZE = 1_000
+
+# Case name -> setup returning the zero-argument callable to time, or a
+# context manager providing it while the case is timed
+Setup = Callable[[], Union[Callable[[], Any], ContextManager[Callable[[], Any]]]]
+CASES: Dict[str, Setup] = {}
+
+
+def case(name: str) -> Callable[[Setup], Setup]:
+    """Register a benchmark setup under `name`."""
+    def register(setup: Setup) -> Setup:
+        CASES[name] = setup
+        return setup
+    return register
+
+
+@case("rate_limiter.check_rate_limit")
+@contextlib.contextmanager
+def _rate_limiter() -> Iterator[Callable[[], Any]]:
+    """Enabled limiter; the setting is restored once the case is timed."""
+    limiter = RateLimiter(requests_per_minute=10**9)
+    identifiers = itertools.cycle([f"user:{i}" for i in range(10_000)])
+    with patch.object(settings, "RATE_LIMIT_ENABLED", True):
+        yield lambda: limiter.check_rate_limit(next(identifiers), "orders")
+
+
+def _filled_idempotency_store(entries: int) -> IdempotencyStore:
+    """Store holding `entries` live keys, filled without the per-set cleanup."""
+    store = IdempotencyStore()
+    entry = {"response": {"id": 1, "status": "pending"}, "expires_at": float("inf"), "created_at": 0.0}
+    store._store = dict.fromkeys((f"key-{i:07d}" for i in range(entries)), entry)
+    return store
+
+
+def _idempotency_get(entries: int) -> Callable[[], Callable[[], Any]]:
+    def setup() -> Callable[[], Any]:
+        store = _filled_idempotency_store(entries)
+        keys = itertools.cycle(list(store._store)[:: max(1, entries // 1000)])
+        return lambda: store.get(next(keys))
+    return setup
+
+
+def _idempotency_set(entries: int) -> Callable[[], Callable[[], Any]]:
+    def setup() -> Callable[[], Any]:
+        store = _filled_idempotency_store(entries)
+        keys = itertools.cycle(list(store._store)[:: max(1, entries // 1000)])
+        response = {"id": 1, "status": "pending"}
+        return lambda: store.set(next(keys), response)
+    return setup
+
+
+for _entries in IDEMPOTENCY_SIZES:
+    case(f"idempotency_store.get[{_entries}]")(_idempotency_get(_entries))
+    case(f"idempotency_store.set[{_entries}]")(_idempotency_set(_entries))
+
+
+@case("security.create_access_token")
+def _create_access_token() -> Callable[[], Any]:
+    return lambda: create_access_token(42)
+
+
+@case("security.decode_token")
+def _decode_token() -> Callable[[], Any]:
+    token = create_access_token(42)
+    return lambda: decode_token(token)
+
+
+def _order(items: int = 10) -> Order:
+    order = Order(id=uuid.uuid4(), user_id=uuid.uuid4(), fulfillment_type=FulfillmentType.DELIVERY)
+    for i in range(items):
+        order.add_item(product_id=uuid.uuid4(), quantity=i % 3 + 1, unit_price=2.5 + i)
+    return order
+
+
+@case("order.total[10 items]")
+def _order_total() -> Callable[[], Any]:
+    order = _order()
+    return lambda: order.total
+
+
+@case("order.transition_to[lifecycle]")
+def _order_transition() -> Callable[[], Any]:
+    """One call walks PENDING -> CONFIRMED -> PREPARING -> ON_THE_WAY -> DELIVERED."""
+    order = _order(items=1)
+    lifecycle = (OrderStatus.CONFIRMED, OrderStatus.PREPARING, OrderStatus.ON_THE_WAY, OrderStatus.DELIVERED)
+
+    def run() -> None:
+        order.status = OrderStatus.PENDING
+        for status in lifecycle:
+            order.transition_to(status)
+
+    return run
+
+
+def _repository_get_all(orders: int) -> Callable[[], Callable[[], Any]]:
+    def setup() -> Callable[[], Any]:
+        repository = OrderRepository()
+        spec = DatasetSpec(users=1_000, orders=orders, now=datetime(2024, 6, 1, 12))
+        DatasetGenerator(spec).load(orders=repository)
+        return lambda: repository.get_all(skip=0, limit=100)
+    return setup
+
+
+for _orders in REPOSITORY_SIZES:
+    case(f"order_repository.get_all[{_orders}]")(_repository_get_all(_orders))
+
+
+def _order_payload(order_id: int = 1, items: int = 5) -> Dict[str, Any]:
+    now = datetime.now(timezone.utc)
+    return {
+        "id": order_id,
+        "customer_id": 7,
+        "status": "confirmed",
+        "order_type": "delivery",
+        "payment_status": "completed",
+        "total_amount": 5.5 * items,
+        "created_at": now,
+        "updated_at": now,
+        "items": [
+            {"product_id": i, "product_name": f"Item {i}", "quantity": 1, "unit_price": 5.5, "subtotal": 5.5}
+            for i in range(items)
+        ],
+    }
+
+
+@case("order_response.model_validate[5 items]")
+def _order_response() -> Callable[[], Any]:
+    payload = _order_payload()
+    return lambda: OrderResponse.model_validate(payload)
+
+
+def _order_page() -> List[OrderResponse]:
+    return [OrderResponse.model_validate(_order_payload(i)) for i in range(ORDER_PAGE_SIZE)]
+
+
+@case(f"order_page.jsonable_encoder[{ORDER_PAGE_SIZE}]")
+def _order_page_jsonable_encoder() -> Callable[[], Any]:
+    """Generic path: jsonable_encoder, then json.dumps in JSONResponse."""
+    orders = _order_page()
+    return lambda: JSONResponse(jsonable_encoder(orders))
+
+
+@case(f"order_page.response_model[{ORDER_PAGE_SIZE}]")
+def _order_page_response_model() -> Callable[[], Any]:
+    """FastAPI's response_model path: validate from attributes, then dump_json."""
+    adapter = TypeAdapter(List[OrderResponse])
+    orders = [
+        SimpleNamespace(**{**payload, "items": [SimpleNamespace(**item) for item in payload["items"]]})
+        for payload in (_order_payload(i) for i in range(ORDER_PAGE_SIZE))
+    ]
+    return lambda: adapter.dump_json(adapter.validate_python(orders, from_attributes=True))
+
+
+@case(f"order_page.pydantic_json_response[{ORDER_PAGE_SIZE}]")
+def _order_page_pydantic_json_response() -> Callable[[], Any]:
+    """Validated models returned as PydanticJSONResponse."""
+    orders = _order_page()
+    return lambda: PydanticJSONResponse(orders)
+
+
+def time_case(func: Callable[[], Any], rounds: int = DEFAULT_ROUNDS) -> Dict[str, Any]:
+    """
+    Time one case.
+
+    Args:
+        func: The call to time
+        rounds: Timed rounds after calibration
+
+    Returns:
+        Fastest and median nanoseconds per call, and calls per round
+    """
+    timer = timeit.Timer(func)
+    loops, _ = timer.autorange()
+    per_call = sorted(total / loops * 1e9 for total in timer.repeat(repeat=rounds, number=loops))
+    return {
+        "ns_per_op": round(per_call[0], 1),
+        "median_ns_per_op": round(per_call[len(per_call) // 2], 1),
+        "loops": loops,
+    }
+
+
+def run(pattern: Optional[str] = None, rounds: int = DEFAULT_ROUNDS) -> Dict[str, Any]:
+    """
+    Run the registered cases.
+
+    Args:
+        pattern: Only run cases whose name contains it
+        rounds: Timed rounds per case
+
+    Returns:
+        Results document with environment details, as stored in baselines
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+    for name, setup in CASES.items():
+        if pattern and pattern not in name:
+            continue
+        prepared = setup()
+        if isinstance(prepared, contextlib.AbstractContextManager):
+            with prepared as func:
+                results[name] = time_case(func, rounds)
+        else:
+            results[name] = time_case(prepared, rounds)
+        print(f"{name:<45} {results[name]['ns_per_op'] / 1000:>12.3f} us", file=sys.stderr)
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], tolerance: float) -> List[Dict[str, Any]]:
+    """
+    Compare results against a baseline.
+
+    Args:
+        baseline: Baseline results document
+        current: Current results document
+        tolerance: Allowed slowdown ratio, e.g. 0.25 for 25%
+
+    Returns:
+        One row per case with both timings, the ratio and a status of
+        ok, faster, regression, new or missing
+    """
+    rows = []
+    before, after = baseline["results"], current["results"]
+    for name in sorted(set(before) | set(after)):
+        if name not in after:
+            rows.append({"case": name, "status": "missing"})
+            continue
+        if name not in before:
+            rows.append({"case": name, "current_ns": after[name]["ns_per_op"], "status": "new"})
+            continue
+        base, now = before[name]["ns_per_op"], after[name]["ns_per_op"]
+        ratio = now / base if base else float("inf")
+        if ratio > 1 + tolerance:
+            status = "regression"
+        elif ratio < 1 - tolerance:
+            status = "faster"
+        else:
+            status = "ok"
+        rows.append({"case": name, "baseline_ns": base, "current_ns": now, "ratio": ratio, "status": status})
+    return rows
+
+
+def _print_comparison(rows: List[Dict[str, Any]]) -> None:
+    print(f"{'case':<45} {'baseline us':>12} {'current us':>12} {'ratio':>8}  status")
+    for row in rows:
+        base = f"{row['baseline_ns'] / 1000:.3f}" if "baseline_ns" in row else "-"
+        now = f"{row['current_ns'] / 1000:.3f}" if "current_ns" in row else "-"
+        ratio = f"{row['ratio']:.2f}" if "ratio" in row else "-"
+        print(f"{row['case']:<45} {base:>12} {now:>12} {ratio:>8}  {row['status']}")
+
+
+def main() -> None:
+    """Run benchmarks or compare them against a baseline."""
+    parser = argparse.ArgumentParser(description="Core hot path microbenchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the benchmarks")
+    run_parser.add_argument("--filter", help="Only cases whose name contains this")
+    run_parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS)
+    run_parser.add_argument("--output", type=Path, help="Write results here, e.g. the baseline")
+
+    compare_parser = commands.add_parser("compare", help="Compare with a baseline")
+    compare_parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    compare_parser.add_argument("--current", type=Path, help="Saved results, instead of running now")
+    compare_parser.add_argument("--filter", help="Only cases whose name contains this")
+    compare_parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS)
+    compare_parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args()
+
+    structlog.configure(processors=[drop_event])
+
+    if args.command == "run":
+        document = run(args.filter, args.rounds)
+        if args.output:
+            args.output.parent.mkdir(parents=True, exist_ok=True)
+            args.output.write_text(json.dumps(document, indent=2, sort_keys=True) + "\n")
+        else:
+            print(json.dumps(document, indent=2, sort_keys=True))
+        return
+
+    baseline = json.loads(args.baseline.read_text())
+    if args.current:
+        current = json.loads(args.current.read_text())
+    else:
+        current = run(args.filter, args.rounds)
+    if args.filter:
+        baseline["results"] = {k: v for k, v in baseline["results"].items() if args.filter in k}
+    rows = compare(baseline, current, args.tolerance)
+    _print_comparison(rows)
+    regressions = [row["case"] for row in rows if row["status"] == "regression"]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.tolerance:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Per-request overhead of the request ID and timing middlewares.
+
+Compares the pure ASGI middlewares in core/middleware.py against the
+BaseHTTPMiddleware versions they replaced, by driving the ASGI app directly
+(no HTTP client, no sockets) so only middleware cost differs between runs.
+
+    cd backend && python -m benchmarks.middleware_overhead --requests 5000
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from typing import Callable, Dict, List
+
+import structlog
+from fastapi import FastAPI, Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message
+
+from bakerySpotGourmet.core.constants import REQUEST_ID_HEADER
+from bakerySpotGourmet.core.middleware import RequestIDMiddleware, RequestTimingMiddleware
+
+from benchmarks.utils import drop_event
+
+
+logger = structlog.get_logger()
+
+
+class LegacyRequestIDMiddleware(BaseHTTPMiddleware):
+    """The BaseHTTPMiddleware request ID middleware, kept as the baseline."""
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        request_id = request.headers.get(REQUEST_ID_HEADER, str(uuid.uuid4()))
+        structlog.contextvars.clear_contextvars()
+        structlog.contextvars.bind_contextvars(request_id=request_id)
+        request.state.request_id = request_id
+        response = await call_next(request)
+        response.headers[REQUEST_ID_HEADER] = request_id
+        return response
+
+
+class LegacyRequestTimingMiddleware(BaseHTTPMiddleware):
+    """The BaseHTTPMiddleware timing middleware, kept as the baseline."""
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        start_time = time.time()
+        logger.info(
+            "request_started",
+            method=request.method,
+            path=request.url.path,
+            client=request.client.host if request.client else None,
+        )
+        response = await call_next(request)
+        duration = time.time() - start_time
+        logger.info(
+            "request_completed",
+            method=request.method,
+            path=request.url.path,
+            status_code=response.status_code,
+            duration_seconds=round(duration, 3),
+        )
+        return response
+
+
+def build_app(middlewares: List[type]) -> FastAPI:
+    """Minimal app with the given middlewares (first in the list is innermost)."""
+    app = FastAPI()
+    for middleware in middlewares:
+        app.add_middleware(middleware)
+
+    @app.get("/ping")
+    async def ping() -> Dict[str, str]:
+        return {"status": "ok"}
+
+    return app
+
+
+async def _run(app: ASGIApp, requests: int) -> float:
+    """Send `requests` GET /ping calls and return mean nanoseconds per request."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/ping",
+        "raw_path": b"/ping",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        pass
+
+    start = time.perf_counter_ns()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    return (time.perf_counter_ns() - start) / requests
+
+
+def measure(app: ASGIApp, requests: int, rounds: int) -> float:
+    """Median over rounds of the mean nanoseconds per request, after a warm-up round."""
+    asyncio.run(_run(app, min(requests, 500)))
+    return statistics.median(asyncio.run(_run(app, requests)) for _ in range(rounds))
+
+
+def main() -> None:
+    """Run the benchmark and print per-request timings in microseconds."""
+    parser = argparse.ArgumentParser(description="Middleware per-request overhead")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    structlog.configure(processors=[drop_event])
+
+    stacks = {
+        "no middleware": [],
+        "BaseHTTPMiddleware": [LegacyRequestTimingMiddleware, LegacyRequestIDMiddleware],
+        "pure ASGI": [RequestTimingMiddleware, RequestIDMiddleware],
+    }
+    results = {
+        name: measure(build_app(middlewares), args.requests, args.rounds) / 1000
+        for name, middlewares in stacks.items()
+    }
+
+    bare = results["no middleware"]
+    print(f"{'stack':<20} {'us/request':>12} {'overhead us':>12}")
+    for name, micros in results.items():
+        print(f"{name:<20} {micros:>12.1f} {micros - bare:>12.1f}")
+    saved = results["BaseHTTPMiddleware"] - results["pure ASGI"]
+    print(f"\nPure ASGI saves {saved:.1f} us per request")
+
+
+if __name__ == "__main__":
+    main()
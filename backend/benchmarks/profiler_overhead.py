@@ -0,0 +1,65 @@
+"""
+Cost of the continuous profiler on request throughput.
+
+Runs the middleware stack of the app with the profiler stopped and running
+at a few sampling rates, and prints the per-request slowdown next to the
+profiler's own CPU accounting. The target is CONTINUOUS_PROFILER_TARGET_OVERHEAD
+at the default rate.
+
+    cd backend && python -m benchmarks.profiler_overhead --requests 5000
+"""
+import argparse
+import threading
+
+import structlog
+
+from bakerySpotGourmet.core.constants import (
+    CONTINUOUS_PROFILER_INTERVAL_SECONDS,
+    CONTINUOUS_PROFILER_TARGET_OVERHEAD,
+)
+from bakerySpotGourmet.core.middleware import RequestIDMiddleware, RequestTimingMiddleware
+from bakerySpotGourmet.core.profiling import ContinuousProfiler
+
+from benchmarks.middleware_overhead import build_app, measure
+from benchmarks.utils import drop_event
+
+
+def _idle_threads(count: int, stop: threading.Event) -> None:
+    """Start idle worker threads, so the profiler walks more than one stack."""
+    for _ in range(count):
+        threading.Thread(target=stop.wait, daemon=True).start()
+
+
+def main() -> None:
+    """Run the benchmark and print per-request timings in microseconds."""
+    parser = argparse.ArgumentParser(description="Continuous profiler overhead")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--threads", type=int, default=8, help="Extra idle threads to sample")
+    args = parser.parse_args()
+
+    structlog.configure(processors=[drop_event])
+    stop = threading.Event()
+    _idle_threads(args.threads, stop)
+    app = build_app([RequestTimingMiddleware, RequestIDMiddleware])
+
+    baseline = measure(app, args.requests, args.rounds) / 1000
+    print(f"{'profiler':<20} {'us/request':>12} {'slowdown':>10} {'self cpu':>10}")
+    print(f"{'off':<20} {baseline:>12.1f} {'':>10} {'':>10}")
+
+    for hz in (1 / CONTINUOUS_PROFILER_INTERVAL_SECONDS, 100, 250):
+        profiler = ContinuousProfiler(interval=1 / hz)
+        profiler.start()
+        micros = measure(app, args.requests, args.rounds) / 1000
+        profiler.stop()
+        stats = profiler.get_stats()
+        slowdown = micros / baseline - 1
+        label = f"{hz:.0f} Hz"
+        print(f"{label:<20} {micros:>12.1f} {slowdown:>9.2%} {stats['overhead_ratio']:>9.2%}")
+
+    stop.set()
+    print(f"\nTarget: {CONTINUOUS_PROFILER_TARGET_OVERHEAD:.0%} of one core at the default rate")
+
+
+if __name__ == "__main__":
+    main()
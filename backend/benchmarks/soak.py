@@ -0,0 +1,312 @@
+"""
+Soak test: hours of load from benchmarks.load, checked for memory growth and
+latency drift.
+
+Every `--interval` the harness samples the process RSS, the entry count and
+approximate size of every store in the memory registry (see
+bakerySpotGourmet.core.memory), and the latency percentiles of the requests
+completed since the previous sample. After `--warmup`, it fits straight
+lines to the samples:
+
+    RSS per request      RSS growth per request served, minus the growth of
+                         the shared load_* repositories that stand in for the
+                         database and are expected to grow with every order
+    store growth         bytes per request of each store, to point at the leak
+    p99 drift            change of the fitted p99 from the first to the last
+                         sample, relative to the first
+
+The run fails (exit status 1) when the RSS growth per request exceeds
+`--max-bytes-per-request`, the p99 drift exceeds `--max-p99-drift`, or a
+response is neither 2xx nor an expected client error (see benchmarks.load). A run
+with too few samples after the warmup to fit a trend exits with status 2.
+
+    cd backend
+    python -m benchmarks.soak --duration 2h --rate 100 --json soak.json
+    python -m benchmarks.soak --duration 10m --interval 10s --concurrency 10
+
+Durations accept s, m and h suffixes. Request latency is only kept per
+sample window, so the harness does not grow with the run length itself.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+from collections import Counter
+from typing import Any, Dict, List, Sequence, Tuple
+
+from bakerySpotGourmet.core.memory import get_memory_registry, get_rss_bytes
+
+from benchmarks.load import DEFAULT_MIX, LoadRecorder, parse_mix, percentile, run_load
+
+
+DEFAULT_INTERVAL = 60.0
+DEFAULT_MAX_BYTES_PER_REQUEST = 256.0
+DEFAULT_MAX_P99_DRIFT = 0.25  # 25% slower p99 at the end of the run
+MIN_FIT_SAMPLES = 3
+
+# Stores standing in for the database; their growth is the data, not a leak
+DATABASE_STORES = ("load_users", "load_orders", "load_payments")
+
+
+def parse_duration(value: str) -> float:
+    """
+    Parse seconds with an optional s, m or h suffix, e.g. "90", "10m", "2h".
+
+    Raises:
+        argparse.ArgumentTypeError: For malformed durations
+    """
+    units = {"s": 1, "m": 60, "h": 3600}
+    number, unit = (value[:-1], value[-1]) if value and value[-1] in units else (value, "s")
+    try:
+        return float(number) * units[unit]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid duration {value!r}, expected e.g. 90, 10m or 2h")
+
+
+def linear_fit(xs: Sequence[float], ys: Sequence[float]) -> Tuple[float, float]:
+    """
+    Least squares line through the points.
+
+    Returns:
+        Slope and intercept; a zero slope when every x is the same
+    """
+    n = len(xs)
+    mean_x, mean_y = sum(xs) / n, sum(ys) / n
+    spread = sum((x - mean_x) ** 2 for x in xs)
+    if spread == 0:
+        return 0.0, mean_y
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / spread
+    return slope, mean_y - slope * mean_x
+
+
+class SoakRecorder(LoadRecorder):
+    """
+    Recorder keeping latencies only until the next sample.
+
+    Status counts are kept for the whole run; latencies are drained by
+    every sample, so hours of requests do not accumulate in memory.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.requests = 0
+        self.window: List[float] = []
+
+    def record(self, route: str, status_code: int, seconds: float) -> None:
+        """Record one request."""
+        self.routes[route].statuses[status_code] += 1
+        self.window.append(seconds)
+        self.requests += 1
+
+    def drain(self) -> List[float]:
+        """Latencies recorded since the previous drain, sorted."""
+        window, self.window = self.window, []
+        return sorted(window)
+
+    def report(self, elapsed: float) -> Dict[str, Any]:
+        """
+        Summarize the run without latencies, which are reported per sample.
+
+        Args:
+            elapsed: Wall-clock duration of the run in seconds
+
+        Returns:
+            Request, workflow and status counts, and the unexpected statuses
+        """
+        statuses: Counter = Counter()
+        for stats in self.routes.values():
+            statuses.update(stats.statuses)
+        return {
+            "elapsed_seconds": round(elapsed, 3),
+            "requests": self.requests,
+            "workflows": dict(self.workflows),
+            "statuses": {str(code): count for code, count in sorted(statuses.items())},
+            "unexpected_statuses": self.unexpected_statuses(),
+        }
+
+
+class SoakSampler:
+    """Periodic samples of memory and latency during a soak run."""
+
+    def __init__(self, recorder: SoakRecorder, interval: float):
+        self.recorder = recorder
+        self.interval = interval
+        self.samples: List[Dict[str, Any]] = []
+        self._started = time.perf_counter()
+
+    async def run(self, recorder: LoadRecorder) -> None:
+        """Sample every interval until cancelled; the run_load monitor."""
+        self._started = time.perf_counter()
+        self.recorder.drain()
+        self.sample()
+        while True:
+            await asyncio.sleep(self.interval)
+            self.sample()
+
+    def sample(self) -> Dict[str, Any]:
+        """Take one sample and print a progress line."""
+        latencies = self.recorder.drain()
+        stores = {
+            row["name"]: {"entries": row["entries"], "approx_bytes": row["approx_bytes"]}
+            for row in get_memory_registry().report()
+        }
+        sample = {
+            "elapsed_seconds": round(time.perf_counter() - self._started, 3),
+            "requests": self.recorder.requests,
+            "rss_bytes": get_rss_bytes(),
+            "window_requests": len(latencies),
+            "p50_ms": round(percentile(latencies, 50) * 1000, 2) if latencies else None,
+            "p99_ms": round(percentile(latencies, 99) * 1000, 2) if latencies else None,
+            "stores": stores,
+        }
+        self.samples.append(sample)
+        rss = f"{sample['rss_bytes'] / 2**20:.1f} MiB" if sample["rss_bytes"] is not None else "n/a"
+        p99 = f"{sample['p99_ms']:.2f} ms" if sample["p99_ms"] is not None else "n/a"
+        print(
+            f"[{sample['elapsed_seconds']:>9.0f}s] requests={sample['requests']:<9} rss={rss:<12} p99={p99}",
+            file=sys.stderr,
+        )
+        return sample
+
+
+def analyze(
+    samples: List[Dict[str, Any]],
+    warmup: float,
+    max_bytes_per_request: float = DEFAULT_MAX_BYTES_PER_REQUEST,
+    max_p99_drift: float = DEFAULT_MAX_P99_DRIFT,
+) -> Dict[str, Any]:
+    """
+    Fit memory and latency trends to the samples taken after the warmup.
+
+    Args:
+        samples: Samples in the order taken
+        warmup: Seconds of samples to ignore while caches and pools fill
+        max_bytes_per_request: RSS growth per request above which the run fails
+        max_p99_drift: Relative p99 increase over the run above which it fails
+
+    Returns:
+        The fitted trends, per store growth (largest first), the failures and
+        a verdict of pass, fail or inconclusive
+    """
+    steady = [s for s in samples if s["elapsed_seconds"] >= warmup]
+    result: Dict[str, Any] = {"samples": len(steady), "failures": []}
+    if len(steady) < MIN_FIT_SAMPLES or steady[-1]["requests"] == steady[0]["requests"]:
+        result["verdict"] = "inconclusive"
+        return result
+
+    requests = [float(s["requests"]) for s in steady]
+    stores: Dict[str, float] = {}
+    for name in steady[-1]["stores"]:
+        points = [(r, s["stores"][name]["approx_bytes"]) for r, s in zip(requests, steady) if name in s["stores"]]
+        if len(points) >= MIN_FIT_SAMPLES:
+            stores[name] = linear_fit(*zip(*points))[0]
+    result["store_bytes_per_request"] = {
+        name: round(slope, 2) for name, slope in sorted(stores.items(), key=lambda item: -item[1])
+    }
+
+    if all(s["rss_bytes"] is not None for s in steady):
+        rss_slope = linear_fit(requests, [float(s["rss_bytes"]) for s in steady])[0]
+        expected = sum(stores.get(name, 0.0) for name in DATABASE_STORES)
+        result["rss_bytes_per_request"] = round(rss_slope, 2)
+        result["database_bytes_per_request"] = round(expected, 2)
+        result["leaked_bytes_per_request"] = round(rss_slope - expected, 2)
+        if rss_slope - expected > max_bytes_per_request:
+            result["failures"].append(
+                f"memory grows {rss_slope - expected:.1f} bytes per request beyond the data stored, "
+                f"above {max_bytes_per_request:.1f}"
+            )
+
+    timed = [(s["elapsed_seconds"], s["p99_ms"]) for s in steady if s["p99_ms"] is not None]
+    if len(timed) >= MIN_FIT_SAMPLES:
+        slope, intercept = linear_fit(*zip(*timed))
+        first, last = intercept + slope * timed[0][0], intercept + slope * timed[-1][0]
+        drift = (last - first) / first if first > 0 else 0.0
+        result["p99_start_ms"] = round(first, 2)
+        result["p99_end_ms"] = round(last, 2)
+        result["p99_drift"] = round(drift, 4)
+        if drift > max_p99_drift:
+            result["failures"].append(f"p99 drifted {drift:.1%} over the run, above {max_p99_drift:.0%}")
+
+    result["verdict"] = "fail" if result["failures"] else "pass"
+    return result
+
+
+def _print_analysis(analysis: Dict[str, Any]) -> None:
+    print(f"verdict: {analysis['verdict']} ({analysis['samples']} samples after warmup)")
+    for key in (
+        "rss_bytes_per_request",
+        "database_bytes_per_request",
+        "leaked_bytes_per_request",
+        "p99_start_ms",
+        "p99_end_ms",
+        "p99_drift",
+    ):
+        if key in analysis:
+            print(f"  {key:<28} {analysis[key]}")
+    growing = {name: slope for name, slope in analysis.get("store_bytes_per_request", {}).items() if slope > 0}
+    if growing:
+        print("  growing stores (bytes per request):")
+        for name, slope in growing.items():
+            print(f"    {name:<26} {slope}")
+    for failure in analysis["failures"]:
+        print(f"  FAIL: {failure}")
+
+
+def main() -> None:
+    """Run the soak test and exit non-zero on memory growth, latency drift or unexpected statuses."""
+    parser = argparse.ArgumentParser(description="Soak test for memory growth and latency drift")
+    parser.add_argument("--duration", type=parse_duration, default=parse_duration("1h"), help="e.g. 90, 30m, 4h")
+    parser.add_argument("--interval", type=parse_duration, default=DEFAULT_INTERVAL, help="Between samples")
+    parser.add_argument("--warmup", type=parse_duration, help="Samples ignored by the fits; 10%% of the run by default")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--rate", type=float, default=0.0, help="Workflows per second; 0 for closed loop")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="Workflow weights, name=weight,...")
+    parser.add_argument("--customers", type=int, default=50)
+    parser.add_argument("--admins", type=int, default=3)
+    parser.add_argument("--orders", type=int, default=0, help="Synthetic order history to preload")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--max-bytes-per-request", type=float, default=DEFAULT_MAX_BYTES_PER_REQUEST)
+    parser.add_argument("--max-p99-drift", type=float, default=DEFAULT_MAX_P99_DRIFT)
+    parser.add_argument("--show-logs", action="store_true", help="Print application logs instead of discarding them")
+    parser.add_argument("--json", dest="json_path", help="Also write the samples and analysis here")
+    args = parser.parse_args()
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    from bakerySpotGourmet.main import app
+
+    recorder = SoakRecorder()
+    sampler = SoakSampler(recorder, args.interval)
+    summary = asyncio.run(run_load(
+        app,
+        parse_mix(args.mix),
+        duration=args.duration,
+        concurrency=args.concurrency,
+        rate=args.rate,
+        customers=args.customers,
+        admins=args.admins,
+        orders=args.orders,
+        seed=args.seed,
+        show_logs=args.show_logs,
+        recorder=recorder,
+        monitor=sampler.run,
+    ))
+    sampler.sample()
+    warmup = args.warmup if args.warmup is not None else args.duration * 0.1
+    analysis = analyze(sampler.samples, warmup, args.max_bytes_per_request, args.max_p99_drift)
+    for route, codes in summary["unexpected_statuses"].items():
+        returned = ", ".join(f"{count}x {code}" for code, count in codes.items())
+        analysis["failures"].append(f"{route} returned {returned}")
+        analysis["verdict"] = "fail"
+    print(json.dumps(summary, indent=2))
+    _print_analysis(analysis)
+    if args.json_path:
+        with open(args.json_path, "w") as output:
+            json.dump({"summary": summary, "analysis": analysis, "samples": sampler.samples}, output, indent=2)
+    if analysis["verdict"] != "pass":
+        sys.exit(1 if analysis["verdict"] == "fail" else 2)
+
+
+if __name__ == "__main__":
+    main()
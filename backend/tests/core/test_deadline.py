@@ -0,0 +1,212 @@
+"""
+Tests for request deadline propagation.
+"""
+import asyncio
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from bakerySpotGourmet.core.constants import REQUEST_TIMEOUT_HEADER
+from bakerySpotGourmet.core.deadline import (
+    check_deadline,
+    deadline_scope,
+    get_deadline,
+    resolve_deadline,
+    time_remaining,
+)
+from bakerySpotGourmet.core.exceptions import DeadlineExceededException
+from bakerySpotGourmet.core.metrics import get_metrics_registry
+from bakerySpotGourmet.core.middleware import RequestDeadlineMiddleware, RequestTimeoutMiddleware
+from bakerySpotGourmet.domain.payments.payment import Payment
+from bakerySpotGourmet.infrastructure.payments.circuit_breaker import CircuitBreaker
+from bakerySpotGourmet.infrastructure.payments.exceptions import PaymentGatewayException
+from bakerySpotGourmet.infrastructure.payments.retry_policy import RetryPolicy
+from bakerySpotGourmet.repositories.payment_repository import PaymentRepository
+
+
+def _deadline_app(timeout_seconds: float) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(RequestDeadlineMiddleware, timeout_seconds=timeout_seconds)
+
+    @app.get("/remaining")
+    async def remaining():
+        return {"remaining": time_remaining()}
+
+    return app
+
+
+def test_no_deadline_outside_requests():
+    """Without a deadline every check passes."""
+    assert get_deadline() is None
+    assert time_remaining() is None
+    check_deadline("noop")
+
+
+def test_deadline_scope_nests_to_earliest():
+    """Nested scopes can shorten but never extend the deadline."""
+    with deadline_scope(10) as outer:
+        with deadline_scope(60) as inner:
+            assert inner == outer
+        with deadline_scope(1) as shorter:
+            assert shorter < outer
+        assert get_deadline() == outer
+    assert get_deadline() is None
+
+
+def test_resolve_deadline_prefers_earliest():
+    """Explicit and request deadlines combine to the earlier one."""
+    with deadline_scope(5) as request_deadline:
+        assert resolve_deadline(None) == request_deadline
+        assert resolve_deadline(request_deadline + 10) == request_deadline
+        assert resolve_deadline(request_deadline - 1) == request_deadline - 1
+
+
+def test_check_deadline_raises_after_expiry():
+    """Expired deadlines raise a TimeoutError subclass."""
+    with deadline_scope(0):
+        with pytest.raises(DeadlineExceededException) as exc_info:
+            check_deadline("work")
+    assert isinstance(exc_info.value, TimeoutError)
+
+
+def test_middleware_sets_deadline_from_config():
+    """The configured budget bounds the request."""
+    client = TestClient(_deadline_app(timeout_seconds=5))
+    remaining = client.get("/remaining").json()["remaining"]
+    assert 4 < remaining <= 5
+
+
+def test_middleware_honors_shorter_client_header():
+    """A client asking for less time shortens the deadline, never extends it."""
+    client = TestClient(_deadline_app(timeout_seconds=5))
+
+    shorter = client.get("/remaining", headers={REQUEST_TIMEOUT_HEADER: "0.5"}).json()["remaining"]
+    longer = client.get("/remaining", headers={REQUEST_TIMEOUT_HEADER: "60"}).json()["remaining"]
+    invalid = client.get("/remaining", headers={REQUEST_TIMEOUT_HEADER: "soon"}).json()["remaining"]
+
+    assert 0 < shorter <= 0.5
+    assert 4 < longer <= 5
+    assert 4 < invalid <= 5
+
+
+def test_middleware_disabled_without_budget():
+    """A zero budget and no header means no deadline."""
+    client = TestClient(_deadline_app(timeout_seconds=0))
+    assert client.get("/remaining").json()["remaining"] is None
+
+
+def test_retry_policy_stops_when_retry_would_cross_deadline():
+    """Retries that cannot finish within the request deadline are skipped."""
+    policy = RetryPolicy(max_retries=5, base_delay=0.2, retryable_exceptions=(PaymentGatewayException,))
+    calls = 0
+
+    def flaky():
+        nonlocal calls
+        calls += 1
+        raise PaymentGatewayException("down")
+
+    started = time.monotonic()
+    with deadline_scope(0.1):
+        with pytest.raises(PaymentGatewayException):
+            policy.execute(flaky)
+
+    assert calls == 1
+    assert time.monotonic() - started < 0.1
+
+
+def test_async_retry_policy_uses_request_deadline():
+    """execute_async picks up the request deadline without an explicit argument."""
+    policy = RetryPolicy(max_retries=3, base_delay=0.01)
+
+    async def slow():
+        await asyncio.sleep(1)
+
+    async def scenario():
+        with deadline_scope(0.05):
+            await policy.execute_async(slow)
+
+    started = time.monotonic()
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(scenario())
+    assert time.monotonic() - started < 0.5
+
+
+def test_circuit_breaker_ignores_expired_deadlines():
+    """Calls rejected for lack of time are not counted as dependency failures."""
+    breaker = CircuitBreaker(failure_threshold=1)
+
+    with deadline_scope(0):
+        with pytest.raises(DeadlineExceededException):
+            breaker.call(lambda: "never")
+
+    assert breaker.get_stats()["failure_count"] == 0
+    assert breaker.call(lambda: "ok") == "ok"
+
+
+def test_repository_calls_fail_fast_after_deadline():
+    """Repositories refuse new work once the request ran out of time."""
+    repository = PaymentRepository()
+    repository.save(Payment(order_id=1, amount=5.0, payment_method="card"))
+
+    with deadline_scope(0):
+        with pytest.raises(DeadlineExceededException):
+            repository.get_by_order_id(1)
+
+
+def _timeout_app(timeout_seconds: float, route_timeouts=None) -> tuple[FastAPI, dict]:
+    state = {"cancelled": 0}
+    app = FastAPI()
+    app.add_middleware(RequestTimeoutMiddleware)
+    app.add_middleware(
+        RequestDeadlineMiddleware,
+        timeout_seconds=timeout_seconds,
+        route_timeouts=route_timeouts or {},
+    )
+
+    @app.get("/sleep/{seconds}")
+    async def sleep(seconds: float):
+        try:
+            await asyncio.sleep(seconds)
+        except asyncio.CancelledError:
+            state["cancelled"] += 1
+            raise
+        return {"slept": seconds}
+
+    return app, state
+
+
+def test_timeout_middleware_cancels_slow_route():
+    """A route outliving the deadline is cancelled and answered with 504."""
+    app, state = _timeout_app(timeout_seconds=0.05)
+    timeouts = get_metrics_registry().get("http_request_timeouts_total")
+    before = timeouts.value(("/sleep/{seconds}",))
+
+    started = time.monotonic()
+    response = TestClient(app).get("/sleep/2")
+
+    assert response.status_code == 504
+    assert time.monotonic() - started < 1
+    assert state["cancelled"] == 1
+    assert timeouts.value(("/sleep/{seconds}",)) == before + 1
+
+
+def test_timeout_middleware_passes_fast_routes():
+    """Routes finishing in time are untouched."""
+    app, state = _timeout_app(timeout_seconds=1)
+
+    response = TestClient(app).get("/sleep/0")
+
+    assert response.status_code == 200
+    assert response.json() == {"slept": 0}
+    assert state["cancelled"] == 0
+
+
+def test_route_timeouts_override_default():
+    """The longest matching path prefix sets the route budget."""
+    app, _ = _timeout_app(timeout_seconds=0.05, route_timeouts={"/sleep": 1, "/sleep/0.3": 0.01})
+    client = TestClient(app)
+
+    assert client.get("/sleep/0.2").status_code == 200
+    assert client.get("/sleep/0.3").status_code == 504
@@ -0,0 +1,95 @@
+"""
+Tests for adaptive log sampling.
+"""
+import random
+from types import SimpleNamespace
+
+import pytest
+import structlog
+
+from bakerySpotGourmet.core import log_sampling
+from bakerySpotGourmet.core.log_sampling import LogSampler
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Frozen monotonic clock for the sampler module."""
+    fake = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(log_sampling, "time", SimpleNamespace(monotonic=lambda: fake.now))
+    return fake
+
+
+def _sampler(**kwargs) -> LogSampler:
+    options = dict(
+        events=["request_completed"],
+        per_second=10,
+        priority_per_second=100,
+        slow_seconds=1.0,
+        rng=random.Random(7),
+    )
+    options.update(kwargs)
+    return LogSampler(**options)
+
+
+def _emit(
+    sampler: LogSampler, count: int, method: str = "info", route: str = "/api/v1/items/", **fields
+) -> list:
+    kept = []
+    for _ in range(count):
+        event = {"event": "request_completed", "route": route, **fields}
+        try:
+            kept.append(sampler(None, method, event))
+        except structlog.DropEvent:
+            pass
+    return kept
+
+
+def test_low_volume_keeps_every_line(clock):
+    """Below the per-second target every line is kept with sample_rate 1."""
+    kept = _emit(_sampler(), 10)
+
+    assert len(kept) == 10
+    assert all(line["sample_rate"] == 1.0 for line in kept)
+
+
+def test_high_volume_is_sampled_with_unbiased_rates(clock):
+    """Busy keys are thinned and 1/sample_rate sums back to the real count."""
+    sampler = _sampler()
+    kept = _emit(sampler, 1000)
+    clock.now += 1
+    kept_next = _emit(sampler, 1000)
+
+    assert len(kept_next) < 50
+    assert all(line["sample_rate"] == pytest.approx(0.01) for line in kept_next)
+    estimate = sum(1 / line["sample_rate"] for line in kept + kept_next)
+    assert estimate == pytest.approx(2000, rel=0.3)
+    assert sampler.dropped == 2000 - len(kept) - len(kept_next)
+
+
+def test_errors_and_slow_requests_use_priority_target(clock):
+    """Errors and slow requests are kept up to the much higher priority cap."""
+    sampler = _sampler()
+
+    assert len(_emit(sampler, 100, route="/a", status_code=503)) == 100
+    assert len(_emit(sampler, 100, route="/b", duration_seconds=2.5)) == 100
+    assert len(_emit(sampler, 100, route="/c", method="error")) == 100
+    assert len(_emit(sampler, 100, route="/d")) < 100
+
+
+def test_routes_are_sampled_independently(clock):
+    """A busy route does not reduce the rate of a quiet one."""
+    sampler = _sampler()
+    _emit(sampler, 1000)
+
+    quiet = _emit(sampler, 5, route="/health")
+
+    assert all(line["sample_rate"] == 1.0 for line in quiet)
+
+
+def test_other_events_pass_through_untouched(clock):
+    """Events outside the sampled set are neither sampled nor annotated."""
+    sampler = _sampler(per_second=1)
+    lines = [sampler(None, "info", {"event": "order_status_updated"}) for _ in range(50)]
+
+    assert len(lines) == 50
+    assert all("sample_rate" not in line for line in lines)
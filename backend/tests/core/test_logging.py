@@ -0,0 +1,106 @@
+"""
+Tests for logging setup and the background log writer.
+"""
+import json
+import logging
+import queue
+
+import pytest
+import structlog
+
+from bakerySpotGourmet.core import logging as app_logging
+from bakerySpotGourmet.core.config import settings
+from bakerySpotGourmet.core.logging import (
+    LogOverflowPolicy,
+    _BoundedQueueHandler,
+    get_logging_stats,
+    setup_logging,
+    shutdown_logging,
+)
+
+
+@pytest.fixture
+def queue_logging(monkeypatch):
+    """Enable queue mode with JSON output for one test."""
+    monkeypatch.setattr(settings, "DEBUG", False)
+    monkeypatch.setattr(settings, "LOG_LEVEL", "INFO")
+    monkeypatch.setattr(settings, "LOG_QUEUE_ENABLED", True)
+    yield
+    shutdown_logging()
+    structlog.reset_defaults()
+
+
+def _record(message: str) -> logging.LogRecord:
+    return logging.LogRecord("test", logging.INFO, __file__, 1, message, None, None)
+
+
+def test_queue_mode_writes_json_on_shutdown_flush(queue_logging, capsys):
+    """Queued events are rendered by the writer and flushed on shutdown."""
+    setup_logging()
+    logger = structlog.get_logger("queue-test")
+    for i in range(50):
+        logger.info("order_created", order_id=i)
+
+    shutdown_logging()
+
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    events = [line for line in lines if line.get("event") == "order_created"]
+    assert [e["order_id"] for e in events] == list(range(50))
+    assert events[0]["level"] == "info"
+    assert "timestamp" in events[0]
+    assert get_logging_stats()["mode"] == "sync"
+
+
+def test_queue_mode_renders_foreign_records(queue_logging, capsys):
+    """Plain stdlib records go through the same writer and renderer."""
+    setup_logging()
+    logging.getLogger("thirdparty").warning("pool %s exhausted", "db")
+
+    shutdown_logging()
+
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert {"event": "pool db exhausted", "level": "warning"}.items() <= lines[-1].items()
+
+
+def test_drop_newest_counts_dropped_records():
+    """A full queue drops the incoming record and counts it."""
+    handler = _BoundedQueueHandler(queue.Queue(maxsize=2), LogOverflowPolicy.DROP_NEWEST)
+    for message in ("a", "b", "c"):
+        handler.handle(_record(message))
+
+    assert [handler.queue.get_nowait().msg for _ in range(2)] == ["a", "b"]
+    assert handler.dropped == 1
+
+
+def test_drop_oldest_keeps_newest_records():
+    """DROP_OLDEST evicts the oldest queued record for the new one."""
+    handler = _BoundedQueueHandler(queue.Queue(maxsize=2), LogOverflowPolicy.DROP_OLDEST)
+    for message in ("a", "b", "c"):
+        handler.handle(_record(message))
+
+    assert [handler.queue.get_nowait().msg for _ in range(2)] == ["b", "c"]
+    assert handler.dropped == 1
+
+
+def test_stats_report_queue_mode(queue_logging, monkeypatch):
+    """Stats expose the queue capacity and drop counter in queue mode."""
+    monkeypatch.setattr(settings, "LOG_QUEUE_SIZE", 123)
+    setup_logging()
+
+    stats = get_logging_stats()
+
+    assert stats["mode"] == "queue"
+    assert stats["capacity"] == 123
+    assert stats["dropped"] == 0
+
+
+@pytest.mark.skipif(app_logging.orjson is None, reason="orjson not installed")
+def test_orjson_serializer_output_matches_json(monkeypatch):
+    """The orjson serializer produces text JSON, falling back for unknown types."""
+    monkeypatch.setattr(settings, "LOG_JSON_SERIALIZER", "orjson")
+    dumps = app_logging._json_serializer()
+
+    rendered = dumps({"event": "x", "value": object()}, default=repr)
+
+    assert isinstance(rendered, str)
+    assert json.loads(rendered)["event"] == "x"
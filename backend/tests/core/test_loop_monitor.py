@@ -0,0 +1,98 @@
+"""
+Tests for the event loop lag monitor.
+"""
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+
+from bakerySpotGourmet.api.v1 import dependencies as deps
+from bakerySpotGourmet.core.loop_monitor import EventLoopMonitor
+from bakerySpotGourmet.core.metrics import MetricsRegistry
+from bakerySpotGourmet.domain.users.entities import RoleName
+from bakerySpotGourmet.main import app
+
+
+def _blocking_handler() -> None:
+    time.sleep(0.3)
+
+
+def test_blocking_call_is_counted_and_its_stack_captured():
+    """A callback blocking the loop shows in lag metrics and the logged stack."""
+    registry = MetricsRegistry()
+    monitor = EventLoopMonitor(interval=0.01, block_threshold=0.1, registry=registry)
+
+    async def run() -> None:
+        await monitor.start()
+        await asyncio.sleep(0.05)
+        _blocking_handler()
+        await asyncio.sleep(0.05)
+        await monitor.stop()
+
+    asyncio.run(run())
+
+    stats = monitor.get_stats()
+    assert not stats["running"]
+    assert stats["blocked"] == 1
+    assert stats["max_lag_seconds"] >= 0.25
+    assert stats["stacks_captured"] == 1
+    assert any("_blocking_handler" in frame for frame in stats["last_blocked"]["loop_stack"])
+    assert registry.get("event_loop_blocked_total").value() == 1
+    assert registry.get("event_loop_lag_seconds").count() == stats["ticks"]
+
+
+def test_idle_loop_reports_no_blocking():
+    """Heartbeats on an idle loop stay under the threshold."""
+    monitor = EventLoopMonitor(interval=0.01, block_threshold=0.1, registry=MetricsRegistry())
+
+    async def run() -> None:
+        await monitor.start()
+        await asyncio.sleep(0.1)
+        await monitor.stop()
+
+    asyncio.run(run())
+
+    assert monitor.ticks > 0
+    assert monitor.blocked == 0
+    assert monitor.last_blocked is None
+
+
+def test_check_logs_each_blocking_episode_once():
+    """Repeated watchdog checks during one stall capture a single stack."""
+    monitor = EventLoopMonitor(interval=0.01, block_threshold=0.05, registry=MetricsRegistry())
+    monitor._loop_thread_id = threading.get_ident()
+    monitor._last_tick = time.monotonic() - 1.0
+
+    assert monitor.check()
+    assert not monitor.check()
+    assert monitor.stacks_captured == 1
+
+
+def test_blocking_before_first_heartbeat_is_captured():
+    """A stall right after start, before any heartbeat ran, is still reported."""
+    monitor = EventLoopMonitor(interval=0.01, block_threshold=0.1, registry=MetricsRegistry())
+
+    async def run() -> None:
+        await monitor.start()
+        _blocking_handler()
+        await asyncio.sleep(0.05)
+        await monitor.stop()
+
+    asyncio.run(run())
+
+    assert monitor.stacks_captured == 1
+    assert any("_blocking_handler" in frame for frame in monitor.last_blocked["loop_stack"])
+
+
+def test_admin_event_loop_endpoint():
+    """Admins can read the monitor statistics."""
+    app.dependency_overrides[deps.get_current_user] = lambda: SimpleNamespace(id=1, role=RoleName.ADMIN)
+    try:
+        response = TestClient(app).get("/api/v1/admin/event-loop")
+    finally:
+        app.dependency_overrides = {}
+
+    assert response.status_code == 200
+    assert "max_lag_seconds" in response.json()
@@ -0,0 +1,159 @@
+"""
+Tests for memory introspection of in-process stores.
+"""
+import sys
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+
+from bakerySpotGourmet.api.v1 import dependencies as deps
+from bakerySpotGourmet.core.memory import (
+    MemoryRegistry,
+    TracemallocSnapshots,
+    deep_sizeof,
+    get_memory_registry,
+)
+from bakerySpotGourmet.domain.users.entities import RoleName
+from bakerySpotGourmet.main import app
+
+
+def test_deep_sizeof_counts_referenced_objects():
+    """Nested containers and object attributes are included in the size."""
+    payload = "x" * 10_000
+    holder = SimpleNamespace(entries={"a": [payload]})
+
+    size, sampled = deep_sizeof(holder)
+
+    assert size >= sys.getsizeof(payload)
+    assert not sampled
+
+
+def test_deep_sizeof_extrapolates_large_containers():
+    """Containers above the sample size are scaled from a sample."""
+    store = {f"key-{i:06d}": {"response": i} for i in range(20_000)}
+
+    exact, _ = deep_sizeof(store, sample=len(store))
+    approx, sampled = deep_sizeof(store, sample=500)
+
+    assert sampled
+    assert abs(approx - exact) / exact < 0.1
+
+
+class _ChangingDict(dict):
+    """Dict whose first `failures` iterations fail as if another thread resized it."""
+
+    def __init__(self, *args, failures: int, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.failures = failures
+
+    def items(self):
+        return _ChangingItems(self)
+
+
+class _ChangingItems:
+    def __init__(self, owner: _ChangingDict):
+        self.owner = owner
+
+    def __iter__(self):
+        if self.owner.failures:
+            self.owner.failures -= 1
+            raise RuntimeError("dictionary changed size during iteration")
+        return iter(dict.items(self.owner))
+
+
+def test_deep_sizeof_retries_containers_changed_while_copied():
+    """A store mutated during one copy is sized from the next attempt."""
+    payload = "x" * 10_000
+    store = _ChangingDict({"a": payload}, failures=1)
+
+    size, sampled = deep_sizeof(store)
+
+    assert size >= sys.getsizeof(payload)
+    assert not sampled
+
+
+def test_registry_reports_store_that_keeps_changing_as_sampled():
+    """A store that cannot be copied is reported without its entries, not raised."""
+    registry = MemoryRegistry()
+    registry.register("busy", _ChangingDict({"a": "x" * 10_000}, failures=10**6))
+
+    report = registry.report()
+
+    assert report[0]["sampled"]
+    assert report[0]["entries"] == 1
+    assert report[0]["approx_bytes"] < 10_000
+
+
+def test_registry_reports_largest_store_first():
+    """Stores are reported with their entry counts, largest first."""
+    registry = MemoryRegistry()
+    registry.register("small", [1])
+    registry.register("large", {"k": "v" * 1000}, count=lambda: 42)
+
+    report = registry.report()
+
+    assert [row["name"] for row in report] == ["large", "small"]
+    assert report[0]["entries"] == 42
+    assert report[1]["entries"] == 1
+
+
+def test_global_stores_are_registered():
+    """Singleton stores register themselves on import."""
+    names = get_memory_registry().names()
+
+    assert {"rate_limiter", "idempotency_store", "slow_request_log", "profile_store"} <= set(names)
+
+
+def test_snapshot_diff_shows_growing_allocation():
+    """A diff between two snapshots points at the allocation that grew."""
+    snapshots = TracemallocSnapshots(max_snapshots=2)
+    leak = []
+    try:
+        first = snapshots.take()
+        leak.extend(bytearray(1024) for _ in range(1000))
+        second = snapshots.take()
+
+        diff = snapshots.diff(first["id"], second["id"], limit=5)
+    finally:
+        snapshots.stop()
+
+    assert diff[0]["size_diff_bytes"] >= 1000 * 1024
+    assert __file__ in diff[0]["location"][0]
+    assert not snapshots.tracing
+    assert snapshots.list() == []
+
+
+def test_snapshots_keep_the_newest():
+    """Snapshots beyond the limit drop the oldest."""
+    snapshots = TracemallocSnapshots(max_snapshots=2)
+    try:
+        ids = [snapshots.take()["id"] for _ in range(3)]
+        kept = [snapshot["id"] for snapshot in snapshots.list()]
+    finally:
+        snapshots.stop()
+
+    assert kept == ids[1:]
+
+
+def test_admin_memory_endpoints():
+    """Admins can read the store report and take and diff snapshots."""
+    app.dependency_overrides[deps.get_current_user] = lambda: SimpleNamespace(id=1, role=RoleName.ADMIN)
+    client = TestClient(app)
+    try:
+        report = client.get("/api/v1/admin/memory")
+        first = client.post("/api/v1/admin/memory/snapshots").json()
+        second = client.post("/api/v1/admin/memory/snapshots").json()
+        top = client.get(f"/api/v1/admin/memory/snapshots/{second['id']}/top", params={"limit": 3})
+        diff = client.get("/api/v1/admin/memory/diff", params={"first": first["id"], "second": second["id"]})
+        missing = client.get("/api/v1/admin/memory/diff", params={"first": first["id"], "second": 10**6})
+        stopped = client.delete("/api/v1/admin/memory/snapshots")
+    finally:
+        client.delete("/api/v1/admin/memory/snapshots")
+        app.dependency_overrides = {}
+
+    assert report.status_code == 200
+    assert "idempotency_store" in {store["name"] for store in report.json()["stores"]}
+    assert top.status_code == 200 and len(top.json()) <= 3
+    assert diff.status_code == 200
+    assert missing.status_code == 404
+    assert stopped.status_code == 204
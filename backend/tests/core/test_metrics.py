@@ -0,0 +1,166 @@
+"""
+Tests for the metrics registry and the /metrics endpoint.
+"""
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+from bakerySpotGourmet.core.constants import METRICS_UNMATCHED_ROUTE
+from bakerySpotGourmet.core.metrics import Histogram, MetricsRegistry, get_metrics_registry
+from bakerySpotGourmet.core.middleware import RequestTimingMiddleware
+from bakerySpotGourmet.main import app
+from bakerySpotGourmet.services.metrics_service import register_default_collectors
+
+
+def test_counter_renders_per_label_set():
+    """Counters keep one series per label set and render with HELP/TYPE lines."""
+    registry = MetricsRegistry()
+    counter = registry.counter("jobs_total", "Jobs run.", ("kind",))
+    counter.inc(("bake",))
+    counter.inc(("bake",), 2)
+    counter.inc(("ship",))
+
+    text = registry.render()
+
+    assert "# TYPE jobs_total counter" in text
+    assert 'jobs_total{kind="bake"} 3' in text
+    assert 'jobs_total{kind="ship"} 1' in text
+    with pytest.raises(ValueError):
+        counter.inc(("bake",), -1)
+
+
+def test_counter_callback_read_at_scrape_time():
+    """Callback counters export a cumulative count kept by a component."""
+    registry = MetricsRegistry()
+    rejected = {"count": 2}
+    registry.counter("rejected_total", "Rejections.").set_function(
+        lambda: {(): float(rejected["count"])}
+    )
+
+    rejected["count"] = 5
+
+    assert "# TYPE rejected_total counter" in registry.render()
+    assert "rejected_total 5" in registry.render()
+
+
+def test_repository_sizes_follow_served_repositories():
+    """Repository sizes are read from the repositories the app serves."""
+    class Repository:
+        def __init__(self, size):
+            self.size = size
+
+        def count(self):
+            return self.size
+
+    served = {"orders": Repository(3)}
+    registry = register_default_collectors(MetricsRegistry(), repositories=lambda: served)
+
+    assert 'repository_entities{repository="orders"} 3' in registry.render()
+    served["orders"] = Repository(7)
+    assert 'repository_entities{repository="orders"} 7' in registry.render()
+
+
+def test_label_count_is_validated():
+    """Recording with the wrong number of label values is rejected."""
+    registry = MetricsRegistry()
+    counter = registry.counter("jobs_total", "Jobs run.", ("kind",))
+
+    with pytest.raises(ValueError):
+        counter.inc(("bake", "extra"))
+
+
+def test_registry_returns_existing_metric_and_rejects_kind_clash():
+    """Declaring a metric twice returns the same instance; a different kind fails."""
+    registry = MetricsRegistry()
+    first = registry.gauge("queue_depth", "Queued items.")
+
+    assert registry.gauge("queue_depth", "Queued items.") is first
+    with pytest.raises(ValueError):
+        registry.counter("queue_depth", "Queued items.")
+
+
+def test_gauge_callback_is_read_at_scrape_time():
+    """Callback gauges report the current value on every render."""
+    registry = MetricsRegistry()
+    depth = {"value": 1}
+    registry.gauge("queue_depth", "Queued items.").set_function(lambda: {(): depth["value"]})
+
+    assert "queue_depth 1" in registry.render()
+    depth["value"] = 7
+    assert "queue_depth 7" in registry.render()
+
+
+def test_histogram_buckets_are_cumulative():
+    """Bucket lines are cumulative and end with +Inf, followed by sum and count."""
+    histogram = Histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 5.0):
+        histogram.observe(value)
+
+    lines = histogram.render()
+
+    assert 'latency_seconds_bucket{le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{le="1"} 3' in lines
+    assert 'latency_seconds_bucket{le="+Inf"} 4' in lines
+    assert "latency_seconds_sum 6.05" in lines
+    assert "latency_seconds_count 4" in lines
+
+
+def test_histogram_quantile_interpolates_within_bucket():
+    """Quantiles are interpolated linearly inside the bucket holding the rank."""
+    histogram = Histogram("latency_seconds", "Latency.", buckets=(1.0, 2.0))
+    for _ in range(10):
+        histogram.observe(1.5)
+
+    assert histogram.quantile(0.5) == pytest.approx(1.5)
+    assert histogram.quantile(1.0) == pytest.approx(2.0)
+    assert Histogram("empty", "Empty.").quantile(0.5) is None
+
+
+def test_timing_middleware_labels_by_route_template():
+    """Requests are counted by full route template and status class."""
+    router = APIRouter()
+
+    @router.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return {"id": item_id}
+
+    test_app = FastAPI()
+    test_app.include_router(router, prefix="/api/test-metrics")
+    test_app.add_middleware(RequestTimingMiddleware)
+    counter = get_metrics_registry().counter(
+        "http_requests_total", "", ("method", "route", "status_class")
+    )
+    route_labels = ("GET", "/api/test-metrics/items/{item_id}", "2xx")
+    unmatched_labels = ("GET", METRICS_UNMATCHED_ROUTE, "4xx")
+    before = counter.value(route_labels)
+    before_unmatched = counter.value(unmatched_labels)
+
+    with TestClient(test_app) as test_client:
+        assert test_client.get("/api/test-metrics/items/1").status_code == 200
+        assert test_client.get("/api/test-metrics/items/2").status_code == 200
+        assert test_client.get("/api/test-metrics/nothing/here").status_code == 404
+
+    assert counter.value(route_labels) == before + 2
+    assert counter.value(unmatched_labels) == before_unmatched + 1
+
+
+def test_metrics_endpoint_exposes_prometheus_text():
+    """The /metrics endpoint serves request metrics and component gauges."""
+    register_default_collectors()
+    client = TestClient(app)
+    client.get("/health")
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    assert 'http_requests_total{method="GET",route="/health",status_class="2xx"}' in body
+    assert "http_request_duration_seconds_bucket" in body
+    assert 'circuit_breaker_state{name="payment_gateway"} 0' in body
+    assert "rate_limiter_tracked_keys" in body
+    assert "idempotency_store_entries" in body
+    assert 'repository_entities{repository="payments"}' in body
+    assert "# TYPE bulkhead_rejected_total counter" in body
+    assert 'circuit_breaker_rejected_total{name="payment_gateway"}' in body
+    assert "# TYPE http_request_timeouts_total counter" in body
@@ -2,9 +2,12 @@
 Tests for middleware functionality.
 """
 import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
 from fastapi.testclient import TestClient
 from bakerySpotGourmet.main import app
 from bakerySpotGourmet.core.constants import REQUEST_ID_HEADER
+from bakerySpotGourmet.core.middleware import RequestIDMiddleware, RequestTimingMiddleware
 
 
 client = TestClient(app)
@@ -53,3 +56,43 @@ def test_multiple_requests_different_ids():
     id2 = response2.headers[REQUEST_ID_HEADER]
     
     assert id1 != id2
+
+
+def _middleware_app() -> FastAPI:
+    test_app = FastAPI()
+    test_app.add_middleware(RequestTimingMiddleware)
+    test_app.add_middleware(RequestIDMiddleware)
+    
+    @test_app.get("/state")
+    async def state(request: Request):
+        return {"request_id": request.state.request_id}
+    
+    @test_app.get("/stream")
+    async def stream():
+        async def chunks():
+            for i in range(3):
+                yield f"chunk-{i};".encode()
+        return StreamingResponse(chunks(), media_type="text/plain")
+    
+    return test_app
+
+
+def test_request_id_available_in_request_state():
+    """Test that the request ID is stored on request.state."""
+    test_client = TestClient(_middleware_app())
+    
+    response = test_client.get("/state", headers={REQUEST_ID_HEADER: "state-123"})
+    
+    assert response.json() == {"request_id": "state-123"}
+    assert response.headers[REQUEST_ID_HEADER] == "state-123"
+
+
+def test_streaming_response_passes_through():
+    """Test that streaming bodies are forwarded intact with the request ID header."""
+    test_client = TestClient(_middleware_app())
+    
+    response = test_client.get("/stream")
+    
+    assert response.status_code == 200
+    assert response.text == "chunk-0;chunk-1;chunk-2;"
+    assert REQUEST_ID_HEADER in response.headers
@@ -0,0 +1,191 @@
+"""
+Tests for on-demand request profiling and the continuous profiler.
+"""
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from bakerySpotGourmet.api.v1 import dependencies as deps
+from bakerySpotGourmet.core.constants import PROFILE_TOKEN_HEADER, REQUEST_ID_HEADER
+from bakerySpotGourmet.core.middleware import RequestIDMiddleware, RequestProfilingMiddleware
+from bakerySpotGourmet.core import profiling
+from bakerySpotGourmet.core.profiling import (
+    WAITING_FRAME,
+    ContinuousProfiler,
+    ProfileStore,
+    RequestProfile,
+    get_continuous_profiler,
+    get_profile_store,
+)
+from bakerySpotGourmet.domain.users.entities import RoleName
+from bakerySpotGourmet.main import app
+
+
+def _burn_cpu(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def _profiled_app(store: ProfileStore) -> FastAPI:
+    test_app = FastAPI()
+
+    @test_app.get("/slow")
+    async def slow_endpoint():
+        _burn_cpu(0.05)
+        await asyncio.sleep(0.05)
+        return {"ok": True}
+
+    test_app.add_middleware(RequestProfilingMiddleware, token="secret", interval=0.002, store=store)
+    test_app.add_middleware(RequestIDMiddleware)
+    return test_app
+
+
+def test_authorized_request_is_profiled_under_its_request_id():
+    """CPU and waiting time of the request end up in its stored profile."""
+    store = ProfileStore()
+    with TestClient(_profiled_app(store)) as client:
+        response = client.get("/slow", headers={PROFILE_TOKEN_HEADER: "secret"})
+
+    profile = store.get(response.headers[REQUEST_ID_HEADER])
+    assert profile is not None
+    assert profile.status_code == 200
+    assert profile.samples > 0
+    assert any("slow_endpoint;" in stack and "_burn_cpu" in stack for stack in profile.stacks)
+    assert any(stack.endswith(WAITING_FRAME) for stack in profile.stacks)
+    assert "_burn_cpu" in profile.collapsed()
+
+
+def test_requests_without_valid_token_are_not_profiled():
+    """Missing or wrong tokens run the request normally without a profile."""
+    store = ProfileStore()
+    with TestClient(_profiled_app(store)) as client:
+        assert client.get("/slow").status_code == 200
+        assert client.get("/slow", headers={PROFILE_TOKEN_HEADER: "wrong"}).status_code == 200
+
+    assert store.list() == []
+
+
+def test_profile_store_evicts_oldest():
+    """The store keeps only the most recent profiles, newest first."""
+    store = ProfileStore(max_profiles=2)
+    for request_id in ("a", "b", "c"):
+        store.add(RequestProfile(request_id=request_id, method="GET", path="/", started_at=0.0))
+
+    assert store.get("a") is None
+    assert [p.request_id for p in store.list()] == ["c", "b"]
+
+
+def test_admin_profile_endpoints():
+    """Admins can list profiles and download collapsed stacks."""
+    profile = RequestProfile(
+        request_id="profile-endpoint-test",
+        method="GET",
+        path="/slow",
+        started_at=0.0,
+        status_code=200,
+        samples=3,
+        stacks={"main:handler;main:work": 2, "main:handler;[waiting]": 1},
+    )
+    get_profile_store().add(profile)
+    app.dependency_overrides[deps.get_current_user] = lambda: SimpleNamespace(id=1, role=RoleName.ADMIN)
+    try:
+        client = TestClient(app)
+        listed = client.get("/api/v1/admin/profiles")
+        detail = client.get("/api/v1/admin/profiles/profile-endpoint-test")
+        collapsed = client.get("/api/v1/admin/profiles/profile-endpoint-test/collapsed")
+        missing = client.get("/api/v1/admin/profiles/unknown")
+    finally:
+        app.dependency_overrides = {}
+
+    assert listed.status_code == 200
+    assert listed.json()[0]["request_id"] == "profile-endpoint-test"
+    assert detail.json()["stacks"] == profile.stacks
+    assert collapsed.text.splitlines() == ["main:handler;main:work 2", "main:handler;[waiting] 1"]
+    assert missing.status_code == 404
+
+
+def _spin_until(stop: threading.Event) -> None:
+    while not stop.is_set():
+        pass
+
+
+def test_continuous_profiler_samples_busy_threads_and_skips_idle_ones():
+    """Busy threads show up rooted at their name; idle waits are only counted."""
+    stop = threading.Event()
+    busy = threading.Thread(target=_spin_until, args=(stop,), name="busy-worker")
+    idle = threading.Thread(target=stop.wait, name="idle-worker")
+    busy.start()
+    idle.start()
+    profiler = ContinuousProfiler()
+    try:
+        for _ in range(5):
+            profiler.sample()
+    finally:
+        stop.set()
+        busy.join()
+        idle.join()
+
+    stacks = profiler.stacks()
+    busy_stacks = [s for s in stacks if s.startswith("busy-worker;")]
+    assert busy_stacks and all("_spin_until" in s for s in busy_stacks)
+    assert not any(s.startswith("idle-worker;") for s in stacks)
+    assert profiler.idle_samples >= 5
+    assert profiler.samples == 5
+
+
+def test_continuous_profiler_keeps_rolling_windows(monkeypatch):
+    """Only the configured number of windows is kept and `seconds` narrows the view."""
+    now = SimpleNamespace(value=1000.0)
+    monkeypatch.setattr(
+        profiling, "time",
+        SimpleNamespace(monotonic=lambda: now.value, thread_time=time.thread_time),
+    )
+    stop = threading.Event()
+    busy = threading.Thread(target=_spin_until, args=(stop,))
+    busy.start()
+    profiler = ContinuousProfiler(window_seconds=10, windows=2)
+    try:
+        for _ in range(3):
+            profiler.sample()
+            now.value += 10
+    finally:
+        stop.set()
+        busy.join()
+
+    assert profiler.get_stats()["windows"] == 2
+    recent = sum(profiler.stacks(seconds=5).values())
+    assert 0 < recent < sum(profiler.stacks().values())
+
+
+def test_continuous_profiler_measures_its_overhead():
+    """The running profiler reports its CPU time as a fraction of wall time."""
+    profiler = ContinuousProfiler(interval=0.001)
+    profiler.start()
+    time.sleep(0.1)
+    profiler.stop()
+
+    stats = profiler.get_stats()
+    assert not stats["running"]
+    assert stats["samples"] > 0
+    assert 0 < stats["overhead_ratio"] < 1
+
+
+def test_admin_flamegraph_endpoint():
+    """Admins can download the continuous profiler's collapsed stacks."""
+    get_continuous_profiler().sample()
+    app.dependency_overrides[deps.get_current_user] = lambda: SimpleNamespace(id=1, role=RoleName.ADMIN)
+    try:
+        client = TestClient(app)
+        flamegraph = client.get("/api/v1/admin/profiler/flamegraph", params={"seconds": 600})
+        stats = client.get("/api/v1/admin/profiler")
+    finally:
+        app.dependency_overrides = {}
+
+    assert flamegraph.status_code == 200
+    assert flamegraph.headers["content-type"].startswith("text/plain")
+    assert stats.json()["samples"] >= 1
@@ -0,0 +1,78 @@
+"""
+Tests for pydantic-core JSON responses.
+"""
+import json
+from datetime import datetime, timezone
+from typing import List
+
+from fastapi import FastAPI
+from fastapi.datastructures import Default
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from bakerySpotGourmet.core.responses import PydanticJSONResponse, dump_json, model_list_adapter
+from bakerySpotGourmet.domain.orders.status import OrderStatus
+
+
+class _Item(BaseModel):
+    name: str
+    status: OrderStatus
+    created_at: datetime
+
+
+def _item(name: str = "croissant") -> _Item:
+    return _Item(name=name, status=OrderStatus.PENDING, created_at=datetime(2024, 6, 1, tzinfo=timezone.utc))
+
+
+def test_dump_json_matches_model_dump_json():
+    """Models serialize exactly as model_dump_json does."""
+    item = _item()
+
+    assert dump_json(item) == item.model_dump_json().encode()
+
+
+def test_model_lists_use_the_cached_adapter():
+    """Homogeneous model lists are dumped by one adapter per model."""
+    items = [_item("a"), _item("b")]
+
+    body = dump_json(items)
+
+    assert json.loads(body) == [json.loads(i.model_dump_json()) for i in items]
+    assert model_list_adapter(_Item) is model_list_adapter(_Item)
+
+
+def test_plain_content_is_serialized_like_jsonable_encoder():
+    """Datetimes, enums, nested models and non-finite floats in plain data."""
+    content = {"item": _item(), "status": OrderStatus.READY, "ratio": float("nan"), "mixed": [_item(), 1]}
+
+    decoded = json.loads(dump_json(content))
+
+    assert decoded["status"] == "ready"
+    assert decoded["ratio"] is None
+    assert decoded["item"]["created_at"] == "2024-06-01T00:00:00Z"
+    assert decoded["mixed"][1] == 1
+
+
+def test_default_response_class_keeps_response_models_working():
+    """As a Default() class, routes with and without response models both render."""
+    app = FastAPI(default_response_class=Default(PydanticJSONResponse))
+
+    @app.get("/items", response_model=List[_Item])
+    async def items() -> List[_Item]:
+        return [_item()]
+
+    @app.get("/stats")
+    async def stats() -> dict:
+        return {"status": OrderStatus.DELIVERED}
+
+    @app.get("/direct")
+    async def direct() -> PydanticJSONResponse:
+        return PydanticJSONResponse([_item()], status_code=201)
+
+    client = TestClient(app)
+
+    assert client.get("/items").json()[0]["status"] == "pending"
+    assert client.get("/stats").json() == {"status": "delivered"}
+    direct_response = client.get("/direct")
+    assert direct_response.status_code == 201
+    assert direct_response.headers["content-type"] == "application/json"
@@ -0,0 +1,152 @@
+"""
+Tests for request tracing spans and the slow request log.
+"""
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from bakerySpotGourmet.api.v1 import dependencies as deps
+from bakerySpotGourmet.core import tracing
+from bakerySpotGourmet.core.constants import REQUEST_ID_HEADER
+from bakerySpotGourmet.core.middleware import RequestIDMiddleware, SlowRequestTraceMiddleware
+from bakerySpotGourmet.core.tracing import (
+    SlowRequestLog,
+    end_trace,
+    get_slow_request_log,
+    start_trace,
+    traced,
+)
+from bakerySpotGourmet.domain.users.entities import RoleName
+from bakerySpotGourmet.main import app
+
+
+@traced
+def _persist() -> str:
+    time.sleep(0.02)
+    return "saved"
+
+
+@traced(name="auth")
+async def _authenticate() -> int:
+    await asyncio.sleep(0.01)
+    return 1
+
+
+@traced
+def _fail() -> None:
+    raise ValueError("boom")
+
+
+def _names(span: dict) -> list:
+    return [span["name"]] + [name for child in span["children"] for name in _names(child)]
+
+
+def test_spans_nest_under_the_active_trace():
+    """Sync and async traced calls form a tree with timings and errors."""
+    async def handler() -> None:
+        await _authenticate()
+        _persist()
+        with pytest.raises(ValueError):
+            _fail()
+
+    async def run() -> tracing.Trace:
+        trace, token = start_trace("trace-test", "POST", "/orders")
+        await handler()
+        end_trace(trace, token)
+        return trace
+
+    trace = asyncio.run(run())
+    spans = trace.to_dict()["spans"]
+
+    assert [child["name"] for child in spans["children"]] == ["auth", "_persist", "_fail"]
+    assert spans["children"][2]["error"] == "ValueError"
+    assert spans["children"][1]["duration_ms"] >= 20
+    assert trace.slowest_span().name == "_persist"
+
+
+def test_traced_is_a_no_op_outside_a_trace():
+    """Without an active trace the function just runs."""
+    assert _persist() == "saved"
+    assert asyncio.run(_authenticate()) == 1
+
+
+def test_spans_beyond_the_cap_are_counted_as_dropped(monkeypatch):
+    """A trace records at most TRACE_MAX_SPANS spans."""
+    monkeypatch.setattr(tracing, "TRACE_MAX_SPANS", 3)
+    trace, token = start_trace("cap-test", "GET", "/")
+    for _ in range(5):
+        _persist()
+    end_trace(trace, token)
+
+    assert len(trace.root.children) == 3
+    assert trace.dropped_spans == 2
+
+
+def test_slow_request_log_evicts_oldest():
+    """The log keeps only the most recent traces, newest first."""
+    log = SlowRequestLog(max_size=2)
+    for request_id in ("a", "b", "c"):
+        trace, token = start_trace(request_id, "GET", "/")
+        end_trace(trace, token)
+        log.add(trace)
+
+    assert log.get("a") is None
+    assert [trace.request_id for trace in log.list()] == ["c", "b"]
+    assert log.captured == 3
+
+
+def _traced_app(log: SlowRequestLog, threshold: float) -> FastAPI:
+    test_app = FastAPI()
+
+    @test_app.get("/orders/{order_id}")
+    async def get_order(order_id: int, user: int = Depends(_authenticate)):
+        return {"saved": _persist(), "user": user}
+
+    test_app.add_middleware(SlowRequestTraceMiddleware, threshold_seconds=threshold, log=log)
+    test_app.add_middleware(RequestIDMiddleware)
+    return test_app
+
+
+def test_middleware_keeps_only_slow_requests():
+    """Requests over the threshold are stored with dependency and call spans."""
+    slow_log = SlowRequestLog()
+    with TestClient(_traced_app(slow_log, threshold=0.0)) as client:
+        response = client.get("/orders/7")
+
+    trace = slow_log.get(response.headers[REQUEST_ID_HEADER])
+    assert trace is not None
+    assert trace.status_code == 200
+    assert trace.route == "/orders/{order_id}"
+    assert _names(trace.to_dict()["spans"]) == ["request", "auth", "_persist"]
+
+    fast_log = SlowRequestLog()
+    with TestClient(_traced_app(fast_log, threshold=60.0)) as client:
+        client.get("/orders/7")
+    assert fast_log.list() == []
+
+
+def test_admin_slow_request_endpoints():
+    """Admins can list slow requests and fetch one span tree."""
+    trace, token = start_trace("slow-endpoint-test", "POST", "/api/v1/orders/")
+    _persist()
+    end_trace(trace, token)
+    trace.status_code = 201
+    get_slow_request_log().add(trace)
+    app.dependency_overrides[deps.get_current_user] = lambda: SimpleNamespace(id=1, role=RoleName.ADMIN)
+    try:
+        client = TestClient(app)
+        listed = client.get("/api/v1/admin/slow-requests")
+        detail = client.get("/api/v1/admin/slow-requests/slow-endpoint-test")
+        missing = client.get("/api/v1/admin/slow-requests/unknown")
+    finally:
+        app.dependency_overrides = {}
+
+    assert listed.status_code == 200
+    assert listed.json()[0]["request_id"] == "slow-endpoint-test"
+    assert "spans" not in listed.json()[0]
+    assert _names(detail.json()["spans"]) == ["request", "_persist"]
+    assert missing.status_code == 404
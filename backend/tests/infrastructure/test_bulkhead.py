@@ -0,0 +1,144 @@
+"""
+Tests for the bulkhead concurrency limiter.
+"""
+import asyncio
+import threading
+
+import pytest
+
+from bakerySpotGourmet.infrastructure.payments.bulkhead import Bulkhead
+from bakerySpotGourmet.infrastructure.payments.exceptions import BulkheadFullException
+
+
+def test_bulkhead_limits_concurrent_async_calls():
+    """No more than max_concurrent_calls coroutines run at once."""
+    bulkhead = Bulkhead(max_concurrent_calls=3, max_queue_size=20, queue_timeout=5)
+    running = 0
+    peak = 0
+
+    async def work():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    async def scenario():
+        await asyncio.gather(*(bulkhead.call_async(work) for _ in range(15)))
+
+    asyncio.run(scenario())
+
+    stats = bulkhead.get_stats()
+    assert peak == 3
+    assert stats["accepted_count"] == 15
+    assert stats["active"] == 0
+    assert stats["queued"] == 0
+
+
+def test_bulkhead_rejects_when_queue_full():
+    """Callers beyond slots plus queue are rejected immediately."""
+    bulkhead = Bulkhead(max_concurrent_calls=1, max_queue_size=1, queue_timeout=5)
+    release = None
+
+    async def block():
+        await release.wait()
+
+    async def scenario():
+        nonlocal release
+        release = asyncio.Event()
+        active = asyncio.create_task(bulkhead.call_async(block))
+        queued = asyncio.create_task(bulkhead.call_async(block))
+        await asyncio.sleep(0)
+
+        assert bulkhead.get_stats()["active"] == 1
+        assert bulkhead.get_stats()["queued"] == 1
+        with pytest.raises(BulkheadFullException):
+            await bulkhead.call_async(block)
+
+        release.set()
+        await asyncio.gather(active, queued)
+
+    asyncio.run(scenario())
+
+    assert bulkhead.get_stats()["rejected_count"] == 1
+    assert bulkhead.get_stats()["accepted_count"] == 2
+
+
+def test_bulkhead_queue_timeout():
+    """A queued caller gives up after queue_timeout and leaves the queue."""
+    bulkhead = Bulkhead(max_concurrent_calls=1, max_queue_size=5, queue_timeout=0.02)
+
+    async def slow():
+        await asyncio.sleep(0.2)
+
+    async def scenario():
+        active = asyncio.create_task(bulkhead.call_async(slow))
+        await asyncio.sleep(0)
+        with pytest.raises(BulkheadFullException):
+            await bulkhead.call_async(slow)
+        assert bulkhead.get_stats()["queued"] == 0
+        await active
+
+    asyncio.run(scenario())
+
+    assert bulkhead.get_stats()["timed_out_count"] == 1
+    assert bulkhead.get_stats()["active"] == 0
+
+
+def test_bulkhead_releases_slot_on_error_and_cancellation():
+    """Failed and cancelled calls never leak slots."""
+    bulkhead = Bulkhead(max_concurrent_calls=1, max_queue_size=5, queue_timeout=1)
+
+    async def fail():
+        raise ValueError("boom")
+
+    async def scenario():
+        with pytest.raises(ValueError):
+            await bulkhead.call_async(fail)
+
+        blocker = asyncio.create_task(bulkhead.call_async(asyncio.sleep, 10))
+        waiter = asyncio.create_task(bulkhead.call_async(asyncio.sleep, 0))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        blocker.cancel()
+        await asyncio.gather(blocker, waiter, return_exceptions=True)
+
+    asyncio.run(scenario())
+
+    stats = bulkhead.get_stats()
+    assert stats["active"] == 0
+    assert stats["queued"] == 0
+
+
+def test_bulkhead_sync_calls_from_threads():
+    """Threads queue for slots and all complete when the queue is large enough."""
+    bulkhead = Bulkhead(max_concurrent_calls=2, max_queue_size=10, queue_timeout=5)
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+    gate = threading.Event()
+
+    def work():
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        gate.wait(0.05)
+        with lock:
+            running -= 1
+
+    threads = [threading.Thread(target=bulkhead.call, args=(work,)) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert peak == 2
+    assert bulkhead.get_stats()["accepted_count"] == 8
+    assert bulkhead.get_stats()["active"] == 0
+
+
+def test_invalid_configuration():
+    """Non-positive concurrency is rejected."""
+    with pytest.raises(ValueError):
+        Bulkhead(max_concurrent_calls=0)
@@ -163,3 +163,193 @@ def test_circuit_breaker_with_arguments():
     
     result = cb.call(add, a=5, b=7)
     assert result == 12
+
+
+def _fail():
+    raise ValueError("Test failure")
+
+
+def test_sliding_window_opens_on_failure_rate():
+    """Count-based window opens once the failure rate crosses the threshold."""
+    from bakerySpotGourmet.infrastructure.payments.circuit_breaker import SlidingWindowType
+    
+    cb = CircuitBreaker(
+        sliding_window_type=SlidingWindowType.COUNT_BASED,
+        sliding_window_size=10,
+        minimum_calls=10,
+        failure_rate_threshold=0.5,
+    )
+    
+    # Alternating outcomes: never 5 consecutive failures, but 50% failure rate
+    for i in range(9):
+        if i % 2:
+            with pytest.raises(ValueError):
+                cb.call(_fail)
+        else:
+            cb.call(lambda: "ok")
+    assert cb.state == CircuitState.CLOSED
+    
+    with pytest.raises(ValueError):
+        cb.call(_fail)
+    
+    assert cb.state == CircuitState.OPEN
+    assert cb.get_stats()["rejected_count"] == 0
+
+
+def test_sliding_window_respects_minimum_calls():
+    """Rates are not evaluated until the window has enough calls."""
+    from bakerySpotGourmet.infrastructure.payments.circuit_breaker import SlidingWindowType
+    
+    cb = CircuitBreaker(
+        sliding_window_type=SlidingWindowType.COUNT_BASED,
+        sliding_window_size=20,
+        minimum_calls=10,
+        failure_rate_threshold=0.5,
+    )
+    
+    for _ in range(9):
+        with pytest.raises(ValueError):
+            cb.call(_fail)
+    
+    assert cb.state == CircuitState.CLOSED
+
+
+def test_sliding_window_opens_on_slow_call_rate():
+    """Slow successful calls can open the circuit."""
+    import time
+    from bakerySpotGourmet.infrastructure.payments.circuit_breaker import SlidingWindowType
+    
+    cb = CircuitBreaker(
+        sliding_window_type=SlidingWindowType.COUNT_BASED,
+        sliding_window_size=4,
+        minimum_calls=4,
+        slow_call_rate_threshold=0.5,
+        slow_call_duration=0.01,
+    )
+    
+    cb.call(lambda: "fast")
+    cb.call(lambda: "fast")
+    cb.call(time.sleep, 0.02)
+    assert cb.state == CircuitState.CLOSED
+    cb.call(time.sleep, 0.02)
+    
+    assert cb.state == CircuitState.OPEN
+
+
+def test_time_based_window_forgets_old_calls():
+    """Time-based window only counts calls from the last N seconds."""
+    from bakerySpotGourmet.infrastructure.payments.circuit_breaker import _TimeWindow
+    
+    window = _TimeWindow(size=10)
+    window.record(failed=True, slow=False, now=100.0)
+    window.record(failed=False, slow=True, now=105.5)
+    
+    assert window.snapshot(now=106.0) == (2, 1, 1)
+    assert window.snapshot(now=112.0) == (1, 0, 1)
+    assert window.snapshot(now=200.0) == (0, 0, 0)
+
+
+def test_half_open_admits_limited_probes():
+    """Only half_open_max_calls concurrent probes reach a recovering service."""
+    import asyncio
+    from bakerySpotGourmet.infrastructure.payments.exceptions import CircuitBreakerOpenException
+    
+    cb = CircuitBreaker(failure_threshold=1, timeout_seconds=0, half_open_max_calls=2)
+    with pytest.raises(ValueError):
+        cb.call(_fail)
+    assert cb.state == CircuitState.OPEN
+    
+    admitted = [0]
+    
+    async def slow_probe():
+        admitted[0] += 1
+        await asyncio.sleep(0.02)
+        return "ok"
+    
+    async def scenario():
+        return await asyncio.gather(
+            *(cb.call_async(slow_probe) for _ in range(10)),
+            return_exceptions=True,
+        )
+    
+    results = asyncio.run(scenario())
+    
+    assert admitted[0] == 2
+    assert sum(isinstance(r, CircuitBreakerOpenException) for r in results) == 8
+    assert cb.state == CircuitState.CLOSED
+
+
+def test_half_open_failed_probe_reopens():
+    """A failed probe sends the circuit back to OPEN."""
+    cb = CircuitBreaker(failure_threshold=1, timeout_seconds=0, half_open_max_calls=2)
+    with pytest.raises(ValueError):
+        cb.call(_fail)
+    
+    with pytest.raises(ValueError):
+        cb.call(_fail)
+    
+    assert cb.state == CircuitState.OPEN
+
+
+def test_half_open_recovery_timeout_reopens():
+    """Probes that never conclude within recovery_timeout re-open the circuit."""
+    cb = CircuitBreaker(failure_threshold=1, timeout_seconds=0, recovery_timeout=0)
+    with pytest.raises(ValueError):
+        cb.call(_fail)
+    
+    # Reserve the only probe slot without finishing it
+    assert cb._acquire_permission() is True
+    assert cb.state == CircuitState.HALF_OPEN
+    
+    # recovery_timeout elapsed: the stuck probe is abandoned and a new one admitted
+    assert cb.call(lambda: "ok") == "ok"
+    assert cb.state == CircuitState.CLOSED
+
+
+def test_call_async_records_failures():
+    """call_async counts failures like call."""
+    import asyncio
+    
+    cb = CircuitBreaker(failure_threshold=2, timeout_seconds=60)
+    
+    async def failing():
+        raise ValueError("Test failure")
+    
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            asyncio.run(cb.call_async(failing))
+    
+    assert cb.state == CircuitState.OPEN
+
+
+def test_circuit_breaker_thread_safety():
+    """Concurrent threads never admit more probes than allowed."""
+    import threading
+    import time
+    
+    cb = CircuitBreaker(failure_threshold=1, timeout_seconds=0, half_open_max_calls=3)
+    with pytest.raises(ValueError):
+        cb.call(_fail)
+    
+    admitted = []
+    lock = threading.Lock()
+    
+    def probe():
+        with lock:
+            admitted.append(1)
+        time.sleep(0.02)
+    
+    def worker():
+        try:
+            cb.call(probe)
+        except Exception:
+            pass
+    
+    threads = [threading.Thread(target=worker) for _ in range(20)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    
+    assert len(admitted) == 3
+    assert cb.state == CircuitState.CLOSED
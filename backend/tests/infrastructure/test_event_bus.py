@@ -0,0 +1,217 @@
+"""
+Tests for the in-process event bus.
+"""
+import asyncio
+import threading
+
+import pytest
+
+from bakerySpotGourmet.domain.orders.events import OrderStatusChanged
+from bakerySpotGourmet.domain.orders.status import OrderStatus
+from bakerySpotGourmet.domain.payments.events import PaymentCompleted
+from bakerySpotGourmet.infrastructure.events.event_bus import EventBus, OverflowPolicy
+from bakerySpotGourmet.infrastructure.events.exceptions import EventBusFullException
+
+
+def _status_event(order_id: int) -> OrderStatusChanged:
+    return OrderStatusChanged(
+        order_id=order_id,
+        old_status=OrderStatus.PENDING,
+        new_status=OrderStatus.CONFIRMED,
+    )
+
+
+def test_publish_without_subscribers_is_noop():
+    """Events with no subscribers are not routed anywhere."""
+    bus = EventBus()
+    assert bus.publish(_status_event(1)) == 0
+
+
+def test_events_delivered_in_batches():
+    """Queued events are handed to the subscriber in batches."""
+    batches = []
+
+    async def handler(events):
+        batches.append(list(events))
+
+    async def scenario():
+        bus = EventBus()
+        bus.subscribe([OrderStatusChanged], handler, batch_size=4, batch_timeout=0.01)
+        for i in range(10):
+            bus.publish(_status_event(i))
+        await bus.start()
+        await bus.stop(drain=True)
+        return bus
+
+    bus = asyncio.run(scenario())
+
+    assert [len(b) for b in batches] == [4, 4, 2]
+    assert [e.order_id for b in batches for e in b] == list(range(10))
+    assert bus.get_stats()["subscribers"][0]["delivered"] == 10
+
+
+def test_events_routed_by_type():
+    """Subscribers only receive the event types they registered for."""
+    received = []
+
+    async def handler(events):
+        received.extend(events)
+
+    async def scenario():
+        bus = EventBus()
+        bus.subscribe([PaymentCompleted], handler)
+        await bus.start()
+        bus.publish(_status_event(1))
+        bus.publish(PaymentCompleted(payment_id=1, order_id=1, amount=5.0))
+        await bus.stop(drain=True)
+
+    asyncio.run(scenario())
+
+    assert len(received) == 1
+    assert isinstance(received[0], PaymentCompleted)
+
+
+def test_drop_newest_policy_counts_drops():
+    """A full DROP_NEWEST queue discards incoming events."""
+    async def handler(events):
+        pass
+
+    bus = EventBus()
+    sub = bus.subscribe([OrderStatusChanged], handler, queue_size=2)
+    for i in range(5):
+        bus.publish(_status_event(i))
+
+    assert sub.queue.qsize() == 2
+    assert sub.dropped == 3
+    assert sub.queue.get_nowait().order_id == 0
+
+
+def test_drop_oldest_policy_keeps_latest():
+    """A full DROP_OLDEST queue evicts the oldest events."""
+    async def handler(events):
+        pass
+
+    bus = EventBus()
+    sub = bus.subscribe(
+        [OrderStatusChanged], handler, queue_size=2, overflow_policy=OverflowPolicy.DROP_OLDEST
+    )
+    for i in range(5):
+        bus.publish(_status_event(i))
+
+    assert sub.dropped == 3
+    assert [sub.queue.get_nowait().order_id for _ in range(2)] == [3, 4]
+
+
+def test_block_policy_raises_on_sync_publish():
+    """A full BLOCK queue signals backpressure to synchronous publishers."""
+    async def handler(events):
+        pass
+
+    bus = EventBus()
+    bus.subscribe([OrderStatusChanged], handler, queue_size=1, overflow_policy=OverflowPolicy.BLOCK)
+    bus.publish(_status_event(1))
+
+    with pytest.raises(EventBusFullException):
+        bus.publish(_status_event(2))
+
+
+def test_block_policy_waits_on_async_publish():
+    """publish_async waits for room instead of dropping."""
+    received = []
+
+    async def handler(events):
+        received.extend(events)
+
+    async def scenario():
+        bus = EventBus()
+        bus.subscribe(
+            [OrderStatusChanged], handler, queue_size=1,
+            batch_size=1, overflow_policy=OverflowPolicy.BLOCK,
+        )
+        await bus.start()
+        for i in range(5):
+            await bus.publish_async(_status_event(i))
+        await bus.stop(drain=True)
+
+    asyncio.run(scenario())
+
+    assert [e.order_id for e in received] == list(range(5))
+
+
+def test_handler_failure_is_counted_and_worker_survives():
+    """A failing batch is recorded and later batches are still delivered."""
+    received = []
+
+    async def handler(events):
+        if events[0].order_id == 0:
+            raise RuntimeError("boom")
+        received.extend(events)
+
+    async def scenario():
+        bus = EventBus()
+        sub = bus.subscribe([OrderStatusChanged], handler, batch_size=1)
+        await bus.start()
+        bus.publish(_status_event(0))
+        bus.publish(_status_event(1))
+        await bus.stop(drain=True)
+        return sub
+
+    sub = asyncio.run(scenario())
+
+    assert sub.failed_batches == 1
+    assert [e.order_id for e in received] == [1]
+
+
+def test_concurrent_batches():
+    """With concurrency > 1, batches are processed in parallel."""
+    active = [0]
+    peak = [0]
+
+    async def handler(events):
+        active[0] += 1
+        peak[0] = max(peak[0], active[0])
+        await asyncio.sleep(0.01)
+        active[0] -= 1
+
+    async def scenario():
+        bus = EventBus()
+        bus.subscribe([OrderStatusChanged], handler, batch_size=1, concurrency=3)
+        for i in range(6):
+            bus.publish(_status_event(i))
+        await bus.start()
+        await bus.stop(drain=True)
+
+    asyncio.run(scenario())
+
+    assert peak[0] == 3
+
+
+def test_publish_from_other_thread():
+    """Publishing from a worker thread is marshalled onto the loop."""
+    received = []
+
+    async def handler(events):
+        received.extend(events)
+
+    async def scenario():
+        bus = EventBus()
+        bus.subscribe([OrderStatusChanged], handler)
+        await bus.start()
+        thread = threading.Thread(target=bus.publish, args=(_status_event(7),))
+        thread.start()
+        thread.join()
+        await asyncio.sleep(0.1)
+        await bus.stop(drain=True)
+
+    asyncio.run(scenario())
+
+    assert [e.order_id for e in received] == [7]
+
+
+def test_subscribe_rejects_invalid_batch_size():
+    """Batch size must be positive."""
+    async def handler(events):
+        pass
+
+    with pytest.raises(ValueError):
+        EventBus().subscribe([OrderStatusChanged], handler, batch_size=0)
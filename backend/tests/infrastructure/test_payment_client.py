@@ -0,0 +1,213 @@
+"""
+Tests for the async payment client against the in-process stub gateway.
+"""
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from bakerySpotGourmet.core.deadline import deadline_scope
+from bakerySpotGourmet.infrastructure.payments.bulkhead import Bulkhead
+from bakerySpotGourmet.infrastructure.payments.circuit_breaker import CircuitBreaker
+from bakerySpotGourmet.infrastructure.payments.exceptions import (
+    BulkheadFullException,
+    PaymentGatewayException,
+)
+from bakerySpotGourmet.infrastructure.payments.http_client import build_payment_http_client
+from bakerySpotGourmet.infrastructure.payments.payment_client import PaymentClient
+from bakerySpotGourmet.infrastructure.payments.retry_policy import RetryPolicy
+from bakerySpotGourmet.infrastructure.payments.stub_gateway import (
+    StubGatewayConfig,
+    create_stub_gateway_app,
+)
+
+
+def _client_for(config: StubGatewayConfig, **client_kwargs) -> tuple[PaymentClient, httpx.AsyncClient]:
+    """Build a payment client wired to a stub gateway without sockets."""
+    app = create_stub_gateway_app(config)
+    http_client = build_payment_http_client(
+        base_url="http://stub-gateway",
+        transport=httpx.ASGITransport(app=app),
+    )
+    client_kwargs.setdefault("retry_policy", RetryPolicy(max_retries=0))
+    client_kwargs.setdefault("circuit_breaker", CircuitBreaker(failure_threshold=1000))
+    return PaymentClient(http_client=http_client, **client_kwargs), http_client
+
+
+def test_process_payment_async_success():
+    """A healthy gateway returns a transaction id."""
+    async def scenario():
+        client, http_client = _client_for(StubGatewayConfig())
+        async with http_client:
+            return await client.process_payment_async(12.5, "USD", reference="order-1")
+
+    result = asyncio.run(scenario())
+
+    assert result["status"] == "success"
+    assert result["amount"] == 12.5
+    assert result["reference"] == "order-1"
+    assert result["transaction_id"].startswith("stub_")
+
+
+def test_process_payment_async_gateway_error():
+    """Gateway 5xx responses surface as PaymentGatewayException."""
+    async def scenario():
+        client, http_client = _client_for(StubGatewayConfig(error_rate=1.0))
+        async with http_client:
+            await client.process_payment_async(10.0, "USD")
+
+    with pytest.raises(PaymentGatewayException):
+        asyncio.run(scenario())
+
+
+def test_process_payment_async_per_call_timeout():
+    """The per-call timeout is applied and gateway timeouts are translated."""
+    seen_timeouts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_timeouts.append(request.extensions["timeout"]["read"])
+        raise httpx.ReadTimeout("slow gateway", request=request)
+
+    async def scenario():
+        http_client = build_payment_http_client(
+            base_url="http://stub-gateway",
+            transport=httpx.MockTransport(handler),
+        )
+        client = PaymentClient(
+            http_client=http_client,
+            retry_policy=RetryPolicy(
+                max_retries=2, base_delay=0.001, retryable_exceptions=(PaymentGatewayException,)
+            ),
+        )
+        async with http_client:
+            await client.process_payment_async(10.0, "USD", timeout=0.05)
+
+    with pytest.raises(PaymentGatewayException):
+        asyncio.run(scenario())
+    # Initial attempt plus two retries, each with the per-call timeout
+    assert seen_timeouts == [0.05, 0.05, 0.05]
+
+
+def test_stub_gateway_error_rate_is_reproducible():
+    """With a seed, the stub produces a deterministic error pattern."""
+    async def run_batch() -> list[bool]:
+        client, http_client = _client_for(StubGatewayConfig(error_rate=0.5, seed=42))
+        outcomes = []
+        async with http_client:
+            for _ in range(20):
+                try:
+                    await client.process_payment_async(1.0, "USD")
+                    outcomes.append(True)
+                except PaymentGatewayException:
+                    outcomes.append(False)
+        return outcomes
+
+    first = asyncio.run(run_batch())
+    second = asyncio.run(run_batch())
+
+    assert first == second
+    assert 0 < sum(first) < 20
+
+
+def test_pooled_client_limits():
+    """The shared client is configured with connection limits."""
+    http_client = build_payment_http_client(max_connections=7, max_keepalive_connections=3)
+    pool = http_client._transport._pool
+
+    assert pool._max_connections == 7
+    assert pool._max_keepalive_connections == 3
+    asyncio.run(http_client.aclose())
+
+
+def test_process_payment_async_opens_circuit():
+    """Repeated gateway failures open the circuit and stop calling the gateway."""
+    from bakerySpotGourmet.infrastructure.payments.exceptions import CircuitBreakerOpenException
+
+    async def scenario():
+        client, http_client = _client_for(
+            StubGatewayConfig(error_rate=1.0),
+            circuit_breaker=CircuitBreaker(failure_threshold=2, timeout_seconds=60),
+        )
+        async with http_client:
+            for _ in range(2):
+                with pytest.raises(PaymentGatewayException):
+                    await client.process_payment_async(1.0, "USD")
+            with pytest.raises(CircuitBreakerOpenException):
+                await client.process_payment_async(1.0, "USD")
+            return (await http_client.get("/stats")).json()
+
+    stats = asyncio.run(scenario())
+
+    assert stats["requests"] == 2
+
+
+def test_payment_client_rejects_when_bulkhead_full():
+    """Gateway calls beyond the bulkhead limits fail fast."""
+    bulkhead = Bulkhead(max_concurrent_calls=1, max_queue_size=0, queue_timeout=0)
+
+    async def scenario():
+        client, http_client = _client_for(StubGatewayConfig(latency_seconds=0.05), bulkhead=bulkhead)
+        async with http_client:
+            return await asyncio.gather(
+                *(client.process_payment_async(5.0, "USD") for _ in range(3)),
+                return_exceptions=True,
+            )
+
+    results = asyncio.run(scenario())
+
+    assert sum(isinstance(r, dict) for r in results) == 1
+    assert sum(isinstance(r, BulkheadFullException) for r in results) == 2
+    assert bulkhead.get_stats()["rejected_count"] == 2
+    assert bulkhead.get_stats()["active"] == 0
+
+
+def test_process_payment_async_stops_at_request_deadline():
+    """A slow gateway call is abandoned once the request deadline passes."""
+    async def scenario():
+        client, http_client = _client_for(StubGatewayConfig(latency_seconds=1.0))
+        async with http_client:
+            with deadline_scope(0.05):
+                await client.process_payment_async(5.0, "USD")
+
+    started = time.monotonic()
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(scenario())
+    assert time.monotonic() - started < 0.5
+
+
+def test_bulkhead_slot_released_during_backoff():
+    """Retries take a bulkhead slot per attempt, not through the backoff sleep."""
+    bulkhead = Bulkhead(max_concurrent_calls=1, max_queue_size=0, queue_timeout=0)
+    attempts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(request)
+        if len(attempts) == 1:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"status": "success", "transaction_id": "txn_1"})
+
+    async def scenario():
+        http_client = build_payment_http_client(
+            base_url="http://stub-gateway",
+            transport=httpx.MockTransport(handler),
+        )
+        client = PaymentClient(
+            http_client=http_client,
+            bulkhead=bulkhead,
+            circuit_breaker=CircuitBreaker(failure_threshold=1000),
+            retry_policy=RetryPolicy(
+                max_retries=1, base_delay=0.1, retryable_exceptions=(PaymentGatewayException,)
+            ),
+        )
+        async with http_client:
+            call = asyncio.ensure_future(client.process_payment_async(5.0, "USD"))
+            await asyncio.sleep(0.05)
+            active_during_backoff = bulkhead.get_stats()["active"]
+            return active_during_backoff, await call
+
+    active_during_backoff, result = asyncio.run(scenario())
+
+    assert active_during_backoff == 0
+    assert result["transaction_id"] == "txn_1"
+    assert len(attempts) == 2
@@ -0,0 +1,124 @@
+"""
+Tests for the shared retry budget.
+"""
+import asyncio
+
+import pytest
+
+from bakerySpotGourmet.core.deadline import deadline_scope
+from bakerySpotGourmet.infrastructure.payments.retry_budget import RetryBudget
+from bakerySpotGourmet.infrastructure.payments.retry_policy import RetryPolicy
+
+
+def test_retry_budget_reserve_allows_initial_retry():
+    """A fresh budget allows a retry from its reserve."""
+    budget = RetryBudget(ratio=0.1, min_retries_per_second=1.0)
+    
+    assert budget.try_acquire_retry() is True
+    assert budget.try_acquire_retry() is False
+
+
+def test_retry_budget_without_reserve_requires_successes():
+    """Without a reserve, retries are earned only by successful calls."""
+    budget = RetryBudget(ratio=0.5, min_retries_per_second=0)
+    
+    assert budget.try_acquire_retry() is False
+    
+    budget.record_success()
+    budget.record_success()
+    assert budget.try_acquire_retry() is True
+    assert budget.try_acquire_retry() is False
+
+
+def test_retry_budget_caps_tokens():
+    """Saved-up tokens never exceed max_tokens."""
+    budget = RetryBudget(ratio=1.0, min_retries_per_second=0, max_tokens=3)
+    
+    for _ in range(10):
+        budget.record_success()
+    
+    allowed = sum(budget.try_acquire_retry() for _ in range(10))
+    assert allowed == 3
+
+
+def test_retry_budget_bounds_amplification():
+    """With every call failing, retries stay bounded by the budget."""
+    budget = RetryBudget(ratio=0.25, min_retries_per_second=0, max_tokens=100)
+    for _ in range(40):
+        budget.record_success()
+    
+    policy = RetryPolicy(max_retries=2, base_delay=0, retry_budget=budget)
+    attempts = [0]
+    
+    def always_failing_func():
+        attempts[0] += 1
+        raise ValueError("Gateway down")
+    
+    for _ in range(50):
+        with pytest.raises(ValueError):
+            policy.execute(always_failing_func)
+    
+    # 50 initial attempts plus only the 10 retries the budget paid for
+    assert attempts[0] == 60
+    stats = budget.get_stats()
+    assert stats["retries_allowed"] == 10
+    assert stats["retries_rejected"] == 45
+
+
+def test_retry_budget_shared_by_async_policy():
+    """Async retries draw from the same budget."""
+    budget = RetryBudget(ratio=0.1, min_retries_per_second=0)
+    policy = RetryPolicy(max_retries=3, base_delay=0, retry_budget=budget)
+    attempts = [0]
+    
+    async def always_failing_func():
+        attempts[0] += 1
+        raise ValueError("Gateway down")
+    
+    with pytest.raises(ValueError):
+        asyncio.run(policy.execute_async(always_failing_func))
+    
+    assert attempts[0] == 1
+    assert budget.get_stats()["retries_rejected"] == 1
+
+
+def test_retry_budget_not_spent_past_deadline():
+    """A retry the deadline rules out does not take a budget token."""
+    budget = RetryBudget(ratio=1.0, min_retries_per_second=0)
+    budget.record_success()
+    policy = RetryPolicy(max_retries=1, base_delay=5.0, retry_budget=budget)
+    
+    def failing_func():
+        raise ValueError("Gateway down")
+    
+    async def failing_coroutine():
+        raise ValueError("Gateway down")
+    
+    with deadline_scope(1.0):
+        with pytest.raises(ValueError):
+            policy.execute(failing_func)
+        with pytest.raises(ValueError):
+            asyncio.run(policy.execute_async(failing_coroutine))
+    
+    stats = budget.get_stats()
+    assert stats["retries_allowed"] == 0
+    assert stats["tokens"] == pytest.approx(1.0)
+
+
+def test_retry_budget_records_successes():
+    """Successful executions credit the budget."""
+    budget = RetryBudget(ratio=0.2, min_retries_per_second=0)
+    policy = RetryPolicy(retry_budget=budget)
+    
+    for _ in range(5):
+        policy.execute(lambda: "ok")
+    
+    stats = budget.get_stats()
+    assert stats["successes"] == 5
+    assert stats["tokens"] == pytest.approx(1.0)
+
+
+def test_retry_budget_rejects_invalid_config():
+    """Negative ratios are rejected."""
+    with pytest.raises(ValueError):
+        RetryBudget(ratio=-1)
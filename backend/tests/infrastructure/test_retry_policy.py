@@ -99,3 +99,109 @@ def test_retry_policy_retryable_exceptions():
         policy.execute(type_error_func)
     
     assert call_count[0] == 1  # Only initial attempt, no retries
+
+
+def test_retry_policy_full_jitter_within_bounds():
+    """Full jitter delays stay between zero and the exponential delay."""
+    import random
+    from bakerySpotGourmet.infrastructure.payments.retry_policy import JitterStrategy
+    
+    policy = RetryPolicy(base_delay=1.0, jitter=JitterStrategy.FULL, rng=random.Random(1))
+    
+    for attempt in range(5):
+        delay = policy._next_delay(attempt, 0.0)
+        assert 0 <= delay <= policy._calculate_delay(attempt)
+
+
+def test_retry_policy_decorrelated_jitter_within_bounds():
+    """Decorrelated jitter grows from the previous delay and respects max_delay."""
+    import random
+    from bakerySpotGourmet.infrastructure.payments.retry_policy import JitterStrategy
+    
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0, jitter=JitterStrategy.DECORRELATED, rng=random.Random(1))
+    
+    delay = 0.0
+    for attempt in range(10):
+        previous = delay
+        delay = policy._next_delay(attempt, previous)
+        assert 1.0 <= delay <= min(5.0, max(1.0, previous * 3))
+
+
+def test_retry_policy_execute_async_reports_attempts_and_wait():
+    """Async execution retries without blocking and reports its work."""
+    import asyncio
+    
+    policy = RetryPolicy(max_retries=3, base_delay=0.01)
+    call_count = [0]
+    
+    async def sometimes_failing_func():
+        call_count[0] += 1
+        if call_count[0] < 3:
+            raise ValueError("Temporary failure")
+        return "success"
+    
+    result = asyncio.run(policy.execute_async_with_result(sometimes_failing_func))
+    
+    assert result.value == "success"
+    assert result.attempts == 3
+    assert result.total_wait_seconds == pytest.approx(0.01 + 0.02)
+
+
+def test_retry_policy_execute_async_does_not_block_loop():
+    """Other tasks keep running while a retry is sleeping."""
+    import asyncio
+    
+    policy = RetryPolicy(max_retries=1, base_delay=0.05)
+    ticks = [0]
+    
+    async def always_failing_func():
+        raise ValueError("Always fails")
+    
+    async def ticker():
+        for _ in range(5):
+            ticks[0] += 1
+            await asyncio.sleep(0.005)
+    
+    async def scenario():
+        ticker_task = asyncio.create_task(ticker())
+        with pytest.raises(ValueError):
+            await policy.execute_async(always_failing_func)
+        await ticker_task
+    
+    asyncio.run(scenario())
+    assert ticks[0] == 5
+
+
+def test_retry_policy_execute_async_respects_deadline():
+    """Retries stop when the next delay would exceed the remaining budget."""
+    import asyncio
+    import time
+    
+    policy = RetryPolicy(max_retries=5, base_delay=0.05)
+    call_count = [0]
+    
+    async def always_failing_func():
+        call_count[0] += 1
+        raise ValueError("Always fails")
+    
+    started = time.monotonic()
+    with pytest.raises(ValueError):
+        asyncio.run(policy.execute_async(always_failing_func, deadline=started + 0.12))
+    
+    # 0.05 + 0.10 would exceed the 0.12s budget: only one retry fits
+    assert call_count[0] == 2
+    assert time.monotonic() - started < 0.12
+
+
+def test_retry_policy_execute_async_cuts_off_slow_attempt():
+    """An attempt still running at the deadline is cancelled."""
+    import asyncio
+    import time
+    
+    policy = RetryPolicy(max_retries=3, base_delay=0.01, retryable_exceptions=(ValueError,))
+    
+    async def slow_func():
+        await asyncio.sleep(1)
+    
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(policy.execute_async(slow_func, deadline=time.monotonic() + 0.05))
@@ -0,0 +1,22 @@
+"""
+Unit tests for bulk loading the in-memory order repository.
+"""
+from bakerySpotGourmet.domain.business_rules.fulfillment import FulfillmentType
+from bakerySpotGourmet.domain.orders.order import Order
+from bakerySpotGourmet.repositories.order_repository import OrderRepository
+
+
+def _order(user_id: int) -> Order:
+    return Order(id=None, user_id=user_id, fulfillment_type=FulfillmentType.PICKUP)
+
+
+def test_save_many_assigns_ids():
+    """save_many assigns sequential IDs and later saves continue from them."""
+    repo = OrderRepository()
+    
+    saved = repo.save_many([_order(1), _order(2), _order(1)])
+    later = repo.save(_order(3))
+    
+    assert [o.id for o in saved] == [1, 2, 3]
+    assert later.id == 4
+    assert repo.get_by_id(2).user_id == 2
@@ -0,0 +1,101 @@
+"""
+Unit tests for the in-memory payment repository and its indexes.
+"""
+from bakerySpotGourmet.domain.payments.payment import Payment
+from bakerySpotGourmet.domain.payments.status import PaymentStatus
+from bakerySpotGourmet.repositories.payment_repository import PaymentRepository
+
+
+def _payment(order_id: int, amount: float = 10.0) -> Payment:
+    return Payment(order_id=order_id, amount=amount, payment_method="card")
+
+
+def test_save_assigns_ids():
+    """New payments receive sequential IDs."""
+    repo = PaymentRepository()
+    
+    first = repo.save(_payment(1))
+    second = repo.save(_payment(1))
+    
+    assert (first.id, second.id) == (1, 2)
+    assert repo.count() == 2
+
+
+def test_get_by_order_id_uses_index():
+    """Payments are returned per order, in insertion order."""
+    repo = PaymentRepository()
+    a = repo.save(_payment(1))
+    repo.save(_payment(2))
+    c = repo.save(_payment(1))
+    
+    assert repo.get_by_order_id(1) == [a, c]
+    assert repo.get_by_order_id(99) == []
+
+
+def test_get_by_order_ids_bulk():
+    """Bulk lookup returns every requested order, including those without payments."""
+    repo = PaymentRepository()
+    a = repo.save(_payment(1))
+    b = repo.save(_payment(2))
+    
+    result = repo.get_by_order_ids([1, 2, 3])
+    
+    assert result == {1: [a], 2: [b], 3: []}
+
+
+def test_status_index_follows_updates():
+    """Saving a payment after a status change moves it in the status index."""
+    repo = PaymentRepository()
+    payment = repo.save(_payment(1))
+    assert repo.get_by_status(PaymentStatus.PENDING) == [payment]
+    
+    payment.complete()
+    repo.save(payment)
+    
+    assert repo.get_by_status(PaymentStatus.PENDING) == []
+    assert repo.get_by_status(PaymentStatus.COMPLETED) == [payment]
+
+
+def test_status_index_ignores_unsaved_mutation():
+    """A payment mutated but not saved is not returned under its old status."""
+    repo = PaymentRepository()
+    payment = repo.save(_payment(1))
+    
+    payment.fail()
+    
+    assert repo.get_by_status(PaymentStatus.PENDING) == []
+
+
+def test_order_index_follows_reassignment():
+    """Changing a payment's order moves it between order buckets."""
+    repo = PaymentRepository()
+    payment = repo.save(_payment(1))
+    
+    payment.order_id = 2
+    repo.save(payment)
+    
+    assert repo.get_by_order_id(1) == []
+    assert repo.get_by_order_id(2) == [payment]
+
+
+def test_save_many():
+    """save_many persists and indexes every payment."""
+    repo = PaymentRepository()
+    
+    saved = repo.save_many([_payment(1), _payment(2), _payment(2)])
+    
+    assert [p.id for p in saved] == [1, 2, 3]
+    assert len(repo.get_by_order_id(2)) == 2
+
+
+def test_status_index_keeps_entry_order():
+    """Payments are listed in the order they were saved in a status."""
+    repo = PaymentRepository()
+    first, second = repo.save_many([_payment(1), _payment(2)])
+    
+    first.complete()
+    second.complete()
+    repo.save_many([second, first])
+    
+    assert repo.get_by_status(PaymentStatus.COMPLETED) == [second, first]
+    assert repo.get_by_status(PaymentStatus.PENDING) == []
@@ -0,0 +1,78 @@
+"""
+Tests for the order and payment event subscribers.
+"""
+import asyncio
+from uuid import uuid4
+
+from bakerySpotGourmet.domain.business_rules.fulfillment import FulfillmentType
+from bakerySpotGourmet.domain.orders.order import Order
+from bakerySpotGourmet.domain.payments.events import PaymentCompleted
+from bakerySpotGourmet.domain.payments.payment import Payment
+from bakerySpotGourmet.domain.payments.status import PaymentStatus
+from bakerySpotGourmet.infrastructure.events.event_bus import EventBus, OverflowPolicy, publish_event
+from bakerySpotGourmet.repositories.order_repository import OrderRepository
+from bakerySpotGourmet.repositories.payment_repository import PaymentRepository
+from bakerySpotGourmet.services.order_event_service import OrderEventService
+from bakerySpotGourmet.services.payment_service import PaymentService
+
+
+def _order_repository(orders: int = 2) -> OrderRepository:
+    repository = OrderRepository()
+    for _ in range(orders):
+        repository.save(Order(id=None, user_id=uuid4(), fulfillment_type=FulfillmentType.PICKUP))  # type: ignore[arg-type]
+    return repository
+
+
+def test_completed_payment_marks_order_paid_in_background():
+    """Completing a payment publishes an event the subscriber applies to the order."""
+    bus = EventBus()
+    order_repository = _order_repository()
+    payment_repository = PaymentRepository()
+    payment = payment_repository.save(Payment(order_id=1, amount=10.0, payment_method="card"))
+    OrderEventService(order_repository, bus)
+    payment_service = PaymentService(payment_repository, bus)
+
+    async def scenario():
+        await bus.start()
+        payment_service.complete_payment(payment.id)
+        # Not applied inline by the service
+        assert getattr(order_repository.get_by_id(1), "payment_status", None) is None
+        await bus.stop(drain=True)
+
+    asyncio.run(scenario())
+
+    assert order_repository.get_by_id(1).payment_status == PaymentStatus.COMPLETED
+    assert getattr(order_repository.get_by_id(2), "payment_status", None) is None
+
+
+def test_apply_payments_updates_each_order_once():
+    """Several completions for one order in a batch cause a single update."""
+    order_repository = _order_repository(orders=1)
+    service = OrderEventService(order_repository, EventBus())
+    updates = []
+    update = order_repository.update
+    order_repository.update = lambda order: updates.append(order.id) or update(order)  # type: ignore[method-assign]
+
+    asyncio.run(service.apply_payments([
+        PaymentCompleted(payment_id=1, order_id=1, amount=5.0),
+        PaymentCompleted(payment_id=2, order_id=1, amount=5.0),
+        PaymentCompleted(payment_id=3, order_id=99, amount=5.0),
+    ]))
+    asyncio.run(service.apply_payments([PaymentCompleted(payment_id=4, order_id=1, amount=5.0)]))
+
+    assert updates == [1]
+
+
+def test_publish_event_does_not_raise_when_queue_full():
+    """A full BLOCK queue after the change was saved is logged, not raised."""
+    bus = EventBus()
+
+    async def handler(events):
+        pass
+
+    bus.subscribe([PaymentCompleted], handler, queue_size=1, overflow_policy=OverflowPolicy.BLOCK)
+    event = PaymentCompleted(payment_id=1, order_id=1, amount=5.0)
+
+    assert publish_event(bus, event) == 1
+    assert publish_event(bus, event) == 0
+    assert publish_event(None, event) == 0
@@ -0,0 +1,230 @@
+"""
+Tests for payment webhook ingestion.
+"""
+import asyncio
+import json
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+from bakerySpotGourmet.api.v1 import dependencies as deps
+from bakerySpotGourmet.core.config import settings
+from bakerySpotGourmet.core.constants import PAYMENT_WEBHOOK_SIGNATURE_HEADER
+from bakerySpotGourmet.core.security import sign_webhook_payload
+from bakerySpotGourmet.domain.business_rules.fulfillment import FulfillmentType
+from bakerySpotGourmet.domain.orders.order import Order
+from bakerySpotGourmet.domain.payments.events import PaymentCompleted, PaymentWebhookReceived
+from bakerySpotGourmet.domain.payments.payment import Payment
+from bakerySpotGourmet.domain.payments.status import PaymentStatus
+from bakerySpotGourmet.infrastructure.events.event_bus import EventBus
+from bakerySpotGourmet.infrastructure.events.exceptions import EventBusFullException
+from bakerySpotGourmet.main import app
+from bakerySpotGourmet.repositories.order_repository import OrderRepository
+from bakerySpotGourmet.repositories.payment_repository import PaymentRepository
+from bakerySpotGourmet.schemas.payment import PaymentWebhookEvent
+from bakerySpotGourmet.services.payment_webhook_service import PaymentWebhookService, get_payment_webhook_service
+
+
+def _service(payments: int = 3, **kwargs) -> PaymentWebhookService:
+    """Service over fresh repositories holding one order and payment per index."""
+    payment_repository = PaymentRepository()
+    order_repository = OrderRepository()
+    for _ in range(payments):
+        order = order_repository.save(
+            Order(id=None, user_id=uuid4(), fulfillment_type=FulfillmentType.PICKUP)  # type: ignore[arg-type]
+        )
+        payment_repository.save(Payment(order_id=order.id, amount=20.0, payment_method="card"))
+    return PaymentWebhookService(payment_repository, order_repository, EventBus(), **kwargs)
+
+
+def _event(event_id: str, payment_id: int, status: PaymentStatus) -> PaymentWebhookEvent:
+    return PaymentWebhookEvent(event_id=event_id, payment_id=payment_id, status=status)
+
+
+def _post_webhook(client: TestClient, body: dict, secret: str = "whsec_test"):
+    """POST a webhook delivery signed with `secret`."""
+    payload = json.dumps(body).encode()
+    return client.post(
+        f"{settings.API_V1_STR}/webhooks/payments",
+        content=payload,
+        headers={
+            "Content-Type": "application/json",
+            PAYMENT_WEBHOOK_SIGNATURE_HEADER: sign_webhook_payload(payload, secret),
+        },
+    )
+
+
+def test_accept_deduplicates_by_event_id():
+    """Redelivered events are acknowledged but queued only once."""
+    service = _service()
+
+    first = service.accept([_event("evt_1", 1, PaymentStatus.COMPLETED)])
+    second = service.accept([
+        _event("evt_1", 1, PaymentStatus.COMPLETED),
+        _event("evt_2", 2, PaymentStatus.FAILED),
+    ])
+
+    assert first == {"accepted": 1, "duplicates": 0}
+    assert second == {"accepted": 1, "duplicates": 1}
+    assert service.subscription.queue.qsize() == 2
+
+
+def test_accept_rejects_whole_delivery_when_queue_full():
+    """A delivery that does not fit is rejected and can be redelivered."""
+    service = _service(queue_size=2)
+    events = [_event(f"evt_{i}", 1, PaymentStatus.COMPLETED) for i in range(3)]
+
+    with pytest.raises(EventBusFullException):
+        service.accept(events)
+
+    assert service.subscription.queue.qsize() == 0
+    assert service.accept(events[:2]) == {"accepted": 2, "duplicates": 0}
+
+
+def test_apply_batch_updates_payments_and_orders():
+    """Queued events update payments in bulk and the order payment status."""
+    service = _service()
+    published = []
+
+    async def collect(events):
+        published.extend(events)
+
+    service.event_bus.subscribe([PaymentCompleted], collect)
+
+    async def scenario():
+        await service.event_bus.start()
+        service.accept([
+            _event("evt_1", 1, PaymentStatus.COMPLETED),
+            _event("evt_2", 2, PaymentStatus.FAILED),
+            _event("evt_3", 3, PaymentStatus.COMPLETED),
+            _event("evt_4", 3, PaymentStatus.REFUNDED),
+            _event("evt_5", 99, PaymentStatus.COMPLETED),
+        ])
+        # Let the PaymentCompleted events published by the batch be delivered too
+        await asyncio.sleep(0.2)
+        await service.event_bus.stop(drain=True)
+
+    asyncio.run(scenario())
+
+    repository = service.payment_repository
+    assert repository.get_by_id(1).status == PaymentStatus.COMPLETED
+    assert repository.get_by_id(2).status == PaymentStatus.FAILED
+    assert repository.get_by_id(3).status == PaymentStatus.REFUNDED
+    assert service.order_repository.get_by_id(1).payment_status == PaymentStatus.COMPLETED
+    assert service.order_repository.get_by_id(3).payment_status == PaymentStatus.REFUNDED
+    assert [e.payment_id for e in published] == [1]
+
+
+def test_apply_batch_skips_invalid_transitions():
+    """A refund for a payment that never completed is ignored."""
+    service = _service(payments=1)
+
+    asyncio.run(service.apply_batch([
+        PaymentWebhookReceived(event_id="evt_1", payment_id=1, status=PaymentStatus.REFUNDED)
+    ]))
+
+    assert service.payment_repository.get_by_id(1).status == PaymentStatus.PENDING
+
+
+def test_apply_batch_remembers_events_only_once_applied():
+    """Event ids become duplicates after their batch applied, and not if it failed."""
+    service = _service(payments=1)
+    event = _event("evt_1", 1, PaymentStatus.COMPLETED)
+    queued = PaymentWebhookReceived(event_id="evt_1", payment_id=1, status=PaymentStatus.COMPLETED)
+
+    assert service.accept([event]) == {"accepted": 1, "duplicates": 0}
+    assert "evt_1" not in service.dedup
+
+    def failing_save_many(payments):
+        raise RuntimeError("store unavailable")
+
+    save_many = service.payment_repository.save_many
+    service.payment_repository.save_many = failing_save_many  # type: ignore[method-assign]
+    with pytest.raises(RuntimeError):
+        asyncio.run(service.apply_batch([queued]))
+    assert "evt_1" not in service.dedup
+    assert service.pending == set()
+
+    # The gateway's redelivery is queued again and applied
+    service.payment_repository.save_many = save_many  # type: ignore[method-assign]
+    assert service.accept([event]) == {"accepted": 1, "duplicates": 0}
+    asyncio.run(service.apply_batch([queued]))
+    assert "evt_1" in service.dedup
+    assert service.accept([event]) == {"accepted": 0, "duplicates": 1}
+
+
+def test_webhook_endpoint_acknowledges_immediately(monkeypatch):
+    """The endpoint answers 202 with accepted and duplicate counts."""
+    monkeypatch.setattr(settings, "PAYMENT_WEBHOOK_SECRET", "whsec_test")
+    service = _service()
+    app.dependency_overrides[deps.get_payment_webhook_service] = lambda: service
+    try:
+        client = TestClient(app)
+        body = {"events": [
+            {"event_id": "evt_1", "payment_id": 1, "status": "completed"},
+            {"event_id": "evt_1", "payment_id": 1, "status": "completed"},
+        ]}
+        response = _post_webhook(client, body)
+    finally:
+        app.dependency_overrides = {}
+
+    assert response.status_code == 202
+    assert response.json() == {"accepted": 1, "duplicates": 1}
+
+
+def test_webhook_endpoint_returns_503_when_queue_full(monkeypatch):
+    """Deliveries that cannot be queued ask the gateway to retry."""
+    monkeypatch.setattr(settings, "PAYMENT_WEBHOOK_SECRET", "whsec_test")
+    service = _service(queue_size=1)
+    app.dependency_overrides[deps.get_payment_webhook_service] = lambda: service
+    try:
+        client = TestClient(app)
+        body = {"events": [
+            {"event_id": "evt_1", "payment_id": 1, "status": "completed"},
+            {"event_id": "evt_2", "payment_id": 2, "status": "completed"},
+        ]}
+        response = _post_webhook(client, body)
+    finally:
+        app.dependency_overrides = {}
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+
+
+def test_webhook_endpoint_rejects_bad_signature(monkeypatch):
+    """Unsigned and forged deliveries get 401 and nothing is queued."""
+    monkeypatch.setattr(settings, "PAYMENT_WEBHOOK_SECRET", "whsec_test")
+    service = _service()
+    app.dependency_overrides[deps.get_payment_webhook_service] = lambda: service
+    body = {"events": [{"event_id": "evt_1", "payment_id": 1, "status": "completed"}]}
+    try:
+        client = TestClient(app)
+        forged = _post_webhook(client, body, secret="wrong")
+        unsigned = client.post(f"{settings.API_V1_STR}/webhooks/payments", json=body)
+        monkeypatch.setattr(settings, "PAYMENT_WEBHOOK_SECRET", None)
+        unconfigured = _post_webhook(client, body)
+    finally:
+        app.dependency_overrides = {}
+
+    assert forged.status_code == 401
+    assert unsigned.status_code == 401
+    assert unconfigured.status_code == 401
+    assert service.subscription.queue.qsize() == 0
+
+
+def test_webhook_dependency_keeps_startup_repositories(monkeypatch):
+    """Requests resolving other repositories do not rewire the background worker."""
+    monkeypatch.setattr(settings, "PAYMENT_WEBHOOK_SECRET", "whsec_test")
+    service = get_payment_webhook_service()
+    wired = service.payment_repository, service.order_repository
+    app.dependency_overrides[deps.get_payment_repository] = PaymentRepository
+    app.dependency_overrides[deps.get_order_repository] = OrderRepository
+    try:
+        body = {"events": [{"event_id": f"evt_{uuid4()}", "payment_id": 1, "status": "completed"}]}
+        response = _post_webhook(TestClient(app), body)
+    finally:
+        app.dependency_overrides = {}
+
+    assert response.status_code == 202
+    assert (service.payment_repository, service.order_repository) == wired
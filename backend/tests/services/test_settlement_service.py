@@ -0,0 +1,199 @@
+"""
+Tests for the batched settlement pipeline against the in-process stub gateway.
+"""
+import asyncio
+import os
+
+import httpx
+
+from bakerySpotGourmet.domain.payments.payment import Payment
+from bakerySpotGourmet.domain.payments.status import PaymentStatus
+from bakerySpotGourmet.infrastructure.payments.circuit_breaker import CircuitBreaker
+from bakerySpotGourmet.infrastructure.payments.http_client import build_payment_http_client
+from bakerySpotGourmet.infrastructure.payments.payment_client import PaymentClient
+from bakerySpotGourmet.infrastructure.payments.retry_policy import RetryPolicy
+from bakerySpotGourmet.infrastructure.payments.stub_gateway import (
+    StubGatewayConfig,
+    create_stub_gateway_app,
+)
+from bakerySpotGourmet.repositories.payment_repository import PaymentRepository
+from bakerySpotGourmet.repositories.settlement_checkpoint_repository import (
+    SettlementCheckpointRepository,
+)
+from bakerySpotGourmet.services.settlement_service import SettlementService
+
+
+def _authorized_payments(count: int) -> PaymentRepository:
+    """Repository holding `count` authorized payments."""
+    repository = PaymentRepository()
+    repository.save_many(
+        Payment(order_id=i, amount=10.0 + i, payment_method="card", status=PaymentStatus.AUTHORIZED)
+        for i in range(1, count + 1)
+    )
+    return repository
+
+
+def _client_for(app) -> tuple[PaymentClient, httpx.AsyncClient]:
+    """Build a payment client wired to a stub gateway app without sockets."""
+    http_client = build_payment_http_client(
+        base_url="http://stub-gateway",
+        transport=httpx.ASGITransport(app=app),
+    )
+    client = PaymentClient(
+        http_client=http_client,
+        retry_policy=RetryPolicy(max_retries=0),
+        circuit_breaker=CircuitBreaker(failure_threshold=1000),
+    )
+    return client, http_client
+
+
+def test_settle_captures_all_authorized_payments_in_batches():
+    """Every authorized payment is captured with one gateway call per batch."""
+    repository = _authorized_payments(25)
+    app = create_stub_gateway_app(StubGatewayConfig())
+
+    async def scenario():
+        client, http_client = _client_for(app)
+        async with http_client:
+            service = SettlementService(
+                repository, client, SettlementCheckpointRepository(), batch_size=10, max_concurrency=2
+            )
+            return await service.settle()
+
+    report = asyncio.run(scenario())
+
+    assert report.batches_total == 3
+    assert report.batches_completed == 3
+    assert report.captured == 25
+    assert app.state.stats["requests"] == 3
+    assert len(repository.get_by_status(PaymentStatus.COMPLETED)) == 25
+    assert repository.get_by_status(PaymentStatus.AUTHORIZED) == []
+
+
+def test_settle_marks_declined_captures_failed():
+    """Declined captures fail the payment instead of completing it."""
+    repository = _authorized_payments(20)
+    app = create_stub_gateway_app(StubGatewayConfig(decline_rate=1.0))
+
+    async def scenario():
+        client, http_client = _client_for(app)
+        async with http_client:
+            service = SettlementService(repository, client, SettlementCheckpointRepository())
+            return await service.settle()
+
+    report = asyncio.run(scenario())
+
+    assert report.declined == 20
+    assert report.captured == 0
+    assert len(repository.get_by_status(PaymentStatus.FAILED)) == 20
+
+
+def test_failed_batches_stay_pending_and_resume():
+    """Batches rejected by the gateway are retried when the run is resumed."""
+    repository = _authorized_payments(12)
+    checkpoints = SettlementCheckpointRepository()
+    failing = create_stub_gateway_app(StubGatewayConfig(error_rate=1.0))
+    healthy = create_stub_gateway_app(StubGatewayConfig())
+
+    async def scenario(app, run_id=None):
+        client, http_client = _client_for(app)
+        async with http_client:
+            service = SettlementService(repository, client, checkpoints, batch_size=5)
+            return await service.settle(run_id)
+
+    first = asyncio.run(scenario(failing))
+    assert first.batches_failed == 3
+    assert first.batches_completed == 0
+    assert not checkpoints.get(first.run_id).is_complete
+
+    second = asyncio.run(scenario(healthy, first.run_id))
+    assert second.run_id == first.run_id
+    assert second.captured == 12
+    assert checkpoints.get(first.run_id).is_complete
+
+
+def test_resume_after_crash_does_not_capture_twice():
+    """A batch sent before a crash is replayed with the same references."""
+    repository = _authorized_payments(10)
+    checkpoints = SettlementCheckpointRepository()
+    app = create_stub_gateway_app(StubGatewayConfig())
+
+    async def scenario():
+        client, http_client = _client_for(app)
+        async with http_client:
+            service = SettlementService(repository, client, checkpoints, batch_size=5)
+            checkpoint = service.plan("shift-1")
+            # Gateway captured the first batch, then the process died before applying it
+            first_batch = [repository.get_by_id(pid) for pid in checkpoint.batches[0]]
+            await client.capture_batch_async([
+                {"reference": f"settlement:shift-1:{p.id}", "amount": p.amount, "currency": "USD"}
+                for p in first_batch
+            ])
+            return await service.settle("shift-1")
+
+    report = asyncio.run(scenario())
+
+    assert report.captured == 10
+    assert app.state.stats["captures"] == 10
+    assert len(repository.get_by_status(PaymentStatus.COMPLETED)) == 10
+
+
+def test_checkpoint_repository_persists_to_file(tmp_path):
+    """File-backed checkpoints survive a new repository instance."""
+    path = os.path.join(tmp_path, "settlement.json")
+    repository = SettlementCheckpointRepository(path)
+    service = SettlementService(_authorized_payments(3), PaymentClient(), repository, batch_size=2)
+    checkpoint = service.plan("shift-2")
+    checkpoint.completed_batches.append(0)
+    repository.save(checkpoint)
+
+    reloaded = SettlementCheckpointRepository(path).get("shift-2")
+
+    assert reloaded is not None
+    assert reloaded.batches == [[1, 2], [3]]
+    assert reloaded.completed_batches == [0]
+
+
+class _PartialGateway:
+    """Gateway answering every capture except those of `unanswered` payments."""
+
+    def __init__(self, unanswered: set):
+        self.unanswered = unanswered
+        self.references: list = []
+
+    async def capture_batch_async(self, captures):
+        self.references.extend(capture["reference"] for capture in captures)
+        return [
+            {"reference": capture["reference"], "status": "success"}
+            for capture in captures
+            if int(capture["reference"].rsplit(":", 1)[1]) not in self.unanswered
+        ]
+
+
+def test_unanswered_captures_keep_batch_pending_and_resume():
+    """A capture without a gateway result is resent on resume with its reference."""
+    repository = _authorized_payments(4)
+    checkpoints = SettlementCheckpointRepository()
+    gateway = _PartialGateway(unanswered={4})
+    service = SettlementService(repository, gateway, checkpoints)  # type: ignore[arg-type]
+
+    first = asyncio.run(service.settle("run1"))
+
+    assert first.captured == 3
+    assert first.unanswered == 1
+    assert first.batches_completed == 0
+    assert checkpoints.get("run1").unanswered_payments == [4]
+    assert repository.get_by_id(4).status == PaymentStatus.AUTHORIZED
+    # A new run leaves the payment to the run awaiting its answer
+    assert service.plan().batches == []
+
+    gateway.unanswered = set()
+    second = asyncio.run(service.settle("run1"))
+
+    assert second.captured == 1
+    assert second.skipped == 3
+    assert second.unanswered == 0
+    assert checkpoints.get("run1").is_complete
+    assert checkpoints.get("run1").unanswered_payments == []
+    assert repository.get_by_id(4).status == PaymentStatus.COMPLETED
+    assert gateway.references.count("settlement:run1:4") == 2
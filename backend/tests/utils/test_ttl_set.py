@@ -0,0 +1,58 @@
+"""
+Tests for the TTL deduplication set.
+"""
+import time
+
+import pytest
+
+from bakerySpotGourmet.utils.ttl_set import TTLSet
+
+
+def test_add_reports_new_and_duplicate_keys():
+    """A key is new once, then a duplicate while remembered."""
+    seen = TTLSet(ttl_seconds=60, max_size=10)
+
+    assert seen.add("evt_1") is True
+    assert seen.add("evt_1") is False
+    assert "evt_1" in seen
+    assert len(seen) == 1
+
+
+def test_keys_expire_after_ttl():
+    """Expired keys are forgotten and can be added again."""
+    seen = TTLSet(ttl_seconds=0.01, max_size=10)
+    seen.add("evt_1")
+
+    time.sleep(0.02)
+
+    assert "evt_1" not in seen
+    assert len(seen) == 0
+    assert seen.add("evt_1") is True
+
+
+def test_oldest_keys_evicted_beyond_max_size():
+    """The set never grows past max_size."""
+    seen = TTLSet(ttl_seconds=60, max_size=3)
+    for i in range(5):
+        seen.add(f"evt_{i}")
+
+    assert len(seen) == 3
+    assert seen.evicted == 2
+    assert "evt_0" not in seen
+    assert "evt_4" in seen
+
+
+def test_discard_forgets_key():
+    """Discarded keys are treated as new again."""
+    seen = TTLSet(ttl_seconds=60, max_size=10)
+    seen.add("evt_1")
+    seen.discard("evt_1")
+    seen.discard("missing")
+
+    assert seen.add("evt_1") is True
+
+
+def test_invalid_configuration():
+    """Non-positive TTL or size is rejected."""
+    with pytest.raises(ValueError):
+        TTLSet(ttl_seconds=0, max_size=10)